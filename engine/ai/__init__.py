@@ -1,12 +1,14 @@
 """AI primitive implementations."""
 
 from engine.ai.agent import FunctionalAgent
+from engine.ai.async_agent import ThreadedAgentRunner
 from engine.ai.blackboard import RuntimeBlackboard
 from engine.ai.utility import best_action, combine_weighted_scores, normalize_scores
 
 __all__ = [
     "FunctionalAgent",
     "RuntimeBlackboard",
+    "ThreadedAgentRunner",
     "best_action",
     "combine_weighted_scores",
     "normalize_scores",
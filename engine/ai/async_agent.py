@@ -0,0 +1,220 @@
+"""Off-thread agent decisions with deadlines and fallback policies.
+
+``agent.decide`` runs on a worker against a private copy of the blackboard;
+its writes are replayed onto the real blackboard by ``poll`` on the calling
+(frame) thread, so game code never sees a half-written blackboard. A decision
+still running at its deadline is abandoned and the fallback agent decides
+synchronously instead. The abandoned worker call keeps running until it
+returns, so callers should not mutate the agent until ``idle`` is true again.
+"""
+
+from __future__ import annotations
+
+import traceback
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from time import perf_counter
+
+from engine.ai.blackboard import RuntimeBlackboard
+from engine.api.ai import Agent, AsyncDecision, DecisionContext
+
+# (key, value, removed)
+type _Write = tuple[str, object, bool]
+
+
+class _RecordingBlackboard(RuntimeBlackboard):
+    """Worker-side blackboard that records writes for replay on the owner thread."""
+
+    def __init__(self, values: dict[str, object]) -> None:
+        super().__init__()
+        self._values.update(values)
+        self.writes: list[_Write] = []
+
+    def set(self, key: str, value: object) -> None:
+        super().set(key, value)
+        self.writes.append((key.strip(), value, False))
+
+    def remove(self, key: str) -> object | None:
+        self.writes.append((key, None, True))
+        return super().remove(key)
+
+
+def _decide(
+    agent: Agent,
+    now_seconds: float,
+    delta_seconds: float,
+    observations: dict[str, object],
+    values: dict[str, object],
+) -> tuple[str, list[_Write], float]:
+    started = perf_counter()
+    blackboard = _RecordingBlackboard(values)
+    action = agent.decide(
+        DecisionContext(
+            now_seconds=now_seconds,
+            delta_seconds=delta_seconds,
+            blackboard=blackboard,
+            observations=observations,
+        )
+    )
+    return action, blackboard.writes, perf_counter() - started
+
+
+@dataclass(slots=True)
+class _Pending:
+    context: DecisionContext
+    future: Future[tuple[str, list[_Write], float]]
+    submitted: float
+    deadline_s: float | None
+    fallback: Agent | None
+    on_complete: Callable[[AsyncDecision], None] | None
+
+
+class ThreadedAgentRunner:
+    """Executor-backed ``AsyncAgentRunner``; one worker keeps decisions in order."""
+
+    def __init__(self, *, max_workers: int = 1, use_processes: bool = False) -> None:
+        self._max_workers = max(1, int(max_workers))
+        self._use_processes = bool(use_processes)
+        self._executor: Executor | None = None
+        self._pending: dict[int, _Pending] = {}
+        self._abandoned: list[Future[tuple[str, list[_Write], float]]] = []
+        self._next_ticket = 1
+        self._hub: object | None = None
+
+    @property
+    def idle(self) -> bool:
+        self._abandoned = [future for future in self._abandoned if not future.done()]
+        return not self._pending and not self._abandoned
+
+    def submit(
+        self,
+        agent: Agent,
+        context: DecisionContext,
+        *,
+        deadline_s: float | None = None,
+        fallback: Agent | None = None,
+        on_complete: Callable[[AsyncDecision], None] | None = None,
+    ) -> int:
+        executor = self._executor
+        if executor is None:
+            if self._use_processes:
+                executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            else:
+                executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="engine-ai"
+                )
+            self._executor = executor
+        ticket = self._next_ticket
+        self._next_ticket += 1
+        future = executor.submit(
+            _decide,
+            agent,
+            context.now_seconds,
+            context.delta_seconds,
+            dict(context.observations),
+            context.blackboard.snapshot(),
+        )
+        self._pending[ticket] = _Pending(
+            context=context,
+            future=future,
+            submitted=perf_counter(),
+            deadline_s=None if deadline_s is None else max(0.0, float(deadline_s)),
+            fallback=fallback,
+            on_complete=on_complete,
+        )
+        return ticket
+
+    def pending(self, ticket: int) -> bool:
+        return ticket in self._pending
+
+    def poll(self, *, tick: int = 0) -> tuple[AsyncDecision, ...]:
+        if not self._pending:
+            return ()
+        now = perf_counter()
+        delivered: list[AsyncDecision] = []
+        for ticket, entry in tuple(self._pending.items()):
+            waited_s = now - entry.submitted
+            if entry.future.done():
+                del self._pending[ticket]
+                decision = self._finished(ticket, entry)
+                if entry.deadline_s is not None and decision.elapsed_s > entry.deadline_s:
+                    self._emit_overrun(tick, decision.elapsed_s, entry.deadline_s)
+            elif entry.deadline_s is not None and waited_s >= entry.deadline_s:
+                del self._pending[ticket]
+                if not entry.future.cancel():
+                    self._abandoned.append(entry.future)
+                decision = self._fall_back(ticket, entry, waited_s, timed_out=True)
+                self._emit_overrun(tick, waited_s, entry.deadline_s)
+            else:
+                continue
+            if entry.on_complete is not None:
+                entry.on_complete(decision)
+            delivered.append(decision)
+        return tuple(delivered)
+
+    def cancel(self, ticket: int) -> None:
+        entry = self._pending.pop(ticket, None)
+        if entry is not None and not entry.future.cancel():
+            self._abandoned.append(entry.future)
+
+    def bind_diagnostics(self, hub: object | None) -> None:
+        self._hub = hub
+
+    def close(self) -> None:
+        for ticket in tuple(self._pending):
+            self.cancel(ticket)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _finished(self, ticket: int, entry: _Pending) -> AsyncDecision:
+        try:
+            action, writes, elapsed_s = entry.future.result()
+        except Exception:  # noqa: BLE001
+            error = traceback.format_exc(limit=4)
+            return self._fall_back(
+                ticket, entry, perf_counter() - entry.submitted, timed_out=False, error=error
+            )
+        blackboard = entry.context.blackboard
+        for key, value, removed in writes:
+            if removed:
+                blackboard.remove(key)
+            else:
+                blackboard.set(key, value)
+        return AsyncDecision(ticket=ticket, action=action, elapsed_s=elapsed_s)
+
+    @staticmethod
+    def _fall_back(
+        ticket: int,
+        entry: _Pending,
+        elapsed_s: float,
+        *,
+        timed_out: bool,
+        error: str | None = None,
+    ) -> AsyncDecision:
+        action = None if entry.fallback is None else entry.fallback.decide(entry.context)
+        return AsyncDecision(
+            ticket=ticket,
+            action=action,
+            elapsed_s=elapsed_s,
+            timed_out=timed_out,
+            used_fallback=entry.fallback is not None,
+            error=error,
+        )
+
+    def _emit_overrun(self, tick: int, elapsed_s: float, deadline_s: float) -> None:
+        emit_fast = getattr(self._hub, "emit_fast", None)
+        if emit_fast is None:
+            return
+        # Frame time a synchronous decision would have stalled past its budget.
+        emit_fast(
+            category="ai",
+            name="ai.decision_overrun_ms",
+            tick=int(tick),
+            value=(elapsed_s - deadline_s) * 1000.0,
+            metadata={"deadline_ms": deadline_s * 1000.0, "elapsed_ms": elapsed_s * 1000.0},
+        )
+
+
+__all__ = ["ThreadedAgentRunner"]
@@ -8,31 +8,49 @@ from engine.api.action_dispatch import (
 )
 from engine.api.ai import (
     Agent,
+    AsyncAgentRunner,
+    AsyncDecision,
     Blackboard,
     DecisionContext,
     best_action,
     combine_weighted_scores,
+    create_async_agent_runner,
     create_blackboard,
     create_functional_agent,
     normalize_scores,
 )
 from engine.api.app_port import EngineAppPort
-from engine.api.assets import AssetHandle, AssetRegistry, create_asset_registry
+from engine.api.assets import (
+    AssetHandle,
+    AssetRegistry,
+    AssetRegistryStats,
+    create_asset_registry,
+)
 from engine.api.commands import Command, CommandMap, create_command_map
 from engine.api.context import RuntimeContext, create_runtime_context
 from engine.api.debug import (
     DebugLoadedSession,
     DebugSessionBundle,
+    ReplayStream,
+    StateHasher,
+    bisect_replay_snapshot,
+    create_state_hasher,
     discover_debug_sessions,
     export_crash_bundle,
     export_profiling_snapshot,
     export_replay_session,
+    find_latest_debug_payload,
     get_diagnostics_snapshot,
     get_metrics_snapshot,
     get_profiling_snapshot,
     get_replay_manifest,
     get_replay_snapshot,
+    iter_binary_log_records,
+    iter_log_records,
     load_debug_session,
+    load_replay_file,
+    open_replay_stream,
+    tail_log_records,
     validate_replay_snapshot,
 )
 from engine.api.dialogs import DialogOpenSpec, open_dialog, resolve_confirm_button_id
@@ -78,8 +96,11 @@ from engine.api.render_snapshot import (
     Mat4,
     RenderCommand,
     RenderPassSnapshot,
+    RenderRectBatch,
+    RenderRectBatchBuilder,
     RenderSnapshot,
     Vec3,
+    create_render_command,
     create_render_snapshot,
 )
 from engine.api.screens import ScreenLayer, ScreenStack, create_screen_stack
@@ -145,6 +166,9 @@ __all__ = [
     "Agent",
     "AssetHandle",
     "AssetRegistry",
+    "AssetRegistryStats",
+    "AsyncAgentRunner",
+    "AsyncDecision",
     "Blackboard",
     "Command",
     "CommandMap",
@@ -179,6 +203,8 @@ __all__ = [
     "KeyEvent",
     "RenderCommand",
     "RenderPassSnapshot",
+    "RenderRectBatch",
+    "RenderRectBatchBuilder",
     "RenderSnapshot",
     "SurfaceHandle",
     "Vec3",
@@ -220,6 +246,7 @@ __all__ = [
     "combine_weighted_scores",
     "create_action_dispatcher",
     "create_asset_registry",
+    "create_async_agent_runner",
     "create_blackboard",
     "create_command_map",
     "create_event_bus",
@@ -228,6 +255,7 @@ __all__ = [
     "create_flow_program",
     "create_empty_input_snapshot",
     "create_interaction_mode_machine",
+    "create_render_command",
     "create_render_snapshot",
     "configure_logging",
     "get_logger",
@@ -239,16 +267,26 @@ __all__ = [
     "draw_stroke_rect",
     "draw_gradient_rect",
     "draw_shadow_rect",
+    "bisect_replay_snapshot",
+    "create_state_hasher",
+    "StateHasher",
+    "ReplayStream",
     "discover_debug_sessions",
     "export_crash_bundle",
     "export_replay_session",
     "export_profiling_snapshot",
+    "find_latest_debug_payload",
     "get_diagnostics_snapshot",
     "get_metrics_snapshot",
     "get_profiling_snapshot",
     "get_replay_manifest",
     "get_replay_snapshot",
+    "iter_binary_log_records",
+    "iter_log_records",
     "load_debug_session",
+    "load_replay_file",
+    "open_replay_stream",
+    "tail_log_records",
     "normalize_scores",
     "validate_replay_snapshot",
     "run_hosted_runtime",
@@ -46,6 +46,52 @@ class Agent(Protocol):
         """Return next action identifier."""
 
 
+@dataclass(frozen=True, slots=True)
+class AsyncDecision:
+    """Delivered result of an off-thread agent decision."""
+
+    ticket: int
+    action: str | None
+    elapsed_s: float
+    timed_out: bool = False
+    used_fallback: bool = False
+    error: str | None = None
+
+
+class AsyncAgentRunner(Protocol):
+    """Runs agent decisions on worker threads/processes with deadlines."""
+
+    @property
+    def idle(self) -> bool:
+        """Return whether no decision is queued or running, abandoned ones included."""
+
+    def submit(
+        self,
+        agent: Agent,
+        context: DecisionContext,
+        *,
+        deadline_s: float | None = None,
+        fallback: Agent | None = None,
+        on_complete: Callable[[AsyncDecision], None] | None = None,
+    ) -> int:
+        """Queue ``agent.decide`` off-thread and return a ticket."""
+
+    def pending(self, ticket: int) -> bool:
+        """Return whether ticket has not been delivered yet."""
+
+    def poll(self, *, tick: int = 0) -> tuple[AsyncDecision, ...]:
+        """Deliver finished and timed-out decisions on the calling thread."""
+
+    def cancel(self, ticket: int) -> None:
+        """Drop a pending decision without delivering it."""
+
+    def bind_diagnostics(self, hub: object | None) -> None:
+        """Emit decision overruns through a diagnostics hub (``emit_fast``)."""
+
+    def close(self) -> None:
+        """Drop pending decisions and stop workers."""
+
+
 def create_blackboard() -> Blackboard:
     """Create default blackboard implementation."""
     from engine.ai.blackboard import RuntimeBlackboard
@@ -62,6 +108,15 @@ def create_functional_agent(
     return FunctionalAgent(decide_fn=decide_fn)
 
 
+def create_async_agent_runner(
+    *, max_workers: int = 1, use_processes: bool = False
+) -> AsyncAgentRunner:
+    """Create off-thread decision runner (threads, or processes for picklable agents)."""
+    from engine.ai.async_agent import ThreadedAgentRunner
+
+    return ThreadedAgentRunner(max_workers=max_workers, use_processes=use_processes)
+
+
 def normalize_scores(scores: dict[str, float]) -> dict[str, float]:
     """Normalize scores into probability distribution."""
     from engine.ai.utility import normalize_scores as _normalize_scores
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
-from typing import Protocol, TypeVar
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Literal, Protocol, TypeVar
 
 TAsset = TypeVar("TAsset")
 AssetLoader = Callable[[str], object]
 AssetUnloader = Callable[[object], None]
+AssetSizer = Callable[[object], int]
+AssetLoadState = Literal["pending", "ready", "failed", "unloaded"]
 
 
 @dataclass(frozen=True, slots=True)
@@ -19,6 +21,22 @@ class AssetHandle[TAsset]:
     asset_id: str
 
 
+@dataclass(frozen=True, slots=True)
+class AssetRegistryStats:
+    """Cache and memory accounting snapshot of an asset registry."""
+
+    hits: int
+    misses: int
+    evictions: int
+    failures: int
+    pending_count: int
+    loaded_count: int
+    retained_count: int
+    bytes_total: int
+    bytes_by_kind: dict[str, int] = field(default_factory=dict)
+    memory_budget_bytes: int | None = None
+
+
 class AssetRegistry(Protocol):
     """Public registry contract for loading and retaining assets."""
 
@@ -28,24 +46,44 @@ class AssetRegistry(Protocol):
         loader: AssetLoader,
         *,
         unloader: AssetUnloader | None = None,
+        sizer: AssetSizer | None = None,
     ) -> None:
         """Register loader for one asset kind."""
 
     def load(self, kind: str, asset_id: str) -> AssetHandle[object]:
         """Load or acquire asset handle."""
 
+    def load_async(self, kind: str, asset_id: str) -> AssetHandle[object]:
+        """Acquire asset handle, loading on a worker thread if needed."""
+
+    def prefetch(self, kind: str, asset_ids: Iterable[str]) -> None:
+        """Start background loads without acquiring references."""
+
+    def state(self, handle: AssetHandle[object]) -> AssetLoadState:
+        """Return load state for a handle."""
+
     def get(self, handle: AssetHandle[TAsset]) -> TAsset:
         """Resolve handle to loaded value."""
 
+    def try_get(self, handle: AssetHandle[TAsset]) -> TAsset | None:
+        """Resolve handle to loaded value, or None while pending."""
+
     def release(self, handle: AssetHandle[object]) -> None:
         """Release one handle reference."""
 
+    def stats(self) -> AssetRegistryStats:
+        """Return cache and memory accounting snapshot."""
+
     def clear(self) -> None:
         """Release all loaded assets."""
 
 
-def create_asset_registry() -> AssetRegistry:
+def create_asset_registry(
+    *,
+    max_workers: int = 2,
+    memory_budget_bytes: int | None = None,
+) -> AssetRegistry:
     """Create default asset-registry implementation."""
     from engine.assets.registry import RuntimeAssetRegistry
 
-    return RuntimeAssetRegistry()
+    return RuntimeAssetRegistry(max_workers=max_workers, memory_budget_bytes=memory_budget_bytes)
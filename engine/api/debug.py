@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Protocol
 
 from engine.diagnostics import (
     DIAG_METRICS_SCHEMA_VERSION,
@@ -23,6 +24,7 @@ class DebugSessionBundle:
     ui_log: Path | None
     run_stamp: datetime | None
     ui_stamp: datetime | None
+    replay_stream: Path | None = None
 
 
 @dataclass(frozen=True)
@@ -31,6 +33,18 @@ class DebugLoadedSession:
     run_records: list[dict[str, Any]]
     ui_frames: list[dict[str, Any]]
     summary: Any
+    replay: ReplayStream | None = None
+
+    def close(self) -> None:
+        """Release the replay stream file handle, if one was opened."""
+        if self.replay is not None:
+            self.replay.close()
+
+    def __enter__(self) -> DebugLoadedSession:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
 
 
 @dataclass(frozen=True)
@@ -97,20 +111,143 @@ class ReplayValidationView:
     mismatches: list[dict[str, Any]]
 
 
-def discover_debug_sessions(log_dir: Path, *, recursive: bool = False) -> list[DebugSessionBundle]:
+@dataclass(frozen=True)
+class ReplayBisectView:
+    schema_version: str
+    diverged: bool
+    first_divergent_tick: int | None
+    last_good_tick: int | None
+    resumed_from_tick: int | None
+    expected_hash: str | None
+    actual_hash: str | None
+    segments_replayed: int
+    ticks_replayed: int
+    state_checkpoint_count: int
+
+
+class StateHasher(Protocol):
+    """Incremental state digest for module ``debug_state_hash`` hooks."""
+
+    def update(self, name: str, *, version: object, build: Callable[[], Any]) -> str:
+        """Hash one section, rebuilding it only when ``version`` changed."""
+
+    def discard(self, name: str) -> None:
+        """Drop a section from the digest."""
+
+    def digest(self) -> str:
+        """Return the root digest over all current sections."""
+
+
+class ReplayStream(Protocol):
+    """Lazily loaded chunked replay stream (see ``open_replay_stream``)."""
+
+    @property
+    def manifest(self) -> dict[str, Any]: ...
+
+    @property
+    def complete(self) -> bool: ...
+
+    @property
+    def command_count(self) -> int: ...
+
+    @property
+    def state_hash_count(self) -> int: ...
+
+    @property
+    def chunks(self) -> tuple[Any, ...]: ...
+
+    def read_chunk(self, index: int) -> dict[str, Any]: ...
+
+    def read_range(self, start_tick: int, end_tick: int) -> dict[str, list[dict[str, Any]]]: ...
+
+    def to_session(self) -> dict[str, Any]: ...
+
+    def close(self) -> None: ...
+
+
+def create_state_hasher() -> StateHasher:
+    """Create an incremental section hasher for replay state marks."""
+    from engine.diagnostics import StateSectionHasher
+
+    return StateSectionHasher()
+
+
+def open_replay_stream(path: Path) -> ReplayStream:
+    """Open a chunked replay stream; chunks are decompressed on demand."""
+    from engine.diagnostics import ReplayStreamReader
+
+    return ReplayStreamReader(path)
+
+
+def load_replay_file(path: Path) -> dict[str, Any]:
+    """Load a replay session from a JSON export or a chunked replay stream."""
+    from engine.diagnostics import load_replay_session
+
+    return load_replay_session(path)
+
+
+def iter_log_records(
+    path: Path, *, field_prefixes: Mapping[str, str | Sequence[str]] | None = None
+) -> Iterator[dict[str, Any]]:
+    """Stream JSONL log rows lazily, optionally keeping only field-prefix matches."""
+    from engine.diagnostics import iter_jsonl_records
+
+    return iter_jsonl_records(path, field_prefixes=field_prefixes)
+
+
+def iter_binary_log_records(path: Path) -> Iterator[dict[str, Any]]:
+    """Decode a fast-mode binary log (``*.englog``) into JSON-log-shaped rows."""
+    from engine.diagnostics import iter_binary_log_records as _iter_binary_log_records
+
+    return _iter_binary_log_records(path)
+
+
+def tail_log_records(
+    path: Path,
+    count: int,
+    *,
+    field_prefixes: Mapping[str, str | Sequence[str]] | None = None,
+) -> list[dict[str, Any]]:
+    """Return the last ``count`` JSONL log rows (after prefix filtering) in file order."""
+    from engine.diagnostics import tail_jsonl_records
+
+    return tail_jsonl_records(path, count, field_prefixes=field_prefixes)
+
+
+def discover_debug_sessions(
+    log_dir: Path, *, recursive: bool = False, use_index: bool = True
+) -> list[DebugSessionBundle]:
+    """Discover session bundles, using the cached session file index by default."""
     runtime = _runtime_observability()
-    bundles = runtime.discover_session_bundles(log_dir, recursive=recursive)
+    bundles = runtime.discover_session_bundles(
+        log_dir, recursive=recursive, use_index=use_index
+    )
     return [
         DebugSessionBundle(
             run_log=b.run_log,
             ui_log=b.ui_log,
             run_stamp=b.run_stamp,
             ui_stamp=b.ui_stamp,
+            replay_stream=b.replay_stream,
         )
         for b in bundles
     ]
 
 
+def find_latest_debug_payload(
+    log_dir: Path, directories: Sequence[Path], *, schema: str
+) -> dict[str, Any] | None:
+    """Return the newest JSON payload with ``schema`` in ``directories``.
+
+    Schemas are cached in the session file index for ``log_dir``, so only the
+    returned file is parsed once the index is warm.
+    """
+    from engine.diagnostics import session_index_root, shared_session_index
+
+    with shared_session_index(session_index_root(log_dir)) as index:
+        return index.latest_payload(directories, schema=schema)
+
+
 def load_debug_session(bundle: DebugSessionBundle) -> DebugLoadedSession:
     runtime = _runtime_observability()
     runtime_bundle = runtime.SessionBundle(
@@ -118,6 +255,7 @@ def load_debug_session(bundle: DebugSessionBundle) -> DebugLoadedSession:
         ui_log=bundle.ui_log,
         run_stamp=bundle.run_stamp,
         ui_stamp=bundle.ui_stamp,
+        replay_stream=bundle.replay_stream,
     )
     loaded = runtime.load_session(runtime_bundle)
     return DebugLoadedSession(
@@ -126,10 +264,12 @@ def load_debug_session(bundle: DebugSessionBundle) -> DebugLoadedSession:
             ui_log=loaded.bundle.ui_log,
             run_stamp=loaded.bundle.run_stamp,
             ui_stamp=loaded.bundle.ui_stamp,
+            replay_stream=loaded.bundle.replay_stream,
         ),
         run_records=loaded.run_records,
         ui_frames=loaded.ui_frames,
         summary=loaded.summary,
+        replay=loaded.replay,
     )
 
 
@@ -328,12 +468,24 @@ def validate_replay_snapshot(
     fixed_step_seconds: float,
     apply_command: Any,
     step: Any,
+    restore: Any = None,
+    resume_tick: int | None = None,
 ) -> ReplayValidationView:
-    """Validate replay snapshot determinism with provided simulation callbacks."""
+    """Validate replay snapshot determinism with provided simulation callbacks.
+
+    Pass ``resume_tick`` and a ``restore`` callback to start from a recorded
+    state checkpoint instead of the first tick.
+    """
     from engine.diagnostics import FixedStepReplayRunner
 
     runner = FixedStepReplayRunner(fixed_step_seconds=fixed_step_seconds)
-    result = runner.run(replay_snapshot, apply_command=apply_command, step=step)
+    result = runner.run(
+        replay_snapshot,
+        apply_command=apply_command,
+        step=step,
+        restore=restore,
+        resume_tick=resume_tick,
+    )
     return ReplayValidationView(
         schema_version=DIAG_REPLAY_VALIDATION_SCHEMA_VERSION,
         passed=bool(result.passed),
@@ -351,6 +503,38 @@ def validate_replay_snapshot(
     )
 
 
+def bisect_replay_snapshot(
+    replay_snapshot: dict[str, Any],
+    *,
+    fixed_step_seconds: float,
+    apply_command: Any,
+    step: Any,
+    restore: Any,
+) -> ReplayBisectView:
+    """Locate the first diverging tick and the state checkpoint that reproduces it."""
+    from engine.diagnostics import FixedStepReplayRunner
+
+    runner = FixedStepReplayRunner(fixed_step_seconds=fixed_step_seconds)
+    result = runner.bisect(
+        replay_snapshot,
+        apply_command=apply_command,
+        step=step,
+        restore=restore,
+    )
+    return ReplayBisectView(
+        schema_version=DIAG_REPLAY_VALIDATION_SCHEMA_VERSION,
+        diverged=bool(result.diverged),
+        first_divergent_tick=result.first_divergent_tick,
+        last_good_tick=result.last_good_tick,
+        resumed_from_tick=result.resumed_from_tick,
+        expected_hash=result.expected_hash,
+        actual_hash=result.actual_hash,
+        segments_replayed=int(result.segments_replayed),
+        ticks_replayed=int(result.ticks_replayed),
+        state_checkpoint_count=int(result.state_checkpoint_count),
+    )
+
+
 def _runtime_observability() -> Any:
     from engine.runtime import observability
 
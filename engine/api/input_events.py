@@ -7,12 +7,16 @@ from dataclasses import dataclass
 
 @dataclass(frozen=True, slots=True)
 class PointerEvent:
-    """Raw pointer event in canvas coordinates."""
+    """Raw pointer event in canvas coordinates.
+
+    ``coalesced_count`` is the number of raw moves merged into a ``pointer_move``.
+    """
 
     event_type: str
     x: float
     y: float
     button: int
+    coalesced_count: int = 1
 
 
 @dataclass(frozen=True, slots=True)
@@ -25,11 +29,15 @@ class KeyEvent:
 
 @dataclass(frozen=True, slots=True)
 class WheelEvent:
-    """Mouse wheel event in canvas coordinates."""
+    """Mouse wheel event in canvas coordinates.
+
+    ``coalesced_count`` is the number of raw wheel events summed into ``dy``.
+    """
 
     x: float
     y: float
     dy: float
+    coalesced_count: int = 1
 
 
 __all__ = ["KeyEvent", "PointerEvent", "WheelEvent"]
@@ -17,7 +17,10 @@ class EngineLoggingConfig:
     level_name: str = "INFO"
     console_format: str = "text"  # text|json
     file_path: str | None = None
-    file_format: str = "json"  # text|json
+    file_format: str = "json"  # text|json|binary (binary implies fast_mode)
+    fast_mode: bool = False
+    rate_limit_per_site: int = 0  # fast mode only; 0 disables
+    rate_limit_window_s: float = 1.0
 
 
 class LoggerPort(Protocol):
@@ -39,7 +42,7 @@ class JsonFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         payload: dict[str, object] = {
-            "ts": datetime.now(UTC).isoformat(),
+            "ts": datetime.fromtimestamp(record.created, UTC).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "msg": record.getMessage(),
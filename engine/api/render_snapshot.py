@@ -2,7 +2,15 @@
 
 from __future__ import annotations
 
+import hashlib
+from collections.abc import Iterator
 from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
 
 
 @dataclass(frozen=True, slots=True)
@@ -49,38 +57,470 @@ IDENTITY_MAT4 = Mat4(
 
 @dataclass(frozen=True, slots=True)
 class RenderCommand:
-    """One immutable draw command in a pass."""
+    """One immutable draw command in a pass.
+
+    ``identity`` is an opt-in stable content identity. Commands with equal
+    identity are interchangeable for render-path caches, so rebuilt but
+    identical commands reuse cached work instead of keying on ``id()``.
+
+    ``order_key`` is an optional packed 64-bit draw-order key (see
+    ``pack_render_order_key``) computed once when the command is built.
+    """
 
     kind: str
     layer: int = 0
     sort_key: str = ""
     transform: Mat4 = IDENTITY_MAT4
     data: tuple[tuple[str, object], ...] = ()
+    identity: int | None = field(default=None, compare=False)
+    order_key: int | None = field(default=None, compare=False)
+
+
+# key, color, x, y, w, h, z, static, order_key
+type RectBatchRow = tuple[str | None, str, float, float, float, float, float, bool, int]
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class RenderRectBatch:
+    """Columnar struct-of-arrays payload for ``rect`` primitives of one pass.
+
+    Row ``i`` stands for a ``rect`` command returned by ``to_commands()``;
+    its translation transform is derived from the ``x``/``y``/``z`` columns
+    instead of being stored per primitive. Numeric columns are read-only
+    numpy arrays with one entry per row. ``clip`` holds per-row clip bounds
+    ``(left, top, right, bottom)``; unclipped rows hold infinite bounds, and
+    rows clipped away entirely expand to no command. Renderers read the
+    columns through ``rows()``; ``to_commands()`` is the command-based view.
+    """
+
+    keys: tuple[str | None, ...]
+    colors: tuple[str, ...]
+    x: NDArray[np.float64]
+    y: NDArray[np.float64]
+    w: NDArray[np.float64]
+    h: NDArray[np.float64]
+    z: NDArray[np.float64]
+    static: NDArray[np.bool_]
+    order_keys: NDArray[np.uint64]
+    clip: NDArray[np.float64] | None = None
+
+    def __post_init__(self) -> None:
+        import numpy as np
+
+        rows = len(self.keys)
+        if len(self.colors) != rows:
+            raise ValueError("RenderRectBatch columns must have equal length")
+        for name, dtype in _RECT_BATCH_COLUMNS:
+            column = _frozen_column(getattr(self, name), dtype)
+            if column.shape != (rows,):
+                raise ValueError("RenderRectBatch columns must have equal length")
+            object.__setattr__(self, name, column)
+        clip = self.clip
+        if clip is None:
+            clip = np.tile(_UNCLIPPED, (rows, 1))
+        column = _frozen_column(clip, "float64")
+        if column.shape != (rows, 4):
+            raise ValueError("RenderRectBatch clip must hold four bounds per row")
+        object.__setattr__(self, "clip", column)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def rows(self) -> Iterator[RectBatchRow]:
+        """Yield visible rows in storage order with clip bounds applied."""
+        import numpy as np
+
+        x, y, w, h = self.x, self.y, self.w, self.h
+        clip = self.clip
+        assert clip is not None
+        clipped = np.isfinite(clip).any(axis=1)
+        if not clipped.any():
+            yield from zip(
+                self.keys,
+                self.colors,
+                x.tolist(),
+                y.tolist(),
+                w.tolist(),
+                h.tolist(),
+                self.z.tolist(),
+                self.static.tolist(),
+                self.order_keys.tolist(),
+                strict=True,
+            )
+            return
+        # Intersect clipped rows only, so unclipped rows keep their exact values.
+        left = np.maximum(x, clip[:, 0])
+        top = np.maximum(y, clip[:, 1])
+        width = np.minimum(x + w, clip[:, 2]) - left
+        height = np.minimum(y + h, clip[:, 3]) - top
+        visible = ~clipped | ((width > 0.0) & (height > 0.0))
+        for row, shown in zip(
+            zip(
+                self.keys,
+                self.colors,
+                np.where(clipped, left, x).tolist(),
+                np.where(clipped, top, y).tolist(),
+                np.where(clipped, width, w).tolist(),
+                np.where(clipped, height, h).tolist(),
+                self.z.tolist(),
+                self.static.tolist(),
+                self.order_keys.tolist(),
+                strict=True,
+            ),
+            visible.tolist(),
+            strict=True,
+        ):
+            if shown:
+                yield row
+
+    def to_commands(self) -> tuple[RenderCommand, ...]:
+        """Expand visible rows into equivalent command-based ``rect`` commands."""
+        commands: list[RenderCommand] = []
+        for key, color, x, y, w, h, z, static, order_key in self.rows():
+            layer = int(round(z * 100.0))
+            transform = mat4_translation(Vec3(x=x, y=y, z=z))
+            data: tuple[tuple[str, object], ...] = (
+                ("key", key),
+                ("x", x),
+                ("y", y),
+                ("w", w),
+                ("h", h),
+                ("color", color),
+                ("z", z),
+                ("static", static),
+            )
+            commands.append(
+                RenderCommand(
+                    kind="rect",
+                    layer=layer,
+                    transform=transform,
+                    data=data,
+                    identity=render_command_identity(
+                        kind="rect", layer=layer, sort_key="", transform=transform, data=data
+                    ),
+                    order_key=order_key,
+                )
+            )
+        return tuple(commands)
+
+    def scaled(self, *, sx: float, sy: float) -> RenderRectBatch:
+        """Return a batch with x/w/clip scaled by ``sx`` and y/h/clip scaled by ``sy``."""
+        if sx == 1.0 and sy == 1.0:
+            return self
+        assert self.clip is not None
+        # Only geometry is copied; keys, colors, z, static and order keys are shared.
+        return RenderRectBatch(
+            keys=self.keys,
+            colors=self.colors,
+            x=_readonly(self.x * sx),
+            y=_readonly(self.y * sy),
+            w=_readonly(self.w * sx),
+            h=_readonly(self.h * sy),
+            z=self.z,
+            static=self.static,
+            order_keys=self.order_keys,
+            clip=_readonly(self.clip * (sx, sy, sx, sy)),
+        )
+
+
+class RenderRectBatchBuilder:
+    """Append-only column lists that freeze into one ``RenderRectBatch``."""
+
+    __slots__ = (
+        "_keys",
+        "_colors",
+        "_x",
+        "_y",
+        "_w",
+        "_h",
+        "_z",
+        "_static",
+        "_sequence",
+        "_clip",
+    )
+
+    def __init__(self) -> None:
+        self._keys: list[str | None] = []
+        self._colors: list[str] = []
+        self._x: list[float] = []
+        self._y: list[float] = []
+        self._w: list[float] = []
+        self._h: list[float] = []
+        self._z: list[float] = []
+        self._static: list[bool] = []
+        self._sequence: list[int] = []
+        self._clip: list[tuple[float, float, float, float]] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def append(
+        self,
+        *,
+        key: str | None,
+        x: float,
+        y: float,
+        w: float,
+        h: float,
+        color: str,
+        z: float = 0.0,
+        static: bool = False,
+        sequence: int = 0,
+        clip: tuple[float, float, float, float] | None = None,
+    ) -> None:
+        """Append one row; ``clip`` is ``(left, top, right, bottom)`` in design space."""
+        self._keys.append(key)
+        self._colors.append(color)
+        self._x.append(x)
+        self._y.append(y)
+        self._w.append(w)
+        self._h.append(h)
+        self._z.append(z)
+        self._static.append(static)
+        self._sequence.append(sequence)
+        self._clip.append(_UNCLIPPED if clip is None else clip)
+
+    def build(self) -> RenderRectBatch:
+        import numpy as np
+
+        z = _readonly(np.asarray(self._z, dtype=np.float64))
+        return RenderRectBatch(
+            keys=tuple(self._keys),
+            colors=tuple(self._colors),
+            x=_readonly(np.asarray(self._x, dtype=np.float64)),
+            y=_readonly(np.asarray(self._y, dtype=np.float64)),
+            w=_readonly(np.asarray(self._w, dtype=np.float64)),
+            h=_readonly(np.asarray(self._h, dtype=np.float64)),
+            z=z,
+            static=_readonly(np.asarray(self._static, dtype=np.bool_)),
+            order_keys=_readonly(
+                pack_render_order_keys(
+                    layers=np.rint(z * 100.0).astype(np.int64),
+                    kind="rect",
+                    sequences=np.asarray(self._sequence, dtype=np.int64),
+                )
+            ),
+            clip=_readonly(np.asarray(self._clip, dtype=np.float64).reshape(-1, 4)),
+        )
 
 
 @dataclass(frozen=True, slots=True)
 class RenderPassSnapshot:
-    """Immutable render pass payload."""
+    """Immutable render pass payload.
+
+    ``trusted`` marks passes whose command payloads are already frozen
+    (tuples of primitives only); hosts may submit them without deep sanitize.
+    ``rect_batches`` carries optional columnar rect payloads drawn in packed
+    order-key order together with ``commands``; see ``render_pass_commands``.
+    """
 
     name: str
     commands: tuple[RenderCommand, ...] = ()
+    trusted: bool = False
+    rect_batches: tuple[RenderRectBatch, ...] = ()
 
 
 @dataclass(frozen=True, slots=True)
 class RenderSnapshot:
-    """Immutable renderer-facing frame snapshot."""
+    """Immutable renderer-facing frame snapshot.
+
+    ``trusted`` marks every pass in the snapshot as pre-frozen.
+    """
 
     frame_index: int
     passes: tuple[RenderPassSnapshot, ...] = ()
+    trusted: bool = False
 
 
 def create_render_snapshot(
     *,
     frame_index: int,
     passes: tuple[RenderPassSnapshot, ...] = (),
+    trusted: bool = False,
 ) -> RenderSnapshot:
     """Create a render snapshot value."""
-    return RenderSnapshot(frame_index=frame_index, passes=passes)
+    return RenderSnapshot(frame_index=frame_index, passes=passes, trusted=trusted)
+
+
+def create_render_command(
+    *,
+    kind: str,
+    layer: int = 0,
+    sort_key: str = "",
+    transform: Mat4 = IDENTITY_MAT4,
+    data: tuple[tuple[str, object], ...] = (),
+    sequence: int = 0,
+) -> RenderCommand:
+    """Create a render command stamped with content identity and packed order key."""
+    return RenderCommand(
+        kind=kind,
+        layer=layer,
+        sort_key=sort_key,
+        transform=transform,
+        data=data,
+        identity=render_command_identity(
+            kind=kind,
+            layer=layer,
+            sort_key=sort_key,
+            transform=transform,
+            data=data,
+        ),
+        order_key=pack_render_order_key(
+            layer=layer,
+            kind=kind,
+            sort_key=sort_key,
+            sequence=sequence,
+        ),
+    )
+
+
+def render_command_identity(
+    *,
+    kind: str,
+    layer: int,
+    sort_key: str,
+    transform: Mat4,
+    data: tuple[tuple[str, object], ...],
+) -> int | None:
+    """Return a cheap structural hash of command content, or None when unhashable."""
+    try:
+        return hash((kind, layer, sort_key, transform.values, data))
+    except TypeError:
+        return None
+
+
+_ORDER_LAYER_BITS = 16
+_ORDER_KIND_BITS = 8
+_ORDER_MATERIAL_BITS = 16
+_ORDER_SEQUENCE_BITS = 24
+_ORDER_LAYER_MAX = (1 << _ORDER_LAYER_BITS) - 1
+_ORDER_LAYER_BIAS = 1 << (_ORDER_LAYER_BITS - 1)
+_ORDER_KIND_UNKNOWN = (1 << _ORDER_KIND_BITS) - 1
+_ORDER_MATERIAL_MAX = (1 << _ORDER_MATERIAL_BITS) - 1
+_ORDER_SEQUENCE_MAX = (1 << _ORDER_SEQUENCE_BITS) - 1
+# Kind ids follow string order so packed keys order kinds like the old tuple keys.
+_ORDER_KIND_IDS: dict[str, int] = {
+    kind: index
+    for index, kind in enumerate(
+        sorted(
+            (
+                "fill_window",
+                "gradient_rect",
+                "grid",
+                "rect",
+                "rounded_rect",
+                "shadow_rect",
+                "stroke_rect",
+                "text",
+                "title",
+            )
+        )
+    )
+}
+
+
+@lru_cache(maxsize=4096)
+def _order_material_id(sort_key: str) -> int:
+    """Stable id derived from the key alone; the empty sort key is always 0."""
+    if not sort_key:
+        return 0
+    digest = hashlib.blake2b(sort_key.encode("utf-8"), digest_size=4).digest()
+    return 1 + int.from_bytes(digest, "big") % _ORDER_MATERIAL_MAX
+
+
+def pack_render_order_key(*, layer: int, kind: str, sort_key: str = "", sequence: int = 0) -> int:
+    """Pack draw order into one non-negative 64-bit integer.
+
+    Bit layout from most to least significant: 16-bit biased layer bucket,
+    8-bit kind id, 16-bit material id hashed from ``sort_key`` and 24-bit
+    builder sequence. Out-of-range fields saturate. Material ids group equal
+    sort keys and do not depend on what was drawn before, but are not ordered
+    lexicographically.
+    """
+    layer_bucket = min(_ORDER_LAYER_MAX, max(0, int(layer) + _ORDER_LAYER_BIAS))
+    kind_id = _ORDER_KIND_IDS.get(kind, _ORDER_KIND_UNKNOWN)
+    material_id = _order_material_id(sort_key)
+    sequence_value = min(_ORDER_SEQUENCE_MAX, max(0, int(sequence)))
+    return (
+        (layer_bucket << (_ORDER_KIND_BITS + _ORDER_MATERIAL_BITS + _ORDER_SEQUENCE_BITS))
+        | (kind_id << (_ORDER_MATERIAL_BITS + _ORDER_SEQUENCE_BITS))
+        | (material_id << _ORDER_SEQUENCE_BITS)
+        | sequence_value
+    )
+
+
+def pack_render_order_keys(
+    *,
+    layers: NDArray[np.int64],
+    kind: str,
+    sequences: NDArray[np.int64],
+    sort_key: str = "",
+) -> NDArray[np.uint64]:
+    """Vectorized ``pack_render_order_key`` for one kind and sort key."""
+    import numpy as np
+
+    base = pack_render_order_key(layer=-_ORDER_LAYER_BIAS, kind=kind, sort_key=sort_key)
+    layer_buckets = np.clip(layers + _ORDER_LAYER_BIAS, 0, _ORDER_LAYER_MAX).astype(np.uint64)
+    shift = np.uint64(_ORDER_KIND_BITS + _ORDER_MATERIAL_BITS + _ORDER_SEQUENCE_BITS)
+    return (
+        (layer_buckets << shift)
+        | np.uint64(base)
+        | np.clip(sequences, 0, _ORDER_SEQUENCE_MAX).astype(np.uint64)
+    )
+
+
+def render_command_order_key(command: RenderCommand) -> int:
+    """Return the stamped packed order key, packing one on demand when absent."""
+    order_key = command.order_key
+    if order_key is not None:
+        return order_key
+    return pack_render_order_key(
+        layer=int(command.layer),
+        kind=str(command.kind),
+        sort_key=str(command.sort_key),
+    )
+
+
+def render_pass_commands(render_pass: RenderPassSnapshot) -> tuple[RenderCommand, ...]:
+    """Return pass commands with columnar batch rows expanded in draw order.
+
+    Passes with batches come back sorted by packed order key; command-only
+    passes are returned unchanged.
+    """
+    if not render_pass.rect_batches:
+        return render_pass.commands
+    expanded = list(render_pass.commands)
+    for batch in render_pass.rect_batches:
+        expanded.extend(batch.to_commands())
+    return tuple(sorted(expanded, key=render_command_order_key))
+
+
+# numpy is imported where columns are built, so command-only callers never load it.
+_RECT_BATCH_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("x", "float64"),
+    ("y", "float64"),
+    ("w", "float64"),
+    ("h", "float64"),
+    ("z", "float64"),
+    ("static", "bool"),
+    ("order_keys", "uint64"),
+)
+_INF = float("inf")
+_UNCLIPPED = (-_INF, -_INF, _INF, _INF)
+
+
+def _frozen_column(values: object, dtype: str) -> NDArray[Any]:
+    import numpy as np
+
+    column = np.asarray(values, dtype=dtype)
+    if column.flags.writeable:
+        column = _readonly(column.copy())
+    return column
+
+
+def _readonly[T: NDArray[Any]](column: T) -> T:
+    column.flags.writeable = False
+    return column
 
 
 def mat4_translation(position: Vec3) -> Mat4:
@@ -136,9 +576,17 @@ __all__ = [
     "Mat4",
     "RenderCommand",
     "RenderPassSnapshot",
+    "RenderRectBatch",
+    "RenderRectBatchBuilder",
     "RenderSnapshot",
     "Vec3",
+    "create_render_command",
     "mat4_scale",
     "mat4_translation",
     "create_render_snapshot",
+    "pack_render_order_key",
+    "pack_render_order_keys",
+    "render_command_identity",
+    "render_command_order_key",
+    "render_pass_commands",
 ]
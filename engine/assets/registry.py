@@ -1,28 +1,74 @@
-"""Typed asset registry primitives."""
+"""Typed asset registry primitives.
+
+Assets load either synchronously on the calling thread (``load``) or on a
+worker thread pool (``load_async``/``prefetch``), which returns the handle at
+once with a ``"pending"`` state. Completed loads are adopted on the owning
+thread whenever it queries the registry, so the bookkeeping needs no locks.
+A failed load reports ``"failed"`` until the asset is requested again, which
+retries it instead of serving the cached error.
+
+With a memory budget, assets whose refcount drops to zero stay cached in LRU
+order and are only unloaded once the bytes of all loaded assets exceed the
+budget. Without one, releasing the last reference unloads immediately.
+"""
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import TypeVar, cast
 
-from engine.api.assets import AssetHandle, AssetLoader, AssetUnloader
+from engine.api.assets import (
+    AssetHandle,
+    AssetLoader,
+    AssetLoadState,
+    AssetRegistryStats,
+    AssetSizer,
+    AssetUnloader,
+)
 
 TAsset = TypeVar("TAsset")
 
+type _AssetKey = tuple[str, str]
+
 
 @dataclass(slots=True)
 class _LoadedAsset:
     value: object
     refs: int
     unloader: AssetUnloader | None
+    size: int = 0
+    future: Future[tuple[object, int]] | None = None
+    error: BaseException | None = None
+    prefetched: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class _KindEntry:
+    loader: AssetLoader
+    unloader: AssetUnloader | None
+    sizer: AssetSizer
 
 
 class RuntimeAssetRegistry:
     """Registry that loads, caches, and releases assets by kind and id."""
 
-    def __init__(self) -> None:
-        self._loaders: dict[str, tuple[AssetLoader, AssetUnloader | None]] = {}
-        self._loaded: dict[tuple[str, str], _LoadedAsset] = {}
+    def __init__(self, *, max_workers: int = 2, memory_budget_bytes: int | None = None) -> None:
+        self._kinds: dict[str, _KindEntry] = {}
+        self._loaded: dict[_AssetKey, _LoadedAsset] = {}
+        self._pending: dict[_AssetKey, _LoadedAsset] = {}
+        self._retained: OrderedDict[_AssetKey, None] = OrderedDict()
+        self._bytes_by_kind: dict[str, int] = {}
+        self._bytes_total = 0
+        self._max_workers = max(1, int(max_workers))
+        self._budget = None if memory_budget_bytes is None else max(0, int(memory_budget_bytes))
+        self._executor: ThreadPoolExecutor | None = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._failures = 0
 
     def register_kind(
         self,
@@ -30,55 +76,262 @@ class RuntimeAssetRegistry:
         loader: AssetLoader,
         *,
         unloader: AssetUnloader | None = None,
+        sizer: AssetSizer | None = None,
     ) -> None:
-        """Register loader (and optional unloader) for one asset kind."""
+        """Register loader (and optional unloader and byte sizer) for one asset kind."""
         normalized = kind.strip()
         if not normalized:
             raise ValueError("kind must not be empty")
-        self._loaders[normalized] = (loader, unloader)
+        self._kinds[normalized] = _KindEntry(
+            loader=loader, unloader=unloader, sizer=sizer or _default_size
+        )
 
     def load(self, kind: str, asset_id: str) -> AssetHandle[object]:
         """Load or acquire cached asset and return its handle."""
         key = (kind, asset_id)
         loaded = self._loaded.get(key)
         if loaded is not None:
-            loaded.refs += 1
+            if loaded.future is not None:
+                self._finish(key, loaded, wait=True)
+                loaded = self._loaded.get(key)
+        if loaded is not None and loaded.error is None:
+            self._acquire(key, loaded)
+            self._hits += 1
             return AssetHandle(kind=kind, asset_id=asset_id)
-        loader_entry = self._loaders.get(kind)
-        if loader_entry is None:
-            raise KeyError(f"unknown asset kind: {kind}")
-        loader, unloader = loader_entry
-        value = loader(asset_id)
-        self._loaded[key] = _LoadedAsset(value=value, refs=1, unloader=unloader)
+        entry = self._kind(kind)
+        value = entry.loader(asset_id)
+        self._misses += 1
+        # A retried failure keeps the references of handles acquired before it.
+        refs = 1 if loaded is None else loaded.refs + 1
+        loaded = _LoadedAsset(value=value, refs=refs, unloader=entry.unloader)
+        self._loaded[key] = loaded
+        self._account(kind, entry.sizer(value), loaded)
+        self._enforce_budget()
         return AssetHandle(kind=kind, asset_id=asset_id)
 
+    def load_async(self, kind: str, asset_id: str) -> AssetHandle[object]:
+        """Acquire a handle at once, loading on a worker thread on a cache miss."""
+        self.poll()
+        key = (kind, asset_id)
+        loaded = self._loaded.get(key)
+        if loaded is not None and loaded.error is None:
+            self._acquire(key, loaded)
+            self._hits += 1
+        else:
+            # Failed loads are retried rather than served from the cache.
+            self._submit(key, refs=1 if loaded is None else loaded.refs + 1)
+            self._misses += 1
+        return AssetHandle(kind=kind, asset_id=asset_id)
+
+    def prefetch(self, kind: str, asset_ids: Iterable[str]) -> None:
+        """Start background loads ahead of use without acquiring references.
+
+        Screens call this before a transition. Prefetched assets are cached like
+        released ones, so a memory budget can evict them before they are used;
+        without a budget they stay cached until acquired and released.
+        """
+        self.poll()
+        for asset_id in asset_ids:
+            key = (kind, asset_id)
+            loaded = self._loaded.get(key)
+            if loaded is None:
+                self._submit(key, refs=0)
+            elif loaded.error is not None:
+                self._submit(key, refs=loaded.refs)
+
+    def poll(self) -> int:
+        """Adopt finished background loads; returns how many completed."""
+        done = [
+            (key, loaded)
+            for key, loaded in self._pending.items()
+            if loaded.future is not None and loaded.future.done()
+        ]
+        for key, loaded in done:
+            self._finish(key, loaded, wait=False)
+        return len(done)
+
+    def state(self, handle: AssetHandle[object]) -> AssetLoadState:
+        """Return ``pending``, ``ready``, ``failed`` or ``unloaded`` for a handle."""
+        self.poll()
+        loaded = self._loaded.get((handle.kind, handle.asset_id))
+        if loaded is None:
+            return "unloaded"
+        if loaded.future is not None:
+            return "pending"
+        return "failed" if loaded.error is not None else "ready"
+
     def get(self, handle: AssetHandle[TAsset]) -> TAsset:
-        """Return loaded value for a handle."""
+        """Return loaded value for a handle, waiting for a pending load."""
         key = (handle.kind, handle.asset_id)
         loaded = self._loaded.get(key)
         if loaded is None:
             raise KeyError(f"asset not loaded: kind={handle.kind} id={handle.asset_id}")
+        if loaded.future is not None:
+            self._finish(key, loaded, wait=True)
+        if loaded.error is not None:
+            raise loaded.error
+        return cast(TAsset, loaded.value)
+
+    def try_get(self, handle: AssetHandle[TAsset]) -> TAsset | None:
+        """Return loaded value, or None while the load is pending or after it failed."""
+        key = (handle.kind, handle.asset_id)
+        loaded = self._loaded.get(key)
+        if loaded is None:
+            raise KeyError(f"asset not loaded: kind={handle.kind} id={handle.asset_id}")
+        if loaded.future is not None:
+            if not loaded.future.done():
+                return None
+            self._finish(key, loaded, wait=False)
+        if loaded.error is not None:
+            return None
         return cast(TAsset, loaded.value)
 
     def release(self, handle: AssetHandle[object]) -> None:
         """Release one reference from a loaded asset handle."""
         key = (handle.kind, handle.asset_id)
         loaded = self._loaded.get(key)
-        if loaded is None:
+        if loaded is None or loaded.refs <= 0:
             return
         loaded.refs -= 1
-        if loaded.refs > 0:
+        if loaded.refs > 0 or loaded.future is not None:
+            # Pending loads are settled once they complete.
             return
-        if loaded.unloader is not None:
-            loaded.unloader(loaded.value)
-        self._loaded.pop(key, None)
+        self._settle_unreferenced(key, loaded)
+
+    def stats(self) -> AssetRegistryStats:
+        """Return cache and memory accounting snapshot."""
+        self.poll()
+        return AssetRegistryStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            failures=self._failures,
+            pending_count=len(self._pending),
+            loaded_count=len(self._loaded) - len(self._pending),
+            retained_count=len(self._retained),
+            bytes_total=self._bytes_total,
+            bytes_by_kind=dict(self._bytes_by_kind),
+            memory_budget_bytes=self._budget,
+        )
 
     def clear(self) -> None:
-        """Release all loaded assets."""
+        """Release all loaded assets, waiting for pending loads first."""
+        for key, loaded in tuple(self._pending.items()):
+            self._finish(key, loaded, wait=True, settle=False)
         for key, loaded in tuple(self._loaded.items()):
-            if loaded.unloader is not None:
-                loaded.unloader(loaded.value)
+            self._unload(key, loaded)
+        self._retained.clear()
+
+    def close(self) -> None:
+        """Release all assets and stop the loader threads."""
+        self.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _kind(self, kind: str) -> _KindEntry:
+        entry = self._kinds.get(kind)
+        if entry is None:
+            raise KeyError(f"unknown asset kind: {kind}")
+        return entry
+
+    def _acquire(self, key: _AssetKey, loaded: _LoadedAsset) -> None:
+        loaded.refs += 1
+        loaded.prefetched = False
+        self._retained.pop(key, None)
+
+    def _submit(self, key: _AssetKey, *, refs: int) -> None:
+        entry = self._kind(key[0])
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="engine-asset-loader"
+            )
+        future = self._executor.submit(_load_sized, entry, key[1])
+        loaded = _LoadedAsset(
+            value=None,
+            refs=refs,
+            unloader=entry.unloader,
+            future=future,
+            prefetched=refs == 0,
+        )
+        self._loaded[key] = loaded
+        self._pending[key] = loaded
+
+    def _finish(
+        self, key: _AssetKey, loaded: _LoadedAsset, *, wait: bool, settle: bool = True
+    ) -> None:
+        future = loaded.future
+        if future is None or (not wait and not future.done()):
+            return
+        loaded.future = None
+        self._pending.pop(key, None)
+        try:
+            value, size = future.result()
+        except Exception as exc:
+            loaded.error = exc
+            self._failures += 1
+        else:
+            loaded.value = value
+            self._account(key[0], size, loaded)
+        if not settle:
+            return
+        if loaded.refs <= 0:
+            self._settle_unreferenced(key, loaded)
+        else:
+            self._enforce_budget()
+
+    def _settle_unreferenced(self, key: _AssetKey, loaded: _LoadedAsset) -> None:
+        if loaded.error is not None:
             self._loaded.pop(key, None)
+            return
+        if self._budget is None and not loaded.prefetched:
+            self._unload(key, loaded)
+            return
+        self._retained[key] = None
+        self._retained.move_to_end(key)
+        self._enforce_budget()
+
+    def _enforce_budget(self) -> None:
+        if self._budget is None:
+            return
+        while self._bytes_total > self._budget and self._retained:
+            key, _ = self._retained.popitem(last=False)
+            loaded = self._loaded.get(key)
+            if loaded is not None:
+                self._unload(key, loaded)
+                self._evictions += 1
+
+    def _account(self, kind: str, size: int, loaded: _LoadedAsset) -> None:
+        loaded.size = max(0, int(size))
+        self._bytes_by_kind[kind] = self._bytes_by_kind.get(kind, 0) + loaded.size
+        self._bytes_total += loaded.size
+
+    def _unload(self, key: _AssetKey, loaded: _LoadedAsset) -> None:
+        self._loaded.pop(key, None)
+        self._retained.pop(key, None)
+        if loaded.error is not None:
+            return
+        kind = key[0]
+        remaining = self._bytes_by_kind.get(kind, 0) - loaded.size
+        if remaining > 0:
+            self._bytes_by_kind[kind] = remaining
+        else:
+            self._bytes_by_kind.pop(kind, None)
+        self._bytes_total -= loaded.size
+        if loaded.unloader is not None:
+            loaded.unloader(loaded.value)
+
+
+def _load_sized(entry: _KindEntry, asset_id: str) -> tuple[object, int]:
+    value = entry.loader(asset_id)
+    return value, entry.sizer(value)
+
+
+def _default_size(value: object) -> int:
+    if isinstance(value, (bytes, bytearray, memoryview, str)):
+        return len(value)
+    nbytes = getattr(value, "nbytes", None)
+    return int(nbytes) if isinstance(nbytes, int) else 0
 
 
 AssetRegistry = RuntimeAssetRegistry
@@ -1,6 +1,7 @@
 """Engine diagnostics core package."""
 
 from engine.diagnostics.adapters import emit_frame_metrics
+from engine.diagnostics.binary_log import BinaryLogWriter, iter_binary_log_records
 from engine.diagnostics.config import (
     DiagnosticsConfig,
     load_diagnostics_config,
@@ -9,10 +10,12 @@ from engine.diagnostics.config import (
 from engine.diagnostics.crash import CrashBundleWriter
 from engine.diagnostics.event import DiagnosticEvent
 from engine.diagnostics.hub import DiagnosticHub
+from engine.diagnostics.jsonl_reader import iter_jsonl_records, tail_jsonl_records
 from engine.diagnostics.metrics_store import DiagnosticsMetricsSnapshot, DiagnosticsMetricsStore
 from engine.diagnostics.profiling import DiagnosticsProfiler, ProfilingSnapshot, ProfilingSpan
 from engine.diagnostics.replay import (
     FixedStepReplayRunner,
+    ReplayBisectResult,
     ReplayCommand,
     ReplayManifest,
     ReplayRecorder,
@@ -20,20 +23,37 @@ from engine.diagnostics.replay import (
     ReplayValidationResult,
     compute_state_hash,
 )
+from engine.diagnostics.replay_stream import (
+    ReplayChunkIndex,
+    ReplayStreamReader,
+    ReplayStreamWriter,
+    load_replay_session,
+)
 from engine.diagnostics.ring_buffer import RingBuffer
+from engine.diagnostics.session_index import (
+    SessionFileIndex,
+    session_index_root,
+    shared_session_index,
+)
+from engine.diagnostics.state_hash import StateSectionHasher, hash_state_value
 from engine.diagnostics.schema import (
+    DIAG_BINARY_LOG_SCHEMA_VERSION,
+    DIAG_CHROME_TRACE_SCHEMA_VERSION,
     DIAG_EVENT_SCHEMA_VERSION,
     DIAG_METRICS_SCHEMA_VERSION,
     DIAG_PROFILING_SCHEMA_VERSION,
     DIAG_REPLAY_MANIFEST_SCHEMA_VERSION,
     DIAG_REPLAY_SESSION_SCHEMA_VERSION,
+    DIAG_REPLAY_STREAM_SCHEMA_VERSION,
     DIAG_REPLAY_VALIDATION_SCHEMA_VERSION,
     DIAG_SNAPSHOT_SCHEMA_VERSION,
     ENGINE_CRASH_BUNDLE_SCHEMA_VERSION,
 )
-from engine.diagnostics.subscribers import JsonlAsyncExporter
+from engine.diagnostics.subscribers import ChromeTraceExporter, JsonlAsyncExporter
 
 __all__ = [
+    "BinaryLogWriter",
+    "ChromeTraceExporter",
     "CrashBundleWriter",
     "DiagnosticEvent",
     "DiagnosticHub",
@@ -41,11 +61,14 @@ __all__ = [
     "DiagnosticsConfig",
     "DiagnosticsMetricsSnapshot",
     "DiagnosticsMetricsStore",
+    "DIAG_BINARY_LOG_SCHEMA_VERSION",
+    "DIAG_CHROME_TRACE_SCHEMA_VERSION",
     "DIAG_EVENT_SCHEMA_VERSION",
     "DIAG_METRICS_SCHEMA_VERSION",
     "DIAG_PROFILING_SCHEMA_VERSION",
     "DIAG_REPLAY_MANIFEST_SCHEMA_VERSION",
     "DIAG_REPLAY_SESSION_SCHEMA_VERSION",
+    "DIAG_REPLAY_STREAM_SCHEMA_VERSION",
     "DIAG_REPLAY_VALIDATION_SCHEMA_VERSION",
     "DIAG_SNAPSHOT_SCHEMA_VERSION",
     "ENGINE_CRASH_BUNDLE_SCHEMA_VERSION",
@@ -53,14 +76,27 @@ __all__ = [
     "JsonlAsyncExporter",
     "ProfilingSnapshot",
     "ProfilingSpan",
+    "ReplayBisectResult",
+    "ReplayChunkIndex",
     "ReplayCommand",
     "ReplayManifest",
     "ReplayRecorder",
+    "ReplayStreamReader",
+    "ReplayStreamWriter",
     "ReplayValidationMismatch",
     "ReplayValidationResult",
     "RingBuffer",
+    "SessionFileIndex",
+    "StateSectionHasher",
     "compute_state_hash",
+    "hash_state_value",
+    "iter_binary_log_records",
+    "iter_jsonl_records",
     "emit_frame_metrics",
     "load_diagnostics_config",
+    "load_replay_session",
     "resolve_crash_bundle_dir",
+    "session_index_root",
+    "shared_session_index",
+    "tail_jsonl_records",
 ]
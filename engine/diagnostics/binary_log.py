@@ -0,0 +1,177 @@
+"""Compact binary log format for the fast logging mode.
+
+Layout::
+
+    b"ENGLOGB1" <u32 header_len> <header JSON>
+    (<u8 tag> <entry>)*
+
+Logger names and call sites are written once as ``NAME``/``SITE`` entries and
+referenced by id from ``RECORD`` entries, which carry a monotonic tick, level,
+the formatted message, optional JSON fields and a suppressed-repeat count.
+The header stores the wall-clock and monotonic origins so readers can turn
+ticks into timestamps. A truncated tail (crashed writer) ends iteration.
+"""
+
+from __future__ import annotations
+
+import logging
+import struct
+from collections.abc import Iterator, Mapping
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from engine.diagnostics.json_codec import dumps_bytes, loads_bytes
+from engine.diagnostics.schema import DIAG_BINARY_LOG_SCHEMA_VERSION
+
+BINARY_LOG_SUFFIX = ".englog"
+_MAGIC = b"ENGLOGB1"
+_TAG_NAME = 1
+_TAG_SITE = 2
+_TAG_RECORD = 3
+_U32 = struct.Struct("<I")
+_NAME = struct.Struct("<HH")
+_SITE = struct.Struct("<IHI")
+_RECORD = struct.Struct("<QHBIII")
+
+
+class BinaryLogWriter:
+    """Append records to a binary log; not thread-safe (listener thread only)."""
+
+    def __init__(self, path: Path, *, wall_origin_ns: int, mono_origin_ns: int) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._path = path
+        self._file: BinaryIO = path.open("wb")
+        self._names: dict[str, int] = {}
+        self._sites: dict[tuple[str, int], int] = {}
+        header = dumps_bytes(
+            {
+                "schema_version": DIAG_BINARY_LOG_SCHEMA_VERSION,
+                "wall_origin_ns": int(wall_origin_ns),
+                "mono_origin_ns": int(mono_origin_ns),
+            }
+        )
+        self._file.write(_MAGIC + _U32.pack(len(header)) + header)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def write(
+        self,
+        *,
+        tick_ns: int,
+        logger: str,
+        level: int,
+        site: tuple[str, int],
+        message: str,
+        fields: Mapping[str, Any] | None = None,
+        suppressed: int = 0,
+    ) -> None:
+        write = self._file.write
+        name_id = self._names.get(logger)
+        if name_id is None:
+            name_id = len(self._names)
+            self._names[logger] = name_id
+            encoded = logger.encode("utf-8")
+            write(bytes((_TAG_NAME,)) + _NAME.pack(name_id, len(encoded)) + encoded)
+        site_id = self._sites.get(site)
+        if site_id is None:
+            site_id = len(self._sites)
+            self._sites[site] = site_id
+            encoded = site[0].encode("utf-8")
+            write(bytes((_TAG_SITE,)) + _SITE.pack(site_id, len(encoded), site[1]) + encoded)
+        body = message.encode("utf-8", "replace")
+        extra = b""
+        if fields:
+            try:
+                extra = dumps_bytes(dict(fields))
+            except TypeError:
+                extra = dumps_bytes({key: repr(value) for key, value in fields.items()})
+        write(
+            bytes((_TAG_RECORD,))
+            + _RECORD.pack(tick_ns, name_id, min(level, 255), site_id, suppressed, len(body))
+            + body
+            + _U32.pack(len(extra))
+            + extra
+        )
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+
+def iter_binary_log_records(path: Path) -> Iterator[dict[str, Any]]:
+    """Decode a binary log into rows shaped like JSON log rows."""
+    data = path.read_bytes()
+    if data[: len(_MAGIC)] != _MAGIC:
+        raise ValueError(f"not a binary log: {path}")
+    offset = len(_MAGIC)
+    (header_len,) = _U32.unpack_from(data, offset)
+    offset += _U32.size
+    header = loads_bytes(data[offset : offset + header_len])
+    offset += header_len
+    schema = header.get("schema_version") if isinstance(header, dict) else None
+    if schema != DIAG_BINARY_LOG_SCHEMA_VERSION:
+        raise ValueError(f"unsupported binary log schema: {path}")
+    wall_offset_ns = int(header["wall_origin_ns"]) - int(header["mono_origin_ns"])
+    names: dict[int, str] = {}
+    sites: dict[int, str] = {}
+    size = len(data)
+    try:
+        while offset < size:
+            tag = data[offset]
+            offset += 1
+            if tag == _TAG_NAME:
+                name_id, length = _NAME.unpack_from(data, offset)
+                offset += _NAME.size
+                names[name_id] = _text(data, offset, length)
+                offset += length
+            elif tag == _TAG_SITE:
+                site_id, length, lineno = _SITE.unpack_from(data, offset)
+                offset += _SITE.size
+                sites[site_id] = f"{_text(data, offset, length)}:{lineno}"
+                offset += length
+            elif tag == _TAG_RECORD:
+                tick_ns, name_id, level, site_id, suppressed, length = _RECORD.unpack_from(
+                    data, offset
+                )
+                offset += _RECORD.size
+                message = _text(data, offset, length)
+                offset += length
+                (fields_len,) = _U32.unpack_from(data, offset)
+                offset += _U32.size
+                if offset + fields_len > size:
+                    return
+                wall_s = (tick_ns + wall_offset_ns) / 1e9
+                row: dict[str, Any] = {
+                    "ts": datetime.fromtimestamp(wall_s, UTC).isoformat(),
+                    "tick_ns": tick_ns,
+                    "level": logging.getLevelName(level),
+                    "logger": names.get(name_id, ""),
+                    "msg": message,
+                    "site": sites.get(site_id, ""),
+                }
+                if fields_len:
+                    row["fields"] = loads_bytes(data[offset : offset + fields_len])
+                    offset += fields_len
+                if suppressed:
+                    row["suppressed"] = suppressed
+                yield row
+            else:
+                raise ValueError(f"corrupt binary log entry at offset {offset - 1}: {path}")
+    except struct.error:
+        # Truncated final entry.
+        return
+
+
+def _text(data: bytes, offset: int, length: int) -> str:
+    if offset + length > len(data):
+        raise struct.error("truncated text")
+    return data[offset : offset + length].decode("utf-8", "replace")
+
+
+__all__ = ["BINARY_LOG_SUFFIX", "BinaryLogWriter", "iter_binary_log_records"]
@@ -44,9 +44,13 @@ class DiagnosticsConfig:
     profile_sampling_n: int = 1
     profile_span_capacity: int = 5_000
     profile_export_dir: str = "appdata/profiling"
+    trace_export: bool = False
     replay_capture: bool = False
     replay_export_dir: str = "appdata/replay"
     replay_hash_interval: int = 60
+    replay_checkpoint_interval: int = 0
+    replay_format: str = "json"
+    replay_chunk_ticks: int = 600
     event_default_sampling_n: int = 1
     event_category_sampling: dict[str, int] = field(default_factory=dict)
     event_category_allowlist: tuple[str, ...] = ()
@@ -73,9 +77,15 @@ def load_diagnostics_config() -> DiagnosticsConfig:
         profile_sampling_n=max(1, _int("ENGINE_DIAGNOSTICS_PROFILING_SAMPLING_N", profile.diagnostics_profile_sampling_n)),
         profile_span_capacity=max(100, _int("ENGINE_DIAGNOSTICS_PROFILING_SPAN_CAP", 5_000)),
         profile_export_dir=_str("ENGINE_DIAGNOSTICS_PROFILING_EXPORT_DIR", "appdata/profiling"),
+        trace_export=_flag("ENGINE_DIAGNOSTICS_TRACE_ENABLED", False),
         replay_capture=_flag("ENGINE_DIAGNOSTICS_REPLAY_ENABLED", False),
         replay_export_dir=_str("ENGINE_DIAGNOSTICS_REPLAY_EXPORT_DIR", "appdata/replay"),
         replay_hash_interval=max(1, _int("ENGINE_DIAGNOSTICS_REPLAY_HASH_INTERVAL", 60)),
+        replay_checkpoint_interval=max(
+            0, _int("ENGINE_DIAGNOSTICS_REPLAY_CHECKPOINT_INTERVAL", 0)
+        ),
+        replay_format=_replay_format(_str("ENGINE_DIAGNOSTICS_REPLAY_FORMAT", "json")),
+        replay_chunk_ticks=max(1, _int("ENGINE_DIAGNOSTICS_REPLAY_CHUNK_TICKS", 600)),
         event_default_sampling_n=max(1, _int("ENGINE_DIAGNOSTICS_DEFAULT_SAMPLING_N", profile.diagnostics_default_sampling_n)),
         event_category_sampling=category_sampling,
         event_category_allowlist=category_allowlist,
@@ -86,6 +96,11 @@ def resolve_crash_bundle_dir(config: DiagnosticsConfig) -> Path:
     return Path(config.crash_bundle_dir)
 
 
+def _replay_format(raw: str) -> str:
+    value = raw.strip().lower()
+    return value if value in {"json", "stream"} else "json"
+
+
 def _parse_category_sampling(raw: str) -> dict[str, int]:
     out: dict[str, int] = {}
     for part in raw.split(","):
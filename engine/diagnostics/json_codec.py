@@ -64,4 +64,16 @@ def dumps_text(
     ).decode("utf-8")
 
 
-__all__ = ["dumps_bytes", "dumps_text"]
+def loads_bytes(data: bytes | bytearray | memoryview | str) -> Any:
+    """Parse one JSON document, using orjson when available.
+
+    Raises ``ValueError`` (both backends' decode errors subclass it) on bad input.
+    """
+    if _ORJSON is not None:
+        return _ORJSON.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+__all__ = ["dumps_bytes", "dumps_text", "loads_bytes"]
@@ -0,0 +1,203 @@
+"""Streaming JSONL reader for large diagnostics logs.
+
+Files are memory-mapped and scanned line by line, so peak memory is the parsed
+rows a caller keeps rather than the whole file text. Optional field-prefix
+filters reject lines with a byte search before any JSON parsing, and
+``tail_jsonl_records`` scans backwards from the end for "last N" views.
+"""
+
+from __future__ import annotations
+
+import mmap
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from engine.diagnostics.json_codec import loads_bytes
+
+type FieldPrefixes = Mapping[str, str | Sequence[str]]
+
+# Scanned pages are dropped from the mapping every window so a full pass over a
+# multi-GB log does not keep the whole file resident.
+_RELEASE_WINDOW = 64 * 1024 * 1024
+
+
+class _LinePrefilter:
+    """Byte-level pre-check for ``"field": "prefix...`` followed by an exact check."""
+
+    def __init__(self, field_prefixes: FieldPrefixes) -> None:
+        self._fields: list[tuple[str, tuple[str, ...], tuple[bytes, ...]]] = []
+        for field_name, raw in field_prefixes.items():
+            prefixes = (raw,) if isinstance(raw, str) else tuple(raw)
+            needles: tuple[bytes, ...] = ()
+            # Prefixes JSON may escape (non-ASCII, quotes, backslashes) skip the byte check.
+            if all(_plain_ascii(text) for text in (field_name, *prefixes)):
+                needles = tuple(
+                    f'"{field_name}"{separator}"{prefix}'.encode("ascii")
+                    for prefix in prefixes
+                    for separator in (":", ": ")
+                )
+            self._fields.append((field_name, prefixes, needles))
+
+    def seeker(self) -> _NeedleSeeker | None:
+        """Seek over the buffer for the first byte-checkable field, if any."""
+        for _field_name, _prefixes, needles in self._fields:
+            if needles:
+                return _NeedleSeeker(needles)
+        return None
+
+    def may_match(self, buffer: mmap.mmap, start: int, end: int) -> bool:
+        for _field_name, _prefixes, needles in self._fields:
+            if needles and not any(buffer.find(needle, start, end) >= 0 for needle in needles):
+                return False
+        return True
+
+    def matches(self, row: dict[str, Any]) -> bool:
+        for field_name, prefixes, _needles in self._fields:
+            value = row.get(field_name)
+            if not isinstance(value, str) or not value.startswith(prefixes):
+                return False
+        return True
+
+
+class _NeedleSeeker:
+    """Find the next needle hit window by window, remembering hits and scanned spans."""
+
+    def __init__(self, needles: tuple[bytes, ...]) -> None:
+        self._needles = needles
+        self._hits = [-1] * len(needles)
+        self._scanned = [0] * len(needles)
+
+    def next_hit(self, buffer: mmap.mmap, start: int) -> int:
+        size = len(buffer)
+        while start < size:
+            # Bounded searches keep a needle that never occurs from paging in the whole file.
+            stop = min(size, start + _RELEASE_WINDOW)
+            best = -1
+            for index, needle in enumerate(self._needles):
+                hit = self._hits[index]
+                if hit < start:
+                    low = max(start, self._scanned[index])
+                    hit = -1
+                    if low < stop:
+                        hit = buffer.find(needle, low, min(size, stop + len(needle) - 1))
+                        self._scanned[index] = stop if hit < 0 else hit
+                    self._hits[index] = hit
+                if 0 <= hit < stop and (best < 0 or hit < best):
+                    best = hit
+            if best >= 0:
+                return best
+            start = stop
+        return -1
+
+
+def _plain_ascii(text: str) -> bool:
+    return text.isascii() and text.isprintable() and '"' not in text and "\\" not in text
+
+
+def iter_jsonl_records(
+    path: Path, *, field_prefixes: FieldPrefixes | None = None
+) -> Iterator[dict[str, Any]]:
+    """Yield JSON-object lines from ``path`` lazily; malformed lines are skipped.
+
+    ``field_prefixes`` keeps only rows whose string fields start with one of the
+    given prefixes, e.g. ``{"logger": ("engine.rendering", "engine.input")}``.
+    Byte-checkable filters jump between needle hits instead of visiting every line.
+    """
+    prefilter = _LinePrefilter(field_prefixes) if field_prefixes else None
+    seeker = prefilter.seeker() if prefilter is not None else None
+    with _mapped(path) as buffer:
+        if buffer is None:
+            return
+        size = len(buffer)
+        _advise(buffer, "MADV_SEQUENTIAL", 0, size)
+        released = 0
+        start = 0
+        while start < size:
+            if seeker is not None:
+                hit = seeker.next_hit(buffer, start)
+                if hit < 0:
+                    return
+                start = buffer.rfind(b"\n", start, hit) + 1 or start
+            end = buffer.find(b"\n", start)
+            if end < 0:
+                end = size
+            row = _parse_line(buffer, start, end, prefilter)
+            if row is not None:
+                yield row
+            start = end + 1
+            if start - released >= _RELEASE_WINDOW:
+                release_to = start - start % mmap.PAGESIZE
+                _advise(buffer, "MADV_DONTNEED", released, release_to - released)
+                released = release_to
+
+
+def tail_jsonl_records(
+    path: Path, count: int, *, field_prefixes: FieldPrefixes | None = None
+) -> list[dict[str, Any]]:
+    """Return the last ``count`` matching rows in file order, scanning from the end."""
+    wanted = max(0, int(count))
+    prefilter = _LinePrefilter(field_prefixes) if field_prefixes else None
+    rows: list[dict[str, Any]] = []
+    with _mapped(path) as buffer:
+        if buffer is None or wanted == 0:
+            return rows
+        end = len(buffer)
+        while end > 0 and len(rows) < wanted:
+            start = buffer.rfind(b"\n", 0, end) + 1
+            row = _parse_line(buffer, start, end, prefilter)
+            if row is not None:
+                rows.append(row)
+            end = start - 1
+    rows.reverse()
+    return rows
+
+
+def _parse_line(
+    buffer: mmap.mmap, start: int, end: int, prefilter: _LinePrefilter | None
+) -> dict[str, Any] | None:
+    if end - start < 2:
+        return None
+    if prefilter is not None and not prefilter.may_match(buffer, start, end):
+        return None
+    try:
+        row = loads_bytes(buffer[start:end])
+    except ValueError:
+        return None
+    if not isinstance(row, dict):
+        return None
+    if prefilter is not None and not prefilter.matches(row):
+        return None
+    return row
+
+
+def _advise(buffer: mmap.mmap, name: str, start: int, length: int) -> None:
+    option = getattr(mmap, name, None)
+    if option is None or length <= 0:
+        return
+    try:
+        buffer.madvise(option, start, length)
+    except (OSError, ValueError):
+        pass
+
+
+@contextmanager
+def _mapped(path: Path) -> Iterator[mmap.mmap | None]:
+    try:
+        handle = path.open("rb")
+    except OSError:
+        yield None
+        return
+    with handle:
+        try:
+            buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped.
+            yield None
+            return
+        with buffer:
+            yield buffer
+
+
+__all__ = ["FieldPrefixes", "iter_jsonl_records", "tail_jsonl_records"]
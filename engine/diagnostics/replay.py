@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import copy
 import hashlib
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from engine.diagnostics.hub import DiagnosticHub
 from engine.diagnostics.json_codec import dumps_text
+from engine.diagnostics.replay_stream import ReplayStreamWriter
 from engine.diagnostics.schema import (
     DIAG_REPLAY_MANIFEST_SCHEMA_VERSION,
     DIAG_REPLAY_SESSION_SCHEMA_VERSION,
@@ -49,8 +52,31 @@ class ReplayValidationResult:
     mismatches: list[ReplayValidationMismatch]
 
 
+@dataclass(frozen=True, slots=True)
+class ReplayBisectResult:
+    """First persistent divergence located by checkpoint bisection.
+
+    The divergence happened in ``(last_good_tick, first_divergent_tick]``.
+    """
+
+    diverged: bool
+    first_divergent_tick: int | None
+    last_good_tick: int | None
+    resumed_from_tick: int | None
+    expected_hash: str | None
+    actual_hash: str | None
+    segments_replayed: int
+    ticks_replayed: int
+    state_checkpoint_count: int
+
+
 class ReplayRecorder:
-    """Capture tick-indexed command stream and deterministic metadata."""
+    """Capture tick-indexed command stream and deterministic metadata.
+
+    By default everything is kept in memory for ``snapshot``/``export_json``.
+    After ``open_stream`` the full capture is written as compressed chunks to a
+    replay stream file and memory only holds a bounded tail for live views.
+    """
 
     def __init__(
         self,
@@ -59,26 +85,92 @@ class ReplayRecorder:
         seed: int | None,
         build: dict[str, Any] | None = None,
         hash_interval: int = 60,
+        checkpoint_interval: int = 0,
         hub: DiagnosticHub | None = None,
     ) -> None:
         self._enabled = bool(enabled)
         self._seed = seed
         self._build = dict(build or {})
         self._hash_interval = max(1, int(hash_interval))
+        self._checkpoint_interval = max(0, int(checkpoint_interval))
         self._hub = hub
         self._commands: list[ReplayCommand] = []
-        self._frame_ticks: list[int] = []
+        self._command_count = 0
+        self._first_tick: int | None = None
+        self._last_tick: int | None = None
         self._state_hashes: list[dict[str, Any]] = []
+        self._state_checkpoints: list[dict[str, Any]] = []
+        self._stream: ReplayStreamWriter | None = None
+        self._stream_chunk_ticks = 0
+        self._stream_tail_limit = 0
+        self._chunk_first_tick: int | None = None
+        self._chunk_commands: list[dict[str, Any]] = []
+        self._chunk_state_hashes: list[dict[str, Any]] = []
+        self._chunk_state_checkpoints: list[dict[str, Any]] = []
 
     @property
     def enabled(self) -> bool:
         return self._enabled
 
+    @property
+    def streaming(self) -> bool:
+        return self._stream is not None
+
+    def open_stream(self, *, path: Path, chunk_ticks: int = 600, tail_limit: int = 5_000) -> None:
+        """Start writing the capture to a chunked replay stream at ``path``."""
+        if not self._enabled or self._stream is not None:
+            return
+        self._stream = ReplayStreamWriter(
+            path,
+            header={"replay_version": 1, "seed": self._seed, "build": dict(self._build)},
+        )
+        self._stream_chunk_ticks = max(1, int(chunk_ticks))
+        self._stream_tail_limit = max(1, int(tail_limit))
+
+    def close_stream(self) -> Path | None:
+        """Flush the pending chunk, write the footer index and return the stream path."""
+        stream = self._stream
+        if stream is None:
+            return None
+        self._flush_chunk()
+        manifest = self.manifest()
+        self._stream = None
+        return stream.close(
+            manifest={
+                "schema_version": manifest.schema_version,
+                "replay_version": manifest.replay_version,
+                "seed": manifest.seed,
+                "build": manifest.build,
+                "command_count": manifest.command_count,
+                "first_tick": manifest.first_tick,
+                "last_tick": manifest.last_tick,
+            }
+        )
+
+    def wants_state_hash(self, tick: int) -> bool:
+        """Return whether ``mark_frame`` records a state hash mark for ``tick``."""
+        return self._enabled and int(tick) % self._hash_interval == 0
+
+    def wants_checkpoint(self, tick: int) -> bool:
+        """Return whether a state checkpoint should be captured after ``tick``."""
+        return (
+            self._enabled
+            and self._checkpoint_interval > 0
+            and int(tick) % self._checkpoint_interval == 0
+        )
+
     def record_command(self, *, tick: int, command_type: str, payload: dict[str, Any]) -> None:
         if not self._enabled:
             return
         cmd = ReplayCommand(tick=int(tick), command_type=command_type, payload=dict(payload))
         self._commands.append(cmd)
+        self._command_count += 1
+        if self._stream is not None:
+            self._chunk_commands.append(
+                {"tick": cmd.tick, "type": cmd.command_type, "payload": cmd.payload}
+            )
+            if self._chunk_first_tick is None:
+                self._chunk_first_tick = cmd.tick
         if self._hub is not None:
             self._hub.emit_fast(
                 category="replay",
@@ -88,15 +180,39 @@ class ReplayRecorder:
                 metadata={"payload": dict(cmd.payload)},
             )
 
-    def mark_frame(self, *, tick: int, state_hash: str | None = None) -> None:
+    def mark_frame(
+        self,
+        *,
+        tick: int,
+        state_hash: str | None = None,
+        checkpoint: Any = None,
+    ) -> None:
         if not self._enabled:
             return
         tick_i = int(tick)
-        self._frame_ticks.append(tick_i)
+        if self._first_tick is None or tick_i < self._first_tick:
+            self._first_tick = tick_i
+        if self._last_tick is None or tick_i > self._last_tick:
+            self._last_tick = tick_i
+        if checkpoint is not None and self.wants_checkpoint(tick_i):
+            # Copy now so later changes to live state cannot rewrite the recording.
+            checkpoint_entry = {"tick": tick_i, "state": copy.deepcopy(checkpoint)}
+            self._state_checkpoints.append(checkpoint_entry)
+            if self._stream is not None:
+                self._chunk_state_checkpoints.append(checkpoint_entry)
+            if self._hub is not None:
+                self._hub.emit_fast(
+                    category="replay",
+                    name="replay.state_checkpoint",
+                    tick=tick_i,
+                    value=len(self._state_checkpoints),
+                )
         if state_hash is not None and tick_i % self._hash_interval == 0:
             hash_value = compute_state_hash(state_hash)
             hash_entry = {"tick": tick_i, "hash": hash_value}
             self._state_hashes.append(hash_entry)
+            if self._stream is not None:
+                self._chunk_state_hashes.append(hash_entry)
             if self._hub is not None:
                 self._hub.emit_fast(
                     category="replay",
@@ -104,22 +220,21 @@ class ReplayRecorder:
                     tick=tick_i,
                     value=hash_value,
                 )
+        if self._stream is not None:
+            if self._chunk_first_tick is None:
+                self._chunk_first_tick = tick_i
+            if tick_i - self._chunk_first_tick + 1 >= self._stream_chunk_ticks:
+                self._flush_chunk(last_tick=tick_i)
 
     def manifest(self) -> ReplayManifest:
-        if self._frame_ticks:
-            first_tick = min(self._frame_ticks)
-            last_tick = max(self._frame_ticks)
-        else:
-            first_tick = 0
-            last_tick = 0
         return ReplayManifest(
             schema_version=DIAG_REPLAY_MANIFEST_SCHEMA_VERSION,
             replay_version=1,
             seed=self._seed,
             build=dict(self._build),
-            command_count=len(self._commands),
-            first_tick=first_tick,
-            last_tick=last_tick,
+            command_count=self._command_count,
+            first_tick=self._first_tick if self._first_tick is not None else 0,
+            last_tick=self._last_tick if self._last_tick is not None else 0,
         )
 
     def snapshot(self, *, limit: int = 5_000) -> dict[str, Any]:
@@ -141,8 +256,37 @@ class ReplayRecorder:
                 for c in commands
             ],
             "state_hashes": list(self._state_hashes),
+            "state_checkpoints": list(self._state_checkpoints),
         }
 
+    def _flush_chunk(self, *, last_tick: int | None = None) -> None:
+        stream = self._stream
+        first_tick = self._chunk_first_tick
+        if stream is None or first_tick is None:
+            return
+        if last_tick is None:
+            last_tick = max(
+                [first_tick, self._last_tick if self._last_tick is not None else first_tick]
+                + [int(item["tick"]) for item in self._chunk_commands]
+            )
+        stream.submit(
+            {
+                "first_tick": first_tick,
+                "last_tick": last_tick,
+                "commands": self._chunk_commands,
+                "state_hashes": self._chunk_state_hashes,
+                "state_checkpoints": self._chunk_state_checkpoints,
+            }
+        )
+        self._chunk_first_tick = None
+        self._chunk_commands = []
+        self._chunk_state_hashes = []
+        self._chunk_state_checkpoints = []
+        tail = self._stream_tail_limit
+        for rows in (self._commands, self._state_hashes, self._state_checkpoints):
+            if len(rows) > tail:
+                del rows[:-tail]
+
     def export_json(self, *, path: Path, limit: int = 5_000) -> Path:
         payload = self.snapshot(limit=limit)
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -164,15 +308,136 @@ class FixedStepReplayRunner:
         *,
         apply_command: Any,
         step: Any,
+        restore: Callable[[Any], None] | None = None,
+        resume_tick: int | None = None,
     ) -> ReplayValidationResult:
+        """Replay ``session`` from its first tick, or from a recorded state checkpoint.
+
+        With ``resume_tick`` the simulation is seeded through ``restore`` with the
+        state checkpoint captured after that tick and replay continues from the
+        next tick, so only the remaining hash marks are validated.
+        """
+        replay = _ParsedReplay.from_session(session)
+        start_tick = replay.first_tick
+        if resume_tick is not None:
+            if restore is None:
+                raise ValueError("resume_tick requires a restore callback")
+            state = replay.state_checkpoints.get(int(resume_tick))
+            if state is None:
+                raise ValueError(f"no state checkpoint recorded at tick {resume_tick}")
+            restore(copy.deepcopy(state))
+            start_tick = int(resume_tick) + 1
+        segment = _replay_ticks(
+            replay,
+            start_tick=start_tick,
+            end_tick=replay.last_tick,
+            apply_command=apply_command,
+            step=step,
+            fixed_step_seconds=self._fixed_step_seconds,
+            stop_on_mismatch=False,
+        )
+        return ReplayValidationResult(
+            passed=not segment.mismatches,
+            total_ticks=segment.ticks,
+            commands_applied=segment.commands_applied,
+            checkpoint_count=(
+                len(replay.expected)
+                if resume_tick is None
+                else sum(1 for tick in replay.expected if start_tick <= tick <= replay.last_tick)
+            ),
+            mismatches=segment.mismatches,
+        )
+
+    def bisect(
+        self,
+        session: dict[str, Any],
+        *,
+        apply_command: Any,
+        step: Any,
+        restore: Callable[[Any], None],
+    ) -> ReplayBisectResult:
+        """Locate the first diverging hash mark and the checkpoint that reproduces it.
+
+        The replay runs forward from its first tick, one state-checkpoint segment
+        at a time, and stops at the first mismatching mark, so a divergence that
+        heals before the end is still found. Only that segment is then replayed
+        again, resumed through ``restore`` from its own checkpoint. When the
+        mismatch reproduces there, ``resumed_from_tick`` names the checkpoint to
+        debug from; otherwise the divergence depends on earlier state and it is
+        ``None``.
+        """
+        replay = _ParsedReplay.from_session(session)
+        segments_replayed = 0
+        ticks_replayed = 0
+        last_good: int | None = None
+
+        def replay_segment(start_tick: int, end_tick: int) -> _SegmentReplay:
+            nonlocal segments_replayed, ticks_replayed
+            outcome = _replay_ticks(
+                replay,
+                start_tick=start_tick,
+                end_tick=end_tick,
+                apply_command=apply_command,
+                step=step,
+                fixed_step_seconds=self._fixed_step_seconds,
+                stop_on_mismatch=True,
+            )
+            segments_replayed += 1
+            ticks_replayed += outcome.ticks
+            return outcome
+
+        def result(
+            mismatch: ReplayValidationMismatch | None, resumed_from: int | None
+        ) -> ReplayBisectResult:
+            return ReplayBisectResult(
+                diverged=mismatch is not None,
+                first_divergent_tick=mismatch.tick if mismatch is not None else None,
+                last_good_tick=last_good if mismatch is not None else None,
+                resumed_from_tick=resumed_from,
+                expected_hash=mismatch.expected_hash if mismatch is not None else None,
+                actual_hash=mismatch.actual_hash if mismatch is not None else None,
+                segments_replayed=segments_replayed,
+                ticks_replayed=ticks_replayed,
+                state_checkpoint_count=len(replay.state_checkpoints),
+            )
+
+        for resume_from, start_tick, end_tick in replay.segments():
+            outcome = replay_segment(start_tick, end_tick)
+            if outcome.last_good_tick is not None:
+                last_good = outcome.last_good_tick
+            if not outcome.mismatches:
+                continue
+            mismatch = outcome.mismatches[0]
+            if resume_from is None:
+                return result(mismatch, None)
+            restore(copy.deepcopy(replay.state_checkpoints[resume_from]))
+            confirm = replay_segment(start_tick, end_tick)
+            if not confirm.mismatches or confirm.mismatches[0].tick != mismatch.tick:
+                return result(mismatch, None)
+            if last_good is None or last_good < resume_from:
+                last_good = resume_from
+            return result(mismatch, resume_from)
+        return result(None, None)
+
+
+@dataclass(frozen=True, slots=True)
+class _ParsedReplay:
+    first_tick: int
+    last_tick: int
+    by_tick: dict[int, list[ReplayCommand]]
+    expected: dict[int, str]
+    state_checkpoints: dict[int, Any]
+
+    @classmethod
+    def from_session(cls, session: dict[str, Any]) -> _ParsedReplay:
         manifest = session.get("manifest", {})
         first_tick = int(manifest.get("first_tick", 0))
         last_tick = int(manifest.get("last_tick", first_tick))
-        commands_raw = session.get("commands", [])
-        checkpoints_raw = session.get("state_hashes", [])
+        if last_tick < first_tick:
+            first_tick, last_tick = last_tick, first_tick
 
         by_tick: dict[int, list[ReplayCommand]] = {}
-        for item in commands_raw:
+        for item in session.get("commands", []):
             if not isinstance(item, dict):
                 continue
             tick = int(item.get("tick", 0))
@@ -184,7 +449,7 @@ class FixedStepReplayRunner:
             by_tick.setdefault(tick, []).append(cmd)
 
         expected: dict[int, str] = {}
-        for item in checkpoints_raw:
+        for item in session.get("state_hashes", []):
             if not isinstance(item, dict):
                 continue
             tick = int(item.get("tick", 0))
@@ -192,36 +457,88 @@ class FixedStepReplayRunner:
             if value:
                 expected[tick] = value
 
-        mismatches: list[ReplayValidationMismatch] = []
-        commands_applied = 0
-        if last_tick < first_tick:
-            first_tick, last_tick = last_tick, first_tick
-        for tick in range(first_tick, last_tick + 1):
-            for command in by_tick.get(tick, ()):
-                apply_command(command)
-                commands_applied += 1
-            state = step(self._fixed_step_seconds)
-            if tick not in expected:
+        state_checkpoints: dict[int, Any] = {}
+        for item in session.get("state_checkpoints", []) or []:
+            if not isinstance(item, dict) or item.get("state") is None:
                 continue
-            actual_hash = compute_state_hash(state)
-            expected_hash = expected[tick]
-            if actual_hash != expected_hash:
-                mismatches.append(
-                    ReplayValidationMismatch(
-                        tick=tick,
-                        expected_hash=expected_hash,
-                        actual_hash=actual_hash,
-                    )
-                )
+            tick = int(item.get("tick", 0))
+            if first_tick <= tick < last_tick:
+                state_checkpoints[tick] = item["state"]
+        return cls(
+            first_tick=first_tick,
+            last_tick=last_tick,
+            by_tick=by_tick,
+            expected=expected,
+            state_checkpoints=state_checkpoints,
+        )
 
-        total_ticks = max(0, last_tick - first_tick + 1)
-        return ReplayValidationResult(
-            passed=not mismatches,
-            total_ticks=total_ticks,
-            commands_applied=commands_applied,
-            checkpoint_count=len(expected),
-            mismatches=mismatches,
+    def segments(self) -> list[tuple[int | None, int, int]]:
+        """Return ``(resume_checkpoint, start_tick, end_tick)`` spans covering the replay."""
+        spans: list[tuple[int | None, int, int]] = []
+        resume_from: int | None = None
+        start_tick = self.first_tick
+        for tick in sorted(self.state_checkpoints):
+            if tick >= start_tick:
+                spans.append((resume_from, start_tick, tick))
+            resume_from, start_tick = tick, tick + 1
+        if start_tick <= self.last_tick:
+            spans.append((resume_from, start_tick, self.last_tick))
+        return spans
+
+
+@dataclass(frozen=True, slots=True)
+class _SegmentReplay:
+    ticks: int
+    commands_applied: int
+    mismatches: list[ReplayValidationMismatch]
+    last_good_tick: int | None
+
+
+def _replay_ticks(
+    replay: _ParsedReplay,
+    *,
+    start_tick: int,
+    end_tick: int,
+    apply_command: Any,
+    step: Any,
+    fixed_step_seconds: float,
+    stop_on_mismatch: bool,
+) -> _SegmentReplay:
+    by_tick = replay.by_tick
+    expected = replay.expected
+    mismatches: list[ReplayValidationMismatch] = []
+    commands_applied = 0
+    last_good_tick: int | None = None
+    ticks = 0
+    for tick in range(start_tick, end_tick + 1):
+        for command in by_tick.get(tick, ()):
+            apply_command(command)
+            commands_applied += 1
+        state = step(fixed_step_seconds)
+        ticks += 1
+        if tick not in expected:
+            continue
+        actual_hash = compute_state_hash(state)
+        expected_hash = expected[tick]
+        if actual_hash == expected_hash:
+            if not mismatches:
+                last_good_tick = tick
+            continue
+        mismatches.append(
+            ReplayValidationMismatch(
+                tick=tick,
+                expected_hash=expected_hash,
+                actual_hash=actual_hash,
+            )
         )
+        if stop_on_mismatch:
+            break
+    return _SegmentReplay(
+        ticks=ticks,
+        commands_applied=commands_applied,
+        mismatches=mismatches,
+        last_good_tick=last_good_tick,
+    )
 
 
 def compute_state_hash(value: Any) -> str:
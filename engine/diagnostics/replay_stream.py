@@ -0,0 +1,351 @@
+"""Append-only chunked replay stream format.
+
+Layout::
+
+    b"RPLYSTR1" <u32 header_len> <header JSON>
+    (<u32 chunk_len> <u32 crc32> <zlib JSON chunk>)*
+    <zlib JSON footer> <u64 footer_offset> <u32 footer_len> b"RPLYEND1"
+
+Each chunk holds the commands, state-hash marks and state checkpoints of a
+contiguous tick range. The footer indexes chunk ticks to file offsets so
+readers can seek straight to a tick range; files without a footer (crashed
+writers) are recovered by scanning the length-prefixed chunks.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import struct
+import threading
+import zlib
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from engine.diagnostics.json_codec import dumps_bytes
+from engine.diagnostics.schema import (
+    DIAG_REPLAY_MANIFEST_SCHEMA_VERSION,
+    DIAG_REPLAY_SESSION_SCHEMA_VERSION,
+    DIAG_REPLAY_STREAM_SCHEMA_VERSION,
+)
+
+_LOG = logging.getLogger("engine.diagnostics.replay_stream")
+
+REPLAY_STREAM_SUFFIX = ".replay"
+_MAGIC = b"RPLYSTR1"
+_END_MAGIC = b"RPLYEND1"
+_LEN = struct.Struct("<I")
+_CHUNK_PREFIX = struct.Struct("<II")
+_TRAILER = struct.Struct("<QI8s")
+_CHUNK_CACHE_MAX = 8
+_COMPRESS_LEVEL = 6
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayChunkIndex:
+    """Footer index entry for one chunk."""
+
+    first_tick: int
+    last_tick: int
+    offset: int
+    length: int
+    command_count: int
+    state_hash_count: int
+
+
+class ReplayStreamWriter:
+    """Write replay chunks from a background thread."""
+
+    def __init__(self, path: Path, *, header: dict[str, Any]) -> None:
+        self._path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: BinaryIO = path.open("wb")
+        header_bytes = dumps_bytes(
+            {"schema_version": DIAG_REPLAY_STREAM_SCHEMA_VERSION, **header}, sort_keys=True
+        )
+        self._file.write(_MAGIC + _LEN.pack(len(header_bytes)) + header_bytes)
+        self._index: list[ReplayChunkIndex] = []
+        self._queue: queue.Queue[dict[str, Any] | None] = queue.Queue()
+        self._closed = False
+        self._failed = False
+        self._thread = threading.Thread(
+            target=self._run, name="engine-replay-stream", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def submit(self, chunk: dict[str, Any]) -> None:
+        """Queue one chunk payload; serialization and I/O happen off-thread."""
+        if self._closed:
+            raise RuntimeError("replay stream writer is closed")
+        self._queue.put(chunk)
+
+    def close(self, *, manifest: dict[str, Any]) -> Path:
+        """Flush queued chunks, write the footer index and close the file."""
+        if self._closed:
+            return self._path
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        footer = zlib.compress(
+            dumps_bytes(
+                {
+                    "manifest": manifest,
+                    "chunks": [
+                        [
+                            item.first_tick,
+                            item.last_tick,
+                            item.offset,
+                            item.length,
+                            item.command_count,
+                            item.state_hash_count,
+                        ]
+                        for item in self._index
+                    ],
+                }
+            ),
+            _COMPRESS_LEVEL,
+        )
+        footer_offset = self._file.tell()
+        self._file.write(footer)
+        self._file.write(_TRAILER.pack(footer_offset, len(footer), _END_MAGIC))
+        self._file.close()
+        return self._path
+
+    def _run(self) -> None:
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                return
+            if self._failed:
+                continue
+            try:
+                self._write_chunk(chunk)
+            except OSError:
+                self._failed = True
+                _LOG.exception("replay_stream_write_failed path=%s", self._path)
+
+    def _write_chunk(self, chunk: dict[str, Any]) -> None:
+        data = zlib.compress(dumps_bytes(chunk), _COMPRESS_LEVEL)
+        offset = self._file.tell()
+        self._file.write(_CHUNK_PREFIX.pack(len(data), zlib.crc32(data)))
+        self._file.write(data)
+        self._file.flush()
+        self._index.append(
+            ReplayChunkIndex(
+                first_tick=int(chunk["first_tick"]),
+                last_tick=int(chunk["last_tick"]),
+                offset=offset,
+                length=len(data),
+                command_count=len(chunk.get("commands", ())),
+                state_hash_count=len(chunk.get("state_hashes", ())),
+            )
+        )
+
+
+class ReplayStreamReader:
+    """Random-access reader; chunks are only decompressed when requested."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._file: BinaryIO = path.open("rb")
+        magic = self._file.read(len(_MAGIC))
+        if magic != _MAGIC:
+            self._file.close()
+            raise ValueError(f"not a replay stream: {path}")
+        (header_len,) = _LEN.unpack(self._file.read(_LEN.size))
+        self._header: dict[str, Any] = json.loads(self._file.read(header_len))
+        self._data_start = self._file.tell()
+        self._chunk_cache: OrderedDict[int, dict[str, Any]] = OrderedDict()
+        footer = self._read_footer()
+        self._complete = footer is not None
+        if footer is None:
+            self._chunks = self._scan_chunks()
+            self._manifest = self._recovered_manifest()
+        else:
+            self._manifest = dict(footer.get("manifest", {}) or {})
+            self._chunks = [ReplayChunkIndex(*map(int, row)) for row in footer.get("chunks", [])]
+        self._first_ticks = [item.first_tick for item in self._chunks]
+        self._last_ticks = [item.last_tick for item in self._chunks]
+
+    def __enter__(self) -> ReplayStreamReader:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def header(self) -> dict[str, Any]:
+        return dict(self._header)
+
+    @property
+    def manifest(self) -> dict[str, Any]:
+        return dict(self._manifest)
+
+    @property
+    def complete(self) -> bool:
+        """False when the footer was missing and the index was rebuilt by scanning."""
+        return self._complete
+
+    @property
+    def chunks(self) -> tuple[ReplayChunkIndex, ...]:
+        return tuple(self._chunks)
+
+    @property
+    def command_count(self) -> int:
+        return sum(item.command_count for item in self._chunks)
+
+    @property
+    def state_hash_count(self) -> int:
+        return sum(item.state_hash_count for item in self._chunks)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def read_chunk(self, index: int) -> dict[str, Any]:
+        cached = self._chunk_cache.get(index)
+        if cached is not None:
+            self._chunk_cache.move_to_end(index)
+            return cached
+        entry = self._chunks[index]
+        self._file.seek(entry.offset + _CHUNK_PREFIX.size)
+        chunk = json.loads(zlib.decompress(self._file.read(entry.length)))
+        self._chunk_cache[index] = chunk
+        while len(self._chunk_cache) > _CHUNK_CACHE_MAX:
+            self._chunk_cache.popitem(last=False)
+        return chunk
+
+    def chunk_range(self, start_tick: int, end_tick: int) -> range:
+        """Indices of chunks overlapping ``[start_tick, end_tick]``."""
+        first = bisect_left(self._last_ticks, int(start_tick))
+        last = bisect_right(self._first_ticks, int(end_tick))
+        return range(first, max(first, last))
+
+    def read_range(self, start_tick: int, end_tick: int) -> dict[str, list[dict[str, Any]]]:
+        """Return commands, hash marks and checkpoints with ticks in the range."""
+        out: dict[str, list[dict[str, Any]]] = {
+            "commands": [],
+            "state_hashes": [],
+            "state_checkpoints": [],
+        }
+        lo = int(start_tick)
+        hi = int(end_tick)
+        for index in self.chunk_range(lo, hi):
+            chunk = self.read_chunk(index)
+            for key, rows in out.items():
+                rows.extend(
+                    item for item in chunk.get(key, ()) if lo <= int(item.get("tick", 0)) <= hi
+                )
+        return out
+
+    def iter_chunks(self) -> Iterator[dict[str, Any]]:
+        for index in range(len(self._chunks)):
+            yield self.read_chunk(index)
+
+    def to_session(self) -> dict[str, Any]:
+        """Materialize the whole stream as a ``diag.replay_session`` payload."""
+        commands: list[dict[str, Any]] = []
+        state_hashes: list[dict[str, Any]] = []
+        state_checkpoints: list[dict[str, Any]] = []
+        for chunk in self.iter_chunks():
+            commands.extend(chunk.get("commands", ()))
+            state_hashes.extend(chunk.get("state_hashes", ()))
+            state_checkpoints.extend(chunk.get("state_checkpoints", ()))
+        return {
+            "schema_version": DIAG_REPLAY_SESSION_SCHEMA_VERSION,
+            "manifest": self.manifest,
+            "commands": commands,
+            "state_hashes": state_hashes,
+            "state_checkpoints": state_checkpoints,
+        }
+
+    def _read_footer(self) -> dict[str, Any] | None:
+        self._file.seek(0, 2)
+        size = self._file.tell()
+        if size - self._data_start < _TRAILER.size:
+            return None
+        self._file.seek(size - _TRAILER.size)
+        footer_offset, footer_len, end_magic = _TRAILER.unpack(self._file.read(_TRAILER.size))
+        if end_magic != _END_MAGIC or footer_offset + footer_len + _TRAILER.size != size:
+            return None
+        self._file.seek(footer_offset)
+        footer = json.loads(zlib.decompress(self._file.read(footer_len)))
+        return footer if isinstance(footer, dict) else None
+
+    def _scan_chunks(self) -> list[ReplayChunkIndex]:
+        chunks: list[ReplayChunkIndex] = []
+        self._file.seek(self._data_start)
+        while True:
+            offset = self._file.tell()
+            prefix = self._file.read(_CHUNK_PREFIX.size)
+            if len(prefix) < _CHUNK_PREFIX.size:
+                break
+            length, crc = _CHUNK_PREFIX.unpack(prefix)
+            data = self._file.read(length)
+            if len(data) < length or zlib.crc32(data) != crc:
+                break
+            chunk = json.loads(zlib.decompress(data))
+            chunks.append(
+                ReplayChunkIndex(
+                    first_tick=int(chunk["first_tick"]),
+                    last_tick=int(chunk["last_tick"]),
+                    offset=offset,
+                    length=length,
+                    command_count=len(chunk.get("commands", ())),
+                    state_hash_count=len(chunk.get("state_hashes", ())),
+                )
+            )
+        return chunks
+
+    def _recovered_manifest(self) -> dict[str, Any]:
+        return {
+            "schema_version": DIAG_REPLAY_MANIFEST_SCHEMA_VERSION,
+            "replay_version": int(self._header.get("replay_version", 1)),
+            "seed": self._header.get("seed"),
+            "build": dict(self._header.get("build", {}) or {}),
+            "command_count": sum(item.command_count for item in self._chunks),
+            "first_tick": self._chunks[0].first_tick if self._chunks else 0,
+            "last_tick": self._chunks[-1].last_tick if self._chunks else 0,
+        }
+
+
+def is_replay_stream(path: Path) -> bool:
+    """Return whether ``path`` starts with the replay stream magic."""
+    try:
+        with path.open("rb") as handle:
+            return handle.read(len(_MAGIC)) == _MAGIC
+    except OSError:
+        return False
+
+
+def load_replay_session(path: Path) -> dict[str, Any]:
+    """Load a replay session from either a JSON export or a replay stream."""
+    if is_replay_stream(path):
+        with ReplayStreamReader(path) as reader:
+            return reader.to_session()
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(payload, dict):
+        raise ValueError("Replay payload must be a JSON object.")
+    return payload
+
+
+__all__ = [
+    "REPLAY_STREAM_SUFFIX",
+    "ReplayChunkIndex",
+    "ReplayStreamReader",
+    "ReplayStreamWriter",
+    "is_replay_stream",
+    "load_replay_session",
+]
@@ -9,4 +9,7 @@ DIAG_PROFILING_SCHEMA_VERSION = "diag.profiling.v1"
 DIAG_REPLAY_MANIFEST_SCHEMA_VERSION = "diag.replay_manifest.v1"
 DIAG_REPLAY_SESSION_SCHEMA_VERSION = "diag.replay_session.v1"
 DIAG_REPLAY_VALIDATION_SCHEMA_VERSION = "diag.replay_validation.v1"
+DIAG_REPLAY_STREAM_SCHEMA_VERSION = "diag.replay_stream.v1"
+DIAG_CHROME_TRACE_SCHEMA_VERSION = "diag.chrome_trace.v1"
+DIAG_BINARY_LOG_SCHEMA_VERSION = "diag.binary_log.v1"
 ENGINE_CRASH_BUNDLE_SCHEMA_VERSION = "engine.crash_bundle.v1"
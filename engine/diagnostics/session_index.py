@@ -0,0 +1,211 @@
+"""In-process cache of diagnostics session files under a logs root.
+
+The cache keeps, per directory, its mtime, subdirectory names and the names of
+diagnostics files (run logs, UI traces, replays, crash bundles, profiling
+exports). A repeated lookup costs one ``os.stat`` per visited directory; only
+directories whose mtime changed are rescanned with ``os.scandir``. JSON payload
+schemas are cached by file mtime and size, so repeated "latest payload of
+schema X" lookups only parse the file they return. Nothing is written to disk,
+so a new process starts cold.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from engine.diagnostics.json_codec import loads_bytes
+from engine.diagnostics.replay_stream import REPLAY_STREAM_SUFFIX
+
+_INDEXED_SUFFIXES = (".json", ".jsonl", REPLAY_STREAM_SUFFIX)
+# Directories modified this recently may change again within the same mtime tick;
+# they are kept as stale so the next lookup rescans them.
+_RACY_WINDOW_NS = 2_000_000_000
+_STALE_MTIME = -1
+
+_SHARED: dict[str, SessionFileIndex] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+@dataclass(slots=True)
+class _IndexedDir:
+    mtime_ns: int
+    subdirs: list[str]
+    files: list[str]
+    # name -> [mtime_ns, size, schema_version or None]
+    schemas: dict[str, list[Any]] = field(default_factory=dict)
+
+
+def session_index_root(log_dir: Path) -> Path:
+    """Return the root of the cache shared by discovery rooted at ``log_dir``."""
+    # Discovery of appdata/logs also searches appdata, so both share its index.
+    return log_dir.parent if log_dir.name == "logs" else log_dir
+
+
+class SessionFileIndex:
+    """Directory listing cache validated by directory mtimes."""
+
+    def __init__(self, root: Path) -> None:
+        self._root = root
+        self._dirs: dict[str, _IndexedDir] = {}
+        self._rescanned = 0
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def rescanned_count(self) -> int:
+        """Directories listed with ``os.scandir`` since the index was created."""
+        return self._rescanned
+
+    def list_files(self, directory: Path, *, recursive: bool = False) -> list[Path]:
+        """Return indexed diagnostics files in ``directory`` (and below if recursive)."""
+        return [
+            Path(folder, name) for folder, name in self.iter_entries(directory, recursive=recursive)
+        ]
+
+    def iter_entries(
+        self, directory: Path, *, recursive: bool = False
+    ) -> Iterator[tuple[str, str]]:
+        """Yield ``(folder, file_name)`` string pairs; cheaper than ``list_files``."""
+        pending = [(os.fspath(directory), self._key(directory))]
+        while pending:
+            folder, key = pending.pop()
+            entry = self._validated(folder, key)
+            if entry is None:
+                continue
+            for name in entry.files:
+                yield folder, name
+            if recursive:
+                prefix = f"{key}/" if key else ""
+                pending.extend(
+                    (os.path.join(folder, name), prefix + name) for name in entry.subdirs
+                )
+
+    def latest_payload(
+        self, directories: Iterable[Path], *, schema: str
+    ) -> dict[str, Any] | None:
+        """Return the newest ``*.json`` payload in ``directories`` with ``schema``."""
+        candidates: list[tuple[int, int, Path, _IndexedDir]] = []
+        seen: set[str] = set()
+        for directory in directories:
+            key = self._key(directory)
+            if key in seen:
+                continue
+            seen.add(key)
+            entry = self._validated(directory, key)
+            if entry is None:
+                continue
+            for name in entry.files:
+                if not name.endswith(".json"):
+                    continue
+                path = directory / name
+                try:
+                    file_stat = path.stat()
+                except OSError:
+                    continue
+                candidates.append((file_stat.st_mtime_ns, file_stat.st_size, path, entry))
+        candidates.sort(key=lambda item: item[0], reverse=True)
+        for mtime_ns, size, path, entry in candidates:
+            cached = entry.schemas.get(path.name)
+            if cached is not None and cached[0] == mtime_ns and cached[1] == size:
+                if cached[2] != schema:
+                    continue
+            payload = _load_json_object(path)
+            found = None if payload is None else str(payload.get("schema_version", ""))
+            entry.schemas[path.name] = [mtime_ns, size, found]
+            if found == schema:
+                return payload
+        return None
+
+    def _key(self, directory: Path) -> str:
+        try:
+            relative = os.path.relpath(directory, self._root)
+        except ValueError:
+            # Different drive on Windows.
+            return directory.as_posix()
+        return "" if relative == "." else Path(relative).as_posix()
+
+    def _validated(self, directory: str | Path, key: str) -> _IndexedDir | None:
+        try:
+            dir_stat = os.stat(directory)
+        except OSError:
+            dir_stat = None
+        if dir_stat is None or not stat.S_ISDIR(dir_stat.st_mode):
+            self._dirs.pop(key, None)
+            return None
+        entry = self._dirs.get(key)
+        if entry is not None and entry.mtime_ns == dir_stat.st_mtime_ns:
+            return entry
+        return self._rescan(directory, key, mtime_ns=dir_stat.st_mtime_ns)
+
+    def _rescan(
+        self, directory: str | Path, key: str, *, mtime_ns: int | None = None
+    ) -> _IndexedDir | None:
+        try:
+            if mtime_ns is None:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            subdirs: list[str] = []
+            files: list[str] = []
+            with os.scandir(directory) as entries:
+                for item in entries:
+                    name = item.name
+                    if item.is_dir(follow_symlinks=False):
+                        subdirs.append(name)
+                    elif name.endswith(_INDEXED_SUFFIXES):
+                        files.append(name)
+        except OSError:
+            self._dirs.pop(key, None)
+            return None
+        self._rescanned += 1
+        if time.time_ns() - mtime_ns < _RACY_WINDOW_NS:
+            mtime_ns = _STALE_MTIME
+        subdirs.sort()
+        files.sort()
+        previous = self._dirs.get(key)
+        schemas: dict[str, list[Any]] = {}
+        if previous is not None and previous.schemas:
+            present = set(files)
+            schemas = {name: row for name, row in previous.schemas.items() if name in present}
+        entry = _IndexedDir(mtime_ns, subdirs, files, schemas)
+        self._dirs[key] = entry
+        return entry
+
+
+@contextmanager
+def shared_session_index(root: Path) -> Iterator[SessionFileIndex]:
+    """Yield the process-wide index for ``root`` under a lock.
+
+    Reusing one instance lets repeated lookups skip unchanged directories; it
+    stays correct because every lookup still validates directory mtimes.
+    """
+    key = os.path.abspath(root)
+    with _SHARED_LOCK:
+        index = _SHARED.get(key)
+        if index is None:
+            index = SessionFileIndex(root)
+            _SHARED[key] = index
+        yield index
+
+
+def _load_json_object(path: Path) -> dict[str, Any] | None:
+    try:
+        payload = loads_bytes(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+__all__ = [
+    "SessionFileIndex",
+    "session_index_root",
+    "shared_session_index",
+]
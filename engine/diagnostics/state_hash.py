@@ -0,0 +1,94 @@
+"""Incremental, section-cached state hashing for replay marks."""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+from engine.diagnostics.replay import compute_state_hash
+
+_ALWAYS_REHASH = object()
+
+
+class StateSectionHasher:
+    """Merkle-style state digest over independently versioned sections.
+
+    Each section remembers the digest computed for its last version token and is
+    only rehashed when the token changes (``version=None`` rehashes every time).
+    The root digest hashes the sorted ``name:digest`` pairs, so it only depends
+    on section content and is stable across processes.
+    """
+
+    def __init__(self) -> None:
+        self._sections: dict[str, tuple[object, str]] = {}
+        self._root: str | None = None
+        self._rehashed = 0
+        self._reused = 0
+
+    @property
+    def rehashed_count(self) -> int:
+        return self._rehashed
+
+    @property
+    def reused_count(self) -> int:
+        return self._reused
+
+    def update(self, name: str, *, version: object, build: Callable[[], Any]) -> str:
+        """Return the section digest, calling ``build`` only when ``version`` changed."""
+        token = _ALWAYS_REHASH if version is None else version
+        cached = self._sections.get(name)
+        if cached is not None and token is not _ALWAYS_REHASH:
+            cached_token, cached_digest = cached
+            if cached_token is token or cached_token == token:
+                self._reused += 1
+                return cached_digest
+        digest = hash_state_value(build())
+        self._rehashed += 1
+        if cached is None or cached[1] != digest:
+            self._root = None
+        self._sections[name] = (token, digest)
+        return digest
+
+    def discard(self, name: str) -> None:
+        if self._sections.pop(name, None) is not None:
+            self._root = None
+
+    def digest(self) -> str:
+        """Return the root digest over all current sections."""
+        root = self._root
+        if root is None:
+            hasher = hashlib.sha256()
+            for name in sorted(self._sections):
+                hasher.update(f"{name}:{self._sections[name][1]}\n".encode())
+            root = hasher.hexdigest()
+            self._root = root
+        return root
+
+
+def hash_state_value(value: Any) -> str:
+    """Hash one state section deterministically.
+
+    Numpy arrays hash their dtype, shape and raw bytes; bytes hash directly;
+    sequences holding arrays combine element digests; everything else uses
+    ``compute_state_hash``.
+    """
+    if isinstance(value, np.ndarray):
+        array = np.ascontiguousarray(value)
+        hasher = hashlib.sha256()
+        hasher.update(f"nd:{array.dtype.str}:{array.shape}\n".encode())
+        hasher.update(array.tobytes())
+        return hasher.hexdigest()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(bytes(value)).hexdigest()
+    if isinstance(value, (tuple, list)) and any(isinstance(item, np.ndarray) for item in value):
+        hasher = hashlib.sha256(b"seq\n")
+        for item in value:
+            hasher.update(hash_state_value(item).encode("ascii"))
+        return hasher.hexdigest()
+    return compute_state_hash(value)
+
+
+__all__ = ["StateSectionHasher", "hash_state_value"]
@@ -1,5 +1,6 @@
 """Diagnostics subscriber implementations."""
 
+from engine.diagnostics.subscribers.chrome_trace import ChromeTraceExporter
 from engine.diagnostics.subscribers.jsonl_exporter import JsonlAsyncExporter
 
-__all__ = ["JsonlAsyncExporter"]
+__all__ = ["ChromeTraceExporter", "JsonlAsyncExporter"]
@@ -0,0 +1,299 @@
+"""Streaming Chrome Trace Event Format exporter for diagnostics events.
+
+The exporter subscribes to the diagnostics hub and turns profiler spans, host
+frame boundaries, renderer stage markers, render profile counters and update
+loop system spans into trace events viewable in ``chrome://tracing`` or
+Perfetto. Events are timestamped with ``perf_counter`` and tagged with the
+emitting thread id on the hub call, so the sim, render and exporter threads
+get separate tracks. Conversion and JSON writes happen on a background thread
+behind a bounded queue; when the queue is full events are dropped and counted.
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import threading
+from pathlib import Path
+from time import perf_counter
+from typing import Any, BinaryIO
+
+from engine.diagnostics.event import DiagnosticEvent
+from engine.diagnostics.json_codec import dumps_bytes
+from engine.diagnostics.schema import DIAG_CHROME_TRACE_SCHEMA_VERSION
+from engine.diagnostics.subscribers.jsonl_exporter import ExporterStats
+
+_WRITE_BATCH_MAX = 512
+# Begin/end marker pairs closed into one complete ("X") event per thread.
+_PAIRED_MARKERS: dict[str, tuple[str, bool]] = {
+    "frame.start": ("frame", True),
+    "frame.end": ("frame", False),
+    "render.stage.begin_frame": ("render.frame", True),
+    "render.stage.end_frame": ("render.frame", False),
+    "render.stage.execute_pass.begin": ("render.pass", True),
+    "render.stage.execute_pass.end": ("render.pass", False),
+}
+_SPAN_METADATA_KEYS = frozenset({"span_category", "span_name", "start_s", "end_s"})
+
+type _QueuedEvent = tuple[DiagnosticEvent, float, int, str | None]
+
+
+class ChromeTraceExporter:
+    """Background ``{"traceEvents": [...]}`` writer with bounded backpressure queue."""
+
+    def __init__(
+        self,
+        *,
+        path: Path,
+        queue_capacity: int = 8192,
+        process_name: str = "engine",
+    ) -> None:
+        self._path = path
+        self._pid = os.getpid()
+        self._origin_s = perf_counter()
+        self._queue: queue.Queue[_QueuedEvent | None] = queue.Queue(
+            maxsize=max(32, queue_capacity)
+        )
+        self._named_tids: set[int] = set()
+        self._open: dict[tuple[int, str], list[tuple[float, dict[str, Any]]]] = {}
+        self._closed = False
+        self._written = 0
+        self._dropped = 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: BinaryIO = path.open("wb")
+        header = dumps_bytes(
+            {
+                "displayTimeUnit": "ms",
+                "otherData": {"schema_version": DIAG_CHROME_TRACE_SCHEMA_VERSION},
+            }
+        )
+        # Splice the event array into the header object so events can stream.
+        self._file.write(header[:-1] + b',"traceEvents":[\n')
+        self._first_event = True
+        self._write_event(
+            {
+                "ph": "M",
+                "name": "process_name",
+                "pid": self._pid,
+                "tid": 0,
+                "args": {"name": process_name},
+            }
+        )
+        self._thread = threading.Thread(
+            target=self._worker, name="diag-chrome-trace-exporter", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def enqueue(self, event: DiagnosticEvent) -> None:
+        """Hub subscriber; records the emit time and thread, defers the rest."""
+        if self._closed:
+            return
+        tid = threading.get_ident()
+        thread_name = None
+        if tid not in self._named_tids:
+            self._named_tids.add(tid)
+            thread_name = threading.current_thread().name
+        try:
+            self._queue.put_nowait((event, perf_counter(), tid, thread_name))
+        except queue.Full:
+            self._dropped += 1
+            if thread_name is not None:
+                self._named_tids.discard(tid)
+
+    def close(self, *, timeout_s: float = 5.0) -> Path:
+        """Drain the queue, terminate the JSON document and close the file."""
+        if self._closed:
+            return self._path
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout=timeout_s)
+        return self._path
+
+    def stats(self) -> ExporterStats:
+        return ExporterStats(
+            written_count=self._written,
+            dropped_count=self._dropped,
+            queued_count=self._queue.qsize(),
+        )
+
+    def _worker(self) -> None:
+        tid = threading.get_ident()
+        self._write_thread_name(tid, threading.current_thread().name)
+        try:
+            done = False
+            while not done:
+                batch = [self._queue.get()]
+                while len(batch) < _WRITE_BATCH_MAX:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                started = perf_counter()
+                count = 0
+                for item in batch:
+                    if item is None:
+                        done = True
+                        continue
+                    count += self._convert(*item)
+                self._write_event(
+                    {
+                        "ph": "X",
+                        "name": "trace.write_batch",
+                        "cat": "diagnostics",
+                        "pid": self._pid,
+                        "tid": tid,
+                        "ts": self._us(started),
+                        "dur": (perf_counter() - started) * 1_000_000.0,
+                        "args": {"events": count},
+                    }
+                )
+        finally:
+            self._file.write(b"\n]}\n")
+            self._file.close()
+
+    def _convert(
+        self, event: DiagnosticEvent, at_s: float, tid: int, thread_name: str | None
+    ) -> int:
+        if thread_name is not None:
+            self._write_thread_name(tid, thread_name)
+        name = event.name
+        metadata = event.metadata
+        paired = _PAIRED_MARKERS.get(name)
+        if paired is not None:
+            return self._convert_marker(event, at_s, tid, paired)
+        if name == "perf.span":
+            start_s = float(metadata.get("start_s", at_s))
+            end_s = float(metadata.get("end_s", at_s))
+            args = {k: v for k, v in metadata.items() if k not in _SPAN_METADATA_KEYS}
+            args["tick"] = event.tick
+            self._write_complete(
+                name=str(metadata.get("span_name", "span")),
+                cat=str(metadata.get("span_category", "perf")),
+                tid=tid,
+                start_s=start_s,
+                end_s=end_s,
+                args=args,
+            )
+            return 1
+        if name == "system.update_spans" and isinstance(event.value, dict):
+            spans = event.value.get("spans", ())
+            for system_id, start_s, end_s in spans:
+                self._write_complete(
+                    name=str(system_id),
+                    cat="system",
+                    tid=tid,
+                    start_s=float(start_s),
+                    end_s=float(end_s),
+                    args={"tick": event.tick},
+                )
+            return len(spans)
+        if name == "render.profile_frame" and isinstance(event.value, dict):
+            counters = {
+                key: float(event.value[key])
+                for key in ("build_ms", "execute_ms", "present_ms")
+                if isinstance(event.value.get(key), (int, float))
+            }
+            self._write_counter("render_ms", tid=tid, at_s=at_s, values=counters)
+            return 1
+        if name == "frame.time_ms" and isinstance(event.value, (int, float)):
+            self._write_counter(
+                "frame_ms", tid=tid, at_s=at_s, values={"frame_ms": float(event.value)}
+            )
+            return 1
+        if name.startswith("render.stage."):
+            self._write_event(
+                {
+                    "ph": "i",
+                    "s": "t",
+                    "name": name.removeprefix("render.stage."),
+                    "cat": "render",
+                    "pid": self._pid,
+                    "tid": tid,
+                    "ts": self._us(at_s),
+                    "args": {"tick": event.tick},
+                }
+            )
+            return 1
+        return 0
+
+    def _convert_marker(
+        self,
+        event: DiagnosticEvent,
+        at_s: float,
+        tid: int,
+        paired: tuple[str, bool],
+    ) -> int:
+        label, is_begin = paired
+        pass_name = event.metadata.get("pass_name")
+        if pass_name is not None:
+            label = f"{label}:{pass_name}"
+        key = (tid, label)
+        if is_begin:
+            self._open.setdefault(key, []).append((at_s, {"tick": event.tick}))
+            return 0
+        stack = self._open.get(key)
+        if not stack:
+            return 0
+        start_s, args = stack.pop()
+        self._write_complete(
+            name=label, cat=event.category, tid=tid, start_s=start_s, end_s=at_s, args=args
+        )
+        return 1
+
+    def _write_complete(
+        self,
+        *,
+        name: str,
+        cat: str,
+        tid: int,
+        start_s: float,
+        end_s: float,
+        args: dict[str, Any],
+    ) -> None:
+        self._write_event(
+            {
+                "ph": "X",
+                "name": name,
+                "cat": cat,
+                "pid": self._pid,
+                "tid": tid,
+                "ts": self._us(start_s),
+                "dur": max(0.0, end_s - start_s) * 1_000_000.0,
+                "args": args,
+            }
+        )
+
+    def _write_counter(
+        self, name: str, *, tid: int, at_s: float, values: dict[str, float]
+    ) -> None:
+        self._write_event(
+            {
+                "ph": "C",
+                "name": name,
+                "pid": self._pid,
+                "tid": tid,
+                "ts": self._us(at_s),
+                "args": values,
+            }
+        )
+
+    def _write_thread_name(self, tid: int, name: str) -> None:
+        self._write_event(
+            {"ph": "M", "name": "thread_name", "pid": self._pid, "tid": tid, "args": {"name": name}}
+        )
+
+    def _write_event(self, payload: dict[str, Any]) -> None:
+        prefix = b"" if self._first_event else b",\n"
+        self._first_event = False
+        self._file.write(prefix + dumps_bytes(payload))
+        self._written += 1
+
+    def _us(self, at_s: float) -> float:
+        return (at_s - self._origin_s) * 1_000_000.0
+
+
+__all__ = ["ChromeTraceExporter"]
@@ -7,9 +7,10 @@ from time import perf_counter
 
 from engine.api.context import RuntimeContext
 from engine.api.gameplay import SystemSpec
+from engine.runtime.logging import get_engine_logger
 from engine.runtime.time import FixedStepAccumulator
 
-_LOG = logging.getLogger("engine.update")
+_LOG = get_engine_logger("engine.update")
 
 
 class RuntimeUpdateLoop:
@@ -52,6 +53,9 @@ class RuntimeUpdateLoop:
             raise ValueError("delta_seconds must be >= 0")
         ordered = self._ordered_systems()
         metrics = context.get("metrics_collector")
+        hub = context.get("diagnostics_hub")
+        # (system_id, start_s, end_s) per update, for trace exporters on the hub.
+        spans: list[tuple[str, float, float]] | None = [] if hub is not None else None
         system_timings_ms: dict[str, float] = {}
         if self._accumulator is None:
             for spec in ordered:
@@ -65,14 +69,19 @@ class RuntimeUpdateLoop:
                     caught_exc = exc
                     self._increment_system_exception_count(metrics)
                 finally:
-                    elapsed_ms = (perf_counter() - started_at) * 1000.0
+                    ended_at = perf_counter()
+                    elapsed_ms = (ended_at - started_at) * 1000.0
                     system_timings_ms[spec.system_id] = (
                         system_timings_ms.get(spec.system_id, 0.0) + elapsed_ms
                     )
+                    if spans is not None:
+                        spans.append((spec.system_id, started_at, ended_at))
                 if caught_exc is not None:
                     self._publish_system_timings(metrics, system_timings_ms)
+                    self._emit_system_spans(hub, context, spans)
                     raise caught_exc
             self._publish_system_timings(metrics, system_timings_ms)
+            self._emit_system_spans(hub, context, spans)
             self._log_system_timings(tick_count=1 if ordered else 0, timings_ms=system_timings_ms)
             return 1 if ordered else 0
 
@@ -92,14 +101,19 @@ class RuntimeUpdateLoop:
                     fixed_step_exc = exc
                     self._increment_system_exception_count(metrics)
                 finally:
-                    elapsed_ms = (perf_counter() - started_at) * 1000.0
+                    ended_at = perf_counter()
+                    elapsed_ms = (ended_at - started_at) * 1000.0
                     system_timings_ms[spec.system_id] = (
                         system_timings_ms.get(spec.system_id, 0.0) + elapsed_ms
                     )
+                    if spans is not None:
+                        spans.append((spec.system_id, started_at, ended_at))
                 if fixed_step_exc is not None:
                     self._publish_system_timings(metrics, system_timings_ms)
+                    self._emit_system_spans(hub, context, spans)
                     raise fixed_step_exc
         self._publish_system_timings(metrics, system_timings_ms)
+        self._emit_system_spans(hub, context, spans)
         self._log_system_timings(tick_count=tick_count, timings_ms=system_timings_ms)
         return tick_count
 
@@ -131,6 +145,23 @@ class RuntimeUpdateLoop:
         for system_id, elapsed_ms in timings_ms.items():
             metrics.record_system_time(system_id, elapsed_ms)
 
+    @staticmethod
+    def _emit_system_spans(
+        hub: object | None,
+        context: RuntimeContext,
+        spans: list[tuple[str, float, float]] | None,
+    ) -> None:
+        if not spans or not hasattr(hub, "emit_fast"):
+            return
+        frame_context = context.get("frame_context")
+        tick = int(getattr(frame_context, "frame_index", 0) or 0)
+        hub.emit_fast(
+            category="system",
+            name="system.update_spans",
+            tick=tick,
+            value={"spans": spans},
+        )
+
     @staticmethod
     def _log_system_timings(*, tick_count: int, timings_ms: dict[str, float]) -> None:
         if not timings_ms or not _LOG.isEnabledFor(logging.DEBUG):
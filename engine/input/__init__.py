@@ -1,6 +1,13 @@
 """Engine input capture runtime modules."""
 
 from engine.api.input_events import KeyEvent, PointerEvent, WheelEvent
-from engine.input.input_controller import InputController, PointerClick
+from engine.input.input_controller import InputController, InputQueueStats, PointerClick
 
-__all__ = ["InputController", "KeyEvent", "PointerClick", "PointerEvent", "WheelEvent"]
+__all__ = [
+    "InputController",
+    "InputQueueStats",
+    "KeyEvent",
+    "PointerClick",
+    "PointerEvent",
+    "WheelEvent",
+]
@@ -1,4 +1,12 @@
-"""Mouse input mapping to placement and firing actions."""
+"""Mouse input mapping to placement and firing actions.
+
+Raw window events are queued until the next snapshot. Consecutive pointer
+moves merge into the latest one (counted in ``coalesced_count``) and queued
+wheel events sum into one. The pointer, key and click queues are capped at
+``max_queue_length``; the oldest events are dropped and counted. The
+``on_click_queued`` invalidate callback fires once per drained batch rather
+than once per event.
+"""
 
 from __future__ import annotations
 
@@ -19,14 +27,51 @@ class PointerClick:
     button: int
 
 
+@dataclass(frozen=True, slots=True)
+class InputQueueStats:
+    """Cumulative coalescing and drop counters of one input controller."""
+
+    pointer_moves_coalesced: int
+    wheel_events_coalesced: int
+    dropped_pointer_events: int
+    dropped_key_events: int
+    dropped_clicks: int
+    invalidate_calls: int
+
+    @property
+    def dropped_total(self) -> int:
+        return (
+            self.dropped_pointer_events
+            + self.dropped_key_events
+            + self.dropped_clicks
+        )
+
+
 class InputController:
     """Collect pointer events from canvas for polling by app loop."""
 
-    def __init__(self, on_click_queued: Callable[[], None] | None = None) -> None:
-        self._clicks: deque[PointerClick] = deque()
-        self._pointer_events: deque[PointerEvent] = deque()
-        self._key_events: deque[KeyEvent] = deque()
-        self._wheel_events: deque[WheelEvent] = deque()
+    def __init__(
+        self,
+        on_click_queued: Callable[[], None] | None = None,
+        *,
+        max_queue_length: int = 1024,
+    ) -> None:
+        if max_queue_length < 1:
+            raise ValueError("max_queue_length must be >= 1")
+        self._clicks: deque[PointerClick] = deque(maxlen=max_queue_length)
+        self._pointer_events: deque[PointerEvent] = deque(maxlen=max_queue_length)
+        self._key_events: deque[KeyEvent] = deque(maxlen=max_queue_length)
+        self._wheel_events: deque[WheelEvent] = deque(maxlen=max_queue_length)
+        self._max_queue_length = max_queue_length
+        self._moves_coalesced = 0
+        self._wheels_coalesced = 0
+        self._dropped_pointer = 0
+        self._dropped_keys = 0
+        self._dropped_clicks = 0
+        self._dropped_since_snapshot = 0
+        self._invalidate_calls = 0
+        self._invalidate_pending = False
+        self._pending_tail_moves = 0
         self._pressed_keys: set[str] = set()
         self._pressed_buttons: set[int] = set()
         self._pointer_x = 0.0
@@ -46,49 +91,106 @@ class InputController:
         events: tuple[PointerEvent | KeyEvent | WheelEvent, ...],
     ) -> None:
         """Ingest normalized raw input events produced by window layer polling."""
+        queued = False
+        limit = self._max_queue_length
+        pointer_events = self._pointer_events
+        # Effective coalesced_count of a trailing pointer_move whose stored event
+        # has not been rewritten yet; 0 when the tail is not a pending move.
+        tail_moves = self._pending_tail_moves
+        last_pointer: PointerEvent | None = None
         for raw in events:
             if isinstance(raw, PointerEvent):
-                self._pointer_events.append(raw)
-                self._pointer_x = float(raw.x)
-                self._pointer_y = float(raw.y)
+                queued = True
+                last_pointer = raw
+                if raw.event_type == "pointer_move":
+                    if tail_moves and pointer_events[-1].button == raw.button:
+                        pointer_events[-1] = raw
+                        tail_moves += raw.coalesced_count
+                        self._moves_coalesced += raw.coalesced_count
+                        continue
+                    self._seal_pointer_tail(tail_moves)
+                    tail_moves = raw.coalesced_count
+                else:
+                    self._seal_pointer_tail(tail_moves)
+                    tail_moves = 0
+                if len(pointer_events) == limit:
+                    self._dropped_pointer += 1
+                    self._dropped_since_snapshot += 1
+                pointer_events.append(raw)
                 if raw.event_type == "pointer_down" and int(raw.button) == 1:
-                    click = PointerClick(x=float(raw.x), y=float(raw.y), button=1)
-                    self._clicks.append(click)
-                if self._on_click_queued is not None:
-                    self._on_click_queued()
+                    if len(self._clicks) == limit:
+                        self._dropped_clicks += 1
+                        self._dropped_since_snapshot += 1
+                    self._clicks.append(PointerClick(x=float(raw.x), y=float(raw.y), button=1))
                 continue
             if isinstance(raw, KeyEvent):
+                queued = True
+                if len(self._key_events) == limit:
+                    self._dropped_keys += 1
+                    self._dropped_since_snapshot += 1
                 self._key_events.append(raw)
-                if self._on_click_queued is not None:
-                    self._on_click_queued()
                 continue
             if isinstance(raw, WheelEvent):
+                queued = True
+                if self._wheel_events:
+                    last_wheel = self._wheel_events[-1]
+                    self._wheel_events[-1] = WheelEvent(
+                        raw.x,
+                        raw.y,
+                        float(last_wheel.dy) + float(raw.dy),
+                        last_wheel.coalesced_count + raw.coalesced_count,
+                    )
+                    self._wheels_coalesced += raw.coalesced_count
+                    continue
                 self._wheel_events.append(raw)
-                if self._on_click_queued is not None:
-                    self._on_click_queued()
+        self._pending_tail_moves = tail_moves
+        if last_pointer is not None:
+            self._pointer_x = float(last_pointer.x)
+            self._pointer_y = float(last_pointer.y)
+        if queued and not self._invalidate_pending and self._on_click_queued is not None:
+            self._invalidate_pending = True
+            self._invalidate_calls += 1
+            self._on_click_queued()
+
+    def queue_stats(self) -> InputQueueStats:
+        """Return cumulative coalescing, drop and invalidate counters."""
+        return InputQueueStats(
+            pointer_moves_coalesced=self._moves_coalesced,
+            wheel_events_coalesced=self._wheels_coalesced,
+            dropped_pointer_events=self._dropped_pointer,
+            dropped_key_events=self._dropped_keys,
+            dropped_clicks=self._dropped_clicks,
+            invalidate_calls=self._invalidate_calls,
+        )
 
     def drain_clicks(self) -> list[PointerClick]:
         """Return and clear all queued clicks."""
         items = list(self._clicks)
         self._clicks.clear()
+        self._invalidate_pending = False
         return items
 
     def drain_pointer_events(self) -> list[PointerEvent]:
         """Return and clear queued pointer events."""
+        self._seal_pointer_tail(self._pending_tail_moves)
+        self._pending_tail_moves = 0
         items = list(self._pointer_events)
         self._pointer_events.clear()
+        self._invalidate_pending = False
         return items
 
     def drain_key_events(self) -> list[KeyEvent]:
         """Return and clear key/char events."""
         items = list(self._key_events)
         self._key_events.clear()
+        self._invalidate_pending = False
         return items
 
     def drain_wheel_events(self) -> list[WheelEvent]:
         """Return and clear wheel events."""
         items = list(self._wheel_events)
         self._wheel_events.clear()
+        self._invalidate_pending = False
         return items
 
     def bind_action_key_down(self, key_name: str, action_name: str) -> None:
@@ -128,6 +230,9 @@ class InputController:
         pointer_events = tuple(self.drain_pointer_events())
         key_events = tuple(self.drain_key_events())
         wheel_events = tuple(self.drain_wheel_events())
+        # Left clicks already travel as pointer_down events in the snapshot; clear the
+        # legacy click queue so clicks nobody drains are not reported as dropped.
+        self._clicks.clear()
 
         just_pressed_buttons: set[int] = set()
         just_released_buttons: set[int] = set()
@@ -214,13 +319,10 @@ class InputController:
             active=frozenset(self._active_actions),
             just_started=frozenset(just_started_actions),
             just_ended=frozenset(just_ended_actions),
-            values=tuple(
-                [("meta.mapping_conflicts", float(len(self._pending_mapping_conflicts)))]
-                if self._pending_mapping_conflicts
-                else []
-            ),
+            values=self._meta_values(),
         )
         self._pending_mapping_conflicts.clear()
+        self._dropped_since_snapshot = 0
         return InputSnapshot(
             frame_index=frame_index,
             keyboard=keyboard,
@@ -230,3 +332,20 @@ class InputController:
             key_events=key_events,
             wheel_events=wheel_events,
         )
+
+    def _meta_values(self) -> tuple[tuple[str, float], ...]:
+        values: list[tuple[str, float]] = []
+        if self._pending_mapping_conflicts:
+            values.append(("meta.mapping_conflicts", float(len(self._pending_mapping_conflicts))))
+        if self._dropped_since_snapshot:
+            values.append(("meta.input_dropped", float(self._dropped_since_snapshot)))
+        return tuple(values)
+
+    def _seal_pointer_tail(self, tail_moves: int) -> None:
+        if not tail_moves or not self._pointer_events:
+            return
+        tail = self._pointer_events[-1]
+        if tail.coalesced_count != tail_moves:
+            self._pointer_events[-1] = PointerEvent(
+                tail.event_type, tail.x, tail.y, tail.button, tail_moves
+            )
@@ -14,11 +14,20 @@ from dataclasses import dataclass, field
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any, Protocol, cast
 
-from engine.api.render_snapshot import RenderCommand, RenderPassSnapshot, RenderSnapshot
+from engine.api.render_snapshot import (
+    RectBatchRow,
+    RenderCommand,
+    RenderPassSnapshot,
+    RenderRectBatch,
+    RenderSnapshot,
+    create_render_command,
+    render_command_order_key,
+)
 from engine.api.window import SurfaceHandle, WindowResizeEvent
 from engine.rendering.scene_runtime import resolve_preserve_aspect
 from engine.rendering.scene_viewport import to_design_space as viewport_to_design_space
 from engine.rendering.scene_viewport import viewport_transform
+from engine.runtime.render_cache import RenderCacheLRU, command_cache_key
 from engine.runtime_profile import resolve_runtime_profile
 
 if TYPE_CHECKING:
@@ -34,6 +43,8 @@ def _optional_import(name: str) -> Any | None:
 _NP = _optional_import("numpy")
 _HB = _optional_import("uharfbuzz")
 _COMMAND_PAYLOAD_CACHE_MAX = 20_000
+_COMMAND_CACHE_MAX = 20_000
+_ORDER_ARGSORT_MIN_COMMANDS = 2048
 _COLOR_CACHE_MAX = 512
 _TRANSFORM_CACHE_MAX = 20_000
 _DEFAULT_UI_DESIGN_WIDTH = 1200
@@ -97,6 +108,7 @@ class _PassDescriptor:
 class _RenderPassBatch:
     name: str
     commands: tuple[RenderCommand, ...]
+    rect_batches: tuple[RenderRectBatch, ...] = ()
 
 
 @dataclass(frozen=True, slots=True)
@@ -111,6 +123,10 @@ class _DrawPacket:
     engine_cache_base: tuple[object, ...] | None = None
 
 
+# Pass entries are commands or columnar rows; rows become packets only on a cache miss.
+type _PacketSource = RenderCommand | RectBatchRow
+
+
 @dataclass(frozen=True, slots=True)
 class _DrawRect:
     layer: int
@@ -238,11 +254,17 @@ class WgpuRenderer:
     ] = field(
         init=False, default_factory=dict
     )
-    _command_packet_cache: dict[int, tuple[RenderCommand, _DrawPacket, str, object]] = field(
-        init=False, default_factory=dict
+    _command_packet_cache: RenderCacheLRU[tuple[_DrawPacket, str, object]] = field(
+        init=False,
+        default_factory=lambda: RenderCacheLRU(
+            name="renderer.command_packet", capacity=_COMMAND_CACHE_MAX
+        ),
     )
-    _command_version_token_cache: dict[int, tuple[RenderCommand, object]] = field(
-        init=False, default_factory=dict
+    _command_version_token_cache: RenderCacheLRU[object] = field(
+        init=False,
+        default_factory=lambda: RenderCacheLRU(
+            name="renderer.command_version_token", capacity=_COMMAND_CACHE_MAX
+        ),
     )
 
     def __post_init__(self) -> None:
@@ -338,7 +360,7 @@ class WgpuRenderer:
         z: float = 0.0,
         static: bool = False,
     ) -> None:
-        command = RenderCommand(
+        command = create_render_command(
             kind="rect",
             layer=int(round(float(z) * 100.0)),
             data=(
@@ -371,7 +393,7 @@ class WgpuRenderer:
         color_secondary: str = "",
         shadow_layers: float = 0.0,
     ) -> None:
-        command = RenderCommand(
+        command = create_render_command(
             kind=str(style_kind),
             layer=int(round(float(z) * 100.0)),
             data=(
@@ -403,7 +425,7 @@ class WgpuRenderer:
         z: float = 0.5,
         static: bool = False,
     ) -> None:
-        command = RenderCommand(
+        command = create_render_command(
             kind="grid",
             layer=int(round(float(z) * 100.0)),
             data=(
@@ -432,7 +454,7 @@ class WgpuRenderer:
         z: float = 2.0,
         static: bool = False,
     ) -> None:
-        command = RenderCommand(
+        command = create_render_command(
             kind="text",
             layer=int(round(float(z) * 100.0)),
             data=(
@@ -454,7 +476,7 @@ class WgpuRenderer:
         self._backend.set_title(title)
 
     def fill_window(self, key: str, color: str, z: float = -100.0) -> None:
-        command = RenderCommand(
+        command = create_render_command(
             kind="fill_window",
             layer=int(round(float(z) * 100.0)),
             data=(("key", str(key)), ("color", str(color)), ("z", float(z))),
@@ -600,6 +622,7 @@ class WgpuRenderer:
                 passes[index] = RenderPassSnapshot(
                     name=render_pass.name,
                     commands=tuple(render_pass.commands) + tuple(overlay_commands),
+                    rect_batches=render_pass.rect_batches,
                 )
                 merged = True
                 break
@@ -613,20 +636,13 @@ class WgpuRenderer:
         batches: list[_RenderPassBatch] = []
         for render_pass in snapshot.passes:
             descriptor = _resolve_pass_descriptor(render_pass.name)
-            keyed: list[tuple[tuple[object, ...], RenderCommand]] = []
-            already_sorted = True
-            previous_key: tuple[object, ...] | None = None
-            for ordinal, command in enumerate(render_pass.commands):
-                key = _command_sort_key(command, ordinal)
-                if previous_key is not None and key < previous_key:
-                    already_sorted = False
-                previous_key = key
-                keyed.append((key, command))
-            if already_sorted:
-                commands = tuple(command for _, command in keyed)
-            else:
-                commands = tuple(command for _, command in sorted(keyed, key=lambda item: item[0]))
-            batches.append(_RenderPassBatch(name=descriptor.canonical_name, commands=commands))
+            batches.append(
+                _RenderPassBatch(
+                    name=descriptor.canonical_name,
+                    commands=_sort_commands_by_order_key(render_pass.commands),
+                    rect_batches=tuple(render_pass.rect_batches),
+                )
+            )
         return tuple(sorted(batches, key=lambda batch: _resolve_pass_descriptor(batch.name).priority))
 
     def _execute_pass_batches(self, batches: tuple[_RenderPassBatch, ...]) -> dict[str, object]:
@@ -640,7 +656,8 @@ class WgpuRenderer:
         execute_static_packet_cache_hits = 0
         execute_backend_draw_ms = 0.0
         for batch in batches:
-            batch_signature = self._command_batch_signature_cached(batch.commands)
+            sources = _pass_packet_sources(batch)
+            batch_signature = self._pass_signature_cached(sources)
             cached = self._pass_static_packet_cache.get(batch.name)
             static_cached_packets: dict[int, _DrawPacket] = {}
             if cached is not None:
@@ -651,14 +668,17 @@ class WgpuRenderer:
             packet_build_started = time.perf_counter()
             packet_list: list[_DrawPacket] = []
             static_entries_next: list[tuple[int, _DrawPacket]] = []
-            for index, command in enumerate(batch.commands):
+            for index, source in enumerate(sources):
                 cached_packet = static_cached_packets.get(index)
                 if cached_packet is not None:
                     packet_list.append(cached_packet)
                     execute_static_packet_cache_hits += 1
                     static_entries_next.append((index, cached_packet))
                     continue
-                packet, override, version_token = self._command_to_packet_cached(command)
+                if isinstance(source, RenderCommand):
+                    packet, override, version_token = self._command_to_packet_cached(source)
+                else:
+                    packet, override, version_token = _rect_row_packet(source)
                 annotated, auto_static_ms = self._annotate_packet_static_mode(
                     packet,
                     override=override,
@@ -728,12 +748,15 @@ class WgpuRenderer:
                 summary.update(payload)
         return summary
 
-    def _command_batch_signature_cached(
-        self, commands: tuple[RenderCommand, ...]
-    ) -> tuple[object, ...]:
-        if not commands:
+    def _pass_signature_cached(self, sources: tuple[_PacketSource, ...]) -> tuple[object, ...]:
+        if not sources:
             return ()
-        return tuple(self._command_version_token_cached(command) for command in commands)
+        return tuple(
+            self._command_version_token_cached(source)
+            if isinstance(source, RenderCommand)
+            else source
+            for source in sources
+        )
 
     def _annotate_packet_static_mode(
         self,
@@ -802,31 +825,23 @@ class WgpuRenderer:
         return stable_count >= int(self._auto_static_min_stable_frames)
 
     def _command_to_packet_cached(self, command: RenderCommand) -> tuple[_DrawPacket, str, object]:
-        command_id = int(id(command))
-        cached = self._command_packet_cache.get(command_id)
+        cache_key = command_cache_key(command)
+        cached = self._command_packet_cache.get(cache_key, command)
         if cached is not None:
-            cached_command, packet, override, version_token = cached
-            if cached_command is command:
-                return packet, override, version_token
+            return cached
         override = _command_static_override(command)
         packet = _command_to_packet(command)
         version_token = self._command_version_token_cached(command)
-        self._command_packet_cache[command_id] = (command, packet, override, version_token)
-        if len(self._command_packet_cache) > 20000:
-            self._command_packet_cache.clear()
-            self._command_packet_cache[command_id] = (command, packet, override, version_token)
+        self._command_packet_cache.put(cache_key, command, (packet, override, version_token))
         return packet, override, version_token
 
     def _command_version_token_cached(self, command: RenderCommand) -> object:
-        command_id = int(id(command))
-        cached = self._command_version_token_cache.get(command_id)
-        if cached is not None and cached[0] is command:
-            return cached[1]
+        cache_key = command_cache_key(command)
+        cached = self._command_version_token_cache.get(cache_key, command)
+        if cached is not None:
+            return cached
         token = _command_version_token(command)
-        self._command_version_token_cache[command_id] = (command, token)
-        if len(self._command_version_token_cache) > 20000:
-            self._command_version_token_cache.clear()
-            self._command_version_token_cache[command_id] = (command, token)
+        self._command_version_token_cache.put(cache_key, command, token)
         return token
 
     def _prune_auto_static_state(self, frame: int) -> None:
@@ -1020,18 +1035,69 @@ def _command_to_packet(command: RenderCommand) -> _DrawPacket:
     )
 
 
+def _pass_packet_sources(batch: _RenderPassBatch) -> tuple[_PacketSource, ...]:
+    """Merge sorted pass commands with columnar rect rows in packed order-key order."""
+    if not batch.rect_batches:
+        return batch.commands
+    keyed: list[tuple[int, _PacketSource]] = [
+        (render_command_order_key(command), command) for command in batch.commands
+    ]
+    for rect_batch in batch.rect_batches:
+        keyed.extend((row[8], row) for row in rect_batch.rows())
+    # Stable, so commands keep their place ahead of rows with an equal key.
+    keyed.sort(key=lambda entry: entry[0])
+    return tuple(source for _order_key, source in keyed)
+
+
+def _rect_row_packet(row: RectBatchRow) -> tuple[_DrawPacket, str, object]:
+    """Build the packet ``_command_to_packet`` yields for the row's expanded command.
+
+    The row tuple itself is the version token: it is hashable and changes
+    whenever anything drawn for the row changes.
+    """
+    key, color, x, y, w, h, z, static, _order_key = row
+    payload: tuple[tuple[str, object], ...] = (
+        ("key", key),
+        ("x", x),
+        ("y", y),
+        ("w", w),
+        ("h", h),
+        ("color", color),
+        ("z", z),
+        ("static", static),
+    )
+    srgb_rgba = _srgb_rgba_from_value(color)
+    linear_rgba = _srgb_to_linear_rgba_cached(srgb_rgba)
+    packet = _DrawPacket(
+        kind="rect",
+        layer=int(round(z * 100.0)),
+        sort_key="",
+        transform=(1.0, 0.0, 0.0, x, 0.0, 1.0, 0.0, y, 0.0, 0.0, 1.0, z, 0.0, 0.0, 0.0, 1.0),
+        data=payload
+        + (
+            ("srgb_rgba", srgb_rgba),
+            ("linear_rgba", linear_rgba),
+            ("srgb_secondary_rgba", srgb_rgba),
+            ("linear_secondary_rgba", linear_rgba),
+        ),
+    )
+    return packet, "force_static" if static else "auto", row
+
+
 def _create_wgpu_backend(surface: SurfaceHandle | None) -> _Backend:
     return _WgpuBackend(surface=surface)
 
 
-def _command_sort_key(command: RenderCommand, ordinal: int) -> tuple[object, ...]:
-    return (
-        int(command.layer),
-        str(command.sort_key),
-        str(command.kind),
-        _command_key(command),
-        int(ordinal),
-    )
+def _sort_commands_by_order_key(commands: tuple[RenderCommand, ...]) -> tuple[RenderCommand, ...]:
+    """Stable-sort commands by packed order key, skipping passes already in order."""
+    keys = [render_command_order_key(command) for command in commands]
+    if all(left <= right for left, right in zip(keys, keys[1:])):
+        return commands
+    if _NP is not None and len(keys) >= _ORDER_ARGSORT_MIN_COMMANDS:
+        order = _NP.argsort(_NP.asarray(keys, dtype=_NP.uint64), kind="stable").tolist()
+    else:
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+    return tuple(commands[index] for index in order)
 
 
 def _command_static_override(command: RenderCommand) -> str:
@@ -1116,6 +1182,10 @@ def _extract_srgb_rgba(payload: tuple[tuple[str, object], ...]) -> tuple[float,
         if str(key) == "color":
             color_value = value
             break
+    return _srgb_rgba_from_value(color_value)
+
+
+def _srgb_rgba_from_value(color_value: object) -> tuple[float, float, float, float]:
     cached = _COMMAND_COLOR_CACHE.get(color_value)
     if cached is not None:
         return cached
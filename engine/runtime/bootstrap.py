@@ -5,17 +5,25 @@ from __future__ import annotations
 import os
 import traceback
 from collections.abc import Callable
+from pathlib import Path
 from typing import Any
 
 from engine.api.game_module import GameModule
 from engine.api.render import RenderAPI
 from engine.api.render_snapshot import RenderSnapshot
 from engine.api.ui_primitives import GridLayout
+from engine.diagnostics.json_codec import dumps_text
 from engine.input.input_controller import InputController
 from engine.rendering.scene_runtime import resolve_render_loop_config, resolve_render_vsync
 from engine.rendering.wgpu_renderer import WgpuInitError, WgpuRenderer
+from engine.runtime.fast_forward import (
+    FastForwardConfig,
+    load_scripted_input,
+    run_fast_forward,
+)
 from engine.runtime.host import EngineHost, EngineHostConfig
 from engine.runtime.logging import setup_engine_logging
+from engine.runtime.time import FrameClock, VirtualClock
 from engine.runtime.window_frontend import create_window_frontend
 from engine.window import create_window_layer
 
@@ -36,6 +44,12 @@ def run_hosted_runtime(
     if _resolve_engine_headless():
         renderer: RenderAPI = _HeadlessRenderer()
         module = module_factory(renderer, layout)
+        fast_forward = _resolve_fast_forward_config()
+        if fast_forward is not None:
+            _run_headless_fast_forward(
+                module=module, config=config, renderer=renderer, fast_forward=fast_forward
+            )
+            return
         host = EngineHost(module=module, config=config, render_api=renderer)
         while not host.is_closed():
             host.frame()
@@ -121,6 +135,62 @@ def _resolve_engine_headless() -> bool:
     return raw in {"1", "true", "yes", "on"}
 
 
+def _resolve_fast_forward_config() -> FastForwardConfig | None:
+    raw = os.getenv("ENGINE_HEADLESS_FAST_FORWARD", "0").strip().lower()
+    if raw not in {"1", "true", "yes", "on"}:
+        return None
+    step_seconds = _env_float("ENGINE_HEADLESS_FAST_FORWARD_STEP_SECONDS", 1.0 / 60.0)
+    max_frames = _env_int("ENGINE_HEADLESS_MAX_FRAMES", 0)
+    max_sim_seconds = _env_float("ENGINE_HEADLESS_MAX_SIM_SECONDS", 0.0)
+    return FastForwardConfig(
+        step_seconds=step_seconds if step_seconds > 0.0 else 1.0 / 60.0,
+        max_frames=max_frames if max_frames > 0 else None,
+        max_sim_seconds=max_sim_seconds if max_sim_seconds > 0.0 else None,
+    )
+
+
+def _run_headless_fast_forward(
+    *,
+    module: GameModule,
+    config: EngineHostConfig,
+    renderer: RenderAPI,
+    fast_forward: FastForwardConfig,
+) -> None:
+    clock = FrameClock(
+        time_source=VirtualClock(step_seconds=fast_forward.step_seconds),
+        max_delta_seconds=max(0.25, fast_forward.step_seconds),
+    )
+    host = EngineHost(module=module, config=config, render_api=renderer, clock=clock)
+    script_path = os.getenv("ENGINE_HEADLESS_INPUT_SCRIPT", "").strip()
+    script = load_scripted_input(Path(script_path)) if script_path else None
+    report = run_fast_forward(host, config=fast_forward, script=script)
+    report_path = os.getenv("ENGINE_HEADLESS_REPORT_PATH", "").strip()
+    if report_path:
+        path = Path(report_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(dumps_text(report.to_payload(), pretty=True), encoding="utf-8")
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
 def _resolve_wgpu_backend_priority() -> tuple[str, ...]:
     raw = os.getenv("ENGINE_WGPU_BACKENDS", "").strip()
     if not raw:
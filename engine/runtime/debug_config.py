@@ -44,6 +44,11 @@ def resolve_log_level_name(default: str = "INFO") -> str:
     return value.strip().upper()
 
 
+def resolve_log_fast_mode(default: bool = False) -> bool:
+    """Resolve whether logging uses the deferred-formatting fast pipeline."""
+    return _flag("ENGINE_LOG_FAST_MODE", default)
+
+
 def load_debug_config() -> DebugConfig:
     """Load immutable debug configuration from env vars."""
     profile = resolve_runtime_profile()
@@ -0,0 +1,275 @@
+"""Deterministic fast-forward runner for headless soak, perf and replay runs."""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from engine.api.input_events import KeyEvent, PointerEvent, WheelEvent
+from engine.api.input_snapshot import ActionSnapshot
+from engine.input.input_controller import InputController
+from engine.runtime.host import EngineHost
+
+_LOG = logging.getLogger("engine.fast_forward")
+
+type ScriptedEvent = PointerEvent | KeyEvent | WheelEvent
+
+
+@dataclass(frozen=True, slots=True)
+class FastForwardConfig:
+    """Bounds and pacing for one fast-forward run."""
+
+    step_seconds: float = 1.0 / 60.0
+    max_frames: int | None = None
+    max_sim_seconds: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.step_seconds <= 0.0:
+            raise ValueError("step_seconds must be > 0")
+        if self.max_frames is not None and self.max_frames < 0:
+            raise ValueError("max_frames must be >= 0")
+        if self.max_sim_seconds is not None and self.max_sim_seconds < 0.0:
+            raise ValueError("max_sim_seconds must be >= 0")
+
+
+@dataclass(frozen=True, slots=True)
+class ScriptedInputFrame:
+    """Raw events and logical action edges injected before one frame."""
+
+    events: tuple[ScriptedEvent, ...] = ()
+    actions_started: frozenset[str] = field(default_factory=frozenset)
+    actions_ended: frozenset[str] = field(default_factory=frozenset)
+
+
+@dataclass(frozen=True, slots=True)
+class ScriptedInput:
+    """Frame-indexed scripted input loaded from a script or replay session."""
+
+    frames: dict[int, ScriptedInputFrame] = field(default_factory=dict)
+
+    @property
+    def event_count(self) -> int:
+        return sum(
+            len(frame.events) + len(frame.actions_started) + len(frame.actions_ended)
+            for frame in self.frames.values()
+        )
+
+    @property
+    def last_frame(self) -> int:
+        return max(self.frames, default=-1)
+
+
+@dataclass(frozen=True, slots=True)
+class FastForwardReport:
+    """Exit report for one fast-forward run."""
+
+    frames: int
+    sim_seconds: float
+    wall_seconds: float
+    input_events: int
+    stop_reason: str
+
+    @property
+    def frames_per_second(self) -> float:
+        if self.wall_seconds <= 0.0:
+            return 0.0
+        return float(self.frames) / self.wall_seconds
+
+    @property
+    def speedup(self) -> float:
+        if self.wall_seconds <= 0.0:
+            return 0.0
+        return self.sim_seconds / self.wall_seconds
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "frames": int(self.frames),
+            "sim_seconds": float(self.sim_seconds),
+            "wall_seconds": float(self.wall_seconds),
+            "frames_per_second": float(self.frames_per_second),
+            "speedup": float(self.speedup),
+            "input_events": int(self.input_events),
+            "stop_reason": self.stop_reason,
+        }
+
+
+def run_fast_forward(
+    host: EngineHost,
+    *,
+    config: FastForwardConfig,
+    script: ScriptedInput | None = None,
+    input_controller: InputController | None = None,
+) -> FastForwardReport:
+    """Drive ``host`` frame by frame without sleeping until a bound is hit.
+
+    The host is expected to run on a ``VirtualClock`` with the same step so
+    simulated time advances exactly ``config.step_seconds`` per frame.
+    """
+    controller = input_controller or InputController()
+    frames = script.frames if script is not None else {}
+    input_events = 0
+    frame_count = 0
+    stop_reason = "closed"
+    started = perf_counter()
+    while not host.is_closed():
+        if config.max_frames is not None and frame_count >= config.max_frames:
+            stop_reason = "max_frames"
+            break
+        if (
+            config.max_sim_seconds is not None
+            and _sim_seconds(frame_count, config.step_seconds) >= config.max_sim_seconds
+        ):
+            stop_reason = "max_sim_seconds"
+            break
+        frame_index = host.current_frame_index()
+        scripted = frames.get(frame_index)
+        if scripted is not None and scripted.events:
+            controller.consume_window_input_events(scripted.events)
+        snapshot = controller.build_input_snapshot(frame_index=frame_index)
+        if scripted is not None and (scripted.actions_started or scripted.actions_ended):
+            actions = snapshot.actions
+            snapshot = replace(
+                snapshot,
+                actions=ActionSnapshot(
+                    active=(actions.active | scripted.actions_started) - scripted.actions_ended,
+                    just_started=actions.just_started | scripted.actions_started,
+                    just_ended=actions.just_ended | scripted.actions_ended,
+                    values=actions.values,
+                ),
+            )
+        if scripted is not None:
+            input_events += (
+                len(scripted.events) + len(scripted.actions_started) + len(scripted.actions_ended)
+            )
+        host.handle_input_snapshot(snapshot)
+        host.frame()
+        frame_count += 1
+    wall_seconds = perf_counter() - started
+    if not host.is_closed():
+        host.close()
+    report = FastForwardReport(
+        frames=frame_count,
+        sim_seconds=_sim_seconds(frame_count, config.step_seconds),
+        wall_seconds=wall_seconds,
+        input_events=input_events,
+        stop_reason=stop_reason,
+    )
+    _LOG.info(
+        "fast_forward_complete frames=%d sim_seconds=%.3f wall_seconds=%.3f fps=%.1f reason=%s",
+        report.frames,
+        report.sim_seconds,
+        report.wall_seconds,
+        report.frames_per_second,
+        report.stop_reason,
+    )
+    return report
+
+
+def _sim_seconds(frames: int, step_seconds: float) -> float:
+    # FrameClock reports a zero delta on the first frame, so N frames span N - 1 steps.
+    return max(0, frames - 1) * step_seconds
+
+
+def load_scripted_input(path: Path) -> ScriptedInput:
+    """Load scripted input from a JSONL script or an exported replay session.
+
+    Script lines look like ``{"frame": 12, "events": [{"type": "pointer_down",
+    "x": 10, "y": 20, "button": 1}]}``; ``key_down``/``key_up``/``char`` events
+    carry ``value`` and ``wheel`` events carry ``x``/``y``/``dy``. Replay
+    sessions contribute their ``input.action`` commands as action edges.
+    """
+    text = path.read_text(encoding="utf-8")
+    stripped = text.lstrip()
+    if stripped.startswith("{"):
+        try:
+            document = json.loads(text)
+        except json.JSONDecodeError:
+            document = None
+        if isinstance(document, dict) and isinstance(document.get("commands"), list):
+            return _scripted_input_from_replay(document)
+    builders: dict[int, _FrameBuilder] = {}
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        row = json.loads(line)
+        if not isinstance(row, dict):
+            raise ValueError(f"script line {line_number} must be a JSON object")
+        frame_index = int(row.get("frame", 0))
+        builder = builders.setdefault(frame_index, _FrameBuilder())
+        for raw_event in row.get("events", ()) or ():
+            builder.events.append(_parse_scripted_event(raw_event, line_number=line_number))
+        builder.started.update(str(name) for name in row.get("actions_started", ()) or ())
+        builder.ended.update(str(name) for name in row.get("actions_ended", ()) or ())
+    return ScriptedInput(frames={frame: builder.build() for frame, builder in builders.items()})
+
+
+@dataclass(slots=True)
+class _FrameBuilder:
+    events: list[ScriptedEvent] = field(default_factory=list)
+    started: set[str] = field(default_factory=set)
+    ended: set[str] = field(default_factory=set)
+
+    def build(self) -> ScriptedInputFrame:
+        return ScriptedInputFrame(
+            events=tuple(self.events),
+            actions_started=frozenset(self.started),
+            actions_ended=frozenset(self.ended),
+        )
+
+
+def _scripted_input_from_replay(session: dict[str, Any]) -> ScriptedInput:
+    manifest = session.get("manifest", {})
+    first_tick = int(manifest.get("first_tick", 0)) if isinstance(manifest, dict) else 0
+    builders: dict[int, _FrameBuilder] = {}
+    for item in session.get("commands", []):
+        if not isinstance(item, dict) or str(item.get("type", "")) != "input.action":
+            continue
+        payload = item.get("payload", {})
+        if not isinstance(payload, dict):
+            continue
+        name = str(payload.get("name", ""))
+        if not name:
+            continue
+        frame_index = int(item.get("tick", 0)) - first_tick
+        builder = builders.setdefault(frame_index, _FrameBuilder())
+        if str(payload.get("phase", "start")) == "end":
+            builder.ended.add(name)
+        else:
+            builder.started.add(name)
+    return ScriptedInput(frames={frame: builder.build() for frame, builder in builders.items()})
+
+
+def _parse_scripted_event(raw: object, *, line_number: int) -> ScriptedEvent:
+    if not isinstance(raw, dict):
+        raise ValueError(f"script line {line_number} has a non-object event")
+    event_type = str(raw.get("type", ""))
+    if event_type.startswith("pointer_"):
+        return PointerEvent(
+            event_type=event_type,
+            x=float(raw.get("x", 0.0)),
+            y=float(raw.get("y", 0.0)),
+            button=int(raw.get("button", 0)),
+        )
+    if event_type in {"key_down", "key_up", "char"}:
+        return KeyEvent(event_type=event_type, value=str(raw.get("value", "")))
+    if event_type == "wheel":
+        return WheelEvent(
+            x=float(raw.get("x", 0.0)),
+            y=float(raw.get("y", 0.0)),
+            dy=float(raw.get("dy", 0.0)),
+        )
+    raise ValueError(f"script line {line_number} has unsupported event type {event_type!r}")
+
+
+__all__ = [
+    "FastForwardConfig",
+    "FastForwardReport",
+    "ScriptedInput",
+    "ScriptedInputFrame",
+    "load_scripted_input",
+    "run_fast_forward",
+]
@@ -0,0 +1,330 @@
+"""Low-overhead logging pipeline.
+
+On the calling thread a record is reduced to a monotonic tick, the interned
+logger name, the level, the unformatted message and args, and the call site,
+and pushed onto a queue. Message formatting, ``LogRecord`` construction and all
+handler and file I/O happen on one listener thread. Per-call-site rate
+limiting drops repeats past ``rate_limit_per_site`` records per window; the
+drop count is emitted as a summary record when the window rolls over or the
+sink closes. Records can also be written to a compact binary log
+(``engine.diagnostics.binary_log``).
+
+Because formatting is deferred, message args are rendered when the listener
+reaches the record; callers should not mutate objects passed as args.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import sys
+import threading
+import time
+import traceback
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from types import CodeType
+from typing import Any
+
+from engine.diagnostics.binary_log import BinaryLogWriter
+
+# Attributes every LogRecord has; anything else is a caller ``extra`` field.
+_STANDARD_ATTRS = frozenset(
+    logging.LogRecord("", logging.INFO, "", 0, "", (), None).__dict__
+) | {"message", "asctime"}
+_SUPPRESSED_MESSAGE = "suppressed %d repeated log records from this call site"
+
+type _SiteKey = tuple[CodeType | str, int]
+# (tick_ns, suppressed, record, name, level, msg, args, site, exc_info, extra)
+type _Captured = tuple[
+    int,
+    int,
+    logging.LogRecord | None,
+    str,
+    int,
+    object,
+    tuple[object, ...],
+    _SiteKey,
+    Any,
+    dict[str, object] | None,
+]
+
+
+class FastLogSink:
+    """Caller-side capture queue drained by a formatting listener thread."""
+
+    def __init__(
+        self,
+        handlers: Sequence[logging.Handler],
+        *,
+        binary_path: Path | None = None,
+        rate_limit_per_site: int = 0,
+        rate_limit_window_s: float = 1.0,
+    ) -> None:
+        self._handlers = tuple(handlers)
+        self._mono_origin_ns = time.monotonic_ns()
+        self._wall_offset_ns = time.time_ns() - self._mono_origin_ns
+        self._binary = (
+            None
+            if binary_path is None
+            else BinaryLogWriter(
+                binary_path,
+                wall_origin_ns=self._mono_origin_ns + self._wall_offset_ns,
+                mono_origin_ns=self._mono_origin_ns,
+            )
+        )
+        self._rate_limit = max(0, int(rate_limit_per_site))
+        self._window_ns = max(1, int(rate_limit_window_s * 1e9))
+        # site -> [window_end_ns, emitted, suppressed, logger name, level]
+        self._sites: dict[_SiteKey, list[Any]] = {}
+        self._queue: queue.SimpleQueue[_Captured | None] = queue.SimpleQueue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="engine-log-listener", daemon=True)
+        self._thread.start()
+
+    @property
+    def binary_path(self) -> Path | None:
+        return None if self._binary is None else self._binary.path
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def capture(
+        self,
+        name: str,
+        level: int,
+        msg: object,
+        args: tuple[object, ...],
+        site: _SiteKey,
+        exc_info: Any = None,
+        extra: dict[str, object] | None = None,
+        record: logging.LogRecord | None = None,
+    ) -> None:
+        """Queue one record; the only work done on the logging thread."""
+        tick_ns = time.monotonic_ns()
+        suppressed = 0
+        if self._rate_limit:
+            state = self._sites.get(site)
+            if state is None:
+                self._sites[site] = [tick_ns + self._window_ns, 1, 0, name, level]
+            elif tick_ns >= state[0]:
+                suppressed = state[2]
+                state[0] = tick_ns + self._window_ns
+                state[1] = 1
+                state[2] = 0
+            elif state[1] >= self._rate_limit:
+                state[2] += 1
+                return
+            else:
+                state[1] += 1
+        self._queue.put(
+            (tick_ns, suppressed, record, name, level, msg, args, site, exc_info, extra)
+        )
+
+    def close(self, *, timeout_s: float = 5.0) -> None:
+        """Emit pending suppression summaries, drain the queue and stop the listener."""
+        if self._closed:
+            return
+        self._closed = True
+        tick_ns = time.monotonic_ns()
+        for site, state in tuple(self._sites.items()):
+            if state[2]:
+                self._queue.put(
+                    (tick_ns, state[2], None, state[3], state[4], None, (), site, None, None)
+                )
+        self._queue.put(None)
+        self._thread.join(timeout=timeout_s)
+
+    def _run(self) -> None:
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    return
+                try:
+                    self._emit(item)
+                except Exception:  # noqa: BLE001
+                    # A bad record or writer must not stop the listener.
+                    traceback.print_exc(file=sys.stderr)
+        finally:
+            if self._binary is not None:
+                self._binary.close()
+
+    def _emit(self, item: _Captured) -> None:
+        tick_ns, suppressed, record, name, level, msg, args, site, exc_info, extra = item
+        filename = site[0].co_filename if isinstance(site[0], CodeType) else site[0]
+        lineno = site[1]
+        if suppressed:
+            self._dispatch(
+                self._make_record(
+                    name, level, filename, lineno, _SUPPRESSED_MESSAGE, (suppressed,), tick_ns
+                ),
+                tick_ns,
+                (filename, lineno),
+                suppressed,
+            )
+        if msg is None and record is None:
+            # Close-time suppression summary only.
+            return
+        if record is None:
+            record = self._make_record(name, level, filename, lineno, msg, args, tick_ns)
+            if exc_info:
+                record.exc_info = exc_info
+            if extra:
+                record.__dict__.update(extra)
+        self._dispatch(record, tick_ns, (filename, lineno), 0)
+
+    def _dispatch(
+        self, record: logging.LogRecord, tick_ns: int, site: tuple[str, int], suppressed: int
+    ) -> None:
+        for handler in self._handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        if self._binary is None:
+            return
+        fields: dict[str, object] = {
+            key: value for key, value in record.__dict__.items() if key not in _STANDARD_ATTRS
+        }
+        if record.exc_info:
+            fields["exc_info"] = logging.Formatter().formatException(record.exc_info)
+        self._binary.write(
+            tick_ns=tick_ns,
+            logger=record.name,
+            level=record.levelno,
+            site=site,
+            message=record.getMessage(),
+            fields=fields,
+            suppressed=suppressed,
+        )
+
+    def _make_record(
+        self,
+        name: str,
+        level: int,
+        filename: str,
+        lineno: int,
+        msg: object,
+        args: tuple[object, ...],
+        tick_ns: int,
+    ) -> logging.LogRecord:
+        record = logging.LogRecord(name, level, filename, lineno, msg, args or None, None)
+        created_ns = tick_ns + self._wall_offset_ns
+        record.created = created_ns / 1e9
+        record.msecs = (created_ns // 1_000_000) % 1000
+        return record
+
+
+class FastCaptureHandler(logging.Handler):
+    """Root handler that hands stdlib records to a ``FastLogSink`` unformatted."""
+
+    def __init__(self, sink: FastLogSink) -> None:
+        super().__init__()
+        self._sink = sink
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._sink.capture(
+            record.name,
+            record.levelno,
+            record.msg,
+            (),
+            (record.pathname, record.lineno),
+            record=record,
+        )
+
+
+class FastLogger:
+    """Logger facade that skips ``LogRecord`` creation on the calling thread.
+
+    With ``resolve_sink`` the sink is looked up on every call, so a cached facade
+    follows logging reconfiguration. Without a live sink, calls go to the wrapped
+    stdlib logger.
+    """
+
+    __slots__ = ("_logger", "_name", "_resolve_sink", "_sink")
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        sink: FastLogSink | None = None,
+        *,
+        resolve_sink: Callable[[], FastLogSink | None] | None = None,
+    ) -> None:
+        self._logger = logger
+        self._name = sys.intern(logger.name)
+        self._sink = sink
+        self._resolve_sink = resolve_sink
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def isEnabledFor(self, level: int) -> bool:  # noqa: N802 - logging.Logger parity
+        return self._logger.isEnabledFor(level)
+
+    def setLevel(self, level: int | str) -> None:  # noqa: N802 - logging.Logger parity
+        self._logger.setLevel(level)
+
+    def debug(self, message: object, *args: object, **kwargs: object) -> None:
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._capture(logging.DEBUG, message, args, kwargs)
+
+    def info(self, message: object, *args: object, **kwargs: object) -> None:
+        if self._logger.isEnabledFor(logging.INFO):
+            self._capture(logging.INFO, message, args, kwargs)
+
+    def warning(self, message: object, *args: object, **kwargs: object) -> None:
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._capture(logging.WARNING, message, args, kwargs)
+
+    def error(self, message: object, *args: object, **kwargs: object) -> None:
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._capture(logging.ERROR, message, args, kwargs)
+
+    def exception(self, message: object, *args: object, **kwargs: object) -> None:
+        if self._logger.isEnabledFor(logging.ERROR):
+            kwargs.setdefault("exc_info", True)
+            self._capture(logging.ERROR, message, args, kwargs)
+
+    def critical(self, message: object, *args: object, **kwargs: object) -> None:
+        if self._logger.isEnabledFor(logging.CRITICAL):
+            self._capture(logging.CRITICAL, message, args, kwargs)
+
+    def log(self, level: int, message: object, *args: object, **kwargs: object) -> None:
+        if self._logger.isEnabledFor(level):
+            self._capture(level, message, args, kwargs)
+
+    def _capture(
+        self, level: int, message: object, args: tuple[object, ...], kwargs: dict[str, object]
+    ) -> None:
+        sink = self._sink if self._resolve_sink is None else self._resolve_sink()
+        if sink is None or sink.closed:
+            # Facade frame plus this one sit between the caller and Logger.log.
+            stacklevel = kwargs.pop("stacklevel", 1)
+            self._logger.log(
+                level,
+                message,
+                *args,
+                stacklevel=int(stacklevel) + 2,  # type: ignore[call-overload]
+                **kwargs,  # type: ignore[arg-type]
+            )
+            return
+        frame = sys._getframe(2)  # noqa: SLF001
+        exc_info: Any = kwargs.get("exc_info") if kwargs else None
+        if isinstance(exc_info, BaseException):
+            exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
+        elif exc_info is not None and not isinstance(exc_info, tuple):
+            exc_info = sys.exc_info() if exc_info else None
+        extra = kwargs.get("extra") if kwargs else None
+        sink.capture(
+            self._name,
+            level,
+            message,
+            args,
+            (frame.f_code, frame.f_lineno),
+            exc_info,
+            extra if isinstance(extra, dict) else None,
+        )
+
+
+__all__ = ["FastCaptureHandler", "FastLogSink", "FastLogger"]
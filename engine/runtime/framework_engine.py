@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import logging
 import os
 
 from engine.api.app_port import EngineAppPort, InteractionPlanView
@@ -20,6 +19,7 @@ from engine.api.ui_primitives import (
     route_modal_pointer_event,
     route_non_modal_key_event,
 )
+from engine.runtime.logging import get_engine_logger
 from engine.runtime.ui_space import UISpaceTransform, resolve_ui_space_transform
 
 
@@ -41,7 +41,7 @@ class EngineUIFramework:
             "yes",
             "on",
         }
-        self._trace_log = logging.getLogger("engine.inputtrace")
+        self._trace_log = get_engine_logger("engine.inputtrace")
 
     def sync_ui_state(self) -> None:
         """Sync framework runtime state from app UI snapshot."""
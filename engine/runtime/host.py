@@ -9,13 +9,22 @@ from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
+from time import perf_counter
 
 from engine.api.game_module import GameModule, HostControl, HostFrameContext
 from engine.api.input_events import KeyEvent
 from engine.api.input_snapshot import InputSnapshot
 from engine.api.render import RenderAPI
-from engine.api.render_snapshot import IDENTITY_MAT4, RenderCommand, RenderPassSnapshot, RenderSnapshot
+from engine.api.render_snapshot import (
+    IDENTITY_MAT4,
+    RenderCommand,
+    RenderPassSnapshot,
+    RenderSnapshot,
+    create_render_command,
+    render_command_order_key,
+)
 from engine.diagnostics import (
+    ChromeTraceExporter,
     CrashBundleWriter,
     DiagnosticHub,
     DiagnosticsMetricsStore,
@@ -26,20 +35,25 @@ from engine.diagnostics import (
     resolve_crash_bundle_dir,
 )
 from engine.diagnostics.json_codec import dumps_text
+from engine.diagnostics.replay_stream import REPLAY_STREAM_SUFFIX
 from engine.diagnostics.event import DiagnosticEvent
 from engine.runtime.debug_config import enabled_metrics, enabled_overlay, load_debug_config
 from engine.runtime.diagnostics_http import DiagnosticsHttpServer
+from engine.runtime.logging import get_engine_logger
 from engine.runtime.metrics import MetricsSnapshot, create_metrics_collector
 from engine.runtime.profiling import FrameProfiler
+from engine.runtime.render_cache import RenderCacheLRU, commands_cache_key
 from engine.runtime.scheduler import Scheduler
 from engine.runtime.snapshot_exchange import DoubleBufferedSnapshotExchange
 from engine.runtime.time import FrameClock
 from engine.runtime.ui_space import UISpaceTransform, resolve_ui_space_transform, scale_render_snapshot
+from engine.runtime_profile import resolve_runtime_profile_name
 from engine.ui_runtime.debug_overlay import DebugOverlay
 
-_LOG = logging.getLogger("engine.runtime")
-_PROFILE_LOG = logging.getLogger("engine.profiling")
+_LOG = get_engine_logger("engine.runtime")
+_PROFILE_LOG = get_engine_logger("engine.profiling")
 _OVERLAY_TOGGLE_KEY = "f3"
+_SANITIZED_PASS_CACHE_MAX = 64
 _PROFILE_LOG_ENABLED = os.getenv("ENGINE_PROFILING_LOG_PAYLOAD_ENABLED", "1").strip().lower() in {
     "1",
     "true",
@@ -66,6 +80,7 @@ class EngineHost(HostControl):
         module: GameModule,
         config: EngineHostConfig | None = None,
         render_api: RenderAPI | None = None,
+        clock: FrameClock | None = None,
     ) -> None:
         self._module = module
         self._config = config or EngineHostConfig()
@@ -73,7 +88,7 @@ class EngineHost(HostControl):
         self._frame_index = 0
         self._closed = False
         self._started = False
-        self._clock = FrameClock()
+        self._clock = clock or FrameClock()
         self._scheduler = Scheduler()
         self._render_api = render_api
         self._connected_controller_ids: set[str] = set()
@@ -128,19 +143,29 @@ class EngineHost(HostControl):
             seed=_resolve_replay_seed(),
             build=self._runtime_metadata(self._runtime_name),
             hash_interval=diag_cfg.replay_hash_interval,
+            checkpoint_interval=diag_cfg.replay_checkpoint_interval,
             hub=self._diagnostics_hub,
         )
+        if diag_cfg.replay_capture and diag_cfg.replay_format == "stream":
+            self._open_replay_stream()
         self._render_snapshot_exchange: DoubleBufferedSnapshotExchange[RenderSnapshot] = (
             DoubleBufferedSnapshotExchange()
         )
         self._sanitize_render_snapshot_enabled = _env_flag(
             "ENGINE_RUNTIME_RENDER_SNAPSHOT_SANITIZE", True
         )
-        self._last_snapshot_passes_identity: int = 0
-        self._last_sanitized_passes: tuple[RenderPassSnapshot, ...] | None = None
-        self._last_scaled_snapshot_passes_identity: int = 0
-        self._last_scaled_transform_key: tuple[float, float, float] | None = None
-        self._last_scaled_passes: tuple[RenderPassSnapshot, ...] | None = None
+        self._trusted_snapshot_validate_n = max(
+            0,
+            _env_int(
+                "ENGINE_RUNTIME_RENDER_SNAPSHOT_TRUSTED_VALIDATE_N",
+                60 if resolve_runtime_profile_name() == "dev-debug" else 0,
+            ),
+        )
+        self._trusted_snapshot_validate_count = 0
+        self._sanitized_pass_cache: RenderCacheLRU[RenderPassSnapshot] = RenderCacheLRU(
+            name="host.sanitized_pass",
+            capacity=_SANITIZED_PASS_CACHE_MAX,
+        )
         self._module_ui_transform: UISpaceTransform | None = None
         if self._render_api is not None:
             self._module_ui_transform = resolve_ui_space_transform(
@@ -149,6 +174,10 @@ class EngineHost(HostControl):
             )
         self._diagnostics_http: DiagnosticsHttpServer | None = None
         self._try_start_diagnostics_http()
+        self._trace_exporter: ChromeTraceExporter | None = None
+        self._trace_subscriber_token: int | None = None
+        if diag_cfg.trace_export:
+            self._open_trace_export()
 
     @property
     def config(self) -> EngineHostConfig:
@@ -166,6 +195,11 @@ class EngineHost(HostControl):
     def diagnostics_hub(self) -> DiagnosticHub:
         return self._diagnostics_hub
 
+    @property
+    def diagnostics_trace_active(self) -> bool:
+        """Whether a Chrome trace export is recording hub events."""
+        return self._trace_exporter is not None
+
     @property
     def diagnostics_metrics_snapshot(self) -> object:
         return self._diagnostics_metrics.snapshot()
@@ -253,6 +287,13 @@ class EngineHost(HostControl):
                     tick=self._frame_index,
                     value=float(value),
                 )
+            elif name == "meta.input_dropped" and float(value) > 0:
+                self._diagnostics_hub.emit_fast(
+                    category="input",
+                    name="input.events_dropped",
+                    tick=self._frame_index,
+                    value=float(value),
+                )
         current_connected: set[str] = {
             str(controller.device_id)
             for controller in snapshot.controllers
@@ -294,9 +335,13 @@ class EngineHost(HostControl):
         if "engine.debug_overlay.toggle" not in just_started_actions:
             return False
         self._debug_overlay_visible = not self._debug_overlay_visible
+        self.request_redraw()
+        return True
+
+    def request_redraw(self) -> None:
+        """Ask the render loop for another frame; on-demand loops otherwise wait for input."""
         if self._render_api is not None and hasattr(self._render_api, "invalidate"):
             self._render_api.invalidate()
-        return True
 
     def _filter_overlay_key_events(self, snapshot: InputSnapshot) -> InputSnapshot:
         filtered_key_events = tuple(
@@ -382,28 +427,10 @@ class EngineHost(HostControl):
                 },
             )
             if module_render_snapshot is not None and self._module_ui_transform is not None:
-                transform = self._module_ui_transform
-                transform_key = (
-                    round(float(transform.scale_x), 6),
-                    round(float(transform.scale_y), 6),
-                    round(float(transform.font_scale), 6),
+                # Scaled passes are memoized per command tuple in ui_space caches.
+                module_render_snapshot = scale_render_snapshot(
+                    module_render_snapshot, self._module_ui_transform
                 )
-                passes_identity = int(id(module_render_snapshot.passes))
-                if (
-                    self._last_scaled_passes is not None
-                    and self._last_scaled_snapshot_passes_identity == passes_identity
-                    and self._last_scaled_transform_key == transform_key
-                ):
-                    module_render_snapshot = RenderSnapshot(
-                        frame_index=int(module_render_snapshot.frame_index),
-                        passes=self._last_scaled_passes,
-                    )
-                else:
-                    scaled = scale_render_snapshot(module_render_snapshot, transform)
-                    self._last_scaled_snapshot_passes_identity = passes_identity
-                    self._last_scaled_transform_key = transform_key
-                    self._last_scaled_passes = scaled.passes
-                    module_render_snapshot = scaled
             if (
                 self._debug_overlay is not None
                 and self._debug_overlay_visible
@@ -454,8 +481,17 @@ class EngineHost(HostControl):
                         extra={"profile": profile},
                     )
             self._diagnostics_profiler.end_span(frame_span)
-            state_hash = self._resolve_replay_state_hash()
-            self._replay_recorder.mark_frame(tick=self._frame_index, state_hash=state_hash)
+            state_hash = None
+            if self._replay_recorder.wants_state_hash(self._frame_index):
+                state_hash = self._resolve_replay_state_hash()
+            checkpoint = None
+            if self._replay_recorder.wants_checkpoint(self._frame_index):
+                checkpoint = self._resolve_replay_state_checkpoint()
+            self._replay_recorder.mark_frame(
+                tick=self._frame_index,
+                state_hash=state_hash,
+                checkpoint=checkpoint,
+            )
             self._frame_index += 1
             if self._module.should_close():
                 self.close()
@@ -486,19 +522,73 @@ class EngineHost(HostControl):
     def _sanitize_snapshot_cached(self, snapshot: RenderSnapshot) -> RenderSnapshot:
         if not self._sanitize_render_snapshot_enabled:
             return snapshot
-        passes_identity = id(snapshot.passes)
-        if (
-            self._last_sanitized_passes is not None
-            and self._last_snapshot_passes_identity == passes_identity
-        ):
-            return RenderSnapshot(
-                frame_index=int(snapshot.frame_index),
-                passes=self._last_sanitized_passes,
+        honor_trusted = self._validate_trusted_snapshot_sampled(snapshot)
+        if honor_trusted and _is_trusted_render_snapshot(snapshot):
+            return snapshot
+        start_s = perf_counter()
+        passes: list[RenderPassSnapshot] = []
+        sanitized_count = 0
+        for render_pass in snapshot.passes:
+            if honor_trusted and (snapshot.trusted or render_pass.trusted):
+                passes.append(render_pass)
+                continue
+            cache_key = (commands_cache_key(render_pass.commands), str(render_pass.name))
+            sanitized = (
+                self._sanitized_pass_cache.get(cache_key, render_pass.commands)
+                if honor_trusted
+                else None
+            )
+            if sanitized is None:
+                sanitized = _sanitize_render_pass(render_pass)
+                self._sanitized_pass_cache.put(cache_key, render_pass.commands, sanitized)
+                sanitized_count += 1
+            if sanitized.rect_batches is not render_pass.rect_batches:
+                # Columnar batches freeze their columns on construction.
+                sanitized = replace(sanitized, rect_batches=render_pass.rect_batches)
+            passes.append(sanitized)
+        if sanitized_count > 0:
+            self._diagnostics_hub.emit_fast(
+                category="render",
+                name="render.snapshot_sanitize_ms",
+                tick=self._frame_index,
+                value=(perf_counter() - start_s) * 1000.0,
+                metadata={"passes": len(passes), "sanitized_passes": sanitized_count},
             )
-        sanitized = _sanitize_render_snapshot(snapshot)
-        self._last_snapshot_passes_identity = passes_identity
-        self._last_sanitized_passes = sanitized.passes
-        return sanitized
+        return RenderSnapshot(
+            frame_index=int(snapshot.frame_index),
+            passes=tuple(passes),
+            trusted=True,
+        )
+
+    def _validate_trusted_snapshot_sampled(self, snapshot: RenderSnapshot) -> bool:
+        """Sample-check trusted passes; return whether trusted markers may be honored."""
+        interval = self._trusted_snapshot_validate_n
+        if interval <= 0:
+            return True
+        if not snapshot.trusted and not any(render_pass.trusted for render_pass in snapshot.passes):
+            return True
+        count = self._trusted_snapshot_validate_count
+        self._trusted_snapshot_validate_count = count + 1
+        if count % interval != 0:
+            return True
+        violations = _find_trusted_render_violations(snapshot)
+        if not violations:
+            return True
+        _LOG.warning(
+            "render_snapshot_trusted_violation frame=%d count=%d samples=%s",
+            self._frame_index,
+            len(violations),
+            violations[:5],
+        )
+        self._diagnostics_hub.emit_fast(
+            category="render",
+            name="render.snapshot_trusted_violation",
+            tick=self._frame_index,
+            level="warning",
+            value=len(violations),
+            metadata={"samples": violations[:5]},
+        )
+        return False
 
     def _ingest_render_profile_event(self, event: DiagnosticEvent) -> None:
         if event.category != "render" or event.name != "render.profile_frame":
@@ -518,6 +608,7 @@ class EngineHost(HostControl):
             self._diagnostics_http = None
         self._diagnostics_hub.unsubscribe(self._diagnostics_subscriber_token)
         self._diagnostics_hub.unsubscribe(self._render_profile_subscriber_token)
+        self._close_trace_export()
         self._frame_profiler.close()
         self._module.on_shutdown()
 
@@ -535,6 +626,16 @@ class EngineHost(HostControl):
             _LOG.exception("replay_state_hash_provider_failed")
             return None
 
+    def _resolve_replay_state_checkpoint(self) -> object | None:
+        provider = getattr(self._module, "debug_state_checkpoint", None)
+        if not callable(provider):
+            return None
+        try:
+            return provider()
+        except Exception:  # pylint: disable=broad-exception-caught
+            _LOG.exception("replay_state_checkpoint_provider_failed")
+            return None
+
     @staticmethod
     def _runtime_metadata(runtime_name: str = "game") -> dict[str, object]:
         versions: dict[str, str] = {}
@@ -568,7 +669,55 @@ class EngineHost(HostControl):
         self._diagnostics_http = server
         _LOG.info("diagnostics_http_endpoint=%s", server.endpoint)
 
+    def _open_replay_stream(self) -> None:
+        stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+        out_dir = Path(self._diag_cfg.replay_export_dir)
+        out_path = out_dir / f"{self._runtime_name}_replay_session_{stamp}{REPLAY_STREAM_SUFFIX}"
+        try:
+            self._replay_recorder.open_stream(
+                path=out_path, chunk_ticks=self._diag_cfg.replay_chunk_ticks
+            )
+        except OSError:
+            _LOG.warning("replay_stream_open_failed path=%s", out_path)
+
+    def _open_trace_export(self) -> None:
+        stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+        out_dir = Path(self._diag_cfg.profile_export_dir)
+        out_path = out_dir / f"{self._runtime_name}_trace_{stamp}.json"
+        try:
+            exporter = ChromeTraceExporter(path=out_path, process_name=self._runtime_name)
+        except OSError:
+            _LOG.warning("trace_export_open_failed path=%s", out_path)
+            return
+        self._trace_exporter = exporter
+        self._trace_subscriber_token = self._diagnostics_hub.subscribe(exporter.enqueue)
+
+    def _close_trace_export(self) -> None:
+        exporter = self._trace_exporter
+        if exporter is None:
+            return
+        if self._trace_subscriber_token is not None:
+            self._diagnostics_hub.unsubscribe(self._trace_subscriber_token)
+            self._trace_subscriber_token = None
+        self._trace_exporter = None
+        out_path = exporter.close()
+        stats = exporter.stats()
+        _LOG.info(
+            "trace_export_written path=%s events=%d dropped=%d",
+            out_path,
+            stats.written_count,
+            stats.dropped_count,
+        )
+
     def _export_replay_capture_on_shutdown(self) -> None:
+        if self._replay_recorder.streaming:
+            try:
+                exported_stream = self._replay_recorder.close_stream()
+            except OSError:
+                _LOG.warning("replay_stream_close_failed")
+                return
+            _LOG.info("replay_export_written path=%s", exported_stream)
+            return
         manifest = self._replay_recorder.manifest()
         if not self._diag_cfg.replay_capture:
             return
@@ -643,7 +792,8 @@ class _OverlaySnapshotRecorder:
         static: bool = False,
     ) -> None:
         self._commands.append(
-            RenderCommand(
+            create_render_command(
+                sequence=len(self._commands),
                 kind="rect",
                 layer=int(round(float(z) * 100.0)),
                 transform=IDENTITY_MAT4,
@@ -673,7 +823,8 @@ class _OverlaySnapshotRecorder:
         static: bool = False,
     ) -> None:
         self._commands.append(
-            RenderCommand(
+            create_render_command(
+                sequence=len(self._commands),
                 kind="grid",
                 layer=int(round(float(z) * 100.0)),
                 transform=IDENTITY_MAT4,
@@ -704,7 +855,8 @@ class _OverlaySnapshotRecorder:
         static: bool = False,
     ) -> None:
         self._commands.append(
-            RenderCommand(
+            create_render_command(
+                sequence=len(self._commands),
                 kind="text",
                 layer=int(round(float(z) * 100.0)),
                 transform=IDENTITY_MAT4,
@@ -724,7 +876,8 @@ class _OverlaySnapshotRecorder:
 
     def set_title(self, title: str) -> None:
         self._commands.append(
-            RenderCommand(
+            create_render_command(
+                sequence=len(self._commands),
                 kind="title",
                 layer=0,
                 transform=IDENTITY_MAT4,
@@ -734,7 +887,8 @@ class _OverlaySnapshotRecorder:
 
     def fill_window(self, key: str, color: str, z: float = -100.0) -> None:
         self._commands.append(
-            RenderCommand(
+            create_render_command(
+                sequence=len(self._commands),
                 kind="fill_window",
                 layer=int(round(float(z) * 100.0)),
                 transform=IDENTITY_MAT4,
@@ -762,19 +916,10 @@ class _OverlaySnapshotRecorder:
     def snapshot(self) -> RenderSnapshot | None:
         if not self._commands:
             return None
-        commands = tuple(
-            sorted(
-                self._commands,
-                key=lambda command: (
-                    int(getattr(command, "layer", 0)),
-                    str(getattr(command, "kind", "")),
-                    str(getattr(command, "sort_key", "")),
-                ),
-            )
-        )
+        commands = tuple(sorted(self._commands, key=render_command_order_key))
         return RenderSnapshot(
             frame_index=self._frame_index,
-            passes=(RenderPassSnapshot(name="debug_overlay", commands=commands),),
+            passes=(RenderPassSnapshot(name="debug_overlay", commands=commands, trusted=True),),
         )
 
 
@@ -800,27 +945,78 @@ def _merge_render_snapshots(
     return RenderSnapshot(
         frame_index=left.frame_index,
         passes=tuple(left.passes) + tuple(right.passes),
+        trusted=bool(left.trusted and right.trusted),
     )
 
 
-def _sanitize_render_snapshot(snapshot: RenderSnapshot) -> RenderSnapshot:
+def _is_trusted_render_snapshot(snapshot: RenderSnapshot) -> bool:
+    if snapshot.trusted:
+        return True
+    return all(render_pass.trusted for render_pass in snapshot.passes)
+
+
+def _sanitize_render_snapshot(
+    snapshot: RenderSnapshot, *, honor_trusted: bool = True
+) -> RenderSnapshot:
     passes = tuple(
-        RenderPassSnapshot(
-            name=str(render_pass.name),
-            commands=tuple(
-                RenderCommand(
-                    kind=str(command.kind),
-                    layer=int(command.layer),
-                    sort_key=str(command.sort_key),
-                    transform=command.transform,
-                    data=tuple((str(key), _freeze_render_value(value)) for key, value in command.data),
-                )
-                for command in render_pass.commands
-            ),
-        )
+        render_pass
+        if honor_trusted and (snapshot.trusted or render_pass.trusted)
+        else _sanitize_render_pass(render_pass)
         for render_pass in snapshot.passes
     )
-    return RenderSnapshot(frame_index=int(snapshot.frame_index), passes=passes)
+    return RenderSnapshot(frame_index=int(snapshot.frame_index), passes=passes, trusted=True)
+
+
+def _sanitize_render_pass(render_pass: RenderPassSnapshot) -> RenderPassSnapshot:
+    return RenderPassSnapshot(
+        name=str(render_pass.name),
+        commands=tuple(
+            RenderCommand(
+                kind=str(command.kind),
+                layer=int(command.layer),
+                sort_key=str(command.sort_key),
+                transform=command.transform,
+                data=tuple((str(key), _freeze_render_value(value)) for key, value in command.data),
+                identity=command.identity,
+                order_key=command.order_key,
+            )
+            for command in render_pass.commands
+        ),
+        trusted=True,
+        rect_batches=tuple(render_pass.rect_batches),
+    )
+
+
+def _find_trusted_render_violations(snapshot: RenderSnapshot) -> list[str]:
+    """Describe payload entries in trusted passes that are not already frozen."""
+    violations: list[str] = []
+    for render_pass in snapshot.passes:
+        if not (snapshot.trusted or render_pass.trusted):
+            continue
+        if not isinstance(render_pass.commands, tuple):
+            violations.append(f"{render_pass.name}:<commands>")
+            continue
+        for command in render_pass.commands:
+            if not isinstance(command.data, tuple):
+                violations.append(f"{render_pass.name}:{command.kind}:<data>")
+                continue
+            for item in command.data:
+                if (
+                    not isinstance(item, tuple)
+                    or len(item) != 2
+                    or not isinstance(item[0], str)
+                    or not _is_frozen_render_value(item[1])
+                ):
+                    violations.append(f"{render_pass.name}:{command.kind}:{item!r:.60}")
+    return violations
+
+
+def _is_frozen_render_value(value: object) -> bool:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return True
+    if isinstance(value, tuple):
+        return all(_is_frozen_render_value(item) for item in value)
+    return False
 
 
 def _freeze_render_value(value: object) -> object:
@@ -883,6 +1079,16 @@ def _try_state_hash_provider(module: object) -> str | None:
     return str(state_hash)
 
 
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return int(default)
+    try:
+        return int(raw.strip())
+    except ValueError:
+        return int(default)
+
+
 def _env_flag(name: str, default: bool) -> bool:
     raw = os.getenv(name)
     if raw is None:
@@ -2,32 +2,38 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
 import queue
 from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from engine.api.logging import EngineLoggingConfig, JsonFormatter
-from engine.runtime.debug_config import resolve_log_level_name
+from engine.runtime.debug_config import resolve_log_fast_mode, resolve_log_level_name
+from engine.runtime.fast_logging import FastCaptureHandler, FastLogger, FastLogSink
 
 _QUEUE_LISTENER: QueueListener | None = None
+_FAST_SINK: FastLogSink | None = None
+_FAST_LOGGERS: dict[str, FastLogger] = {}
 RESERVED_LOGGER_NAMES: tuple[str, ...] = ("engine.network", "engine.audio")
 
 
 def configure_engine_logging(config: EngineLoggingConfig) -> None:
     """Configure root logging with optional async file streaming."""
-    global _QUEUE_LISTENER
+    global _QUEUE_LISTENER, _FAST_SINK
 
     if _QUEUE_LISTENER is not None:
         _QUEUE_LISTENER.stop()
         _QUEUE_LISTENER = None
+    stop_fast_logging()
 
     level = getattr(logging, config.level_name.upper(), logging.INFO)
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(_resolve_formatter(config.console_format))
     handlers: list[logging.Handler] = [console_handler]
+    binary = config.file_format.strip().lower() == "binary"
 
-    if config.file_path:
+    if config.file_path and not binary:
         file_path = Path(config.file_path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(file_path, mode="a", encoding="utf-8", delay=True)
@@ -38,6 +44,16 @@ def configure_engine_logging(config: EngineLoggingConfig) -> None:
     root.handlers.clear()
     root.setLevel(level)
 
+    if config.fast_mode or binary:
+        _FAST_SINK = FastLogSink(
+            handlers,
+            binary_path=Path(config.file_path) if binary and config.file_path else None,
+            rate_limit_per_site=config.rate_limit_per_site,
+            rate_limit_window_s=config.rate_limit_window_s,
+        )
+        root.addHandler(FastCaptureHandler(_FAST_SINK))
+        return
+
     if len(handlers) == 1:
         root.addHandler(handlers[0])
         return
@@ -59,16 +75,43 @@ def setup_engine_logging() -> None:
             console_format="text",
             file_path=None,
             file_format="json",
+            fast_mode=resolve_log_fast_mode(),
         )
     )
 
 
-def get_engine_logger(name: str) -> logging.Logger:
-    """Return namespaced logger instance."""
-    return logging.getLogger(name)
+def stop_fast_logging() -> None:
+    """Flush and stop the fast-mode listener, if running."""
+    global _FAST_SINK
+
+    sink = _FAST_SINK
+    if sink is None:
+        return
+    _FAST_SINK = None
+    root = logging.getLogger()
+    for handler in tuple(root.handlers):
+        if isinstance(handler, FastCaptureHandler):
+            root.removeHandler(handler)
+    sink.close()
+
+
+def get_engine_logger(name: str) -> FastLogger:
+    """Return namespaced logger; it uses the fast sink whenever one is configured."""
+    fast = _FAST_LOGGERS.get(name)
+    if fast is None:
+        fast = FastLogger(logging.getLogger(name), resolve_sink=_current_fast_sink)
+        _FAST_LOGGERS[name] = fast
+    return fast
+
+
+def _current_fast_sink() -> FastLogSink | None:
+    return _FAST_SINK
 
 
 def _resolve_formatter(kind: str) -> logging.Formatter:
     if kind.strip().lower() == "json":
         return JsonFormatter()
     return logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+
+atexit.register(stop_fast_logging)
@@ -1,14 +1,27 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import re
 import statistics
+from bisect import bisect_left
 from dataclasses import dataclass
 from datetime import datetime
+from fnmatch import translate
 from pathlib import Path
 from typing import Any
 
+from engine.diagnostics.jsonl_reader import iter_jsonl_records
+from engine.diagnostics.replay_stream import REPLAY_STREAM_SUFFIX, ReplayStreamReader
+from engine.diagnostics.session_index import (
+    SessionFileIndex,
+    session_index_root,
+    shared_session_index,
+)
+
+# Replay streams are stamped when the host starts, within moments of the run log.
+_REPLAY_STREAM_MATCH_SECONDS = 120.0
+
 
 @dataclass(frozen=True)
 class SessionBundle:
@@ -16,6 +29,7 @@ class SessionBundle:
     ui_log: Path | None
     run_stamp: datetime | None
     ui_stamp: datetime | None
+    replay_stream: Path | None = None
 
 
 @dataclass(frozen=True)
@@ -47,17 +61,18 @@ class LoadedSession:
     run_records: list[dict[str, Any]]
     ui_frames: list[dict[str, Any]]
     summary: SessionSummary
+    replay: ReplayStreamReader | None = None
 
+    def close(self) -> None:
+        """Release the replay stream file handle, if one was opened."""
+        if self.replay is not None:
+            self.replay.close()
 
-def _safe_json_line(line: str) -> dict[str, Any] | None:
-    line = line.strip()
-    if not line:
-        return None
-    try:
-        value = json.loads(line)
-    except json.JSONDecodeError:
-        return None
-    return value if isinstance(value, dict) else None
+    def __enter__(self) -> LoadedSession:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
 
 
 def _parse_iso_timestamp(value: object) -> datetime | None:
@@ -69,20 +84,38 @@ def _parse_iso_timestamp(value: object) -> datetime | None:
         return None
 
 
+_STAMP_RE = re.compile(r"_(\d{8}T\d{6})(?:_|$)")
+
+
 def _extract_stamp(path: Path, prefix: str) -> datetime | None:
-    name = path.stem
+    return _stamp_from_name(path.name, prefix)
+
+
+def _stamp_from_name(file_name: str, prefix: str) -> datetime | None:
+    dot = file_name.rfind(".")
+    stem = file_name[:dot] if dot > 0 else file_name
     # New pattern: <game>_<kind>_<YYYYMMDDTHHMMSS>[...]
-    match = re.search(r"_(\d{8}T\d{6})(?:_|$)", name)
+    match = _STAMP_RE.search(stem)
     if match:
         raw = match.group(1)
-    else:
-        # Legacy pattern support: warships_run_<stamp>, ui_diag_run_<stamp>
-        if not path.name.startswith(prefix):
+        try:
+            return datetime(
+                int(raw[0:4]),
+                int(raw[4:6]),
+                int(raw[6:8]),
+                int(raw[9:11]),
+                int(raw[11:13]),
+                int(raw[13:15]),
+            )
+        except ValueError:
             return None
-        raw = path.name[len(prefix) :]
-        if raw.endswith(".jsonl"):
-            raw = raw[:-6]
-        raw = raw.split("_", 1)[0]
+    # Legacy pattern support: warships_run_<stamp>, ui_diag_run_<stamp>
+    if not file_name.startswith(prefix):
+        return None
+    raw = file_name[len(prefix) :]
+    if raw.endswith(".jsonl"):
+        raw = raw[:-6]
+    raw = raw.split("_", 1)[0]
     try:
         return datetime.strptime(raw, "%Y%m%dT%H%M%S")
     except ValueError:
@@ -108,83 +141,146 @@ def _p95(values: list[float]) -> float | None:
     return _percentile(sorted_values, 0.95)
 
 
-def discover_session_bundles(log_dir: Path, *, recursive: bool = False) -> list[SessionBundle]:
+_RUN_LOG_NAMES = re.compile(
+    "|".join(translate(pattern) for pattern in ("*_logs_*.jsonl", "warships_run_*.jsonl"))
+)
+_UI_LOG_NAMES = re.compile(
+    "|".join(translate(pattern) for pattern in ("*_ui_trace_*.jsonl", "ui_diag_run_*.jsonl"))
+)
+_REPLAY_STREAM_NAMES = re.compile(translate(f"*_replay_session_*{REPLAY_STREAM_SUFFIX}"))
+
+
+def discover_session_bundles(
+    log_dir: Path, *, recursive: bool = False, use_index: bool = True
+) -> list[SessionBundle]:
+    """Pair run logs, UI traces and replay streams by their file-name stamps.
+
+    With ``use_index`` the directory listing comes from (and refreshes) the
+    in-process session file cache for ``session_index_root(log_dir)``.
+    """
     search_roots = [log_dir]
     if log_dir.name == "logs":
         # Allow passing appdata/logs while ui traces are in sibling appdata/ui.
         search_roots.append(log_dir.parent)
-    run_logs: list[Path] = []
-    ui_logs: list[Path] = []
-    if recursive:
-        for root in search_roots:
-            run_logs.extend(root.rglob("*_logs_*.jsonl"))
-            run_logs.extend(root.rglob("warships_run_*.jsonl"))
-            ui_logs.extend(root.rglob("*_ui_trace_*.jsonl"))
-            ui_logs.extend(root.rglob("ui_diag_run_*.jsonl"))
-        run_logs = sorted(set(run_logs))
-        ui_logs = sorted(set(ui_logs))
+    index_root = session_index_root(log_dir)
+    if use_index:
+        with shared_session_index(index_root) as index:
+            listed = _list_session_files(index, search_roots, recursive=recursive)
     else:
-        for root in search_roots:
-            run_logs.extend(root.glob("*_logs_*.jsonl"))
-            run_logs.extend(root.glob("warships_run_*.jsonl"))
-            ui_logs.extend(root.glob("*_ui_trace_*.jsonl"))
-            ui_logs.extend(root.glob("ui_diag_run_*.jsonl"))
-        run_logs = sorted(set(run_logs))
-        ui_logs = sorted(set(ui_logs))
-    run_items = [(p, _extract_stamp(p, "warships_run_")) for p in run_logs]
-    ui_items = [(p, _extract_stamp(p, "ui_diag_run_")) for p in ui_logs]
-
-    bundles: list[SessionBundle] = []
-    used_runs: set[Path] = set()
+        index = SessionFileIndex(index_root)
+        listed = _list_session_files(index, search_roots, recursive=recursive)
+    run_items = _stamped(listed, _RUN_LOG_NAMES, "warships_run_")
+    ui_items = _stamped(listed, _UI_LOG_NAMES, "ui_diag_run_")
+    run_lookup = _StampLookup(
+        [(path, stamp) for path, stamp in run_items if stamp is not None], prefer_last=False
+    )
+    replay_items = [
+        (path, stamp) for path, stamp in _stamped(listed, _REPLAY_STREAM_NAMES, "") if stamp
+    ]
+    replay_lookup = _StampLookup(replay_items, prefer_last=True)
+
+    keyed: list[tuple[datetime, str, SessionBundle]] = []
+    used_runs: set[str] = set()
     for ui_path, ui_stamp in ui_items:
-        best_run: Path | None = None
-        best_stamp: datetime | None = None
-        best_delta: float | None = None
-        if ui_stamp is not None:
-            for run_path, run_stamp in run_items:
-                if run_stamp is None:
-                    continue
-                delta = abs((ui_stamp - run_stamp).total_seconds())
-                if best_delta is None or delta < best_delta:
-                    best_delta = delta
-                    best_run = run_path
-                    best_stamp = run_stamp
-        bundles.append(
-            SessionBundle(
-                run_log=best_run,
-                ui_log=ui_path,
-                run_stamp=best_stamp,
-                ui_stamp=ui_stamp,
-            )
+        nearest = run_lookup.nearest(ui_stamp) if ui_stamp is not None else None
+        best_run, best_stamp = nearest if nearest is not None else (None, None)
+        bundle = SessionBundle(
+            run_log=None if best_run is None else Path(best_run),
+            ui_log=Path(ui_path),
+            run_stamp=best_stamp,
+            ui_stamp=ui_stamp,
+            replay_stream=_nearest_replay_stream(replay_lookup, best_stamp or ui_stamp),
         )
+        keyed.append((ui_stamp or best_stamp or datetime.min, ui_path, bundle))
         if best_run is not None:
             used_runs.add(best_run)
 
     for run_path, run_stamp in run_items:
         if run_path in used_runs:
             continue
-        bundles.append(
-            SessionBundle(run_log=run_path, ui_log=None, run_stamp=run_stamp, ui_stamp=None)
+        bundle = SessionBundle(
+            run_log=Path(run_path),
+            ui_log=None,
+            run_stamp=run_stamp,
+            ui_stamp=None,
+            replay_stream=_nearest_replay_stream(replay_lookup, run_stamp),
         )
+        keyed.append((run_stamp or datetime.min, run_path, bundle))
+
+    keyed.sort(key=lambda item: (item[0], item[1]))
+    return [bundle for _stamp, _path, bundle in keyed]
+
+
+def _list_session_files(
+    index: SessionFileIndex, search_roots: list[Path], *, recursive: bool
+) -> dict[str, str]:
+    # Paths stay strings until they are matched; Path hashing/sorting dominates otherwise.
+    listed: dict[str, str] = {}
+    for root in search_roots:
+        for folder, file_name in index.iter_entries(root, recursive=recursive):
+            listed[os.path.join(folder, file_name)] = file_name
+        if not recursive:
+            for folder, file_name in index.iter_entries(root / "replay"):
+                if _REPLAY_STREAM_NAMES.match(file_name):
+                    listed[os.path.join(folder, file_name)] = file_name
+    return listed
+
+
+def _stamped(
+    listed: dict[str, str], names: re.Pattern[str], prefix: str
+) -> list[tuple[str, datetime | None]]:
+    return [
+        (path, _stamp_from_name(listed[path], prefix))
+        for path in sorted(path for path, file_name in listed.items() if names.match(file_name))
+    ]
+
+
+class _StampLookup:
+    """Nearest-stamp search over sorted stamps.
+
+    Ties between equally near stamps (and between paths sharing a stamp) go to
+    the first path in sorted order, or the last one with ``prefer_last``.
+    """
+
+    def __init__(self, items: list[tuple[str, datetime]], *, prefer_last: bool) -> None:
+        by_stamp: dict[datetime, tuple[int, str]] = {}
+        for order, (path, stamp) in enumerate(items):
+            current = by_stamp.get(stamp)
+            if current is None or prefer_last:
+                by_stamp[stamp] = (order, path)
+        self._stamps = sorted(by_stamp)
+        self._by_stamp = by_stamp
+        self._prefer_last = prefer_last
+
+    def nearest(
+        self, stamp: datetime, *, max_seconds: float | None = None
+    ) -> tuple[str, datetime] | None:
+        position = bisect_left(self._stamps, stamp)
+        best: tuple[float, int, datetime] | None = None
+        for candidate in self._stamps[max(0, position - 1) : position + 1]:
+            delta = abs((candidate - stamp).total_seconds())
+            if max_seconds is not None and delta > max_seconds:
+                continue
+            order = self._by_stamp[candidate][0]
+            rank = (delta, -order if self._prefer_last else order, candidate)
+            if best is None or rank < best:
+                best = rank
+        if best is None:
+            return None
+        return self._by_stamp[best[2]][1], best[2]
 
-    bundles.sort(
-        key=lambda b: (
-            b.ui_stamp or b.run_stamp or datetime.min,
-            str(b.ui_log or b.run_log or ""),
-        )
-    )
-    return bundles
+
+def _nearest_replay_stream(lookup: _StampLookup, stamp: datetime | None) -> Path | None:
+    if stamp is None:
+        return None
+    nearest = lookup.nearest(stamp, max_seconds=_REPLAY_STREAM_MATCH_SECONDS)
+    return None if nearest is None else Path(nearest[0])
 
 
 def _load_jsonl(path: Path | None) -> list[dict[str, Any]]:
     if path is None or not path.exists():
         return []
-    out: list[dict[str, Any]] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        row = _safe_json_line(line)
-        if row is not None:
-            out.append(row)
-    return out
+    return list(iter_jsonl_records(path))
 
 
 def _frame_time_ms(frames: list[dict[str, Any]]) -> tuple[list[float], list[HitchRecord]]:
@@ -273,10 +369,24 @@ def load_session(bundle: SessionBundle) -> LoadedSession:
     ui_frames.sort(key=lambda r: int(r["frame_seq"]))
     summary = summarize_session(run_records=run_records, ui_frames=ui_frames)
     return LoadedSession(
-        bundle=bundle, run_records=run_records, ui_frames=ui_frames, summary=summary
+        bundle=bundle,
+        run_records=run_records,
+        ui_frames=ui_frames,
+        summary=summary,
+        replay=_open_replay_stream(bundle.replay_stream),
     )
 
 
+def _open_replay_stream(path: Path | None) -> ReplayStreamReader | None:
+    # Opening only reads the footer index; chunks decompress on demand.
+    if path is None or not path.exists():
+        return None
+    try:
+        return ReplayStreamReader(path)
+    except (OSError, ValueError):
+        return None
+
+
 def _format_float(value: float | None) -> str:
     if value is None:
         return "n/a"
@@ -328,7 +438,8 @@ def main(argv: list[str] | None = None) -> int:
         bundle = SessionBundle(
             run_log=args.run_log, ui_log=args.ui_log, run_stamp=None, ui_stamp=None
         )
-        _print_session_summary(load_session(bundle))
+        with load_session(bundle) as session:
+            _print_session_summary(session)
         return 0
 
     bundles = discover_session_bundles(args.logs_dir, recursive=args.recursive)
@@ -345,7 +456,8 @@ def main(argv: list[str] | None = None) -> int:
         print("No sessions discovered.")
         return 0
     index = max(0, min(args.session_index, len(bundles) - 1))
-    _print_session_summary(load_session(bundles[index]))
+    with load_session(bundles[index]) as session:
+        _print_session_summary(session)
     return 0
 
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import cProfile
 import os
 import pstats
+import threading
 import tracemalloc
 from datetime import UTC, datetime
 from importlib import import_module
@@ -14,6 +15,8 @@ from typing import Any
 
 from engine.diagnostics.json_codec import dumps_text
 from engine.runtime.metrics import MetricsSnapshot
+from engine.runtime.render_cache import render_cache_stats
+from engine.runtime.stack_sampler import StackSampler
 
 _RSS_PROVIDER: str | None = None
 _RSS_PSUTIL_MOD: Any | None = None
@@ -53,6 +56,12 @@ class FrameProfiler:
     _capture_frame_samples: list[dict[str, Any]] = field(default_factory=list)
     _capture_timeline_max: int = 0
     _capture_warmup_frames: int = 0
+    _sampler_enabled: bool = False
+    _sampler_rate_hz: float = 100.0
+    _sampler_max_stacks: int = 2048
+    _sampler: StackSampler | None = None
+    _sampler_report_path: str = ""
+    _sampler_error: str = ""
 
     def __post_init__(self) -> None:
         self._sampling_n = max(1, int(self.sampling_n))
@@ -76,18 +85,34 @@ class FrameProfiler:
             10, _env_int("ENGINE_PROFILING_CAPTURE_WARMUP_FRAMES", 30)
         )
         self._capture_frame_samples = []
-        if self.enabled:
+        self._sampler_enabled = _env_flag("ENGINE_PROFILING_SAMPLER_ENABLED", False)
+        self._sampler_rate_hz = float(max(1, _env_int("ENGINE_PROFILING_SAMPLER_HZ", 100)))
+        self._sampler_max_stacks = max(16, _env_int("ENGINE_PROFILING_SAMPLER_MAX_STACKS", 2048))
+        # Sampling mode is meant to run continuously, so it skips tracemalloc's
+        # per-allocation cost unless a bounded capture also needs it.
+        if self.enabled and (self._capture_enabled or not self._sampler_enabled):
             tracemalloc.start(max(1, self._capture_tracemalloc_depth))
             self._tracemalloc_started = True
 
     def close(self) -> None:
         if self._capture_profiler is not None:
             self._finalize_capture(frame_index=self._capture_end_frame or 0)
+        if self._sampler is not None:
+            self._sampler.stop()
+            self.export_sampler_folded()
         if self._tracemalloc_started:
             tracemalloc.stop()
             self._tracemalloc_started = False
 
     def on_frame_start(self, *, frame_index: int) -> None:
+        if self._sampler_enabled and self._sampler is None:
+            # Bind to the thread that drives frames, not the one that built the host.
+            self._sampler = StackSampler(
+                thread_id=threading.get_ident(),
+                rate_hz=self._sampler_rate_hz,
+                max_stacks=self._sampler_max_stacks,
+            )
+            self._sampler.start()
         if not self._capture_enabled or self._capture_complete:
             return
         if self._capture_profiler is not None:
@@ -188,9 +213,11 @@ class FrameProfiler:
             "memory": memory,
             "render": {
                 "latest_profile": dict(self._latest_render_profile or {}),
+                "caches": render_cache_stats(),
             },
             "bottlenecks": bottlenecks,
             "capture": self._capture_state_payload(),
+            "sampler": self._sampler_state_payload(),
         }
         self._last_payload = payload
         return payload
@@ -207,6 +234,22 @@ class FrameProfiler:
             return None
         return dict(self._last_payload)
 
+    def export_sampler_folded(self, path: Path | None = None) -> Path | None:
+        """Write sampled stacks as folded-stack text; ``None`` if sampling never ran."""
+        sampler = self._sampler
+        if sampler is None:
+            return None
+        if path is None:
+            stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+            path = self._capture_export_dir / f"host_profile_samples_{stamp}.folded"
+        try:
+            exported = sampler.export_folded(path)
+        except OSError as exc:
+            self._sampler_error = f"oserror:{exc}"
+            return None
+        self._sampler_report_path = str(exported)
+        return exported
+
     def consume_capture_report_ready(self) -> dict[str, Any] | None:
         ready = self._capture_report_ready
         self._capture_report_ready = None
@@ -240,6 +283,20 @@ class FrameProfiler:
             "sort": str(self._capture_sort),
         }
 
+    def _sampler_state_payload(self) -> dict[str, Any]:
+        sampler = self._sampler
+        if sampler is None:
+            return {"state": "pending" if self._sampler_enabled else "off"}
+        return {
+            "state": "running" if sampler.running else "stopped",
+            "rate_hz": float(sampler.rate_hz),
+            "samples": int(sampler.sample_count),
+            "stacks": int(sampler.stack_count),
+            "dropped": int(sampler.dropped_count),
+            "report_path": str(self._sampler_report_path),
+            "error": str(self._sampler_error),
+        }
+
     def _finalize_capture(self, *, frame_index: int) -> dict[str, Any]:
         profiler = self._capture_profiler
         if profiler is None:
@@ -328,6 +385,7 @@ class FrameProfiler:
             },
             "render": {
                 "latest_profile": dict(self._latest_render_profile or {}),
+                "caches": render_cache_stats(),
             },
         }
 
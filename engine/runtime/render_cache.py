@@ -0,0 +1,161 @@
+"""Shared bounded LRU caches for render-path memoization."""
+
+from __future__ import annotations
+
+import weakref
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from engine.api.render_snapshot import RenderCommand
+
+type RenderCacheKey = tuple[object, ...]
+
+_CACHES: weakref.WeakSet[RenderCacheLRU[Any]] = weakref.WeakSet()
+
+
+@dataclass(frozen=True, slots=True)
+class RenderCacheStats:
+    """Aggregated counters for one named render cache."""
+
+    name: str
+    capacity: int
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups <= 0:
+            return 0.0
+        return float(self.hits) / float(lookups)
+
+
+class RenderCacheLRU[V]:
+    """Bounded LRU keyed by render content keys with source verification.
+
+    Entries remember the source object they were derived from. A lookup only
+    hits when the stored source is the same object or compares equal, so
+    content-hash collisions and recycled ``id()`` values never return stale
+    results.
+    """
+
+    def __init__(self, *, name: str, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        self._name = str(name)
+        self._capacity = int(capacity)
+        self._entries: OrderedDict[Hashable, tuple[object, V]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        _CACHES.add(self)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, source: object) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        cached_source, value = entry
+        if cached_source is not source and cached_source != source:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def put(self, key: Hashable, source: object, value: V) -> None:
+        entries = self._entries
+        entries[key] = (source, value)
+        entries.move_to_end(key)
+        while len(entries) > self._capacity:
+            entries.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> RenderCacheStats:
+        return RenderCacheStats(
+            name=self._name,
+            capacity=self._capacity,
+            size=len(self._entries),
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+        )
+
+
+def command_cache_key(command: RenderCommand) -> RenderCacheKey:
+    """Key a command by its stable identity when stamped, else by object id."""
+    identity = command.identity
+    if identity is not None:
+        return ("h", identity)
+    return ("id", id(command))
+
+
+def commands_cache_key(commands: tuple[RenderCommand, ...]) -> RenderCacheKey:
+    """Key a command tuple by member identities when every command is stamped."""
+    identities: list[int] = []
+    for command in commands:
+        identity = command.identity
+        if identity is None:
+            return ("id", id(commands))
+        identities.append(identity)
+    return ("h", hash(tuple(identities)), len(identities))
+
+
+def derived_identity(identity: int | None, *parts: object) -> int | None:
+    """Identity for a command deterministically derived from a stamped source."""
+    if identity is None:
+        return None
+    return hash((identity, *parts))
+
+
+def render_cache_stats() -> dict[str, dict[str, float | int]]:
+    """Return unified hit/miss/evict counters aggregated by cache name."""
+    return _aggregate_stats(cache.stats() for cache in list(_CACHES))
+
+
+def _aggregate_stats(stats: Iterable[RenderCacheStats]) -> dict[str, dict[str, float | int]]:
+    totals: dict[str, list[int]] = {}
+    for item in stats:
+        row = totals.setdefault(item.name, [0, 0, 0, 0, 0])
+        row[0] += item.capacity
+        row[1] += item.size
+        row[2] += item.hits
+        row[3] += item.misses
+        row[4] += item.evictions
+    out: dict[str, dict[str, float | int]] = {}
+    for name in sorted(totals):
+        capacity, size, hits, misses, evictions = totals[name]
+        lookups = hits + misses
+        out[name] = {
+            "capacity": capacity,
+            "size": size,
+            "hits": hits,
+            "misses": misses,
+            "evictions": evictions,
+            "hit_rate": (float(hits) / float(lookups)) if lookups > 0 else 0.0,
+        }
+    return out
+
+
+__all__ = [
+    "RenderCacheLRU",
+    "RenderCacheStats",
+    "command_cache_key",
+    "commands_cache_key",
+    "derived_identity",
+    "render_cache_stats",
+]
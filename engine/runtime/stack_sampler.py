@@ -0,0 +1,157 @@
+"""Statistical stack sampler for continuous low-overhead profiling.
+
+A daemon thread wakes at a fixed rate, reads the target thread's current frame
+from ``sys._current_frames()`` and counts the stack (as a tuple of code
+objects) in a fixed-size table. Nothing runs on the sampled thread, so timings
+stay close to an unprofiled run. Labels are only rendered on export, as folded
+stacks (``root;caller;callee count``) ready for flamegraph tools. Stacks deeper
+than ``max_depth`` keep their root-side frames and end in ``[truncated]``.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from pathlib import Path
+from types import CodeType, FrameType
+
+OTHER_STACK = "[other]"
+TRUNCATED_FRAME = "[truncated]"
+# Stands in for the leaf-side frames cut by ``max_depth``.
+_TRUNCATED_CODE = compile("", TRUNCATED_FRAME, "exec")
+
+
+class StackSampler:
+    """Sample one thread's Python stack at ``rate_hz`` into a bounded table."""
+
+    def __init__(
+        self,
+        *,
+        thread_id: int | None = None,
+        rate_hz: float = 100.0,
+        max_stacks: int = 2048,
+        max_depth: int = 64,
+    ) -> None:
+        self._thread_id = threading.get_ident() if thread_id is None else int(thread_id)
+        self._interval_s = 1.0 / max(1.0, float(rate_hz))
+        self._max_stacks = max(1, int(max_stacks))
+        self._max_depth = max(1, int(max_depth))
+        self._counts: dict[tuple[CodeType, ...], int] = {}
+        self._dropped = 0
+        self._samples = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        # The thread also exits on its own once the sampled thread is gone.
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def rate_hz(self) -> float:
+        return 1.0 / self._interval_s
+
+    @property
+    def sample_count(self) -> int:
+        return self._samples
+
+    @property
+    def stack_count(self) -> int:
+        return len(self._counts)
+
+    @property
+    def dropped_count(self) -> int:
+        """Samples counted under ``[other]`` because the table was full."""
+        return self._dropped
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        thread = threading.Thread(target=self._run, name="engine-stack-sampler", daemon=True)
+        self._thread = thread
+        thread.start()
+
+    def stop(self) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        thread.join()
+        self._thread = None
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = {}
+            self._dropped = 0
+            self._samples = 0
+
+    def sample_once(self) -> bool:
+        """Record the target thread's current stack; False if the thread is gone."""
+        frame = sys._current_frames().get(self._thread_id)  # noqa: SLF001
+        if frame is None:
+            return False
+        self._record(frame)
+        return True
+
+    def folded_lines(self) -> list[str]:
+        """Return ``root;...;leaf count`` lines, most sampled first."""
+        with self._lock:
+            rows = list(self._counts.items())
+            dropped = self._dropped
+        labels: dict[CodeType, str] = {}
+        lines = [
+            (count, ";".join(_label(code, labels) for code in reversed(stack)))
+            for stack, count in rows
+        ]
+        if dropped:
+            lines.append((dropped, OTHER_STACK))
+        lines.sort(key=lambda item: (-item[0], item[1]))
+        return [f"{stack} {count}" for count, stack in lines]
+
+    def export_folded(self, path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lines = self.folded_lines()
+        path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+        return path
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval_s):
+            if not self.sample_once():
+                return
+
+    def _record(self, frame: FrameType) -> None:
+        stack: list[CodeType] = []
+        current: FrameType | None = frame
+        while current is not None:
+            stack.append(current.f_code)
+            current = current.f_back
+        if len(stack) > self._max_depth:
+            # Keep the root side so deep stacks still fold under their call path.
+            stack = [_TRUNCATED_CODE, *stack[len(stack) - self._max_depth :]]
+        key = tuple(stack)
+        with self._lock:
+            self._samples += 1
+            count = self._counts.get(key)
+            if count is not None:
+                self._counts[key] = count + 1
+            elif len(self._counts) < self._max_stacks:
+                self._counts[key] = 1
+            else:
+                self._dropped += 1
+
+
+def _label(code: CodeType, cache: dict[CodeType, str]) -> str:
+    if code is _TRUNCATED_CODE:
+        return TRUNCATED_FRAME
+    label = cache.get(code)
+    if label is None:
+        name = getattr(code, "co_qualname", code.co_name)
+        label = f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+        cache[code] = label
+    return label
+
+
+__all__ = ["OTHER_STACK", "TRUNCATED_FRAME", "StackSampler"]
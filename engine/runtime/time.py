@@ -48,6 +48,31 @@ class FrameClock:
         )
 
 
+class VirtualClock:
+    """Deterministic time source that advances a fixed step on every read.
+
+    Passing an instance as ``FrameClock(time_source=...)`` yields exactly
+    ``step_seconds`` of simulated time per frame without sleeping.
+    """
+
+    def __init__(self, *, step_seconds: float, start_seconds: float = 0.0) -> None:
+        if step_seconds <= 0.0:
+            raise ValueError("step_seconds must be > 0")
+        self._step_seconds = float(step_seconds)
+        self._reads = 0
+        self._start_seconds = float(start_seconds)
+
+    @property
+    def step_seconds(self) -> float:
+        return self._step_seconds
+
+    def __call__(self) -> float:
+        # Multiply instead of accumulating so long runs do not drift.
+        now = self._start_seconds + self._reads * self._step_seconds
+        self._reads += 1
+        return now
+
+
 class FixedStepAccumulator:
     """Accumulates variable deltas into fixed-step update counts."""
 
@@ -7,17 +7,30 @@ from dataclasses import dataclass
 from typing import Any
 
 from engine.api.render import RenderAPI
-from engine.api.render_snapshot import RenderCommand, RenderPassSnapshot, RenderSnapshot
+from engine.api.render_snapshot import (
+    IDENTITY_MAT4,
+    Mat4,
+    RenderCommand,
+    RenderPassSnapshot,
+    RenderSnapshot,
+)
+from engine.runtime.render_cache import (
+    RenderCacheLRU,
+    command_cache_key,
+    commands_cache_key,
+    derived_identity,
+)
 
 _SCALE_CACHE_MAX = 20_000
-_SCALED_COMMAND_CACHE: dict[
-    tuple[int, tuple[float, float, float]],
-    tuple[RenderCommand, RenderCommand],
-] = {}
-_SCALED_PASS_CACHE: dict[
-    tuple[int, tuple[float, float, float]],
-    tuple[tuple[RenderCommand, ...], tuple[RenderCommand, ...]],
-] = {}
+_SCALE_PASS_CACHE_MAX = 256
+_SCALED_COMMAND_CACHE: RenderCacheLRU[RenderCommand] = RenderCacheLRU(
+    name="ui_space.scaled_command",
+    capacity=_SCALE_CACHE_MAX,
+)
+_SCALED_PASS_CACHE: RenderCacheLRU[tuple[RenderCommand, ...]] = RenderCacheLRU(
+    name="ui_space.scaled_pass",
+    capacity=_SCALE_PASS_CACHE_MAX,
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -299,10 +312,19 @@ def _scale_render_snapshot(snapshot: RenderSnapshot, transform: UISpaceTransform
                 transform,
                 scale_key=scale_key,
             ),
+            trusted=bool(render_pass.trusted),
+            rect_batches=tuple(
+                batch.scaled(sx=float(transform.scale_x), sy=float(transform.scale_y))
+                for batch in render_pass.rect_batches
+            ),
         )
         for render_pass in snapshot.passes
     )
-    return RenderSnapshot(frame_index=int(snapshot.frame_index), passes=scaled_passes)
+    return RenderSnapshot(
+        frame_index=int(snapshot.frame_index),
+        passes=scaled_passes,
+        trusted=bool(snapshot.trusted),
+    )
 
 
 def scale_render_snapshot(snapshot: RenderSnapshot, transform: UISpaceTransform) -> RenderSnapshot:
@@ -312,7 +334,12 @@ def scale_render_snapshot(snapshot: RenderSnapshot, transform: UISpaceTransform)
     return _scale_render_snapshot(snapshot, transform)
 
 
-def _scale_render_command(command: RenderCommand, transform: UISpaceTransform) -> RenderCommand:
+def _scale_render_command(
+    command: RenderCommand,
+    transform: UISpaceTransform,
+    *,
+    scale_key: tuple[float, float, float] | None = None,
+) -> RenderCommand:
     sx = float(transform.scale_x)
     sy = float(transform.scale_y)
     font_scale = float(transform.font_scale)
@@ -338,8 +365,30 @@ def _scale_render_command(command: RenderCommand, transform: UISpaceTransform) -
         kind=str(command.kind),
         layer=int(command.layer),
         sort_key=str(command.sort_key),
-        transform=command.transform,
+        transform=_scale_transform(command.transform, sx, sy),
         data=tuple(scaled_data),
+        identity=derived_identity(
+            command.identity,
+            "ui_space.scale",
+            scale_key if scale_key is not None else (sx, sy, font_scale),
+        ),
+        order_key=command.order_key,
+    )
+
+
+def _scale_transform(matrix: Mat4, sx: float, sy: float) -> Mat4:
+    """Re-express a design-space transform in pixel space (``S @ M @ S^-1``).
+
+    Translations scale like the ``x``/``y`` data, matching ``RenderRectBatch.scaled``.
+    """
+    if matrix == IDENTITY_MAT4:
+        return matrix
+    axis = (sx, sy, 1.0, 1.0)
+    return Mat4(
+        values=tuple(
+            value * axis[index // 4] / axis[index % 4]
+            for index, value in enumerate(matrix.values)
+        )
     )
 
 
@@ -349,18 +398,15 @@ def _scale_render_commands(
     *,
     scale_key: tuple[float, float, float],
 ) -> tuple[RenderCommand, ...]:
-    pass_cache_key = (int(id(commands)), scale_key)
-    cached_pass = _SCALED_PASS_CACHE.get(pass_cache_key)
-    if cached_pass is not None and cached_pass[0] is commands:
-        return cached_pass[1]
+    pass_cache_key = (commands_cache_key(commands), scale_key)
+    cached_pass = _SCALED_PASS_CACHE.get(pass_cache_key, commands)
+    if cached_pass is not None:
+        return cached_pass
     scaled = tuple(
         _scale_render_command_cached(command, transform, scale_key=scale_key)
         for command in commands
     )
-    _SCALED_PASS_CACHE[pass_cache_key] = (commands, scaled)
-    if len(_SCALED_PASS_CACHE) > _SCALE_CACHE_MAX:
-        _SCALED_PASS_CACHE.clear()
-        _SCALED_PASS_CACHE[pass_cache_key] = (commands, scaled)
+    _SCALED_PASS_CACHE.put(pass_cache_key, commands, scaled)
     return scaled
 
 
@@ -370,13 +416,10 @@ def _scale_render_command_cached(
     *,
     scale_key: tuple[float, float, float],
 ) -> RenderCommand:
-    cache_key = (int(id(command)), scale_key)
-    cached = _SCALED_COMMAND_CACHE.get(cache_key)
-    if cached is not None and cached[0] is command:
-        return cached[1]
-    scaled = _scale_render_command(command, transform)
-    _SCALED_COMMAND_CACHE[cache_key] = (command, scaled)
-    if len(_SCALED_COMMAND_CACHE) > _SCALE_CACHE_MAX:
-        _SCALED_COMMAND_CACHE.clear()
-        _SCALED_COMMAND_CACHE[cache_key] = (command, scaled)
+    cache_key = (command_cache_key(command), scale_key)
+    cached = _SCALED_COMMAND_CACHE.get(cache_key, command)
+    if cached is not None:
+        return cached
+    scaled = _scale_render_command(command, transform, scale_key=scale_key)
+    _SCALED_COMMAND_CACHE.put(cache_key, command, scaled)
     return scaled
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+from time import perf_counter
+
+from warships.game.ai.monte_carlo import MonteCarloAI
+from warships.game.ai.pattern_hard import PatternHardAI
+from warships.game.ai.strategy import AIStrategy
+from warships.game.core.board import BoardState
+from warships.game.core.fleet import build_board_from_fleet, random_fleet
+
+
+def _fire(ai: AIStrategy, board: BoardState) -> None:
+    shot = ai.choose_shot()
+    result, _sunk = board.apply_shot(shot)
+    ai.notify_result(shot, result)
+
+
+def _duel(challenger: AIStrategy, opponent: AIStrategy, *, seed: int) -> tuple[bool, int]:
+    """Alternate shots on mirrored fleets; return (challenger won, challenger shots)."""
+    fleet = random_fleet(random.Random(seed))
+    challenger_target = build_board_from_fleet(fleet)
+    opponent_target = build_board_from_fleet(fleet)
+    shots = 0
+    # Alternate who opens so neither side gets the first-move edge every game.
+    challenger_turn = seed % 2 == 0
+    while True:
+        if challenger_turn:
+            _fire(challenger, challenger_target)
+            shots += 1
+            if challenger_target.all_ships_sunk():
+                return True, shots
+        else:
+            _fire(opponent, opponent_target)
+            if opponent_target.all_ships_sunk():
+                return False, shots
+        challenger_turn = not challenger_turn
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Hard AI shot latency, then Monte Carlo AI samples/sec and win-rate "
+            "versus PatternHardAI per budget."
+        )
+    )
+    parser.add_argument("--games", type=int, default=40)
+    parser.add_argument("--budgets-ms", type=float, nargs="+", default=[5.0, 20.0, 50.0])
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--max-samples", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    baseline_shots: list[int] = []
+    game_cpu_s: list[float] = []
+    shot_latency_s: list[float] = []
+    for game in range(args.games):
+        board = build_board_from_fleet(random_fleet(random.Random(args.seed + game)))
+        ai = PatternHardAI(random.Random(args.seed + game))
+        shots = 0
+        game_started = perf_counter()
+        while not board.all_ships_sunk():
+            shot_started = perf_counter()
+            _fire(ai, board)
+            shot_latency_s.append(perf_counter() - shot_started)
+            shots += 1
+        game_cpu_s.append(perf_counter() - game_started)
+        baseline_shots.append(shots)
+    shot_latency_s.sort()
+    print(f"games={args.games}")
+    print(f"workers={args.workers}")
+    print(f"pattern_hard_mean_shots={statistics.mean(baseline_shots):.2f}")
+    print(f"pattern_hard_game_ms={statistics.mean(game_cpu_s) * 1000.0:.2f}")
+    print(f"pattern_hard_shot_us_p50={statistics.median(shot_latency_s) * 1e6:.1f}")
+    p95 = shot_latency_s[int(0.95 * (len(shot_latency_s) - 1))]
+    print(f"pattern_hard_shot_us_p95={p95 * 1e6:.1f}")
+
+    for budget_ms in args.budgets_ms:
+        wins = 0
+        shots_to_win: list[int] = []
+        samples = 0
+        moves = 0
+        elapsed_s = 0.0
+        for game in range(args.games):
+            seed = args.seed + game
+            challenger = MonteCarloAI(
+                random.Random(seed),
+                budget_s=budget_ms / 1000.0,
+                max_samples=args.max_samples,
+                workers=args.workers,
+            )
+            opponent = PatternHardAI(random.Random(seed + 10_000))
+            try:
+                won, shots = _duel(challenger, opponent, seed=seed)
+            finally:
+                challenger.close()
+            wins += int(won)
+            if won:
+                shots_to_win.append(shots)
+            samples += challenger.stats.samples
+            moves += challenger.stats.moves
+            elapsed_s += challenger.stats.elapsed_s
+        label = f"budget_{budget_ms:g}ms"
+        print(f"{label}_samples_per_sec={samples / max(elapsed_s, 1e-9):.0f}")
+        print(f"{label}_samples_per_move={samples / max(1, moves):.0f}")
+        print(f"{label}_win_rate_vs_hard={wins / max(1, args.games):.3f}")
+        if shots_to_win:
+            print(f"{label}_mean_shots_when_winning={statistics.mean(shots_to_win):.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+from collections import deque
+from collections.abc import Callable
+from time import perf_counter
+
+from engine.api.input_events import KeyEvent, PointerEvent, WheelEvent
+from engine.input.input_controller import InputController
+
+type _RawEvent = PointerEvent | KeyEvent | WheelEvent
+
+
+class _LegacyInputController(InputController):
+    # The pre-coalescing ingest path: unbounded queues, invalidate per event.
+    def __init__(self, on_click_queued: Callable[[], None] | None = None) -> None:
+        super().__init__(on_click_queued)
+        self._pointer_events = deque()
+        self._key_events = deque()
+        self._wheel_events = deque()
+
+    def consume_window_input_events(self, events: tuple[_RawEvent, ...]) -> None:
+        for raw in events:
+            if isinstance(raw, PointerEvent):
+                self._pointer_events.append(raw)
+                self._pointer_x = float(raw.x)
+                self._pointer_y = float(raw.y)
+            elif isinstance(raw, KeyEvent):
+                self._key_events.append(raw)
+            elif isinstance(raw, WheelEvent):
+                self._wheel_events.append(raw)
+            else:
+                continue
+            if self._on_click_queued is not None:
+                self._on_click_queued()
+
+
+def _burst(count: int, *, seed: int) -> tuple[_RawEvent, ...]:
+    rng = random.Random(seed)
+    events: list[_RawEvent] = []
+    x = y = 0.0
+    for index in range(count):
+        roll = rng.random()
+        if roll < 0.9:
+            x += rng.uniform(-2.0, 2.0)
+            y += rng.uniform(-2.0, 2.0)
+            events.append(PointerEvent("pointer_move", x, y, 0))
+        elif roll < 0.97:
+            events.append(WheelEvent(x, y, rng.choice((-1.0, 1.0))))
+        elif roll < 0.99:
+            down = index % 2 == 0
+            events.append(PointerEvent("pointer_down" if down else "pointer_up", x, y, 1))
+        else:
+            events.append(KeyEvent("char", "a"))
+    return tuple(events)
+
+
+def _run(
+    controller_type: type[InputController], events: tuple[_RawEvent, ...], *, batch: int
+) -> tuple[float, int, int]:
+    invalidates: list[int] = []
+    controller = controller_type(on_click_queued=lambda: invalidates.append(1))
+    start = perf_counter()
+    for offset in range(0, len(events), batch):
+        controller.consume_window_input_events(events[offset : offset + batch])
+    snapshot = controller.build_input_snapshot(frame_index=1)
+    elapsed_ms = (perf_counter() - start) * 1000.0
+    return elapsed_ms, len(snapshot.pointer_events) + len(snapshot.wheel_events), len(invalidates)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="One-frame input burst: per-event queueing vs coalesced bounded queues."
+    )
+    parser.add_argument("--events", type=int, default=10_000)
+    parser.add_argument("--poll-batch", type=int, default=64, help="Events per window poll.")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    events = _burst(args.events, seed=args.seed)
+    results: dict[str, list[tuple[float, int, int]]] = {"legacy": [], "coalesced": []}
+    for _ in range(args.rounds):
+        results["legacy"].append(_run(_LegacyInputController, events, batch=args.poll_batch))
+        results["coalesced"].append(_run(InputController, events, batch=args.poll_batch))
+    print(f"events={args.events}")
+    print(f"poll_batch={args.poll_batch}")
+    for mode, rows in results.items():
+        print(f"{mode}_ingest_snapshot_ms={statistics.median(row[0] for row in rows):.3f}")
+        print(f"{mode}_snapshot_events={rows[0][1]}")
+        print(f"{mode}_invalidate_calls={rows[0][2]}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
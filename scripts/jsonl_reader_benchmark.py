@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from engine.diagnostics import iter_jsonl_records, tail_jsonl_records
+
+_LOGGERS = ("engine.runtime", "engine.rendering.scene", "engine.input", "warships.game")
+_MODES = ("legacy", "stream", "prefilter", "tail")
+
+
+def _write_log(path: Path, *, target_bytes: int) -> int:
+    lines = 0
+    written = 0
+    with path.open("w", encoding="utf-8") as handle:
+        while written < target_bytes:
+            chunk: list[str] = []
+            for idx in range(lines, lines + 10_000):
+                chunk.append(
+                    json.dumps(
+                        {
+                            "ts": f"2026-01-01T00:00:{idx % 60:02d}.{idx % 1000:03d}",
+                            "logger": _LOGGERS[idx % len(_LOGGERS)],
+                            "level": "INFO",
+                            "msg": f"frame_metrics frame={idx} dt_ms={16 + idx % 5}",
+                            "frame": idx,
+                            "timing": {"update_ms": 1.25, "render_ms": 3.5},
+                        }
+                    )
+                )
+            text = "\n".join(chunk) + "\n"
+            handle.write(text)
+            written += len(text)
+            lines += len(chunk)
+    return lines
+
+
+def _run_mode(mode: str, path: Path) -> None:
+    # Parses every matching row without retaining it; measures reader overhead only.
+    start = perf_counter()
+    rows = 0
+    if mode == "legacy":
+        for line in path.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and isinstance(json.loads(line), dict):
+                rows += 1
+    elif mode == "stream":
+        rows = sum(1 for _ in iter_jsonl_records(path))
+    elif mode == "prefilter":
+        rows = sum(
+            1 for _ in iter_jsonl_records(path, field_prefixes={"logger": "engine.rendering"})
+        )
+    elif mode == "tail":
+        rows = len(tail_jsonl_records(path, 1_000))
+    print(f"{rows} {perf_counter() - start:.6f}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="JSONL log parse throughput and peak RSS: read_text+json vs mmap+orjson."
+    )
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--mode", choices=_MODES, default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--path", type=Path, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.mode is not None and args.path is not None:
+        _run_mode(args.mode, args.path)
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "run.jsonl"
+        lines = _write_log(path, target_bytes=args.size_mb * 1024 * 1024)
+        size_mb = path.stat().st_size / (1024 * 1024)
+        print(f"log_mb={size_mb:.1f}")
+        print(f"log_lines={lines}")
+        for mode in _MODES:
+            process = subprocess.Popen(
+                [sys.executable, __file__, "--mode", mode, "--path", str(path)],
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            _pid, status, usage = os.wait4(process.pid, 0)
+            assert process.stdout is not None
+            output = process.stdout.read().split()
+            if status != 0 or len(output) != 2:
+                print(f"{mode}_failed status={status}")
+                continue
+            rows, seconds = int(output[0]), float(output[1])
+            print(
+                f"{mode}: rows={rows} seconds={seconds:.2f} "
+                f"mb_per_s={size_mb / seconds:.1f} peak_rss_mb={usage.ru_maxrss / 1024:.0f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
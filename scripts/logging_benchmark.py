@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import logging
+import os
+import statistics
+import tempfile
+from pathlib import Path
+from time import perf_counter_ns
+
+from engine.api.logging import EngineLoggingConfig
+from engine.runtime import logging as runtime_logging
+
+_MODES = ("queue_json", "fast_json", "fast_binary", "fast_stdlib_binary")
+
+
+def _configure(mode: str, path: Path) -> logging.Logger | runtime_logging.FastLogger:
+    binary = mode.endswith("binary")
+    runtime_logging.configure_engine_logging(
+        EngineLoggingConfig(
+            level_name="DEBUG",
+            file_path=str(path.with_suffix(".englog" if binary else ".jsonl")),
+            file_format="binary" if binary else "json",
+            fast_mode=mode.startswith("fast"),
+        )
+    )
+    if mode == "fast_stdlib_binary":
+        # Plain logging.getLogger callers: stdlib records through the capture handler.
+        return logging.getLogger("engine.bench.hot_path")
+    return runtime_logging.get_engine_logger("engine.bench.hot_path")
+
+
+def _drain() -> None:
+    listener = runtime_logging._QUEUE_LISTENER
+    if listener is not None:
+        listener.stop()
+        runtime_logging._QUEUE_LISTENER = None
+    runtime_logging.stop_fast_logging()
+
+
+def _run(mode: str, *, records: int, directory: Path) -> tuple[float, float]:
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stderr(devnull):
+        logger = _configure(mode, directory / mode)
+        start = perf_counter_ns()
+        for index in range(records):
+            logger.debug("frame %d system=%s took %.3f ms", index, "physics", 0.25)
+        caller_ns = perf_counter_ns() - start
+        _drain()
+        total_ns = perf_counter_ns() - start
+    return caller_ns / records, records / (total_ns / 1e9)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Caller-side ns per log call and end-to-end records/sec per logging mode."
+    )
+    parser.add_argument("--records", type=int, default=50_000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    root = logging.getLogger()
+    original_handlers = list(root.handlers)
+    results: dict[str, list[tuple[float, float]]] = {mode: [] for mode in _MODES}
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for _ in range(args.rounds):
+                for mode in _MODES:
+                    results[mode].append(_run(mode, records=args.records, directory=Path(tmp)))
+    finally:
+        root.handlers.clear()
+        root.handlers.extend(original_handlers)
+    print(f"records={args.records}")
+    print(f"rounds={args.rounds}")
+    for mode, rows in results.items():
+        print(f"{mode}_caller_ns_per_call={statistics.median(row[0] for row in rows):.0f}")
+        print(f"{mode}_records_per_sec={statistics.median(row[1] for row in rows):.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from tools.engine_obs_core.datasource.file_source import FileObsSource
+from tools.engine_obs_core.query import filter_events
+
+_LOGGERS = ("engine.runtime", "engine.rendering.scene", "engine.input", "warships.game")
+
+
+def _write_run_log(path: Path, *, events: int) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        for idx in range(events):
+            second, micro = divmod(idx, 1_000)
+            record = {
+                "ts": f"2026-01-01T{second // 3600 % 24:02d}:{second // 60 % 60:02d}:"
+                f"{second % 60:02d}.{micro:03d}",
+                "logger": _LOGGERS[idx % len(_LOGGERS)],
+                "level": "WARNING" if idx % 211 == 0 else "INFO",
+                "msg": f"frame_metrics frame={idx} dt_ms={16 + idx % 5}",
+                "frame": idx,
+                "scene": "battle" if idx % 9 == 0 else "menu",
+            }
+            handle.write(json.dumps(record) + "\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Event load-then-query latency: in-memory filter vs SQLite event index."
+    )
+    parser.add_argument("--events", type=int, default=2_000_000)
+    parser.add_argument("--queries", type=int, default=5)
+    args = parser.parse_args()
+
+    filters = [
+        {"category": "render"},
+        {"level": "warning"},
+        {"text": "frame=123"},
+        {"category": "frame", "text": "battle"},
+        {"name": "warships.game"},
+    ][: max(1, args.queries)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _write_run_log(root / "warships_run_20260101T000000.jsonl", events=args.events)
+
+        memory_source = FileObsSource(root, recursive=False)
+        session = memory_source.list_sessions()[0]
+        start = perf_counter()
+        events = memory_source.load_events(session)
+        memory_load_s = perf_counter() - start
+        memory_query_ms: list[float] = []
+        memory_counts: list[int] = []
+        for item in filters:
+            start = perf_counter()
+            memory_counts.append(len(filter_events(events, **item)))
+            memory_query_ms.append((perf_counter() - start) * 1000.0)
+        del events
+
+        index_dir = root / "index"
+        start = perf_counter()
+        FileObsSource(root, recursive=False, index_dir=index_dir).event_store(session)
+        ingest_s = perf_counter() - start
+
+        # Fresh source, existing index: what a reopen or filter change costs.
+        indexed_source = FileObsSource(root, recursive=False, index_dir=index_dir)
+        start = perf_counter()
+        store = indexed_source.event_store(session)
+        assert store is not None
+        open_ms = (perf_counter() - start) * 1000.0
+        store_query_ms: list[float] = []
+        store_counts: list[int] = []
+        for item in filters:
+            start = perf_counter()
+            store_counts.append(len(store.query_events(**item)))
+            store_query_ms.append((perf_counter() - start) * 1000.0)
+        store.close()
+
+    print(f"events={args.events}")
+    print(f"memory_load_s={memory_load_s:.3f}")
+    print(f"sqlite_ingest_s={ingest_s:.3f}")
+    print(f"sqlite_reopen_ms={open_ms:.3f}")
+    for item, mem_ms, sql_ms, count in zip(
+        filters, memory_query_ms, store_query_ms, store_counts, strict=True
+    ):
+        label = ",".join(f"{key}={value}" for key, value in item.items())
+        print(f"query[{label}] matches={count} memory_ms={mem_ms:.1f} sqlite_ms={sql_ms:.1f}")
+    # Cold inspector path: load the session, then run the first filter.
+    print(f"load_then_query_memory_ms={memory_load_s * 1000.0 + memory_query_ms[0]:.1f}")
+    print(f"load_then_query_sqlite_ms={open_ms + store_query_ms[0]:.1f}")
+    return 0 if memory_counts == store_counts else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
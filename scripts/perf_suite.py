@@ -0,0 +1,544 @@
+"""Headless performance regression suite with JSON baselines.
+
+Each case times one hot-path operation. Per case the loop count is calibrated
+so a sample lasts at least ``--min-sample-ms``, and the suite records
+``--samples`` ns/op samples. ``--save-baseline`` writes the samples with
+machine metadata; ``--compare`` bootstraps a 95% confidence interval for the
+ratio of current/baseline medians and exits 1 when a case's lower bound is
+above ``1 + threshold``, which means it is slower with confidence.
+
+Baselines are machine-specific and are not committed: record one with
+``--save-baseline`` on the machine that runs ``--compare``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import gc
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+from collections.abc import Callable
+from dataclasses import replace
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter_ns
+
+from engine.api.render_snapshot import RenderSnapshot
+from engine.diagnostics import DiagnosticHub
+from engine.diagnostics.json_codec import dumps_bytes, loads_bytes
+from engine.rendering.wgpu_renderer import WgpuRenderer
+from engine.runtime.host import EngineHost
+from engine.runtime.scheduler import Scheduler
+from engine.runtime.ui_space import UISpaceTransform, scale_render_snapshot
+from engine.ui_runtime.grid_layout import GridLayout
+from warships.game.ai.monte_carlo import MonteCarloAI
+from warships.game.app.ports.runtime_primitives import Button
+from warships.game.app.services.battle import build_ai_strategy
+from warships.game.app.state_machine import AppState
+from warships.game.app.ui_state import AppUIState, PresetRowView
+from warships.game.core.fleet import random_fleet, random_fleets
+from warships.game.core.models import Coord, Orientation, ShipType
+from warships.game.core.rules import create_session
+from warships.game.ui.game_view import GameView
+
+PERF_BASELINE_SCHEMA_VERSION = "perf_suite.baseline.v1"
+_DEFAULT_BASELINE = Path("tools/data/perf/perf_baseline.json")
+_DESIGN_SIZE = (1200, 720)
+_TARGET_SIZE = (1920, 1080)
+_SHIP_ORDER = [
+    ShipType.CARRIER,
+    ShipType.BATTLESHIP,
+    ShipType.CRUISER,
+    ShipType.SUBMARINE,
+    ShipType.DESTROYER,
+]
+
+type _Op = Callable[[], object]
+
+
+def _ui_state(state: AppState, *, seed: int = 7, shots: int = 60) -> AppUIState:
+    rng = random.Random(seed)
+    player = random_fleet(rng)
+    session = create_session(player, random_fleet(rng))
+    cells = [Coord(row=row, col=col) for row in range(10) for col in range(10)]
+    rng.shuffle(cells)
+    for coord in cells[:shots]:
+        session.player_board.apply_shot(coord)
+        session.ai_board.apply_shot(coord)
+    in_game = state in {AppState.BATTLE, AppState.RESULT}
+    presets = [f"preset_{index}" for index in range(6)]
+    return AppUIState(
+        state=state,
+        status=f"{state.name} benchmark",
+        buttons=[
+            Button(id=f"button_{index}", x=40.0 + index * 180.0, y=640.0, w=160.0, h=48.0)
+            for index in range(5)
+        ],
+        placements=list(player.ships),
+        placement_orientation=Orientation.HORIZONTAL,
+        session=session if in_game else None,
+        ship_order=list(_SHIP_ORDER),
+        is_closing=False,
+        preset_rows=[PresetRowView(name=name, placements=list(player.ships)) for name in presets],
+        prompt=None,
+        held_ship_type=None,
+        held_ship_orientation=None,
+        held_grab_index=0,
+        hover_cell=Coord(row=4, col=4),
+        hover_x=None,
+        hover_y=None,
+        held_preview_valid=True,
+        held_preview_reason=None,
+        placement_popup_message=None,
+        new_game_difficulty="Normal",
+        new_game_difficulty_open=False,
+        new_game_difficulty_options=["Easy", "Normal", "Hard"],
+        new_game_visible_presets=presets[:4],
+        new_game_selected_preset=presets[0],
+        new_game_can_scroll_up=False,
+        new_game_can_scroll_down=True,
+        new_game_source="preset",
+        new_game_preview=list(player.ships),
+    )
+
+
+def _battle_snapshot() -> RenderSnapshot:
+    view = GameView(renderer=None, layout=GridLayout())  # type: ignore[arg-type]
+    snapshot, _labels = view.build_snapshot(
+        frame_index=0, ui=_ui_state(AppState.BATTLE), debug_ui=False, debug_labels_state=[]
+    )
+    return snapshot
+
+
+def _case_random_fleet() -> _Op:
+    rng = random.Random(11)
+    return lambda: random_fleet(rng)
+
+
+def _case_random_fleets() -> _Op:
+    rng = random.Random(11)
+    # One op is a 1000-fleet batch.
+    return lambda: random_fleets(rng, 1000)
+
+
+def _case_choose_shot(difficulty: str) -> Callable[[], _Op]:
+    def setup() -> _Op:
+        rng = random.Random(13)
+        fleets = [random_fleet(rng) for _ in range(8)]
+        games = [0]
+
+        def op() -> int:
+            # One op is a whole game against a rotating fleet, so every phase of
+            # the hunt is weighted the same in each sample.
+            board = create_session(fleets[0], fleets[games[0] % len(fleets)]).player_board
+            ai = build_ai_strategy(difficulty, random.Random(games[0] % len(fleets)))
+            games[0] += 1
+            shots = 0
+            while not board.all_ships_sunk() and shots < 100:
+                shot = ai.choose_shot()
+                result, _sunk = board.apply_shot(shot)
+                ai.notify_result(shot, result)
+                shots += 1
+            return shots
+
+        return op
+
+    return setup
+
+
+def _case_expert_fixed() -> _Op:
+    rng = random.Random(17)
+    fleet = random_fleet(rng)
+    games = [0]
+
+    def op() -> int:
+        board = create_session(fleet, fleet).player_board
+        ai = MonteCarloAI(random.Random(games[0] % 8), budget_s=None, max_samples=100)
+        games[0] += 1
+        shots = 0
+        while not board.all_ships_sunk() and shots < 100:
+            shot = ai.choose_shot()
+            result, _sunk = board.apply_shot(shot)
+            ai.notify_result(shot, result)
+            shots += 1
+        return shots
+
+    return op
+
+
+def _case_build_snapshot(state: AppState) -> Callable[[], _Op]:
+    def setup() -> _Op:
+        view = GameView(renderer=None, layout=GridLayout())  # type: ignore[arg-type]
+        ui = _ui_state(state)
+        frame = [0]
+
+        def op() -> object:
+            frame[0] += 1
+            return view.build_snapshot(
+                frame_index=frame[0], ui=ui, debug_ui=False, debug_labels_state=[]
+            )
+
+        return op
+
+    return setup
+
+
+class _SnapshotModule:
+    """Minimal module that hands the host a prebuilt battle snapshot each frame."""
+
+    def __init__(self, snapshot: RenderSnapshot) -> None:
+        self._snapshot = snapshot
+        self._frame_index = 0
+
+    def on_start(self, host) -> None:
+        _ = host
+
+    def on_input_snapshot(self, snapshot) -> bool:
+        _ = snapshot
+        return False
+
+    def simulate(self, context) -> None:
+        self._frame_index = int(context.frame_index)
+
+    def build_render_snapshot(self) -> RenderSnapshot:
+        return replace(self._snapshot, frame_index=self._frame_index)
+
+    def should_close(self) -> bool:
+        return False
+
+    def on_shutdown(self) -> None:
+        return
+
+    def ui_design_resolution(self) -> tuple[float, float]:
+        return (float(_DESIGN_SIZE[0]), float(_DESIGN_SIZE[1]))
+
+
+class _NullRenderAPI:
+    """Render target that drops snapshots; the host only needs ``render_snapshot``."""
+
+    def render_snapshot(self, snapshot: RenderSnapshot) -> None:
+        _ = snapshot
+
+
+def _case_host_frame() -> _Op:
+    host = EngineHost(
+        module=_SnapshotModule(_battle_snapshot()),
+        render_api=_NullRenderAPI(),  # type: ignore[arg-type]
+    )
+    return host.frame
+
+
+def _case_scale_snapshot() -> _Op:
+    snapshot = _battle_snapshot()
+    transform = UISpaceTransform(
+        engine_width=float(_TARGET_SIZE[0]),
+        engine_height=float(_TARGET_SIZE[1]),
+        app_width=float(_DESIGN_SIZE[0]),
+        app_height=float(_DESIGN_SIZE[1]),
+    )
+    return lambda: scale_render_snapshot(snapshot, transform)
+
+
+class _NullBackend:
+    """Backend that counts draw packets without touching a GPU."""
+
+    def __init__(self) -> None:
+        self.packet_count = 0
+
+    def begin_frame(self) -> None:
+        self.packet_count = 0
+
+    def draw_packets(self, pass_name: str, packets) -> None:
+        _ = pass_name
+        self.packet_count += len(packets)
+
+    def present(self) -> None:
+        return
+
+    def end_frame(self) -> None:
+        return
+
+    def close(self) -> None:
+        return
+
+    def set_title(self, title: str) -> None:
+        _ = title
+
+    def reconfigure(self, event) -> None:
+        _ = event
+
+    def resize_telemetry(self) -> dict[str, object]:
+        return {}
+
+
+def _case_wgpu_packetize() -> _Op:
+    snapshot = _battle_snapshot()
+    backend = _NullBackend()
+    renderer = WgpuRenderer(
+        width=_TARGET_SIZE[0], height=_TARGET_SIZE[1], _backend_factory=lambda _surface: backend
+    )
+    frame = [0]
+
+    def op() -> None:
+        frame[0] += 1
+        renderer.render_snapshot(replace(snapshot, frame_index=frame[0]))
+
+    return op
+
+
+def _case_scheduler_advance() -> _Op:
+    scheduler = Scheduler()
+    for index in range(64):
+        scheduler.call_every(0.01 + (index % 8) * 0.005, lambda: None)
+    return lambda: scheduler.advance(1.0 / 60.0)
+
+
+def _case_emit_fast() -> _Op:
+    hub = DiagnosticHub(enabled=True)
+    tick = [0]
+
+    def op() -> None:
+        tick[0] += 1
+        hub.emit_fast(category="frame", name="frame.time_ms", tick=tick[0], value=16.0)
+
+    return op
+
+
+CASES: dict[str, Callable[[], _Op]] = {
+    "fleet.random_fleet": _case_random_fleet,
+    "fleet.random_fleets_batch_1000": _case_random_fleets,
+    **{
+        f"ai.choose_shot.{difficulty.lower()}": _case_choose_shot(difficulty)
+        for difficulty in ("Easy", "Normal", "Hard")
+    },
+    # In-game Expert draws 1000 samples a move; 100 keeps one op short.
+    "ai.choose_shot.expert_fixed_samples": _case_expert_fixed,
+    **{
+        f"view.build_snapshot.{state.name.lower()}": _case_build_snapshot(state)
+        for state in AppState
+    },
+    "host.frame_headless": _case_host_frame,
+    "ui.scale_render_snapshot": _case_scale_snapshot,
+    "render.wgpu_packetize": _case_wgpu_packetize,
+    "runtime.scheduler_advance": _case_scheduler_advance,
+    "diagnostics.emit_fast": _case_emit_fast,
+}
+
+
+def _calibrate(op: _Op, *, min_sample_ns: int) -> int:
+    loops = 1
+    while True:
+        start = perf_counter_ns()
+        for _ in range(loops):
+            op()
+        if perf_counter_ns() - start >= min_sample_ns or loops >= 1 << 20:
+            return loops
+        loops *= 2
+
+
+def _measure(setup: Callable[[], _Op], *, samples: int, min_sample_ms: float) -> dict[str, object]:
+    op = setup()
+    loops = _calibrate(op, min_sample_ns=int(min_sample_ms * 1e6))
+    gc.collect()
+    values: list[float] = []
+    for _ in range(samples):
+        start = perf_counter_ns()
+        for _ in range(loops):
+            op()
+        values.append((perf_counter_ns() - start) / loops)
+    low, high = _bootstrap_ci(values, None)
+    return {
+        "unit": "ns/op",
+        "loops": loops,
+        "median_ns": statistics.median(values),
+        "ci95_ns": [low, high],
+        "samples_ns": values,
+    }
+
+
+def _bootstrap_ci(
+    current: list[float], baseline: list[float] | None, *, rounds: int = 2000, seed: int = 0
+) -> tuple[float, float]:
+    """95% percentile-bootstrap interval of the median, or of the median ratio."""
+    rng = random.Random(seed)
+    n = len(current)
+    stats: list[float] = []
+    for _ in range(rounds):
+        value = statistics.median(rng.choices(current, k=n))
+        if baseline is not None:
+            base = statistics.median(rng.choices(baseline, k=len(baseline)))
+            value = value / base if base > 0.0 else float("inf")
+        stats.append(value)
+    stats.sort()
+    return stats[int(rounds * 0.025)], stats[min(rounds - 1, int(rounds * 0.975))]
+
+
+def _git_revision() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+            timeout=5.0,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def _machine_metadata() -> dict[str, object]:
+    return {
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python_implementation": platform.python_implementation(),
+        "python_version": platform.python_version(),
+        "gil_enabled": getattr(sys, "_is_gil_enabled", lambda: True)(),
+        "python_hash_seed": os.environ.get("PYTHONHASHSEED", "random"),
+        "git_revision": _git_revision(),
+    }
+
+
+def _select_cases(patterns: list[str]) -> list[str]:
+    if not patterns:
+        return list(CASES)
+    return [name for name in CASES if any(fnmatch.fnmatch(name, p) for p in patterns)]
+
+
+def _compare(
+    results: dict[str, dict[str, object]],
+    baseline: dict[str, object],
+    *,
+    threshold_pct: float,
+) -> int:
+    cases = baseline.get("cases", {})
+    assert isinstance(cases, dict)
+    machine = _machine_metadata()
+    base_machine = baseline.get("machine", {})
+    assert isinstance(base_machine, dict)
+    for key in ("platform", "machine", "cpu_count", "python_version", "python_hash_seed"):
+        if base_machine.get(key) != machine[key]:
+            print(f"machine_mismatch.{key}={base_machine.get(key)}->{machine[key]}")
+    limit = 1.0 + threshold_pct / 100.0
+    regressions = 0
+    for name, result in results.items():
+        base = cases.get(name)
+        if not isinstance(base, dict):
+            print(f"{name}.verdict=new")
+            continue
+        current = list(result["samples_ns"])  # type: ignore[call-overload]
+        previous = [float(value) for value in base["samples_ns"]]
+        ratio = statistics.median(current) / max(1e-9, statistics.median(previous))
+        low, high = _bootstrap_ci(current, previous)
+        if low > limit:
+            verdict = "regressed"
+            regressions += 1
+        elif high < 1.0 / limit:
+            verdict = "improved"
+        else:
+            verdict = "unchanged"
+        print(f"{name}.ratio={ratio:.3f}")
+        print(f"{name}.ratio_ci95={low:.3f},{high:.3f}")
+        print(f"{name}.verdict={verdict}")
+    print(f"threshold_pct={threshold_pct}")
+    print(f"regressions={regressions}")
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Headless perf regression suite; compares against a baseline recorded on this "
+            "machine using a bootstrap confidence interval."
+        )
+    )
+    parser.add_argument("--cases", nargs="*", default=[], help="fnmatch patterns over case names.")
+    parser.add_argument("--list", action="store_true", help="Print case names and exit.")
+    parser.add_argument("--samples", type=int, default=15)
+    parser.add_argument("--min-sample-ms", type=float, default=5.0)
+    parser.add_argument(
+        "--save-baseline",
+        type=Path,
+        nargs="?",
+        const=_DEFAULT_BASELINE,
+        default=None,
+        help=f"Write results as a baseline (default path {_DEFAULT_BASELINE}).",
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        nargs="?",
+        const=_DEFAULT_BASELINE,
+        default=None,
+        help="Compare against a baseline; exit 1 when a case regresses.",
+    )
+    parser.add_argument("--threshold-pct", type=float, default=10.0)
+    args = parser.parse_args()
+
+    if os.environ.get("PYTHONHASHSEED") != "0":
+        # Set iteration order over enums/strings varies per process otherwise,
+        # which shifts AI and layout timings between baseline and compare runs.
+        # A child process rather than exec, which Windows only emulates.
+        env = {**os.environ, "PYTHONHASHSEED": "0"}
+        completed = subprocess.run([sys.executable, *sys.argv], env=env, check=False)
+        return completed.returncode
+    names = _select_cases(args.cases)
+    if args.list:
+        print("\n".join(names))
+        return 0
+    if not names:
+        print("error: no cases match", file=sys.stderr)
+        return 2
+    baseline: dict[str, object] | None = None
+    if args.compare is not None:
+        if not args.compare.is_file():
+            print(
+                f"error: no baseline at {args.compare}; record one on this machine with "
+                "--save-baseline first",
+                file=sys.stderr,
+            )
+            return 2
+        try:
+            baseline = loads_bytes(args.compare.read_bytes())
+        except (OSError, ValueError) as exc:
+            print(f"error: cannot read baseline {args.compare}: {exc}", file=sys.stderr)
+            return 2
+        if baseline.get("schema_version") != PERF_BASELINE_SCHEMA_VERSION:
+            print(f"error: unsupported baseline schema in {args.compare}", file=sys.stderr)
+            return 2
+
+    results: dict[str, dict[str, object]] = {}
+    for name in names:
+        results[name] = _measure(
+            CASES[name], samples=max(3, args.samples), min_sample_ms=args.min_sample_ms
+        )
+        low, high = results[name]["ci95_ns"]  # type: ignore[misc]
+        print(f"{name}.median_ns={results[name]['median_ns']:.0f}")
+        print(f"{name}.ci95_ns={low:.0f},{high:.0f}")
+
+    if args.save_baseline is not None:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "schema_version": PERF_BASELINE_SCHEMA_VERSION,
+            "created_at": datetime.now(UTC).isoformat(),
+            "machine": _machine_metadata(),
+            "samples": args.samples,
+            "min_sample_ms": args.min_sample_ms,
+            "cases": results,
+        }
+        args.save_baseline.write_bytes(dumps_bytes(payload, pretty=True))
+        print(f"baseline={args.save_baseline}")
+    if baseline is not None:
+        return _compare(results, baseline, threshold_pct=args.threshold_pct)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import argparse
+import random
+import tracemalloc
+from dataclasses import replace
+from statistics import mean
+from time import perf_counter
+
+from engine.api.render_snapshot import RenderSnapshot
+from engine.api.window import WindowResizeEvent
+from engine.rendering.wgpu_renderer import WgpuRenderer
+from engine.runtime.host import _is_trusted_render_snapshot, _sanitize_render_snapshot
+from engine.runtime.ui_space import UISpaceTransform, scale_render_snapshot
+from engine.ui_runtime.grid_layout import GridLayout
+from warships.game.app.state_machine import AppState
+from warships.game.app.ui_state import AppUIState
+from warships.game.core.fleet import random_fleet
+from warships.game.core.models import Coord, Orientation, ShipType
+from warships.game.core.rules import create_session
+from warships.game.ui.game_view import GameView
+
+_SHIP_ORDER = [
+    ShipType.CARRIER,
+    ShipType.BATTLESHIP,
+    ShipType.CRUISER,
+    ShipType.SUBMARINE,
+    ShipType.DESTROYER,
+]
+
+
+def _battle_ui_state(*, seed: int, shots: int) -> AppUIState:
+    rng = random.Random(seed)
+    session = create_session(random_fleet(rng), random_fleet(rng))
+    cells = [Coord(row=row, col=col) for row in range(10) for col in range(10)]
+    rng.shuffle(cells)
+    for coord in cells[:shots]:
+        session.player_board.apply_shot(coord)
+        session.ai_board.apply_shot(coord)
+    return AppUIState(
+        state=AppState.BATTLE,
+        status="Battle mode",
+        buttons=[],
+        placements=[],
+        placement_orientation=Orientation.HORIZONTAL,
+        session=session,
+        ship_order=list(_SHIP_ORDER),
+        is_closing=False,
+        preset_rows=[],
+        prompt=None,
+        held_ship_type=None,
+        held_ship_orientation=None,
+        held_grab_index=0,
+        hover_cell=None,
+        hover_x=None,
+        hover_y=None,
+        held_preview_valid=True,
+        held_preview_reason=None,
+        placement_popup_message=None,
+        new_game_difficulty=None,
+        new_game_difficulty_open=False,
+        new_game_difficulty_options=[],
+        new_game_visible_presets=[],
+        new_game_selected_preset=None,
+        new_game_can_scroll_up=False,
+        new_game_can_scroll_down=False,
+        new_game_source=None,
+        new_game_preview=[],
+    )
+
+
+def _untrusted(snapshot: RenderSnapshot) -> RenderSnapshot:
+    return RenderSnapshot(
+        frame_index=snapshot.frame_index,
+        passes=tuple(replace(render_pass, trusted=False) for render_pass in snapshot.passes),
+    )
+
+
+def _bench_sanitize(*, frames: int, shots: int, trusted: bool) -> tuple[float, float, int]:
+    view = GameView(renderer=None, layout=GridLayout())  # type: ignore[arg-type]
+    ui = _battle_ui_state(seed=7, shots=shots)
+    samples_ms: list[float] = []
+    command_count = 0
+    for frame_index in range(frames):
+        # Rebuild every frame so the host identity cache never hits.
+        snapshot, _labels = view.build_snapshot(
+            frame_index=frame_index,
+            ui=ui,
+            debug_ui=False,
+            debug_labels_state=[],
+        )
+        if not trusted:
+            snapshot = _untrusted(snapshot)
+        command_count = sum(len(render_pass.commands) for render_pass in snapshot.passes)
+        start = perf_counter()
+        if not _is_trusted_render_snapshot(snapshot):
+            _sanitize_render_snapshot(snapshot)
+        samples_ms.append((perf_counter() - start) * 1000.0)
+    ordered = sorted(samples_ms)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return mean(samples_ms), p95, command_count
+
+
+def _bench_columnar(*, frames: int, shots: int, columnar: bool) -> tuple[float, int, int]:
+    view = GameView(renderer=None, layout=GridLayout(), columnar_rects=columnar)  # type: ignore[arg-type]
+    ui = _battle_ui_state(seed=7, shots=shots)
+    samples_ms: list[float] = []
+    for frame_index in range(frames):
+        start = perf_counter()
+        snapshot, _labels = view.build_snapshot(
+            frame_index=frame_index,
+            ui=ui,
+            debug_ui=False,
+            debug_labels_state=[],
+        )
+        samples_ms.append((perf_counter() - start) * 1000.0)
+    tracemalloc.start()
+    before, _peak = tracemalloc.get_traced_memory()
+    snapshot, _labels = view.build_snapshot(
+        frame_index=frames,
+        ui=ui,
+        debug_ui=False,
+        debug_labels_state=[],
+    )
+    retained_bytes = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    rect_rows = sum(len(batch) for batch in snapshot.passes[0].rect_batches)
+    return mean(samples_ms), retained_bytes, rect_rows
+
+
+class _NullBackend:
+    """Backend that accepts draw packets without touching a GPU."""
+
+    def begin_frame(self) -> None:
+        return None
+
+    def draw_packets(self, pass_name: str, packets: object) -> None:
+        _ = (pass_name, packets)
+
+    def present(self) -> None:
+        return None
+
+    def end_frame(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+    def set_title(self, title: str) -> None:
+        _ = title
+
+    def reconfigure(self, event: WindowResizeEvent) -> None:
+        _ = event
+
+    def resize_telemetry(self) -> dict[str, object]:
+        return {}
+
+
+def _bench_full_frame(*, frames: int, shots: int, columnar: bool) -> float:
+    """Build, scale to a 1920x1080 surface and submit one frame to the renderer."""
+    view = GameView(renderer=None, layout=GridLayout(), columnar_rects=columnar)  # type: ignore[arg-type]
+    backend = _NullBackend()
+    renderer = WgpuRenderer(_backend_factory=lambda _surface: backend)  # type: ignore[arg-type]
+    transform = UISpaceTransform(
+        engine_width=1920.0, engine_height=1080.0, app_width=1200.0, app_height=720.0
+    )
+    ui = _battle_ui_state(seed=7, shots=shots)
+    samples_ms: list[float] = []
+    for frame_index in range(frames):
+        start = perf_counter()
+        snapshot, _labels = view.build_snapshot(
+            frame_index=frame_index,
+            ui=ui,
+            debug_ui=False,
+            debug_labels_state=[],
+        )
+        renderer.render_snapshot(scale_render_snapshot(snapshot, transform))
+        samples_ms.append((perf_counter() - start) * 1000.0)
+    renderer.close()
+    return mean(samples_ms)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Per-frame render snapshot sanitize cost on the Warships battle screen."
+    )
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--shots", type=int, default=60)
+    args = parser.parse_args()
+
+    before_mean, before_p95, commands = _bench_sanitize(
+        frames=args.frames, shots=args.shots, trusted=False
+    )
+    after_mean, after_p95, _ = _bench_sanitize(frames=args.frames, shots=args.shots, trusted=True)
+
+    print(f"battle_commands_per_frame={commands}")
+    print(f"sanitize_untrusted_ms_per_frame_mean={before_mean:.6f}")
+    print(f"sanitize_untrusted_ms_per_frame_p95={before_p95:.6f}")
+    print(f"sanitize_trusted_ms_per_frame_mean={after_mean:.6f}")
+    print(f"sanitize_trusted_ms_per_frame_p95={after_p95:.6f}")
+
+    command_ms, command_bytes, _ = _bench_columnar(
+        frames=args.frames, shots=args.shots, columnar=False
+    )
+    columnar_ms, columnar_bytes, rect_rows = _bench_columnar(
+        frames=args.frames, shots=args.shots, columnar=True
+    )
+    print(f"columnar_rect_rows_per_frame={rect_rows}")
+    print(f"build_commands_ms_per_frame_mean={command_ms:.6f}")
+    print(f"build_columnar_ms_per_frame_mean={columnar_ms:.6f}")
+    print(f"snapshot_commands_retained_bytes={command_bytes}")
+    print(f"snapshot_columnar_retained_bytes={columnar_bytes}")
+
+    # Full CPU frame: build, UI-space scaling and renderer packet preparation.
+    frame_commands_ms = _bench_full_frame(frames=args.frames, shots=args.shots, columnar=False)
+    frame_columnar_ms = _bench_full_frame(frames=args.frames, shots=args.shots, columnar=True)
+    print(f"frame_commands_ms_per_frame_mean={frame_commands_ms:.6f}")
+    print(f"frame_columnar_ms_per_frame_mean={frame_columnar_ms:.6f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import argparse
+import random
+from statistics import mean
+from time import perf_counter
+
+from engine.api.render_snapshot import (
+    RenderCommand,
+    create_render_command,
+    render_command_order_key,
+)
+from engine.rendering.wgpu_renderer import _command_key, _sort_commands_by_order_key
+
+_KINDS = ("rect", "grid", "text", "rounded_rect", "stroke_rect")
+_LAYERS = (-10000, 0, 10, 50, 100, 200)
+
+
+def _recorded_commands(*, count: int, seed: int) -> list[RenderCommand]:
+    rng = random.Random(seed)
+    commands: list[RenderCommand] = []
+    for sequence in range(count):
+        commands.append(
+            create_render_command(
+                kind=rng.choice(_KINDS),
+                layer=rng.choice(_LAYERS),
+                data=(("key", f"cmd:{sequence}"), ("x", float(sequence)), ("y", 1.0)),
+                sequence=sequence,
+            )
+        )
+    return commands
+
+
+def _legacy_sort(commands: list[RenderCommand]) -> tuple[RenderCommand, ...]:
+    # Pre-packed pipeline: recorder tuple sort, then renderer tuple sort.
+    recorded = sorted(
+        commands,
+        key=lambda command: (int(command.layer), str(command.kind), str(command.sort_key)),
+    )
+    keyed = [
+        (
+            (
+                int(command.layer),
+                str(command.sort_key),
+                str(command.kind),
+                _command_key(command),
+                ordinal,
+            ),
+            command,
+        )
+        for ordinal, command in enumerate(recorded)
+    ]
+    return tuple(command for _, command in sorted(keyed, key=lambda item: item[0]))
+
+
+def _packed_sort(commands: list[RenderCommand]) -> tuple[RenderCommand, ...]:
+    recorded = tuple(sorted(commands, key=render_command_order_key))
+    return _sort_commands_by_order_key(recorded)
+
+
+def _time_ms(fn, commands: list[RenderCommand], *, repeats: int) -> float:
+    samples: list[float] = []
+    for _ in range(repeats):
+        start = perf_counter()
+        fn(commands)
+        samples.append((perf_counter() - start) * 1000.0)
+    return mean(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Per-frame command sort/batch ordering cost, tuple keys vs packed int keys."
+    )
+    parser.add_argument("--sizes", type=str, default="1000,5000,10000,50000")
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    for size in (int(part) for part in args.sizes.split(",") if part.strip()):
+        commands = _recorded_commands(count=size, seed=size)
+        shuffled = list(commands)
+        random.Random(size + 1).shuffle(shuffled)
+        legacy_ms = _time_ms(_legacy_sort, commands, repeats=args.repeats)
+        packed_ms = _time_ms(_packed_sort, commands, repeats=args.repeats)
+        unsorted_ms = _time_ms(
+            lambda items: _sort_commands_by_order_key(tuple(items)),
+            shuffled,
+            repeats=args.repeats,
+        )
+        print(
+            f"commands={size} tuple_sort_ms={legacy_ms:.3f} packed_sort_ms={packed_ms:.3f} "
+            f"packed_batch_unsorted_ms={unsorted_ms:.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
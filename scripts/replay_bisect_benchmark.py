@@ -0,0 +1,116 @@
+"""Full replay validation vs checkpoint-segment bisection on a synthetic replay.
+
+``--glitch-ticks START END`` reports a wrong score only for ticks in
+``[START, END)``, a divergence that heals, which bisection must still report
+at the same tick as the full run.
+"""
+
+from __future__ import annotations
+
+import argparse
+from time import perf_counter
+from typing import Any
+
+from engine.diagnostics import FixedStepReplayRunner, ReplayCommand, ReplayRecorder
+
+_STEP_SECONDS = 1.0 / 60.0
+
+
+def _simulator(
+    *, drift_from_tick: int | None, glitch_ticks: tuple[int, int] | None = None
+) -> tuple[Any, Any, Any]:
+    state = {"tick": 0, "x": 0, "y": 0, "score": 0}
+
+    def apply_command(command: ReplayCommand) -> None:
+        state["x"] += int(command.payload.get("dx", 0))
+        state["y"] += int(command.payload.get("dy", 0))
+
+    def step(_dt: float) -> dict[str, int]:
+        state["tick"] += 1
+        state["score"] = (state["score"] * 31 + state["x"] - state["y"]) % 1_000_003
+        if drift_from_tick is not None and state["tick"] >= drift_from_tick:
+            state["score"] = (state["score"] + 1) % 1_000_003
+        observed = dict(state)
+        if glitch_ticks is not None and glitch_ticks[0] <= state["tick"] < glitch_ticks[1]:
+            observed["score"] += 1
+        return observed
+
+    def restore(checkpoint: dict[str, int]) -> None:
+        state.update(checkpoint)
+
+    return apply_command, step, restore
+
+
+def _record_session(*, ticks: int, hash_interval: int, checkpoint_interval: int) -> dict[str, Any]:
+    recorder = ReplayRecorder(
+        enabled=True,
+        seed=1,
+        hash_interval=hash_interval,
+        checkpoint_interval=checkpoint_interval,
+    )
+    apply_command, step, _restore = _simulator(drift_from_tick=None)
+    for tick in range(1, ticks + 1):
+        if tick % 17 == 0:
+            payload = {"dx": tick % 5 - 2, "dy": tick % 3 - 1}
+            recorder.record_command(tick=tick, command_type="move", payload=payload)
+            apply_command(ReplayCommand(tick=tick, command_type="move", payload=payload))
+        state = step(_STEP_SECONDS)
+        checkpoint = dict(state) if recorder.wants_checkpoint(tick) else None
+        recorder.mark_frame(tick=tick, state_hash=state, checkpoint=checkpoint)
+    return recorder.snapshot(limit=ticks)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Full replay validation vs checkpoint-segment bisection."
+    )
+    parser.add_argument("--ticks", type=int, default=100_000)
+    parser.add_argument("--hash-interval", type=int, default=60)
+    parser.add_argument("--checkpoint-interval", type=int, default=600)
+    parser.add_argument("--drift-tick", type=int, default=73_421)
+    parser.add_argument(
+        "--glitch-ticks",
+        type=int,
+        nargs=2,
+        default=None,
+        metavar=("START", "END"),
+        help="Report a wrong score for ticks in [START, END) instead of drifting.",
+    )
+    args = parser.parse_args()
+    drift = None if args.glitch_ticks is not None else args.drift_tick
+    glitch = tuple(args.glitch_ticks) if args.glitch_ticks is not None else None
+
+    session = _record_session(
+        ticks=args.ticks,
+        hash_interval=args.hash_interval,
+        checkpoint_interval=args.checkpoint_interval,
+    )
+    runner = FixedStepReplayRunner(fixed_step_seconds=_STEP_SECONDS)
+
+    apply_command, step, _restore = _simulator(drift_from_tick=drift, glitch_ticks=glitch)
+    start = perf_counter()
+    full = runner.run(session, apply_command=apply_command, step=step)
+    full_ms = (perf_counter() - start) * 1000.0
+
+    apply_command, step, restore = _simulator(drift_from_tick=drift, glitch_ticks=glitch)
+    start = perf_counter()
+    bisect = runner.bisect(session, apply_command=apply_command, step=step, restore=restore)
+    bisect_ms = (perf_counter() - start) * 1000.0
+
+    first_full = full.mismatches[0].tick if full.mismatches else None
+    print(f"ticks={args.ticks}")
+    print(f"state_checkpoints={bisect.state_checkpoint_count}")
+    print(f"full_first_mismatch_tick={first_full}")
+    print(f"full_ticks_replayed={full.total_ticks}")
+    print(f"full_ms={full_ms:.3f}")
+    print(f"bisect_first_divergent_tick={bisect.first_divergent_tick}")
+    print(f"bisect_last_good_tick={bisect.last_good_tick}")
+    print(f"bisect_resumed_from_tick={bisect.resumed_from_tick}")
+    print(f"bisect_segments_replayed={bisect.segments_replayed}")
+    print(f"bisect_ticks_replayed={bisect.ticks_replayed}")
+    print(f"bisect_ms={bisect_ms:.3f}")
+    return 0 if first_full == bisect.first_divergent_tick else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
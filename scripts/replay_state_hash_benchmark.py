@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+from pathlib import Path
+from statistics import mean
+from time import perf_counter
+from typing import Any
+
+from engine.api.debug import create_state_hasher
+from engine.diagnostics import compute_state_hash
+from warships.game.app.controller import GameController
+from warships.game.app.events import ButtonPressed
+from warships.game.core.models import Coord
+from warships.game.presets.repository import PresetRepository
+from warships.game.presets.service import PresetService
+
+
+def _battle_controller(preset_dir: Path) -> GameController:
+    controller = GameController(
+        preset_service=PresetService(PresetRepository(preset_dir)),
+        rng=random.Random(7),
+    )
+    for button_id in ("new_game", "new_game_randomize", "start_game"):
+        controller.handle_button(ButtonPressed(button_id))
+    if controller.ui_state().session is None:
+        raise RuntimeError("failed to reach battle state")
+    return controller
+
+
+def _full_state(controller: GameController) -> dict[str, Any]:
+    # Whole-state JSON hashing, the pre-incremental approach.
+    session = controller.ui_state().session
+    assert session is not None
+    return {
+        "controller": controller._debug_controller_section(),
+        "session": {"turn": session.turn.value, "history": len(session.history)},
+        "board.player": [session.player_board.ships.tolist(), session.player_board.shots.tolist()],
+        "board.ai": [session.ai_board.ships.tolist(), session.ai_board.shots.tolist()],
+        "rng": controller._rng.getstate(),
+    }
+
+
+def _bench(*, frames: int, shot_every: int, incremental: bool) -> list[float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        controller = _battle_controller(Path(tmp))
+        session = controller.ui_state().session
+        assert session is not None
+        cells = [Coord(row=row, col=col) for row in range(10) for col in range(10)]
+        hasher = create_state_hasher()
+        samples_us: list[float] = []
+        for frame_index in range(frames):
+            if frame_index % shot_every == 0 and cells:
+                session.ai_board.apply_shot(cells.pop())
+            start = perf_counter()
+            if incremental:
+                controller.debug_state_digest(hasher)
+            else:
+                compute_state_hash(_full_state(controller))
+            samples_us.append((perf_counter() - start) * 1_000_000.0)
+        return samples_us
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Per-frame replay state-hash cost on the Warships battle screen."
+    )
+    parser.add_argument("--frames", type=int, default=3000)
+    parser.add_argument("--shot-every", type=int, default=30)
+    args = parser.parse_args()
+
+    full = _bench(frames=args.frames, shot_every=args.shot_every, incremental=False)
+    incremental = _bench(frames=args.frames, shot_every=args.shot_every, incremental=True)
+    print(f"frames={args.frames}")
+    print(f"full_json_hash_us_per_frame_mean={mean(full):.3f}")
+    print(f"incremental_hash_us_per_frame_mean={mean(incremental):.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+from pathlib import Path
+from statistics import mean, median
+from time import perf_counter
+
+from engine.diagnostics import ReplayRecorder, ReplayStreamReader
+from engine.diagnostics.replay_stream import load_replay_session
+
+
+def _record(
+    *, path: Path, ticks: int, chunk_ticks: int, stream: bool, commands_per_tick: int
+) -> tuple[list[float], float]:
+    recorder = ReplayRecorder(enabled=True, seed=1, hash_interval=1)
+    if stream:
+        recorder.open_stream(path=path, chunk_ticks=chunk_ticks)
+    samples_us: list[float] = []
+    for tick in range(1, ticks + 1):
+        start = perf_counter()
+        for index in range(commands_per_tick):
+            recorder.record_command(
+                tick=tick,
+                command_type="input.pointer",
+                payload={"event_type": "pointer_move", "x": float(index), "y": float(tick)},
+            )
+        recorder.mark_frame(tick=tick, state_hash=f"{tick:08x}")
+        samples_us.append((perf_counter() - start) * 1_000_000.0)
+    start = perf_counter()
+    if stream:
+        recorder.close_stream()
+    else:
+        recorder.export_json(path=path, limit=ticks * commands_per_tick)
+    return samples_us, (perf_counter() - start) * 1000.0
+
+
+def _p99(samples: list[float]) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+
+
+def _random_access_ms(path: Path, *, ticks: int, window: int, reads: int, stream: bool) -> float:
+    rng = random.Random(3)
+    samples_ms: list[float] = []
+    for _ in range(reads):
+        start_tick = rng.randint(1, max(1, ticks - window))
+        start = perf_counter()
+        if stream:
+            with ReplayStreamReader(path) as reader:
+                reader.read_range(start_tick, start_tick + window)
+        else:
+            session = load_replay_session(path)
+            [c for c in session["commands"] if start_tick <= c["tick"] <= start_tick + window]
+        samples_ms.append((perf_counter() - start) * 1000.0)
+    return median(samples_ms)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Replay capture write overhead and random-access load latency, JSON vs stream."
+    )
+    parser.add_argument("--ticks", type=int, default=36_000)
+    parser.add_argument("--commands-per-tick", type=int, default=2)
+    parser.add_argument("--chunk-ticks", type=int, default=600)
+    parser.add_argument("--window", type=int, default=300)
+    parser.add_argument("--reads", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "session.json"
+        stream_path = Path(tmp) / "session.replay"
+        json_write, json_finish_ms = _record(
+            path=json_path,
+            ticks=args.ticks,
+            chunk_ticks=args.chunk_ticks,
+            stream=False,
+            commands_per_tick=args.commands_per_tick,
+        )
+        stream_write, stream_finish_ms = _record(
+            path=stream_path,
+            ticks=args.ticks,
+            chunk_ticks=args.chunk_ticks,
+            stream=True,
+            commands_per_tick=args.commands_per_tick,
+        )
+        json_read_ms = _random_access_ms(
+            json_path, ticks=args.ticks, window=args.window, reads=args.reads, stream=False
+        )
+        stream_read_ms = _random_access_ms(
+            stream_path, ticks=args.ticks, window=args.window, reads=args.reads, stream=True
+        )
+        print(f"ticks={args.ticks}")
+        print(f"json_bytes={json_path.stat().st_size}")
+        print(f"stream_bytes={stream_path.stat().st_size}")
+        print(f"json_record_us_per_frame_mean={mean(json_write):.3f}")
+        print(f"stream_record_us_per_frame_mean={mean(stream_write):.3f}")
+        print(f"stream_record_us_per_frame_p99={_p99(stream_write):.3f}")
+        print(f"json_shutdown_export_ms={json_finish_ms:.3f}")
+        print(f"stream_shutdown_close_ms={stream_finish_ms:.3f}")
+        print(f"json_range_load_ms_median={json_read_ms:.3f}")
+        print(f"stream_range_load_ms_median={stream_read_ms:.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
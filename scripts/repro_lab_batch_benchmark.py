@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from engine.diagnostics import compute_state_hash
+from tools.engine_repro_lab.batch import (
+    ParallelBatchConfig,
+    run_batch_validation,
+    run_parallel_batch_validation,
+    summarize_batch_runs,
+)
+from tools.engine_repro_lab.main import _default_simulator
+from tools.engine_repro_lab.runner import ValidationConfig
+
+
+def _write_corpus(root: Path, *, replays: int, ticks: int, hash_interval: int) -> list[Path]:
+    paths: list[Path] = []
+    for index in range(replays):
+        commands = [
+            {"tick": tick, "type": "input.action", "payload": {"n": tick}}
+            for tick in range(1, ticks + 1, 7 + index % 5)
+        ]
+        command_ticks = [command["tick"] for command in commands]
+        state_hashes: list[dict[str, object]] = []
+        applied = 0
+        cursor = 0
+        for tick in range(0, ticks + 1):
+            while cursor < len(command_ticks) and command_ticks[cursor] == tick:
+                applied += 1
+                cursor += 1
+            if tick % hash_interval == 0:
+                state = {"tick": tick, "command_count": applied}
+                state_hashes.append({"tick": tick, "hash": compute_state_hash(state)})
+        path = root / f"replay_{index:04d}.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "schema_version": "diag.replay_session.v1",
+                    "manifest": {"first_tick": 0, "last_tick": ticks},
+                    "commands": commands,
+                    "state_hashes": state_hashes,
+                }
+            ),
+            encoding="utf-8",
+        )
+        paths.append(path)
+    return paths
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Serial vs process-pool replay batch validation throughput."
+    )
+    parser.add_argument("--replays", type=int, default=64)
+    parser.add_argument("--ticks", type=int, default=20_000)
+    parser.add_argument("--hash-interval", type=int, default=60)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    config = ValidationConfig()
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_corpus(
+            Path(tmp), replays=args.replays, ticks=args.ticks, hash_interval=args.hash_interval
+        )
+        start = perf_counter()
+        serial_runs = run_batch_validation(
+            paths, config=config, simulator_factory=_default_simulator
+        )
+        serial_s = perf_counter() - start
+        pooled = run_parallel_batch_validation(
+            paths,
+            config=config,
+            simulator_factory=_default_simulator,
+            parallel=ParallelBatchConfig(
+                workers=args.workers,
+                job_timeout_s=120.0,
+                report_path=Path(tmp) / "jobs.jsonl",
+            ),
+        )
+    serial_summary = summarize_batch_runs(serial_runs)
+    pooled_summary = summarize_batch_runs(pooled.runs)
+    print(f"replays={args.replays}")
+    print(f"workers={args.workers}")
+    print(f"serial_passed={serial_summary.passed_count}")
+    print(f"pooled_passed={pooled_summary.passed_count}")
+    print(f"serial_replays_per_min={args.replays * 60.0 / serial_s:.1f}")
+    print(f"pooled_replays_per_min={pooled.replays_per_minute:.1f}")
+    for label, q in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+        print(f"pooled_job_seconds_{label}={pooled.job_seconds_percentile(q) or 0.0:.4f}")
+    return 0 if serial_summary == pooled_summary else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import tempfile
+from time import perf_counter
+
+from engine.runtime.profiling import FrameProfiler
+
+_MODES = ("off", "sampler", "capture")
+
+
+def _update_entities(count: int) -> float:
+    total = 0.0
+    for idx in range(count):
+        total += (idx * 31 % 97) * 0.5
+    return total
+
+
+def _build_draw_list(count: int) -> list[tuple[int, int]]:
+    return sorted(((idx * 7919) % 1000, idx) for idx in range(count))
+
+
+def _frame(work: int) -> None:
+    _update_entities(work)
+    _build_draw_list(work // 4)
+
+
+def _run(mode: str, *, frames: int, work: int, rate_hz: int, export_dir: str) -> list[float]:
+    os.environ["ENGINE_PROFILING_CAPTURE_EXPORT_DIR"] = export_dir
+    os.environ["ENGINE_PROFILING_SAMPLER_HZ"] = str(rate_hz)
+    os.environ["ENGINE_PROFILING_SAMPLER_ENABLED"] = "1" if mode == "sampler" else "0"
+    os.environ["ENGINE_PROFILING_CAPTURE_ENABLED"] = "1" if mode == "capture" else "0"
+    os.environ["ENGINE_PROFILING_CAPTURE_FRAMES"] = str(frames + 1)
+    profiler = FrameProfiler(enabled=mode != "off", sampling_n=1)
+    frame_ms: list[float] = []
+    try:
+        for index in range(frames):
+            start = perf_counter()
+            profiler.on_frame_start(frame_index=index)
+            _frame(work)
+            profiler.on_frame_end(frame_index=index)
+            frame_ms.append((perf_counter() - start) * 1000.0)
+    finally:
+        profiler.close()
+    return frame_ms
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Headless frame time with no profiling, the stack sampler and cProfile capture."
+    )
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--work", type=int, default=40_000)
+    parser.add_argument("--rate-hz", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument(
+        "--capture-frames",
+        type=int,
+        default=30,
+        help="Frames run under cProfile capture; it is an order of magnitude slower.",
+    )
+    args = parser.parse_args()
+
+    means: dict[str, list[float]] = {mode: [] for mode in _MODES}
+    with tempfile.TemporaryDirectory() as tmp:
+        # Interleave modes so drift in machine load hits all of them alike.
+        for _ in range(args.rounds):
+            for mode in _MODES:
+                samples = _run(
+                    mode,
+                    frames=args.capture_frames if mode == "capture" else args.frames,
+                    work=args.work,
+                    rate_hz=args.rate_hz,
+                    export_dir=tmp,
+                )
+                means[mode].append(statistics.fmean(samples))
+    baseline = statistics.median(means["off"])
+    print(f"frames={args.frames}")
+    print(f"rounds={args.rounds}")
+    print(f"sampler_rate_hz={args.rate_hz}")
+    for mode in _MODES:
+        mean_ms = statistics.median(means[mode])
+        print(f"{mode}_frame_mean_ms={mean_ms:.3f}")
+        if mode != "off":
+            print(f"{mode}_overhead_pct={(mean_ms / baseline - 1.0) * 100.0:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
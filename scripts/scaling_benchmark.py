@@ -0,0 +1,180 @@
+"""Frame build, AI decision and fleet generation cost as the board grows.
+
+Each ``--sizes`` entry plays with ``RulesProfile.scaled(size)``: the classic
+fleet repeated once per ten rows, so 30 gives a 30x30 board with 15 ships.
+Prints ``size_<n>_<metric>=<value>`` lines; ``frame_fits_budget`` compares the
+battle frame p95 with ``--frame-budget-ms``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+from collections.abc import Callable
+from time import perf_counter
+
+from engine.api.ui_primitives import GridLayout
+from warships.game.app.ports.runtime_primitives import Button
+from warships.game.app.services.battle import build_ai_strategy
+from warships.game.app.state_machine import AppState
+from warships.game.app.ui_state import AppUIState
+from warships.game.core.fleet import build_board_from_fleet, random_fleet, random_fleets
+from warships.game.core.models import Coord, Orientation, RulesProfile
+from warships.game.core.rules import create_session
+from warships.game.ui.game_view import GameView
+from warships.game.ui.layout_metrics import grid_layout_for_board
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[int(fraction * (len(ordered) - 1))]
+
+
+def _rate(count: int, make: Callable[[], object]) -> float:
+    started = perf_counter()
+    make()
+    return count / max(perf_counter() - started, 1e-9)
+
+
+def _battle_ui(rules: RulesProfile, rng: random.Random) -> AppUIState:
+    player = random_fleet(rng, rules=rules)
+    session = create_session(player, random_fleet(rng, rules=rules), rules=rules)
+    size = rules.board_size
+    cells = [Coord(row=row, col=col) for row in range(size) for col in range(size)]
+    rng.shuffle(cells)
+    # Mid-game: 60% of each board shot, like the 60-shot perf_suite battle case.
+    for coord in cells[: int(0.6 * len(cells))]:
+        session.player_board.apply_shot(coord)
+        session.ai_board.apply_shot(coord)
+    return AppUIState(
+        state=AppState.BATTLE,
+        status="scaling benchmark",
+        buttons=[
+            Button(id=f"button_{index}", x=40.0 + index * 180.0, y=640.0, w=160.0, h=48.0)
+            for index in range(5)
+        ],
+        placements=list(player.ships),
+        placement_orientation=Orientation.HORIZONTAL,
+        session=session,
+        ship_order=list(dict.fromkeys(rules.fleet)),
+        is_closing=False,
+        preset_rows=[],
+        prompt=None,
+        held_ship_type=None,
+        held_ship_orientation=None,
+        held_grab_index=0,
+        hover_cell=None,
+        hover_x=None,
+        hover_y=None,
+        held_preview_valid=True,
+        held_preview_reason=None,
+        placement_popup_message=None,
+        new_game_difficulty="Normal",
+        new_game_difficulty_open=False,
+        new_game_difficulty_options=[],
+        new_game_visible_presets=[],
+        new_game_selected_preset=None,
+        new_game_can_scroll_up=False,
+        new_game_can_scroll_down=False,
+        new_game_source=None,
+        new_game_preview=[],
+    )
+
+
+def _frame_build_ms(
+    rules: RulesProfile, frames: int, seed: int, *, columnar_rects: bool
+) -> list[float]:
+    layout = grid_layout_for_board(GridLayout(), rules.board_size)
+    view = GameView(
+        renderer=None,  # type: ignore[arg-type]
+        layout=layout,
+        columnar_rects=columnar_rects,
+    )
+    ui = _battle_ui(rules, random.Random(seed))
+    samples: list[float] = []
+    for frame in range(frames):
+        started = perf_counter()
+        view.build_snapshot(frame_index=frame, ui=ui, debug_ui=False, debug_labels_state=[])
+        samples.append((perf_counter() - started) * 1000.0)
+    return samples
+
+
+def _ai_games(
+    rules: RulesProfile, difficulty: str, games: int, seed: int
+) -> tuple[list[float], list[float], list[int]]:
+    """Play full games; return (per-shot us, per-game ms, shots per game)."""
+    shot_us: list[float] = []
+    game_ms: list[float] = []
+    shots: list[int] = []
+    for game in range(games):
+        rng = random.Random(seed + game)
+        board = build_board_from_fleet(random_fleet(rng, rules=rules), rules=rules)
+        ai = build_ai_strategy(difficulty, rng, rules=rules)
+        fired = 0
+        game_started = perf_counter()
+        while not board.all_ships_sunk():
+            started = perf_counter()
+            shot = ai.choose_shot()
+            result, _sunk = board.apply_shot(shot)
+            ai.notify_result(shot, result)
+            shot_us.append((perf_counter() - started) * 1e6)
+            fired += 1
+        game_ms.append((perf_counter() - game_started) * 1000.0)
+        shots.append(fired)
+        close = getattr(ai, "close", None)
+        if close is not None:
+            close()
+    return shot_us, game_ms, shots
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Frame build, AI decision and fleet generation cost per board size."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 20, 30])
+    parser.add_argument("--difficulties", nargs="+", default=["Easy", "Normal", "Hard"])
+    parser.add_argument("--games", type=int, default=5)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--fleets", type=int, default=200)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--frame-budget-ms", type=float, default=16.7)
+    parser.add_argument(
+        "--columnar-rects", action="store_true", help="Build frames as WARSHIPS_COLUMNAR_RECTS=1."
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        rules = RulesProfile.scaled(size)
+        prefix = f"size_{size}"
+        print(f"{prefix}_ships={len(rules.fleet)}")
+
+        rng = random.Random(args.seed)
+        fleet_rate = _rate(
+            args.fleets, lambda: [random_fleet(rng, rules=rules) for _ in range(args.fleets)]
+        )
+        batch_rate = _rate(args.batch, lambda: random_fleets(rng, args.batch, rules=rules))
+        print(f"{prefix}_random_fleet_per_sec={fleet_rate:.0f}")
+        print(f"{prefix}_random_fleets_per_sec={batch_rate:.0f}")
+
+        frame_ms = _frame_build_ms(
+            rules, args.frames, args.seed, columnar_rects=args.columnar_rects
+        )
+        frame_p95 = _percentile(frame_ms, 0.95)
+        print(f"{prefix}_frame_build_ms_p50={statistics.median(frame_ms):.3f}")
+        print(f"{prefix}_frame_build_ms_p95={frame_p95:.3f}")
+        print(f"{prefix}_frame_fits_budget={int(frame_p95 <= args.frame_budget_ms)}")
+
+        for difficulty in args.difficulties:
+            shot_us, game_ms, shots = _ai_games(rules, difficulty, args.games, args.seed)
+            label = f"{prefix}_ai_{difficulty.lower()}"
+            print(f"{label}_shot_us_p50={statistics.median(shot_us):.1f}")
+            print(f"{label}_shot_us_p95={_percentile(shot_us, 0.95):.1f}")
+            print(f"{label}_game_ms={statistics.mean(game_ms):.2f}")
+            print(f"{label}_mean_shots={statistics.mean(shots):.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from time import perf_counter
+
+from engine.api.debug import find_latest_debug_payload
+from engine.diagnostics.schema import (
+    DIAG_PROFILING_SCHEMA_VERSION,
+    ENGINE_CRASH_BUNDLE_SCHEMA_VERSION,
+)
+from engine.runtime.observability import _extract_stamp, discover_session_bundles
+
+_BASE = datetime(2026, 1, 1)
+
+
+def _build_tree(root: Path, *, sessions: int, payloads: int) -> None:
+    for idx in range(sessions):
+        stamp = (_BASE + timedelta(minutes=idx)).strftime("%Y%m%dT%H%M%S")
+        session_dir = root / "sessions" / f"s{idx:05d}"
+        session_dir.mkdir(parents=True)
+        (session_dir / f"game_logs_{stamp}.jsonl").write_bytes(b"{}\n")
+        (session_dir / f"game_ui_trace_{stamp}.jsonl").write_bytes(b"{}\n")
+    crash = root / "crash"
+    crash.mkdir()
+    bundle = crash / "engine_crash_bundle_20250101T000000.json"
+    bundle.write_text(json.dumps({"schema_version": ENGINE_CRASH_BUNDLE_SCHEMA_VERSION}))
+    os.utime(bundle, (1.0, 1.0))
+    body = json.dumps({"schema_version": DIAG_PROFILING_SCHEMA_VERSION, "spans": [0] * 2000})
+    for idx in range(payloads):
+        (crash / f"host_profile_capture_{idx:05d}.json").write_text(body)
+    stale = datetime(2025, 1, 1).timestamp()
+    for directory in (root, root / "sessions", crash, *(root / "sessions").iterdir()):
+        os.utime(directory, (stale, stale))
+
+
+def _legacy_discover(root: Path) -> int:
+    # The pre-index discovery: four rglob passes and an O(runs x traces) stamp match.
+    run_logs = sorted(set(root.rglob("*_logs_*.jsonl")) | set(root.rglob("warships_run_*.jsonl")))
+    ui_logs = sorted(set(root.rglob("*_ui_trace_*.jsonl")) | set(root.rglob("ui_diag_run_*.jsonl")))
+    run_items = [(p, _extract_stamp(p, "warships_run_")) for p in run_logs]
+    bundles = 0
+    for ui_path in ui_logs:
+        ui_stamp = _extract_stamp(ui_path, "ui_diag_run_")
+        best_delta: float | None = None
+        if ui_stamp is not None:
+            for _run_path, run_stamp in run_items:
+                if run_stamp is None:
+                    continue
+                delta = abs((ui_stamp - run_stamp).total_seconds())
+                if best_delta is None or delta < best_delta:
+                    best_delta = delta
+        bundles += 1
+    return bundles
+
+
+def _legacy_latest_payload(directory: Path, schema: str) -> dict[str, object] | None:
+    paths = sorted(directory.glob("*.json"), key=lambda path: path.stat().st_mtime, reverse=True)
+    for path in paths:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if str(payload.get("schema_version", "")) == schema:
+            return payload
+    return None
+
+
+def _timed_ms(fn) -> tuple[float, object]:
+    start = perf_counter()
+    result = fn()
+    return (perf_counter() - start) * 1000.0, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Session discovery: rglob + O(n*m) matching vs the cached session index."
+    )
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--payloads", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _build_tree(root, sessions=args.sessions, payloads=args.payloads)
+        print(f"sessions={args.sessions}")
+        print(f"payload_files={args.payloads + 1}")
+
+        legacy_ms, legacy_count = _timed_ms(lambda: _legacy_discover(root))
+        cold_ms, cold = _timed_ms(lambda: discover_session_bundles(root, recursive=True))
+        warm_ms, warm = _timed_ms(lambda: discover_session_bundles(root, recursive=True))
+        uncached_ms, uncached = _timed_ms(
+            lambda: discover_session_bundles(root, recursive=True, use_index=False)
+        )
+        assert legacy_count == len(cold) == len(warm) == len(uncached)
+        print(f"legacy_discover_ms={legacy_ms:.1f}")
+        print(f"uncached_discover_ms={uncached_ms:.1f}")
+        print(f"index_cold_discover_ms={cold_ms:.1f}")
+        print(f"index_warm_discover_ms={warm_ms:.1f}")
+
+        crash = root / "crash"
+        schema = ENGINE_CRASH_BUNDLE_SCHEMA_VERSION
+        legacy_ms, expected = _timed_ms(lambda: _legacy_latest_payload(crash, schema))
+        cold_ms, cold_payload = _timed_ms(
+            lambda: find_latest_debug_payload(root, [crash], schema=schema)
+        )
+        warm_ms, warm_payload = _timed_ms(
+            lambda: find_latest_debug_payload(root, [crash], schema=schema)
+        )
+        assert expected == cold_payload == warm_payload
+        print(f"legacy_latest_payload_ms={legacy_ms:.1f}")
+        print(f"index_cold_latest_payload_ms={cold_ms:.1f}")
+        print(f"index_warm_latest_payload_ms={warm_ms:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
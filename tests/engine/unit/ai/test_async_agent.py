@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from engine.api.ai import (
+    DecisionContext,
+    create_async_agent_runner,
+    create_blackboard,
+    create_functional_agent,
+)
+
+
+class _Hub:
+    def __init__(self) -> None:
+        self.events: list[tuple[str, str, float]] = []
+
+    def emit_fast(self, *, category: str, name: str, tick: int, value: float, **kwargs) -> None:
+        _ = (tick, kwargs)
+        self.events.append((category, name, value))
+
+
+def _context(blackboard) -> DecisionContext:
+    return DecisionContext(
+        now_seconds=0.0, delta_seconds=0.0, blackboard=blackboard, observations={}
+    )
+
+
+def _wait_for(runner, ticket: int, timeout_s: float = 2.0):
+    end = time.monotonic() + timeout_s
+    while time.monotonic() < end:
+        for decision in runner.poll(tick=3):
+            if decision.ticket == ticket:
+                return decision
+        time.sleep(0.001)
+    raise AssertionError("decision was not delivered")
+
+
+def test_async_runner_decides_off_thread_and_replays_blackboard_writes() -> None:
+    threads: list[str] = []
+
+    def decide(context: DecisionContext) -> str:
+        threads.append(threading.current_thread().name)
+        context.blackboard.set("shot", (2, 3))
+        context.blackboard.remove("stale")
+        return "fire"
+
+    runner = create_async_agent_runner()
+    blackboard = create_blackboard()
+    blackboard.set("stale", 1)
+    delivered = []
+    try:
+        ticket = runner.submit(
+            create_functional_agent(decide), _context(blackboard), on_complete=delivered.append
+        )
+        decision = _wait_for(runner, ticket)
+    finally:
+        runner.close()
+    assert decision.action == "fire"
+    assert not decision.timed_out and not decision.used_fallback
+    assert delivered == [decision]
+    assert threads[0].startswith("engine-ai")
+    assert blackboard.get("shot") == (2, 3)
+    assert not blackboard.has("stale")
+    assert runner.idle
+
+
+def test_async_runner_falls_back_at_deadline_and_reports_overrun() -> None:
+    release = threading.Event()
+
+    def slow(context: DecisionContext) -> str:
+        context.blackboard.set("shot", "slow")
+        release.wait(2.0)
+        return "slow"
+
+    def cheap(context: DecisionContext) -> str:
+        context.blackboard.set("shot", "cheap")
+        return "cheap"
+
+    hub = _Hub()
+    runner = create_async_agent_runner()
+    runner.bind_diagnostics(hub)
+    blackboard = create_blackboard()
+    try:
+        ticket = runner.submit(
+            create_functional_agent(slow),
+            _context(blackboard),
+            deadline_s=0.01,
+            fallback=create_functional_agent(cheap),
+        )
+        decision = _wait_for(runner, ticket)
+        assert decision.action == "cheap"
+        assert decision.timed_out and decision.used_fallback
+        assert blackboard.get("shot") == "cheap"
+        assert not runner.pending(ticket)
+        # The abandoned worker call still runs until it returns.
+        assert not runner.idle
+        release.set()
+        end = time.monotonic() + 2.0
+        while not runner.idle and time.monotonic() < end:
+            time.sleep(0.001)
+        assert runner.idle
+        assert blackboard.get("shot") == "cheap"
+    finally:
+        release.set()
+        runner.close()
+    assert [name for _, name, _ in hub.events] == ["ai.decision_overrun_ms"]
+    assert hub.events[0][0] == "ai"
+
+
+def test_async_runner_uses_fallback_when_agent_raises() -> None:
+    def broken(context: DecisionContext) -> str:
+        raise RuntimeError("boom")
+
+    runner = create_async_agent_runner()
+    try:
+        ticket = runner.submit(
+            create_functional_agent(broken),
+            _context(create_blackboard()),
+            fallback=create_functional_agent(lambda _context: "wait"),
+        )
+        decision = _wait_for(runner, ticket)
+    finally:
+        runner.close()
+    assert decision.action == "wait"
+    assert decision.used_fallback and not decision.timed_out
+    assert decision.error is not None and "boom" in decision.error
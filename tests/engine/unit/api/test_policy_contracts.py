@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import subprocess
+import sys
 from dataclasses import FrozenInstanceError
+from pathlib import Path
 
 import pytest
 
@@ -16,6 +19,7 @@ from engine.api.render_snapshot import (
     Vec3,
     create_render_snapshot,
     mat4_scale,
+    pack_render_order_key,
     mat4_translation,
 )
 from engine.api.window import (
@@ -86,3 +90,27 @@ def test_window_contract_values_are_normalized_shape() -> None:
     assert WindowFocusEvent(focused=True).focused is True
     assert WindowMinimizeEvent(minimized=False).minimized is False
     assert WindowCloseEvent().requested is True
+
+
+_ORDER_KEY_SCRIPT = """
+import sys
+from engine.api.render_snapshot import pack_render_order_key
+for warmup in sys.argv[1:]:
+    pack_render_order_key(layer=0, kind="rect", sort_key=warmup)
+print(pack_render_order_key(layer=3, kind="text", sort_key="font:mono"))
+"""
+
+
+def test_render_order_key_does_not_depend_on_earlier_sort_keys() -> None:
+    expected = pack_render_order_key(layer=3, kind="text", sort_key="font:mono")
+    root = Path(__file__).resolve().parents[4]
+    for warmups in ([], ["atlas:ui", "font:sans"], [f"material:{i}" for i in range(300)]):
+        completed = subprocess.run(
+            [sys.executable, "-c", _ORDER_KEY_SCRIPT, *warmups],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert int(completed.stdout) == expected
+    assert pack_render_order_key(layer=0, kind="rect") & 0xFFFF000000 == 0
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+
 import pytest
 
 from engine.assets.registry import AssetHandle, AssetRegistry
@@ -61,3 +63,142 @@ def test_asset_registry_release_unknown_handle_is_noop() -> None:
     registry = AssetRegistry()
     unknown = AssetHandle(kind="missing", asset_id="id")
     registry.release(unknown)
+
+
+def _recording_loader(calls: list[tuple[str, bool]], gate: threading.Event | None = None):
+    """Loader that records each asset id with whether it ran on the calling thread."""
+    caller = threading.current_thread()
+
+    def _load(asset_id: str) -> bytes:
+        calls.append((asset_id, threading.current_thread() is caller))
+        if gate is not None and asset_id.startswith("gated"):
+            assert gate.wait(timeout=5.0)
+        return asset_id.encode() * 100
+
+    return _load
+
+
+def test_asset_registry_async_load_runs_off_the_frame_thread() -> None:
+    calls: list[tuple[str, bool]] = []
+    gate = threading.Event()
+    registry = AssetRegistry(max_workers=1)
+    registry.register_kind("texture", loader=_recording_loader(calls, gate))
+
+    assert registry.get(registry.load("texture", "sync")) == b"sync" * 100
+    handle = registry.load_async("texture", "gated")
+
+    # The loader is blocked on the gate, so the frame thread sees a pending load.
+    assert registry.state(handle) == "pending"
+    assert registry.try_get(handle) is None
+    gate.set()
+    assert registry.get(handle) == b"gated" * 100
+    assert registry.state(handle) == "ready"
+    assert calls == [("sync", True), ("gated", False)]
+    registry.close()
+
+
+def test_asset_registry_async_failure_reports_failed_state() -> None:
+    def _broken(asset_id: str) -> object:
+        raise FileNotFoundError(asset_id)
+
+    registry = AssetRegistry()
+    registry.register_kind("font", loader=_broken)
+    handle = registry.load_async("font", "missing.ttf")
+
+    with pytest.raises(FileNotFoundError):
+        registry.get(handle)
+    assert registry.state(handle) == "failed"
+    assert registry.try_get(handle) is None
+    assert registry.stats().failures == 1
+    registry.release(handle)
+    assert registry.state(handle) == "unloaded"
+    registry.close()
+
+
+def test_asset_registry_retries_failed_load_when_requested_again() -> None:
+    attempts: list[str] = []
+
+    def _flaky(asset_id: str) -> object:
+        attempts.append(asset_id)
+        if len(attempts) == 1:
+            raise FileNotFoundError(asset_id)
+        return f"font:{asset_id}"
+
+    registry = AssetRegistry()
+    registry.register_kind("font", loader=_flaky)
+    first = registry.load_async("font", "late.ttf")
+    with pytest.raises(FileNotFoundError):
+        registry.get(first)
+    assert registry.state(first) == "failed"
+
+    second = registry.load_async("font", "late.ttf")
+    assert registry.get(second) == "font:late.ttf"
+    assert attempts == ["late.ttf", "late.ttf"]
+    stats = registry.stats()
+    assert (stats.hits, stats.misses, stats.failures) == (0, 2, 1)
+    registry.release(first)
+    assert registry.state(second) == "ready"
+    registry.close()
+
+
+def test_asset_registry_budget_retains_released_assets_in_lru_order() -> None:
+    unloaded: list[str] = []
+    registry = AssetRegistry(memory_budget_bytes=250)
+    registry.register_kind(
+        "blob",
+        loader=lambda asset_id: asset_id.encode() * 100,
+        unloader=lambda value: unloaded.append(bytes(value[:1]).decode()),
+    )
+    for asset_id in ("a", "b"):
+        registry.release(registry.load("blob", asset_id))
+    assert unloaded == []
+    assert registry.stats().bytes_by_kind == {"blob": 200}
+
+    # Touch "a" so "b" becomes least recently released, then exceed the budget.
+    registry.release(registry.load("blob", "a"))
+    held = registry.load("blob", "c")
+
+    assert unloaded == ["b"]
+    stats = registry.stats()
+    assert (stats.hits, stats.misses, stats.evictions) == (1, 3, 1)
+    assert stats.retained_count == 1
+    assert stats.bytes_total == 200
+    assert registry.get(held) == b"c" * 100
+    registry.close()
+
+
+def test_asset_registry_prefetch_raises_cache_hit_rate() -> None:
+    screens = {"menu": ["bg", "logo"], "battle": ["board", "ships", "logo"]}
+
+    def _visit(registry: AssetRegistry, *, prefetch: bool) -> float:
+        for index, screen in enumerate(["menu", "battle", "menu", "battle"]):
+            if prefetch and index + 1 < 4:
+                upcoming = "battle" if screen == "menu" else "menu"
+                registry.prefetch("texture", screens[upcoming])
+            handles = [registry.load("texture", asset_id) for asset_id in screens[screen]]
+            for handle in handles:
+                registry.release(handle)
+        stats = registry.stats()
+        registry.close()
+        return stats.hits / (stats.hits + stats.misses)
+
+    cold_calls: list[tuple[str, bool]] = []
+    cold = AssetRegistry()
+    cold.register_kind("texture", loader=_recording_loader(cold_calls))
+    cold_hit_rate = _visit(cold, prefetch=False)
+
+    warm_calls: list[tuple[str, bool]] = []
+    warm = AssetRegistry(max_workers=2, memory_budget_bytes=10_000)
+    warm.register_kind("texture", loader=_recording_loader(warm_calls))
+    warm_hit_rate = _visit(warm, prefetch=True)
+
+    assert cold_hit_rate == 0.0
+    assert all(on_caller for _asset_id, on_caller in cold_calls)
+    # Only the first screen's unshared asset misses; everything else was prefetched.
+    assert warm_hit_rate == pytest.approx(0.9)
+    assert [asset_id for asset_id, on_caller in warm_calls if on_caller] == ["bg"]
+    assert sorted(asset_id for asset_id, on_caller in warm_calls if not on_caller) == [
+        "board",
+        "logo",
+        "ships",
+    ]
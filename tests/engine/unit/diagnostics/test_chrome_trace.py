@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+from engine.api.game_module import HostFrameContext
+from engine.api.gameplay import SystemSpec
+from engine.diagnostics import (
+    DIAG_CHROME_TRACE_SCHEMA_VERSION,
+    ChromeTraceExporter,
+    DiagnosticHub,
+    DiagnosticsProfiler,
+)
+from engine.gameplay import RuntimeUpdateLoop
+from engine.runtime.context import RuntimeContextImpl
+
+# Required keys per phase of the Chrome Trace Event Format that the exporter emits.
+_PHASE_FIELDS: dict[str, dict[str, type | tuple[type, ...]]] = {
+    "X": {"name": str, "cat": str, "pid": int, "tid": int, "ts": (int, float), "dur": (int, float)},
+    "i": {"name": str, "cat": str, "pid": int, "tid": int, "ts": (int, float), "s": str},
+    "C": {"name": str, "pid": int, "tid": int, "ts": (int, float), "args": dict},
+    "M": {"name": str, "pid": int, "tid": int, "args": dict},
+}
+
+
+def _validate_trace(payload: Any) -> list[dict[str, Any]]:
+    assert isinstance(payload, dict)
+    assert payload["otherData"]["schema_version"] == DIAG_CHROME_TRACE_SCHEMA_VERSION
+    assert payload["displayTimeUnit"] in {"ms", "ns"}
+    events = payload["traceEvents"]
+    assert isinstance(events, list)
+    for event in events:
+        fields = _PHASE_FIELDS[event["ph"]]
+        for key, expected in fields.items():
+            assert isinstance(event[key], expected), (key, event)
+        if event["ph"] == "X":
+            assert event["dur"] >= 0.0
+        if event["ph"] == "M":
+            assert event["name"] in {"process_name", "thread_name"}
+            assert isinstance(event["args"]["name"], str)
+        if "args" in event:
+            assert isinstance(event["args"], dict)
+    return events
+
+
+class _System:
+    def start(self, _context: object) -> None:
+        return
+
+    def update(self, _context: object, _delta_seconds: float) -> None:
+        sum(range(100))
+
+    def shutdown(self, _context: object) -> None:
+        return
+
+
+def test_chrome_trace_export_is_valid_and_keeps_threads_on_separate_tracks(
+    tmp_path: Path,
+) -> None:
+    hub = DiagnosticHub(capacity=256)
+    exporter = ChromeTraceExporter(path=tmp_path / "trace.json", process_name="test")
+    hub.subscribe(exporter.enqueue)
+    profiler = DiagnosticsProfiler(mode="timeline", hub=hub)
+    loop = RuntimeUpdateLoop()
+    loop.add_system(SystemSpec("physics", _System(), order=0))
+    loop.add_system(SystemSpec("ai", _System(), order=1))
+    context = RuntimeContextImpl()
+    context.provide("diagnostics_hub", hub)
+    loop.start(context)
+
+    def _render_frame(tick: int) -> None:
+        hub.emit_fast(category="render", name="render.stage.begin_frame", tick=tick)
+        hub.emit_fast(category="render", name="render.stage.build_batches", tick=tick)
+        for pass_name in ("world", "ui"):
+            metadata = {"pass_name": pass_name, "packet_count": 3}
+            hub.emit_fast(
+                category="render",
+                name="render.stage.execute_pass.begin",
+                tick=tick,
+                metadata=metadata,
+            )
+            hub.emit_fast(
+                category="render",
+                name="render.stage.execute_pass.end",
+                tick=tick,
+                metadata=metadata,
+            )
+        hub.emit_fast(
+            category="render",
+            name="render.profile_frame",
+            tick=tick,
+            value={"build_ms": 0.5, "execute_ms": 1.5, "present_ms": 0.25, "batch_count": 2},
+        )
+        hub.emit_fast(category="render", name="render.stage.end_frame", tick=tick)
+
+    for tick in range(3):
+        hub.emit_fast(category="frame", name="frame.start", tick=tick)
+        context.provide(
+            "frame_context",
+            HostFrameContext(frame_index=tick, delta_seconds=1.0 / 60.0, elapsed_seconds=0.0),
+        )
+        span = profiler.begin_span(tick=tick, category="module", name="simulate")
+        loop.step(context, 1.0 / 60.0)
+        profiler.end_span(span)
+        hub.emit_fast(category="frame", name="frame.time_ms", tick=tick, value=16.0)
+        hub.emit_fast(category="frame", name="frame.end", tick=tick)
+    render = threading.Thread(
+        target=lambda: [_render_frame(tick) for tick in range(3)], name="render-thread"
+    )
+    render.start()
+    render.join()
+    # An unmatched begin marker is dropped rather than left open.
+    hub.emit_fast(category="frame", name="frame.start", tick=3)
+    exporter.close()
+    exporter.enqueue(hub.snapshot(limit=1)[0])
+
+    events = _validate_trace(json.loads((tmp_path / "trace.json").read_text(encoding="utf-8")))
+    stats = exporter.stats()
+    assert stats.written_count == len(events)
+    assert stats.dropped_count == 0
+
+    thread_names = {
+        event["tid"]: event["args"]["name"] for event in events if event["name"] == "thread_name"
+    }
+    main_tid = threading.get_ident()
+    assert thread_names[main_tid] == "MainThread"
+    assert sorted(thread_names.values()) == [
+        "MainThread",
+        "diag-chrome-trace-exporter",
+        "render-thread",
+    ]
+    assert "diag-chrome-trace-exporter" in thread_names.values()
+
+    complete = [event for event in events if event["ph"] == "X"]
+    by_name: dict[str, list[dict[str, Any]]] = {}
+    for event in complete:
+        by_name.setdefault(event["name"], []).append(event)
+    assert len(by_name["frame"]) == 3
+    assert len(by_name["simulate"]) == 3
+    assert len(by_name["physics"]) == len(by_name["ai"]) == 3
+    assert len(by_name["render.frame"]) == 3
+    assert len(by_name["render.pass:world"]) == len(by_name["render.pass:ui"]) == 3
+    assert by_name["trace.write_batch"]
+    assert {event["tid"] for event in by_name["frame"] + by_name["physics"]} == {main_tid}
+    assert main_tid not in {event["tid"] for event in by_name["render.frame"]}
+
+    # Nested spans stay inside their parents on the same track.
+    for frame in by_name["frame"]:
+        inner = [
+            event
+            for event in by_name["simulate"] + by_name["physics"] + by_name["ai"]
+            if event["args"]["tick"] == frame["args"]["tick"]
+        ]
+        assert len(inner) == 3
+        for event in inner:
+            assert frame["ts"] <= event["ts"]
+            assert event["ts"] + event["dur"] <= frame["ts"] + frame["dur"]
+    for render_frame in by_name["render.frame"]:
+        passes = [
+            event
+            for event in by_name["render.pass:world"]
+            if event["args"]["tick"] == render_frame["args"]["tick"]
+        ]
+        assert len(passes) == 1
+        assert render_frame["ts"] <= passes[0]["ts"]
+        assert passes[0]["ts"] + passes[0]["dur"] <= render_frame["ts"] + render_frame["dur"]
+
+    counters = [event for event in events if event["ph"] == "C"]
+    assert {event["name"] for event in counters} == {"render_ms", "frame_ms"}
+    render_counter = next(event for event in counters if event["name"] == "render_ms")
+    assert render_counter["args"] == {"build_ms": 0.5, "execute_ms": 1.5, "present_ms": 0.25}
+    instants = {event["name"] for event in events if event["ph"] == "i"}
+    assert instants == {"build_batches"}
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from engine.diagnostics import jsonl_reader
+from engine.diagnostics import iter_jsonl_records, tail_jsonl_records
+
+
+def _write_log(path: Path) -> Path:
+    path.write_bytes(
+        b'{"logger":"engine.runtime","msg":"a","n":1}\n'
+        b"\n"
+        b"not json\n"
+        b'[1, 2, 3]\r\n'
+        b'{"logger": "engine.rendering.scene", "msg": "b", "n": 2}\r\n'
+        b'{"logger":"warships.game","msg":"logger=engine.runtime","n":3}\n'
+        b'{"logger":"engine.runtime","msg":"c","n":4}'
+    )
+    return path
+
+
+def test_iter_jsonl_records_skips_malformed_lines(tmp_path: Path) -> None:
+    path = _write_log(tmp_path / "run.jsonl")
+
+    assert [row["n"] for row in iter_jsonl_records(path)] == [1, 2, 3, 4]
+    assert list(iter_jsonl_records(tmp_path / "missing.jsonl")) == []
+    (tmp_path / "empty.jsonl").write_bytes(b"")
+    assert list(iter_jsonl_records(tmp_path / "empty.jsonl")) == []
+
+
+def test_iter_jsonl_records_applies_field_prefixes(tmp_path: Path) -> None:
+    path = _write_log(tmp_path / "run.jsonl")
+
+    runtime = iter_jsonl_records(path, field_prefixes={"logger": "engine.runtime"})
+    engine = iter_jsonl_records(path, field_prefixes={"logger": ("engine.", "nope")})
+
+    assert [row["n"] for row in runtime] == [1, 4]
+    assert [row["n"] for row in engine] == [1, 2, 4]
+
+
+def test_iter_jsonl_records_seeks_across_release_windows(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(jsonl_reader, "_RELEASE_WINDOW", 64)
+    path = tmp_path / "run.jsonl"
+    lines = [
+        f'{{"logger":"{"engine.input" if n % 7 == 0 else "engine.runtime"}","n":{n}}}'
+        if n % 2
+        else f'{{"logger": "{"engine.input" if n % 7 == 0 else "engine.runtime"}", "n": {n}}}'
+        for n in range(200)
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    rows = iter_jsonl_records(path, field_prefixes={"logger": "engine.input"})
+
+    assert [row["n"] for row in rows] == [n for n in range(200) if n % 7 == 0]
+
+
+def test_tail_jsonl_records_returns_last_matches_in_order(tmp_path: Path) -> None:
+    path = _write_log(tmp_path / "run.jsonl")
+
+    assert [row["n"] for row in tail_jsonl_records(path, 2)] == [3, 4]
+    assert [row["n"] for row in tail_jsonl_records(path, 10)] == [1, 2, 3, 4]
+    filtered = tail_jsonl_records(path, 2, field_prefixes={"logger": "engine."})
+    assert [row["n"] for row in filtered] == [2, 4]
+    assert tail_jsonl_records(path, 0) == []
@@ -2,7 +2,12 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from engine.diagnostics import FixedStepReplayRunner, ReplayRecorder, compute_state_hash
+from engine.diagnostics import (
+    FixedStepReplayRunner,
+    ReplayCommand,
+    ReplayRecorder,
+    compute_state_hash,
+)
 
 
 def test_replay_recorder_manifest_and_commands() -> None:
@@ -103,3 +108,119 @@ def test_replay_runner_is_deterministic_from_logical_action_stream_only() -> Non
     assert result.passed is True
     assert result.commands_applied == 4
     assert result.checkpoint_count == 3
+
+
+def _counter_simulator(
+    *, drift_from_tick: int | None = None, glitch: tuple[int, int] | None = None
+):
+    state = {"tick": 0, "total": 0}
+
+    def apply_command(command) -> None:
+        state["total"] += int(command.payload.get("value", 0))
+
+    def step(_dt: float) -> dict[str, int]:
+        state["tick"] += 1
+        if drift_from_tick is not None and state["tick"] >= drift_from_tick:
+            state["total"] += 1
+        if glitch is not None and state["tick"] == glitch[0]:
+            state["total"] += 1
+        if glitch is not None and state["tick"] == glitch[1]:
+            state["total"] -= 1
+        return dict(state)
+
+    def restore(checkpoint: dict[str, int]) -> None:
+        state.update(checkpoint)
+
+    return apply_command, step, restore
+
+
+def _recorded_counter_session(*, ticks: int) -> dict[str, object]:
+    recorder = ReplayRecorder(
+        enabled=True, seed=3, hub=None, hash_interval=5, checkpoint_interval=20
+    )
+    apply_command, step, _restore = _counter_simulator()
+    for tick in range(1, ticks + 1):
+        if tick % 7 == 0:
+            recorder.record_command(tick=tick, command_type="add", payload={"value": tick})
+            apply_command(ReplayCommand(tick=tick, command_type="add", payload={"value": tick}))
+        state = step(1.0 / 60.0)
+        checkpoint = dict(state) if recorder.wants_checkpoint(tick) else None
+        recorder.mark_frame(tick=tick, state_hash=state, checkpoint=checkpoint)
+    return recorder.snapshot(limit=10_000)
+
+
+def test_replay_recorder_captures_state_checkpoints_on_interval() -> None:
+    session = _recorded_counter_session(ticks=100)
+
+    checkpoints = session["state_checkpoints"]
+    assert [item["tick"] for item in checkpoints] == [20, 40, 60, 80, 100]
+    assert checkpoints[0]["state"] == {"tick": 20, "total": 7 + 14}
+
+
+def test_replay_recorder_copies_checkpoints_when_recording() -> None:
+    recorder = ReplayRecorder(enabled=True, seed=3, hub=None, checkpoint_interval=1)
+    live = {"total": 1, "cells": [1, 2]}
+    recorder.mark_frame(tick=1, checkpoint=live)
+    live["total"] = 5
+    live["cells"].append(3)
+
+    recorded = recorder.snapshot()["state_checkpoints"]
+    assert recorded == [{"tick": 1, "state": {"total": 1, "cells": [1, 2]}}]
+
+
+def test_replay_runner_resumes_from_state_checkpoint() -> None:
+    session = _recorded_counter_session(ticks=100)
+    apply_command, step, restore = _counter_simulator()
+
+    result = FixedStepReplayRunner(fixed_step_seconds=1.0 / 60.0).run(
+        session, apply_command=apply_command, step=step, restore=restore, resume_tick=60
+    )
+
+    assert result.passed is True
+    assert result.total_ticks == 40
+    assert result.checkpoint_count == 8
+
+
+def test_replay_runner_bisect_locates_first_divergent_mark() -> None:
+    session = _recorded_counter_session(ticks=200)
+    apply_command, step, restore = _counter_simulator(drift_from_tick=133)
+
+    result = FixedStepReplayRunner(fixed_step_seconds=1.0 / 60.0).bisect(
+        session, apply_command=apply_command, step=step, restore=restore
+    )
+
+    assert result.diverged is True
+    assert result.first_divergent_tick == 135
+    assert result.last_good_tick == 130
+    assert result.resumed_from_tick == 120
+    assert result.segments_replayed < 10
+    assert result.ticks_replayed < 200
+
+
+def test_replay_runner_bisect_finds_divergence_that_heals_later() -> None:
+    session = _recorded_counter_session(ticks=200)
+    runner = FixedStepReplayRunner(fixed_step_seconds=1.0 / 60.0)
+    apply_command, step, _restore = _counter_simulator(glitch=(53, 57))
+    full = runner.run(session, apply_command=apply_command, step=step)
+    apply_command, step, restore = _counter_simulator(glitch=(53, 57))
+
+    result = runner.bisect(session, apply_command=apply_command, step=step, restore=restore)
+
+    assert [mismatch.tick for mismatch in full.mismatches] == [55]
+    assert result.diverged is True
+    assert result.first_divergent_tick == 55
+    assert result.last_good_tick == 50
+    assert result.resumed_from_tick == 40
+
+
+def test_replay_runner_bisect_reports_clean_replay() -> None:
+    session = _recorded_counter_session(ticks=200)
+    apply_command, step, restore = _counter_simulator()
+
+    result = FixedStepReplayRunner(fixed_step_seconds=1.0 / 60.0).bisect(
+        session, apply_command=apply_command, step=step, restore=restore
+    )
+
+    assert result.diverged is False
+    assert result.first_divergent_tick is None
+    assert result.state_checkpoint_count == 9
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from engine.diagnostics import ReplayRecorder, ReplayStreamReader, load_replay_session
+
+
+def _record_stream(path: Path, *, ticks: int, chunk_ticks: int) -> ReplayRecorder:
+    recorder = ReplayRecorder(enabled=True, seed=7, build={"build_id": "x"}, hash_interval=5)
+    recorder.open_stream(path=path, chunk_ticks=chunk_ticks, tail_limit=4)
+    for tick in range(1, ticks + 1):
+        if tick % 3 == 0:
+            recorder.record_command(tick=tick, command_type="input.action", payload={"n": tick})
+        recorder.mark_frame(tick=tick, state_hash={"tick": tick})
+    recorder.close_stream()
+    return recorder
+
+
+def test_replay_stream_roundtrips_recorder_capture(tmp_path: Path) -> None:
+    path = tmp_path / "capture.replay"
+    recorder = _record_stream(path, ticks=100, chunk_ticks=10)
+
+    with ReplayStreamReader(path) as reader:
+        assert reader.complete
+        assert len(reader.chunks) == 10
+        assert reader.command_count == 33
+        assert reader.state_hash_count == 20
+        assert reader.manifest["first_tick"] == 1
+        assert reader.manifest["last_tick"] == 100
+        session = reader.to_session()
+
+    assert [cmd["tick"] for cmd in session["commands"]] == list(range(3, 101, 3))
+    assert session["manifest"]["command_count"] == recorder.manifest().command_count
+    # Streaming keeps only a bounded in-memory tail.
+    assert len(recorder.snapshot(limit=1_000)["commands"]) <= 4 + 10
+    assert load_replay_session(path)["state_hashes"] == session["state_hashes"]
+
+
+def test_replay_stream_reads_tick_range_from_overlapping_chunks(tmp_path: Path) -> None:
+    path = tmp_path / "capture.replay"
+    _record_stream(path, ticks=100, chunk_ticks=10)
+
+    with ReplayStreamReader(path) as reader:
+        assert list(reader.chunk_range(25, 44)) == [2, 3, 4]
+        window = reader.read_range(25, 44)
+
+    assert [cmd["tick"] for cmd in window["commands"]] == [27, 30, 33, 36, 39, 42]
+    assert [mark["tick"] for mark in window["state_hashes"]] == [25, 30, 35, 40]
+
+
+def test_replay_stream_recovers_chunks_without_footer(tmp_path: Path) -> None:
+    path = tmp_path / "capture.replay"
+    _record_stream(path, ticks=100, chunk_ticks=10)
+    complete = path.read_bytes()
+    with ReplayStreamReader(path) as reader:
+        footer_offset = reader.chunks[-1].offset + 8 + reader.chunks[-1].length
+    # Simulate a crashed writer: no footer and a torn final chunk.
+    last_chunk_offset = footer_offset - 8 - 1
+    path.write_bytes(complete[:last_chunk_offset])
+
+    with ReplayStreamReader(path) as reader:
+        assert not reader.complete
+        assert len(reader.chunks) == 9
+        assert reader.manifest["last_tick"] == 90
+        assert reader.read_range(88, 95)["commands"] == [
+            {"tick": 90, "type": "input.action", "payload": {"n": 90}}
+        ]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from engine.diagnostics import SessionFileIndex
+from engine.diagnostics import session_index
+from engine.runtime.observability import discover_session_bundles
+
+
+def _age(*paths: Path) -> None:
+    # Push mtimes out of the racy window so the index trusts them.
+    for path in paths:
+        os.utime(path, ns=(1_000_000_000_000_000_000, 1_000_000_000_000_000_000))
+
+
+def _write_json(path: Path, schema: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"schema_version": schema}), encoding="utf-8")
+    return path
+
+
+def test_list_files_rescans_only_changed_directories(tmp_path: Path) -> None:
+    logs = tmp_path / "logs"
+    logs.mkdir()
+    (logs / "game_logs_20260101T000000.jsonl").write_text("{}\n", encoding="utf-8")
+    (logs / "notes.txt").write_text("x", encoding="utf-8")
+    nested = tmp_path / "sessions" / "a"
+    nested.mkdir(parents=True)
+    (nested / "game_ui_trace_20260101T000001.jsonl").write_text("{}\n", encoding="utf-8")
+    _age(logs, nested, nested.parent, tmp_path)
+
+    index = SessionFileIndex(tmp_path)
+    names = sorted(path.name for path in index.list_files(tmp_path, recursive=True))
+
+    assert names == ["game_logs_20260101T000000.jsonl", "game_ui_trace_20260101T000001.jsonl"]
+    assert index.rescanned_count == 4
+
+    assert len(index.list_files(tmp_path, recursive=True)) == 2
+    assert index.rescanned_count == 4
+
+    (nested / "game_replay_session_20260101T000002.replay").write_bytes(b"")
+    assert len(index.list_files(tmp_path, recursive=True)) == 3
+    assert index.rescanned_count == 5
+    assert len(index.list_files(tmp_path)) == 0
+
+
+def test_latest_payload_skips_cached_schema_mismatches(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    crash = tmp_path / "crash"
+    older = _write_json(crash / "a.json", "engine.crash_bundle.v1")
+    newer = _write_json(crash / "b.json", "diag.profiling.v1")
+    os.utime(older, ns=(1_000_000_000, 1_000_000_000))
+    os.utime(newer, ns=(2_000_000_000, 2_000_000_000))
+    _age(crash)
+    index = SessionFileIndex(tmp_path)
+    payload = index.latest_payload([crash], schema="engine.crash_bundle.v1")
+    assert payload == {"schema_version": "engine.crash_bundle.v1"}
+
+    loaded: list[str] = []
+    original = session_index._load_json_object
+
+    def _counting_load(path: Path) -> dict[str, object] | None:
+        loaded.append(path.name)
+        return original(path)
+
+    monkeypatch.setattr(session_index, "_load_json_object", _counting_load)
+
+    assert index.latest_payload([crash, crash], schema="engine.crash_bundle.v1") == payload
+    assert loaded == ["a.json"]
+    assert index.latest_payload([crash], schema="diag.replay_session.v1") is None
+
+
+def test_discover_session_bundles_matches_with_and_without_index(tmp_path: Path) -> None:
+    for name in (
+        "game_logs_20260101T000000.jsonl",
+        "game_logs_20260101T000010.jsonl",
+        "game_ui_trace_20260101T000004.jsonl",
+        "game_ui_trace_20260101T000005.jsonl",
+    ):
+        (tmp_path / name).write_text("{}\n", encoding="utf-8")
+    (tmp_path / "replay").mkdir()
+    (tmp_path / "replay" / "game_replay_session_20260101T000009.replay").write_bytes(b"")
+    before = sorted(tmp_path.rglob("*"))
+
+    indexed = discover_session_bundles(tmp_path)
+    cached = discover_session_bundles(tmp_path)
+    plain = discover_session_bundles(tmp_path, use_index=False)
+
+    assert indexed == cached == plain
+    # Equally near runs go to the first log in path order.
+    assert [
+        (b.ui_log.name if b.ui_log else None, b.run_log.name if b.run_log else None)
+        for b in plain
+    ] == [
+        ("game_ui_trace_20260101T000004.jsonl", "game_logs_20260101T000000.jsonl"),
+        ("game_ui_trace_20260101T000005.jsonl", "game_logs_20260101T000000.jsonl"),
+        (None, "game_logs_20260101T000010.jsonl"),
+    ]
+    assert {b.replay_stream.name for b in plain if b.replay_stream} == {
+        "game_replay_session_20260101T000009.replay"
+    }
+    # The cache lives in memory only; nothing is written under the logs root.
+    assert sorted(tmp_path.rglob("*")) == before
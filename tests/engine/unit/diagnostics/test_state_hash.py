@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import numpy as np
+
+from engine.diagnostics import StateSectionHasher, compute_state_hash, hash_state_value
+
+
+def test_state_hasher_reuses_sections_until_version_changes() -> None:
+    hasher = StateSectionHasher()
+    board = np.zeros((10, 10), dtype=np.int8)
+    builds: list[str] = []
+
+    def build_board() -> np.ndarray:
+        builds.append("board")
+        return board
+
+    first = hasher.update("board", version=1, build=build_board)
+    hasher.update("board", version=1, build=build_board)
+    board[3, 4] = 2
+    changed = hasher.update("board", version=2, build=build_board)
+
+    assert builds == ["board", "board"]
+    assert first != changed
+    assert hasher.rehashed_count == 2
+    assert hasher.reused_count == 1
+
+
+def test_state_hasher_root_is_independent_of_section_update_order() -> None:
+    left = StateSectionHasher()
+    left.update("controller", version=None, build=lambda: {"status": "ok"})
+    left.update("rng", version=7, build=lambda: [1, 2, 3])
+    right = StateSectionHasher()
+    right.update("rng", version=99, build=lambda: [1, 2, 3])
+    right.update("controller", version=None, build=lambda: {"status": "ok"})
+
+    assert left.digest() == right.digest()
+
+    right.discard("rng")
+    assert left.digest() != right.digest()
+
+
+def test_hash_state_value_is_stable_for_arrays_and_plain_values() -> None:
+    ships = np.arange(9, dtype=np.int16).reshape(3, 3)
+
+    assert hash_state_value(ships) == hash_state_value(ships.copy())
+    assert hash_state_value(ships) != hash_state_value(ships.astype(np.int32))
+    assert hash_state_value(ships) != hash_state_value(ships.reshape(9))
+    assert hash_state_value({"b": 1, "a": 2}) == compute_state_hash({"a": 2, "b": 1})
+    # Pinned so digests stay comparable across processes and releases.
+    assert hash_state_value(np.zeros(4, dtype=np.int8)) == (
+        "1c2cc7e007a8965bfdd0e636e67a68c893b57c730f087a4371864c13d317183d"
+    )
@@ -156,3 +156,74 @@ def test_action_binding_conflicts_are_reported_in_snapshot_values() -> None:
     snapshot = controller.build_input_snapshot(frame_index=1)
     values = dict(snapshot.actions.values)
     assert values.get("meta.mapping_conflicts", 0.0) >= 1.0
+
+
+def test_consecutive_pointer_moves_and_wheels_are_coalesced() -> None:
+    calls: list[str] = []
+    controller = InputController(on_click_queued=lambda: calls.append("queued"))
+    burst = [PointerEvent("pointer_move", float(i), float(i) * 2.0, 0) for i in range(500)]
+    controller.consume_window_input_events(
+        (
+            *burst[:250],
+            PointerEvent("pointer_down", 249.0, 498.0, 1),
+            *burst[250:],
+            WheelEvent(1.0, 1.0, 0.5),
+            KeyEvent("key_down", "A"),
+            WheelEvent(2.0, 2.0, 1.0),
+        )
+    )
+    controller.consume_window_input_events(
+        tuple(PointerEvent("pointer_move", 600.0, 700.0 + i, 0) for i in range(10))
+    )
+
+    snapshot = controller.build_input_snapshot(frame_index=1)
+    assert [(e.event_type, e.coalesced_count) for e in snapshot.pointer_events] == [
+        ("pointer_move", 250),
+        ("pointer_down", 1),
+        ("pointer_move", 260),
+    ]
+    assert (snapshot.mouse.x, snapshot.mouse.y) == (600.0, 709.0)
+    assert snapshot.wheel_events == (WheelEvent(2.0, 2.0, 1.5, coalesced_count=2),)
+    assert snapshot.mouse.wheel_delta == 1.5
+    assert calls == ["queued"]
+    stats = controller.queue_stats()
+    assert (stats.pointer_moves_coalesced, stats.wheel_events_coalesced) == (508, 1)
+
+    controller.consume_window_input_events((KeyEvent("key_up", "A"),))
+    assert calls == ["queued", "queued"]
+
+
+def test_input_queues_are_bounded_and_report_drops() -> None:
+    controller = InputController(max_queue_length=4)
+    controller.consume_window_input_events(
+        tuple(KeyEvent("char", str(i)) for i in range(10))
+        + tuple(
+            PointerEvent("pointer_down" if i % 2 == 0 else "pointer_up", 1.0, 1.0, 1)
+            for i in range(6)
+        )
+    )
+
+    snapshot = controller.build_input_snapshot(frame_index=1)
+    assert snapshot.keyboard.text_input == ("6", "7", "8", "9")
+    assert len(snapshot.pointer_events) == 4
+    assert dict(snapshot.actions.values)["meta.input_dropped"] == 8.0
+    stats = controller.queue_stats()
+    assert (stats.dropped_key_events, stats.dropped_pointer_events, stats.dropped_clicks) == (
+        6,
+        2,
+        0,
+    )
+    assert dict(controller.build_input_snapshot(frame_index=2).actions.values) == {}
+    with pytest.raises(ValueError):
+        InputController(max_queue_length=0)
+
+
+def test_undrained_clicks_past_the_cap_are_not_reported_as_dropped() -> None:
+    controller = InputController(max_queue_length=4)
+    for frame_index in range(1, 7):
+        controller.consume_window_input_events(
+            (PointerEvent("pointer_down", 1.0, 1.0, 1), PointerEvent("pointer_up", 1.0, 1.0, 1))
+        )
+        snapshot = controller.build_input_snapshot(frame_index=frame_index)
+        assert "meta.input_dropped" not in dict(snapshot.actions.values)
+    assert controller.queue_stats().dropped_clicks == 0
@@ -7,7 +7,14 @@ from types import ModuleType, SimpleNamespace
 
 import pytest
 
-from engine.api.render_snapshot import RenderCommand, RenderPassSnapshot, RenderSnapshot
+from engine.api.render_snapshot import (
+    RenderCommand,
+    RenderPassSnapshot,
+    RenderRectBatchBuilder,
+    RenderSnapshot,
+    create_render_command,
+    render_pass_commands,
+)
 from engine.api.window import WindowResizeEvent
 import engine.rendering.wgpu_renderer as wgpu_renderer
 from engine.rendering.wgpu_renderer import _WgpuBackend, WgpuInitError, WgpuRenderer
@@ -131,7 +138,7 @@ def test_wgpu_renderer_pass_execution_order_is_deterministic() -> None:
     assert [name for name, _ in backend.passes] == ["world", "overlay", "post_bloom"]
 
 
-def test_wgpu_renderer_command_sort_uses_deterministic_tie_break_keys() -> None:
+def test_wgpu_renderer_command_sort_keeps_submission_order_for_equal_order_keys() -> None:
     @dataclass(slots=True)
     class _OrderBackend(_FakeBackend):
         sort_keys: list[tuple[str, ...]] = field(default_factory=list)
@@ -159,7 +166,7 @@ def test_wgpu_renderer_command_sort_uses_deterministic_tie_break_keys() -> None:
     renderer.render_snapshot(snapshot)
 
     assert backend.passes == [("overlay", ("rect", "rect", "rect"))]
-    assert backend.sort_keys == [("a", "b", "c")]
+    assert backend.sort_keys == [("b", "a", "c")]
 
 
 def test_wgpu_renderer_normalized_golden_subset_for_packet_translation() -> None:
@@ -1293,3 +1300,123 @@ def test_wgpu_backend_present_recovers_after_submit_failure(monkeypatch) -> None
     telemetry = backend.resize_telemetry()
     assert int(telemetry["present_failures"]) >= 1
     assert int(telemetry["present_recoveries"]) >= 1
+
+
+def test_wgpu_renderer_packet_cache_hits_for_rebuilt_identical_commands() -> None:
+    backend = _FakeBackend()
+    renderer = WgpuRenderer(_backend_factory=lambda _surface: backend)
+
+    def _snapshot(frame_index: int) -> RenderSnapshot:
+        return RenderSnapshot(
+            frame_index=frame_index,
+            passes=(
+                RenderPassSnapshot(
+                    name="world",
+                    commands=(
+                        create_render_command(
+                            kind="rect",
+                            data=(("key", "cache"), ("x", 1.0), ("y", 2.0), ("w", 3.0)),
+                        ),
+                    ),
+                ),
+            ),
+        )
+
+    renderer.render_snapshot(_snapshot(1))
+    before = renderer._command_packet_cache.stats()  # noqa: SLF001
+    renderer.render_snapshot(_snapshot(2))
+    after = renderer._command_packet_cache.stats()  # noqa: SLF001
+
+    assert after.hits == before.hits + 1
+    assert after.misses == before.misses
+
+
+def test_sort_commands_by_order_key_orders_layer_kind_then_sequence() -> None:
+    commands = (
+        create_render_command(kind="text", layer=5, sequence=0, data=(("key", "t"),)),
+        create_render_command(kind="rect", layer=5, sequence=2, data=(("key", "r2"),)),
+        create_render_command(kind="rect", layer=5, sequence=1, data=(("key", "r1"),)),
+        create_render_command(kind="fill_window", layer=-10000, sequence=3, data=(("key", "bg"),)),
+    )
+
+    ordered = wgpu_renderer._sort_commands_by_order_key(commands)  # noqa: SLF001
+
+    assert [dict(command.data)["key"] for command in ordered] == ["bg", "r1", "r2", "t"]
+    assert wgpu_renderer._sort_commands_by_order_key(ordered) is ordered  # noqa: SLF001
+
+
+def test_wgpu_renderer_draws_columnar_rect_batches_in_order_key_order() -> None:
+    backend = _FakeBackend()
+    renderer = WgpuRenderer(_backend_factory=lambda _surface: backend)
+    builder = RenderRectBatchBuilder()
+    builder.append(key="front", x=0.0, y=0.0, w=1.0, h=1.0, color="#fff", z=1.0, sequence=0)
+    builder.append(key="back", x=0.0, y=0.0, w=1.0, h=1.0, color="#000", z=-1.0, sequence=1)
+    snapshot = RenderSnapshot(
+        frame_index=1,
+        passes=(
+            RenderPassSnapshot(
+                name="world",
+                commands=(
+                    create_render_command(
+                        kind="text", layer=0, sequence=2, data=(("key", "label"),)
+                    ),
+                ),
+                rect_batches=(builder.build(),),
+            ),
+        ),
+    )
+
+    renderer.render_snapshot(snapshot)
+
+    assert backend.passes == [("world", ("rect", "text", "rect"))]
+
+
+def test_wgpu_renderer_columnar_rect_packets_match_expanded_commands() -> None:
+    @dataclass(slots=True)
+    class _PacketBackend(_FakeBackend):
+        packets: list[tuple[object, ...]] = field(default_factory=list)
+
+        def draw_packets(self, pass_name: str, packets) -> None:
+            self.packets.extend(
+                (packet.kind, packet.layer, packet.transform, packet.data, packet.engine_static)
+                for packet in packets
+            )
+
+    builder = RenderRectBatchBuilder()
+    builder.append(key="a", x=1.0, y=2.0, w=3.0, h=4.0, color="#336699", z=0.5, sequence=0)
+    builder.append(
+        key="b",
+        x=0.0,
+        y=0.0,
+        w=10.0,
+        h=10.0,
+        color="#fff",
+        static=True,
+        sequence=1,
+        clip=(2.0, 3.0, 6.0, 20.0),
+    )
+    builder.append(
+        key="gone",
+        x=0.0,
+        y=0.0,
+        w=1.0,
+        h=1.0,
+        color="#000",
+        sequence=2,
+        clip=(5.0, 5.0, 9.0, 9.0),
+    )
+    text = create_render_command(kind="text", layer=0, sequence=3, data=(("key", "t"),))
+    batched = RenderPassSnapshot(name="ui", commands=(text,), rect_batches=(builder.build(),))
+    expanded = RenderPassSnapshot(name="ui", commands=render_pass_commands(batched))
+    recorded: list[list[tuple[object, ...]]] = []
+    for render_pass in (batched, expanded):
+        backend = _PacketBackend()
+        renderer = WgpuRenderer(_backend_factory=lambda _surface, backend=backend: backend)
+        for frame_index in range(3):
+            renderer.render_snapshot(RenderSnapshot(frame_index=frame_index, passes=(render_pass,)))
+        recorded.append(backend.packets)
+
+    assert [dict(command.data)["key"] for command in expanded.commands] == ["b", "t", "a"]
+    assert dict(expanded.commands[0].data)["x"] == 2.0
+    assert dict(expanded.commands[0].data)["w"] == 4.0
+    assert recorded[0] == recorded[1]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 import pytest
 
 import engine.runtime.bootstrap as bootstrap
@@ -180,3 +182,40 @@ def test_bootstrap_headless_and_backend_priority_parsing(monkeypatch) -> None:
 
     assert bootstrap._resolve_engine_headless() is True  # noqa: SLF001
     assert bootstrap._resolve_wgpu_backend_priority() == ("vulkan", "metal", "dx12")  # noqa: SLF001
+
+
+def test_bootstrap_headless_fast_forward_writes_exit_report(monkeypatch, tmp_path) -> None:
+    report_path = tmp_path / "ff_report.json"
+    monkeypatch.setenv("ENGINE_HEADLESS", "1")
+    monkeypatch.setenv("ENGINE_HEADLESS_FAST_FORWARD", "1")
+    monkeypatch.setenv("ENGINE_HEADLESS_MAX_FRAMES", "25")
+    monkeypatch.setenv("ENGINE_HEADLESS_REPORT_PATH", str(report_path))
+    deltas: list[float] = []
+
+    class _EndlessModule:
+        def on_start(self, host) -> None:
+            _ = host
+
+        def on_input_snapshot(self, snapshot) -> bool:
+            _ = snapshot
+            return False
+
+        def simulate(self, context) -> None:
+            deltas.append(context.delta_seconds)
+
+        def build_render_snapshot(self):
+            return None
+
+        def should_close(self) -> bool:
+            return False
+
+        def on_shutdown(self) -> None:
+            return
+
+    bootstrap.run_hosted_runtime(module_factory=lambda renderer, layout: _EndlessModule())
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert report["frames"] == 25
+    assert report["stop_reason"] == "max_frames"
+    assert len(deltas) == 25
+    assert deltas[-1] == pytest.approx(1.0 / 60.0)
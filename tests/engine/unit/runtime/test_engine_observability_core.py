@@ -8,7 +8,14 @@ ROOT = Path(__file__).resolve().parents[4]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from engine.api.debug import discover_debug_sessions, load_debug_session  # noqa: E402
+import pytest  # noqa: E402
+
+from engine.api.debug import (  # noqa: E402
+    DebugSessionBundle,
+    discover_debug_sessions,
+    load_debug_session,
+)
+from engine.diagnostics import ReplayRecorder  # noqa: E402
 
 
 def _write_jsonl(path: Path, rows: list[dict]) -> None:
@@ -97,3 +104,26 @@ def test_discover_session_bundles_recursive_finds_nested_logs(tmp_path: Path) ->
     assert len(recursive) == 1
     assert recursive[0].run_log == run_log
     assert recursive[0].ui_log == ui_log
+
+
+def test_loaded_session_closes_its_replay_stream(tmp_path: Path) -> None:
+    replay_path = tmp_path / "warships_run_20260218T200000.replay"
+    recorder = ReplayRecorder(enabled=True, seed=1, build={}, hash_interval=1)
+    recorder.open_stream(path=replay_path, chunk_ticks=4, tail_limit=4)
+    for tick in range(1, 9):
+        recorder.mark_frame(tick=tick, state_hash={"tick": tick})
+    recorder.close_stream()
+    bundle = DebugSessionBundle(
+        run_log=None, ui_log=None, run_stamp=None, ui_stamp=None, replay_stream=replay_path
+    )
+
+    with load_debug_session(bundle) as loaded:
+        assert loaded.replay is not None
+        assert loaded.replay.read_chunk(0)["state_hashes"]
+        replay = loaded.replay
+
+    with pytest.raises(ValueError):
+        # Reading from a closed file; the chunk cache is bypassed for an unread chunk.
+        replay.read_chunk(1)
+    # Deleting works once the handle is released (Windows refuses open files).
+    replay_path.unlink()
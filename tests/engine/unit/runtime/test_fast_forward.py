@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from engine.api.input_events import KeyEvent, PointerEvent
+from engine.runtime.fast_forward import (
+    FastForwardConfig,
+    ScriptedInput,
+    ScriptedInputFrame,
+    load_scripted_input,
+    run_fast_forward,
+)
+from engine.runtime.host import EngineHost
+from engine.runtime.time import FrameClock, VirtualClock
+
+
+class _RecordingModule:
+    def __init__(self, *, close_after: int | None = None) -> None:
+        self.deltas: list[float] = []
+        self.snapshots = []
+        self.shutdowns = 0
+        self._close_after = close_after
+
+    def on_start(self, host) -> None:
+        _ = host
+
+    def on_input_snapshot(self, snapshot) -> bool:
+        self.snapshots.append(snapshot)
+        return False
+
+    def simulate(self, context) -> None:
+        self.deltas.append(context.delta_seconds)
+
+    def build_render_snapshot(self):
+        return None
+
+    def should_close(self) -> bool:
+        return self._close_after is not None and len(self.deltas) >= self._close_after
+
+    def on_shutdown(self) -> None:
+        self.shutdowns += 1
+
+
+def _host(module: _RecordingModule, step_seconds: float) -> EngineHost:
+    clock = FrameClock(time_source=VirtualClock(step_seconds=step_seconds))
+    return EngineHost(module=module, clock=clock)
+
+
+def test_virtual_clock_advances_fixed_step_per_read() -> None:
+    clock = VirtualClock(step_seconds=0.5, start_seconds=10.0)
+
+    assert [clock(), clock(), clock()] == [10.0, 10.5, 11.0]
+    with pytest.raises(ValueError):
+        VirtualClock(step_seconds=0.0)
+
+
+def test_fast_forward_stops_at_max_frames_with_fixed_deltas() -> None:
+    module = _RecordingModule()
+    host = _host(module, 0.02)
+
+    report = run_fast_forward(host, config=FastForwardConfig(step_seconds=0.02, max_frames=50))
+
+    assert report.frames == 50
+    assert report.stop_reason == "max_frames"
+    assert report.sim_seconds == pytest.approx(sum(module.deltas))
+    assert report.sim_seconds == pytest.approx(0.98)
+    assert module.deltas[0] == 0.0
+    assert all(delta == pytest.approx(0.02) for delta in module.deltas[1:])
+    assert host.is_closed()
+    assert module.shutdowns == 1
+    assert report.to_payload()["frames_per_second"] > 0.0
+
+
+def test_fast_forward_stops_at_max_sim_seconds_or_module_close() -> None:
+    bounded = run_fast_forward(
+        _host(_RecordingModule(), 0.1),
+        config=FastForwardConfig(step_seconds=0.1, max_sim_seconds=1.0),
+    )
+    closed = run_fast_forward(
+        _host(_RecordingModule(close_after=3), 0.1),
+        config=FastForwardConfig(step_seconds=0.1, max_frames=100),
+    )
+
+    assert (bounded.frames, bounded.stop_reason) == (11, "max_sim_seconds")
+    assert bounded.sim_seconds == pytest.approx(1.0)
+    assert (closed.frames, closed.stop_reason) == (3, "closed")
+
+
+def test_fast_forward_delivers_scripted_events_on_their_frame() -> None:
+    module = _RecordingModule()
+    script = ScriptedInput(
+        frames={
+            2: ScriptedInputFrame(
+                events=(PointerEvent("pointer_down", 10.0, 20.0, 1), KeyEvent("key_down", "r")),
+                actions_started=frozenset({"game.fire"}),
+            )
+        }
+    )
+
+    report = run_fast_forward(
+        _host(module, 0.1),
+        config=FastForwardConfig(step_seconds=0.1, max_frames=4),
+        script=script,
+    )
+
+    delivered = module.snapshots[2]
+    assert report.input_events == 3
+    assert [event.event_type for event in delivered.pointer_events] == ["pointer_down"]
+    assert "r" in delivered.keyboard.just_pressed_keys
+    assert "game.fire" in delivered.actions.just_started
+    assert not module.snapshots[1].pointer_events
+    assert not module.snapshots[3].actions.just_started
+
+
+def test_load_scripted_input_reads_jsonl_script_and_replay_session(tmp_path) -> None:
+    script_path = tmp_path / "input.jsonl"
+    script_path.write_text(
+        "\n".join(
+            [
+                json.dumps(
+                    {"frame": 1, "events": [{"type": "pointer_down", "x": 1, "y": 2, "button": 1}]}
+                ),
+                json.dumps({"frame": 1, "events": [{"type": "char", "value": "a"}]}),
+                json.dumps({"frame": 4, "events": [{"type": "wheel", "x": 0, "y": 0, "dy": -1}]}),
+            ]
+        ),
+        encoding="utf-8",
+    )
+    replay_path = tmp_path / "replay.json"
+    replay_path.write_text(
+        json.dumps(
+            {
+                "manifest": {"first_tick": 10, "last_tick": 20},
+                "commands": [
+                    {
+                        "tick": 12,
+                        "type": "input.action",
+                        "payload": {"name": "ui.ok", "phase": "start"},
+                    },
+                    {
+                        "tick": 13,
+                        "type": "input.action",
+                        "payload": {"name": "ui.ok", "phase": "end"},
+                    },
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    script = load_scripted_input(script_path)
+    replay = load_scripted_input(replay_path)
+
+    assert len(script.frames[1].events) == 2
+    assert script.last_frame == 4
+    assert replay.frames[2].actions_started == frozenset({"ui.ok"})
+    assert replay.frames[3].actions_ended == frozenset({"ui.ok"})
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import logging
+import threading
+
+import pytest
+
+from engine.api.debug import iter_binary_log_records
+from engine.api.logging import EngineLoggingConfig
+from engine.runtime.fast_logging import FastLogger, FastLogSink
+from engine.runtime.logging import configure_engine_logging, get_engine_logger, stop_fast_logging
+
+
+class _RecordingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.rows: list[tuple[str, str, str]] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.rows.append((record.name, record.getMessage(), threading.current_thread().name))
+
+
+@pytest.fixture
+def restore_root_logging():
+    root = logging.getLogger()
+    original_handlers = list(root.handlers)
+    original_level = root.level
+    yield
+    stop_fast_logging()
+    root.handlers.clear()
+    root.handlers.extend(original_handlers)
+    root.setLevel(original_level)
+
+
+def test_fast_mode_formats_on_listener_and_writes_decodable_binary_log(
+    tmp_path, restore_root_logging
+) -> None:
+    path = tmp_path / "run.englog"
+    configure_engine_logging(
+        EngineLoggingConfig(level_name="DEBUG", file_path=str(path), file_format="binary")
+    )
+    fast = get_engine_logger("engine.test.fast")
+    assert isinstance(fast, FastLogger)
+    assert get_engine_logger("engine.test.fast") is fast
+
+    fast.debug("frame %d took %.1f ms", 7, 12.5, extra={"tick": 7})
+    logging.getLogger("engine.test.stdlib").warning("plain %s", "record")
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        fast.exception("failed")
+    stop_fast_logging()
+
+    rows = list(iter_binary_log_records(path))
+    assert [(row["logger"], row["level"], row["msg"]) for row in rows] == [
+        ("engine.test.fast", "DEBUG", "frame 7 took 12.5 ms"),
+        ("engine.test.stdlib", "WARNING", "plain record"),
+        ("engine.test.fast", "ERROR", "failed"),
+    ]
+    assert rows[0]["fields"] == {"tick": 7}
+    assert rows[0]["site"].startswith(__file__)
+    assert "RuntimeError: boom" in rows[2]["fields"]["exc_info"]
+    assert rows[0]["tick_ns"] <= rows[1]["tick_ns"] <= rows[2]["tick_ns"]
+
+
+def test_fast_sink_rate_limits_per_call_site_with_suppressed_summaries(tmp_path) -> None:
+    handler = _RecordingHandler()
+    sink = FastLogSink(
+        [handler],
+        binary_path=tmp_path / "limited.englog",
+        rate_limit_per_site=3,
+        rate_limit_window_s=60.0,
+    )
+    logger = logging.getLogger("engine.test.limited")
+    logger.setLevel(logging.INFO)
+    fast = FastLogger(logger, sink)
+    for index in range(100):
+        fast.info("hot path %d", index)
+    fast.info("other site")
+    sink.close()
+
+    messages = [message for _, message, _ in handler.rows]
+    assert messages == [
+        "hot path 0",
+        "hot path 1",
+        "hot path 2",
+        "other site",
+        "suppressed 97 repeated log records from this call site",
+    ]
+    assert {thread for _, _, thread in handler.rows} == {"engine-log-listener"}
+    rows = list(iter_binary_log_records(tmp_path / "limited.englog"))
+    assert rows[-1]["suppressed"] == 97
+    assert rows[-1]["site"] == rows[0]["site"]
+
+
+def test_binary_log_reader_stops_at_truncated_tail(tmp_path) -> None:
+    path = tmp_path / "truncated.englog"
+    sink = FastLogSink([], binary_path=path)
+    logger = logging.getLogger("engine.test.truncated")
+    logger.setLevel(logging.INFO)
+    fast = FastLogger(logger, sink)
+    for index in range(10):
+        fast.info("row %d", index)
+    sink.close()
+
+    data = path.read_bytes()
+    path.write_bytes(data[:-3])
+    assert [row["msg"] for row in iter_binary_log_records(path)] == [
+        f"row {index}" for index in range(9)
+    ]
+    path.write_bytes(b"not a log")
+    with pytest.raises(ValueError):
+        list(iter_binary_log_records(path))
+
+
+def test_cached_engine_logger_follows_reconfiguration(tmp_path, restore_root_logging) -> None:
+    fast = get_engine_logger("engine.test.reconfigured")
+    first = tmp_path / "first.englog"
+    configure_engine_logging(
+        EngineLoggingConfig(level_name="INFO", file_path=str(first), file_format="binary")
+    )
+    fast.info("first sink")
+    second = tmp_path / "second.englog"
+    configure_engine_logging(
+        EngineLoggingConfig(level_name="INFO", file_path=str(second), file_format="binary")
+    )
+    assert get_engine_logger("engine.test.reconfigured") is fast
+    fast.info("second sink")
+    stop_fast_logging()
+
+    assert [row["msg"] for row in iter_binary_log_records(first)] == ["first sink"]
+    assert [row["msg"] for row in iter_binary_log_records(second)] == ["second sink"]
+
+
+def test_engine_logger_without_sink_uses_stdlib_logger(caplog) -> None:
+    fast = get_engine_logger("engine.test.stdlib_fallback")
+    fast.setLevel(logging.DEBUG)
+    caplog.set_level(logging.DEBUG, logger="engine.test.stdlib_fallback")
+
+    fast.critical("down %d", 1)
+    fast.log(logging.DEBUG, "detail")
+
+    assert [(record.levelno, record.getMessage()) for record in caplog.records] == [
+        (logging.CRITICAL, "down 1"),
+        (logging.DEBUG, "detail"),
+    ]
+    assert {record.pathname for record in caplog.records} == {__file__}
+
+
+def test_fast_logger_keeps_exception_instance_passed_as_exc_info(tmp_path) -> None:
+    path = tmp_path / "exc.englog"
+    sink = FastLogSink([], binary_path=path)
+    logger = logging.getLogger("engine.test.exc_info")
+    logger.setLevel(logging.INFO)
+    fast = FastLogger(logger, sink)
+    try:
+        raise ValueError("stored")
+    except ValueError as exc:
+        error = exc
+    try:
+        raise KeyError("active")
+    except KeyError:
+        fast.error("saved failure", exc_info=error)
+    sink.close()
+
+    (row,) = iter_binary_log_records(path)
+    assert "ValueError: stored" in row["fields"]["exc_info"]
+    assert "KeyError" not in row["fields"]["exc_info"]
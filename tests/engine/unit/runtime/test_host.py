@@ -201,6 +201,50 @@ def test_engine_host_can_skip_snapshot_sanitize_for_perf(monkeypatch) -> None:
     assert data["text"] == ["base", "mutated"]
 
 
+class _TrustedSnapshotModule(_SnapshotModule):
+    def build_render_snapshot(self) -> RenderSnapshot:
+        snapshot = super().build_render_snapshot()
+        return RenderSnapshot(frame_index=snapshot.frame_index, passes=snapshot.passes, trusted=True)
+
+    def ui_design_resolution(self) -> None:
+        return None
+
+
+def test_engine_host_submits_trusted_snapshot_without_sanitize(monkeypatch) -> None:
+    monkeypatch.setenv("ENGINE_RUNTIME_RENDER_SNAPSHOT_TRUSTED_VALIDATE_N", "0")
+    module = _TrustedSnapshotModule()
+    renderer = _FakeRenderer()
+    host = EngineHost(module=module, render_api=renderer)
+
+    host.frame()
+
+    submitted = renderer.snapshots[0]
+    assert submitted.trusted is True
+    data = dict(submitted.passes[0].commands[0].data)
+    assert data["text"] is module.payload
+    assert not host.diagnostics_hub.snapshot(category="render", name="render.snapshot_sanitize_ms")
+
+
+def test_engine_host_validator_rejects_unfrozen_trusted_snapshot(monkeypatch) -> None:
+    monkeypatch.setenv("ENGINE_RUNTIME_RENDER_SNAPSHOT_TRUSTED_VALIDATE_N", "1")
+    module = _TrustedSnapshotModule()
+    renderer = _FakeRenderer()
+    host = EngineHost(module=module, render_api=renderer)
+
+    host.frame()
+    module.payload.append("mutated")
+
+    submitted = renderer.snapshots[0]
+    data = dict(submitted.passes[0].commands[0].data)
+    assert data["text"] == ("base",)
+    violations = host.diagnostics_hub.snapshot(
+        category="render", name="render.snapshot_trusted_violation"
+    )
+    assert violations and violations[0].value == 1
+    timings = host.diagnostics_hub.snapshot(category="render", name="render.snapshot_sanitize_ms")
+    assert timings and timings[0].metadata["sanitized_passes"] == 1
+
+
 def test_engine_host_handles_input_snapshot() -> None:
     module = FakeModule()
     host = EngineHost(module=module)
@@ -412,6 +456,25 @@ def test_engine_host_records_replay_state_hash_when_provider_available(monkeypat
     assert hash_events
 
 
+def test_engine_host_only_queries_state_hash_provider_on_hash_ticks(monkeypatch) -> None:
+    monkeypatch.setenv("ENGINE_DIAGNOSTICS_REPLAY_ENABLED", "1")
+    monkeypatch.setenv("ENGINE_DIAGNOSTICS_REPLAY_HASH_INTERVAL", "2")
+    module = _HashingModule()
+    calls: list[int] = []
+    original = module.debug_state_hash
+
+    def counting_hash() -> dict[str, int]:
+        calls.append(len(module.frames))
+        return original()
+
+    module.debug_state_hash = counting_hash  # type: ignore[method-assign]
+    host = EngineHost(module=module)
+    host.frame()
+    host.frame()
+
+    assert calls == [1]
+
+
 def test_engine_host_emits_capture_ready_and_profile_capture_state(
     monkeypatch, tmp_path: Path
 ) -> None:
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from engine.api.render_snapshot import (
+    RenderCommand,
+    RenderPassSnapshot,
+    RenderSnapshot,
+    create_render_command,
+)
+from engine.runtime.render_cache import (
+    RenderCacheLRU,
+    command_cache_key,
+    commands_cache_key,
+    render_cache_stats,
+)
+from engine.runtime.ui_space import UISpaceTransform, scale_render_snapshot
+
+
+def test_render_cache_lru_counts_hits_misses_and_evictions() -> None:
+    cache: RenderCacheLRU[int] = RenderCacheLRU(name="test.lru_counts", capacity=2)
+    cache.put("a", "src-a", 1)
+    cache.put("b", "src-b", 2)
+    assert cache.get("a", "src-a") == 1
+    cache.put("c", "src-c", 3)
+
+    assert cache.get("b", "src-b") is None
+    assert cache.get("a", "src-a") == 1
+    stats = cache.stats()
+    assert (stats.size, stats.hits, stats.misses, stats.evictions) == (2, 2, 1, 1)
+    assert stats.hit_rate == 2 / 3
+
+
+def test_render_cache_lru_rejects_mismatched_source_on_key_collision() -> None:
+    cache: RenderCacheLRU[str] = RenderCacheLRU(name="test.lru_collision", capacity=4)
+    cache.put(("h", 1), ("payload", 1), "first")
+
+    assert cache.get(("h", 1), ("payload", 2)) is None
+    assert cache.get(("h", 1), ("payload", 1)) == "first"
+
+
+def test_rebuilt_identical_commands_share_content_cache_key() -> None:
+    first = create_render_command(kind="rect", layer=3, data=(("key", "cell"), ("x", 1.0)))
+    second = create_render_command(kind="rect", layer=3, data=(("key", "cell"), ("x", 1.0)))
+    changed = create_render_command(kind="rect", layer=3, data=(("key", "cell"), ("x", 2.0)))
+
+    assert first is not second
+    assert command_cache_key(first) == command_cache_key(second)
+    assert command_cache_key(first) != command_cache_key(changed)
+    assert commands_cache_key((first,)) == commands_cache_key((second,))
+
+
+def test_unstamped_and_unhashable_commands_fall_back_to_object_identity() -> None:
+    plain = RenderCommand(kind="rect")
+    unhashable = create_render_command(kind="rect", data=(("points", [1, 2]),))
+
+    assert unhashable.identity is None
+    assert command_cache_key(plain) == ("id", id(plain))
+    assert commands_cache_key((plain,))[0] == "id"
+
+
+def test_scaled_pass_cache_hits_for_rebuilt_identical_snapshot() -> None:
+    transform = UISpaceTransform(engine_width=1200, engine_height=720, app_width=600, app_height=360)
+
+    def _snapshot(frame_index: int) -> RenderSnapshot:
+        return RenderSnapshot(
+            frame_index=frame_index,
+            passes=(
+                RenderPassSnapshot(
+                    name="ui",
+                    commands=(
+                        create_render_command(
+                            kind="rect",
+                            data=(("key", "scaled-hit"), ("x", 1.0), ("y", 2.0), ("w", 3.0)),
+                        ),
+                    ),
+                ),
+            ),
+        )
+
+    first = scale_render_snapshot(_snapshot(1), transform)
+    before = render_cache_stats()["ui_space.scaled_pass"]["hits"]
+    second = scale_render_snapshot(_snapshot(2), transform)
+
+    assert render_cache_stats()["ui_space.scaled_pass"]["hits"] == before + 1
+    assert second.passes[0].commands is first.passes[0].commands
+    assert second.frame_index == 2
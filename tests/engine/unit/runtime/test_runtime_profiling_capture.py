@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import cProfile
+import tracemalloc
 
 from engine.runtime.metrics import FrameMetrics, MetricsSnapshot
 from engine.runtime.profiling import FrameProfiler
+from engine.runtime.render_cache import RenderCacheLRU
 
 
 def test_frame_profiler_capture_report_includes_latest_render_profile(monkeypatch) -> None:
     monkeypatch.setenv("ENGINE_PROFILING_CAPTURE_ENABLED", "0")
     profiler = FrameProfiler(enabled=False, sampling_n=1)
+    cache: RenderCacheLRU[int] = RenderCacheLRU(name="test.profile_capture", capacity=1)
+    assert cache.get("missing", None) is None
     profiler.set_latest_render_profile(
         {
             "execute_cffi_type_miss_total": 7,
@@ -29,11 +33,17 @@ def test_frame_profiler_capture_report_includes_latest_render_profile(monkeypatc
     assert latest.get("execute_cffi_type_miss_total") == 7
     assert latest.get("execute_cffi_type_miss_delta") == 1
     assert latest.get("execute_cffi_type_miss_unique") == 2
+    caches = render.get("caches")
+    assert isinstance(caches, dict)
+    assert caches["test.profile_capture"]["misses"] == 1
 
 
-def test_frame_profiler_capture_report_includes_timeline_warmup_summary(monkeypatch) -> None:
+def test_frame_profiler_capture_report_includes_timeline_warmup_summary(
+    monkeypatch, tmp_path
+) -> None:
     monkeypatch.setenv("ENGINE_PROFILING_CAPTURE_ENABLED", "1")
     monkeypatch.setenv("ENGINE_PROFILING_CAPTURE_FRAMES", "999")
+    monkeypatch.setenv("ENGINE_PROFILING_CAPTURE_EXPORT_DIR", str(tmp_path))
     profiler = FrameProfiler(enabled=True, sampling_n=1)
     profiler.on_frame_start(frame_index=0)
     for idx in range(6):
@@ -57,6 +67,9 @@ def test_frame_profiler_capture_report_includes_timeline_warmup_summary(monkeypa
     assert isinstance(active, cProfile.Profile)
     active.disable()
     report = profiler._build_capture_report(frame_index=6, profiler=active)  # noqa: SLF001
+    # Closing stops tracemalloc; left running it slows every later test in the session.
+    profiler.close()
+    assert not tracemalloc.is_tracing()
 
     timeline = report.get("timeline")
     assert isinstance(timeline, dict)
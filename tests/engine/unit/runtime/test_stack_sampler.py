@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+from engine.runtime.metrics import FrameMetrics, MetricsSnapshot
+from engine.runtime.profiling import FrameProfiler
+from engine.runtime.stack_sampler import OTHER_STACK, TRUNCATED_FRAME, StackSampler
+
+
+def _leaf(sampler: StackSampler) -> None:
+    sampler.sample_once()
+
+
+def _other_leaf(sampler: StackSampler) -> None:
+    sampler.sample_once()
+
+
+def test_stack_sampler_folds_stacks_into_bounded_table(tmp_path: Path) -> None:
+    sampler = StackSampler(max_stacks=1)
+    _leaf(sampler)
+    _leaf(sampler)
+    _other_leaf(sampler)
+
+    lines = sampler.folded_lines()
+    assert sampler.sample_count == 3
+    assert sampler.stack_count == 1
+    assert sampler.dropped_count == 1
+    assert lines[0].endswith(" 2")
+    assert "test_stack_sampler_folds_stacks_into_bounded_table" in lines[0]
+    assert lines[0].rsplit(" ", 1)[0].split(";")[-1].startswith("StackSampler.sample_once ")
+    assert lines[1] == f"{OTHER_STACK} 1"
+
+    out = sampler.export_folded(tmp_path / "profiles" / "samples.folded")
+    assert out.read_text(encoding="utf-8").splitlines() == lines
+
+
+def test_stack_sampler_thread_samples_target_thread() -> None:
+    stop = threading.Event()
+    ready = threading.Event()
+
+    def _busy_worker() -> None:
+        ready.set()
+        while not stop.is_set():
+            sum(range(200))
+
+    worker = threading.Thread(target=_busy_worker)
+    worker.start()
+    ready.wait()
+    sampler = StackSampler(thread_id=worker.ident, rate_hz=1000.0)
+    sampler.start()
+    deadline = time.perf_counter() + 2.0
+    while sampler.sample_count < 5 and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    sampler.stop()
+    stop.set()
+    worker.join()
+
+    assert not sampler.running
+    assert sampler.sample_count >= 5
+    assert any("_busy_worker" in line for line in sampler.folded_lines())
+
+
+def _deep(sampler: StackSampler, levels: int) -> None:
+    if levels:
+        _deep(sampler, levels - 1)
+    else:
+        sampler.sample_once()
+
+
+def _path_a(sampler: StackSampler) -> None:
+    _deep(sampler, 10)
+
+
+def _path_b(sampler: StackSampler) -> None:
+    _deep(sampler, 10)
+
+
+def _stack_depth() -> int:
+    depth = 0
+    frame = sys._getframe(1)  # noqa: SLF001
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+
+def test_stack_sampler_truncation_keeps_root_frames() -> None:
+    # Room for this test's stack plus _path_*, so only the _deep recursion is cut.
+    sampler = StackSampler(max_depth=_stack_depth() + 2)
+    _path_a(sampler)
+    _path_b(sampler)
+
+    stacks = [line.rsplit(" ", 1)[0].split(";") for line in sampler.folded_lines()]
+    assert len(stacks) == 2
+    assert all(stack[-1] == TRUNCATED_FRAME for stack in stacks)
+    assert sorted(stack[-3].split(" ")[0] for stack in stacks) == ["_path_a", "_path_b"]
+    assert all("test_stack_sampler_truncation_keeps_root_frames" in stack[-4] for stack in stacks)
+
+
+def test_stack_sampler_stops_running_when_target_thread_exits() -> None:
+    worker = threading.Thread(target=time.sleep, args=(0.05,))
+    worker.start()
+    sampler = StackSampler(thread_id=worker.ident, rate_hz=1000.0)
+    sampler.start()
+    worker.join()
+    deadline = time.perf_counter() + 2.0
+    while sampler.running and time.perf_counter() < deadline:
+        time.sleep(0.01)
+
+    assert not sampler.running
+    sampler.stop()
+
+
+def test_frame_profiler_sampler_mode_skips_tracemalloc_and_exports(
+    monkeypatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("ENGINE_PROFILING_CAPTURE_ENABLED", "0")
+    monkeypatch.setenv("ENGINE_PROFILING_SAMPLER_ENABLED", "1")
+    monkeypatch.setenv("ENGINE_PROFILING_SAMPLER_HZ", "500")
+    monkeypatch.setenv("ENGINE_PROFILING_CAPTURE_EXPORT_DIR", str(tmp_path))
+    profiler = FrameProfiler(enabled=True, sampling_n=1)
+    assert profiler._tracemalloc_started is False  # noqa: SLF001
+
+    profiler.on_frame_start(frame_index=0)
+    payload = profiler.make_profile_payload(
+        MetricsSnapshot(
+            last_frame=FrameMetrics(
+                frame_index=0,
+                dt_ms=16.0,
+                fps_rolling=60.0,
+                scheduler_queue_size=0,
+                event_publish_count=0,
+            ),
+            rolling_dt_ms=16.0,
+            rolling_fps=60.0,
+            top_systems_last_frame=[],
+        )
+    )
+    profiler.on_frame_end(frame_index=0)
+    profiler.close()
+
+    assert payload is not None
+    assert payload["sampler"]["state"] == "running"
+    assert payload["sampler"]["rate_hz"] == 500.0
+    exported = list(tmp_path.glob("host_profile_samples_*.folded"))
+    assert len(exported) == 1
+    assert profiler._sampler_state_payload()["report_path"] == str(exported[0])  # noqa: SLF001
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from engine.api.render_snapshot import RenderCommand, RenderPassSnapshot, RenderSnapshot
+from engine.api.render_snapshot import (
+    IDENTITY_MAT4,
+    RenderCommand,
+    RenderPassSnapshot,
+    RenderRectBatchBuilder,
+    RenderSnapshot,
+)
 from engine.runtime.ui_space import create_app_render_api, resolve_ui_space_transform
 
 
@@ -121,3 +127,61 @@ def test_create_app_render_api_scales_render_snapshot_payload() -> None:
     assert text_data["x"] == 320.0
     assert text_data["y"] == 180.0
     assert text_data["font_size"] == 30.0
+
+
+def test_create_app_render_api_scales_columnar_rect_batches() -> None:
+    renderer = _Renderer()
+    app_renderer = create_app_render_api(app=_App(), renderer=renderer)
+    builder = RenderRectBatchBuilder()
+    builder.append(key="r", x=100.0, y=100.0, w=50.0, h=20.0, color="#fff")
+    snapshot = RenderSnapshot(
+        frame_index=1,
+        passes=(RenderPassSnapshot(name="ui", rect_batches=(builder.build(),)),),
+    )
+
+    app_renderer.render_snapshot(snapshot)
+    scaled_snapshot = renderer.calls[0][1][0]
+    batch = scaled_snapshot.passes[0].rect_batches[0]
+    assert batch.x.tolist() == [160.0]
+    assert batch.y.tolist() == [150.0]
+    assert batch.w.tolist() == [80.0]
+    assert batch.h.tolist() == [30.0]
+    assert not batch.x.flags.writeable
+
+
+def test_scaled_render_command_transform_matches_scaled_rect_batch() -> None:
+    builder = RenderRectBatchBuilder()
+    builder.append(key="r", x=100.0, y=100.0, w=50.0, h=20.0, color="#fff", z=0.25)
+    batch = builder.build()
+    (command,) = batch.to_commands()
+    assert command.transform != IDENTITY_MAT4
+
+    renderer = _Renderer()
+    app_renderer = create_app_render_api(app=_App(), renderer=renderer)
+    app_renderer.render_snapshot(
+        RenderSnapshot(
+            frame_index=1,
+            passes=(RenderPassSnapshot(name="ui", commands=(command,), rect_batches=(batch,)),),
+        )
+    )
+    scaled_pass = renderer.calls[0][1][0].passes[0]
+    (from_batch,) = scaled_pass.rect_batches[0].to_commands()
+    assert scaled_pass.commands[0].transform == from_batch.transform
+    assert dict(scaled_pass.commands[0].data) == dict(from_batch.data)
+
+
+def test_scaled_rect_batch_scales_clip_bounds_and_keeps_identity_scale() -> None:
+    builder = RenderRectBatchBuilder()
+    builder.append(key="c", x=0.0, y=0.0, w=100.0, h=100.0, color="#fff", clip=(10, 20, 30, 40))
+    builder.append(key="u", x=0.0, y=0.0, w=10.0, h=10.0, color="#fff")
+    batch = builder.build()
+
+    scaled = batch.scaled(sx=2.0, sy=0.5)
+
+    assert batch.scaled(sx=1.0, sy=1.0) is batch
+    assert scaled.clip is not None
+    assert scaled.clip[0].tolist() == [20.0, 10.0, 60.0, 20.0]
+    assert not scaled.clip.flags.writeable
+    (clipped, _unclipped) = scaled.to_commands()
+    assert (dict(clipped.data)["x"], dict(clipped.data)["w"]) == (20.0, 40.0)
+    assert (dict(clipped.data)["y"], dict(clipped.data)["h"]) == (10.0, 10.0)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from tools.engine_obs_core.aggregations import aggregate_spans
+from tools.engine_obs_core.contracts import EventRecord, SpanRecord
+from tools.engine_obs_core.datasource.file_source import FileObsSource
+from tools.engine_obs_core.event_store import EventStore
+from tools.engine_obs_core.query import filter_events
+
+
+def _events() -> list[EventRecord]:
+    return [
+        EventRecord(
+            ts_utc=f"2026-01-01T00:00:{idx % 60:02d}.{idx:03d}",
+            tick=idx,
+            category="render" if idx % 2 == 0 else "input",
+            name="render.frame" if idx % 2 == 0 else "input.pointer_move",
+            level="WARNING" if idx % 7 == 0 else "info",
+            value={"button": idx % 3} if idx % 2 else f"draw pass {idx}",
+            metadata={"idx": idx, "scene": "battle" if idx % 5 == 0 else "menu"},
+        )
+        for idx in range(120)
+    ]
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"category": "render"},
+        {"level": "warning"},
+        {"name": "input.pointer_move", "text": "battle"},
+        {"text": "DRAW PASS 1"},
+        {"text": "ba"},
+    ],
+)
+def test_event_store_queries_match_in_memory_filter(tmp_path: Path, filters: dict) -> None:
+    events = _events()
+    expected = filter_events(
+        sorted(events, key=lambda item: (item.ts_utc, item.tick)), **filters
+    )
+
+    with EventStore.build(tmp_path / "events.sqlite", events=reversed(events)) as store:
+        assert store.query_events(**filters) == expected
+        assert store.count_events(**filters) == len(expected)
+
+
+def test_event_store_time_window_and_span_aggregates(tmp_path: Path) -> None:
+    spans = [
+        SpanRecord(
+            tick=idx,
+            category="render" if idx % 3 == 0 else "system",
+            name="present" if idx % 3 == 0 else "update",
+            start_s=0.0,
+            end_s=0.0,
+            duration_ms=float((idx * 7) % 20 + 1),
+        )
+        for idx in range(50)
+    ]
+    with EventStore.build(tmp_path / "events.sqlite", events=_events(), spans=spans) as store:
+        window = store.query_events(
+            start_ts_utc="2026-01-01T00:00:10", end_ts_utc="2026-01-01T00:00:11.999"
+        )
+        aggregates = {agg.key: agg for agg in store.aggregate_spans()}
+
+    assert [event.tick for event in window] == [10, 70, 11, 71]
+    for expected in aggregate_spans(spans):
+        assert aggregates[expected.key].count == expected.count
+        assert aggregates[expected.key].total_ms == pytest.approx(expected.total_ms)
+        assert aggregates[expected.key].p95_ms == pytest.approx(expected.p95_ms)
+        assert aggregates[expected.key].max_ms == expected.max_ms
+
+
+def test_file_source_rebuilds_index_when_logs_change(tmp_path: Path) -> None:
+    run = tmp_path / "warships_run_20260101T000000.jsonl"
+    run.write_text(
+        '{"ts":"2026-01-01T00:00:00","logger":"engine.runtime","level":"INFO","msg":"a"}\n',
+        encoding="utf-8",
+    )
+    source = FileObsSource(tmp_path, recursive=False, index_dir=tmp_path / "index")
+    session = source.list_sessions()[0]
+    assert len(source.query_events(session, category="frame")) == 1
+    store = source.event_store(session)
+    assert store is not None
+    source.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        store.count_events()
+
+    run.write_text(
+        run.read_text(encoding="utf-8")
+        + '{"ts":"2026-01-01T00:00:01","logger":"engine.runtime","level":"INFO","msg":"bb"}\n',
+        encoding="utf-8",
+    )
+    with FileObsSource(tmp_path, recursive=False, index_dir=tmp_path / "index") as fresh:
+        events = fresh.query_events(fresh.list_sessions()[0], category="frame")
+        assert [event.value for event in events] == ["a", "bb"]
+        assert events == fresh.load_events(fresh.list_sessions()[0])
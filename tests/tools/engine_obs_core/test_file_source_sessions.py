@@ -48,3 +48,42 @@ def test_file_source_loads_sessions_events_and_metrics(tmp_path: Path) -> None:
     metrics = source.load_metrics(sessions[0])
     assert metrics.frame_points
     assert metrics.frame_points[0].frame_ms >= 0.0
+
+
+def test_file_source_loads_replay_stream_lazily(tmp_path: Path) -> None:
+    from engine.diagnostics import ReplayRecorder
+
+    _write_session_files(tmp_path)
+    recorder = ReplayRecorder(enabled=True, seed=1, hash_interval=10)
+    recorder.open_stream(
+        path=tmp_path / "replay" / "warships_replay_session_20260101T000001.replay",
+        chunk_ticks=50,
+    )
+    for tick in range(1, 201):
+        if tick % 4 == 0:
+            recorder.record_command(tick=tick, command_type="input.action", payload={})
+        recorder.mark_frame(tick=tick, state_hash=tick)
+    recorder.close_stream()
+    source = FileObsSource(tmp_path, recursive=False)
+
+    sessions = source.list_sessions()
+    assert sessions[0].replay_stream is not None
+
+    replay = source.load_replay(sessions[0])
+    assert len(replay.commands) == 50
+    assert len(replay.checkpoints) == 20
+    assert [cmd.tick for cmd in replay.commands_at(120)] == [120]
+    assert replay.commands_at(121) == []
+    checkpoint = replay.checkpoint_at(150)
+    assert checkpoint is not None and checkpoint.tick == 150
+    assert [cmd.tick for cmd in replay.commands[-2:]] == [196, 200]
+
+
+def test_file_source_tails_run_log_events(tmp_path: Path) -> None:
+    _write_session_files(tmp_path)
+    source = FileObsSource(tmp_path, recursive=False)
+    session = source.list_sessions()[0]
+
+    assert [event.name for event in source.tail_events(session, 1)] == ["engine.rendering.scene"]
+    runtime = source.tail_events(session, 5, name_prefix="engine.runtime")
+    assert [event.value for event in runtime] == ["frame_metrics frame=1 dt_ms=16.0"]
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import numpy as np
+
+from tools.engine_obs_core.timeline import (
+    TimelinePlotArea,
+    TimelinePyramid,
+    bucket_series_coords,
+)
+
+
+def test_pyramid_levels_aggregate_min_max_mean_count() -> None:
+    pyramid = TimelinePyramid.from_points(
+        [(3, 4.0), (0, 1.0), (1, 5.0), (1, 3.0), (2, 2.0), (5, 9.0)], fanout=2
+    )
+
+    assert pyramid.sample_count == 6
+    assert pyramid.tick_range == (0, 5)
+    base = pyramid.buckets(pixel_width=10)
+    assert [(b.start_tick, b.count, b.min_value, b.max_value) for b in base] == [
+        (0, 1, 1.0, 1.0),
+        (1, 2, 3.0, 5.0),
+        (2, 1, 2.0, 2.0),
+        (3, 1, 4.0, 4.0),
+        (5, 1, 9.0, 9.0),
+    ]
+    assert base[1].mean_value == 4.0
+
+    coarse = pyramid.buckets(pixel_width=2)
+    assert [(b.start_tick, b.end_tick, b.count) for b in coarse] == [(0, 3, 5), (5, 5, 1)]
+    assert coarse[0].min_value == 1.0 and coarse[0].max_value == 5.0
+    assert coarse[0].mean_value == 3.0
+
+    window = pyramid.buckets(pixel_width=10, start_tick=2, end_tick=4)
+    assert [b.start_tick for b in window] == [2, 3]
+    assert TimelinePyramid.from_points([]).buckets(pixel_width=10) == []
+
+
+def test_bucket_series_coords_builds_envelope_only_for_ranges() -> None:
+    pyramid = TimelinePyramid([0, 0, 10, 10], [1.0, 3.0, 2.0, 2.0])
+    area = TimelinePlotArea(
+        left=0.0,
+        top=0.0,
+        width=100.0,
+        height=10.0,
+        min_tick=0,
+        max_tick=10,
+        min_value=0.0,
+        max_value=4.0,
+    )
+    mean_line, envelope = bucket_series_coords(pyramid.buckets(pixel_width=10), area)
+
+    assert mean_line == [0.0, 5.0, 100.0, 5.0]
+    assert envelope == [0.0, 2.5, 100.0, 5.0, 100.0, 5.0, 0.0, 7.5]
+    flat = TimelinePyramid([0, 1], [2.0, 2.0]).buckets(pixel_width=10)
+    assert bucket_series_coords(flat, area)[1] == []
+
+
+def test_pyramid_zoom_levels_are_bounded_on_million_frame_session() -> None:
+    frames = 1_000_000
+    ticks = np.arange(frames, dtype=np.int64)
+    values = 8.0 + (ticks % 30).astype(np.float64)
+    values[::997] = 80.0
+    pyramid = TimelinePyramid(ticks, values)
+    pixel_width = 1200
+
+    for span in (frames, frames // 10, frames // 100, 10_000, 1_000, 100):
+        start = (frames - span) // 2
+        level = pyramid.level_for(
+            pixel_width=pixel_width, start_tick=start, end_tick=start + span - 1
+        )
+        buckets = pyramid.buckets(
+            pixel_width=pixel_width, start_tick=start, end_tick=start + span - 1
+        )
+        area = TimelinePlotArea(
+            left=0.0,
+            top=0.0,
+            width=float(pixel_width),
+            height=200.0,
+            min_tick=start,
+            max_tick=start + span - 1,
+            min_value=0.0,
+            max_value=80.0,
+        )
+        mean_line, _envelope = bucket_series_coords(buckets, area)
+
+        # Work per redraw is the visible bucket count, however many frames the span covers.
+        assert 0 < len(buckets) <= pixel_width
+        assert len(mean_line) == 2 * len(buckets)
+        if level > 0:
+            # The finest level that fits: one level finer would overflow the width.
+            assert len(buckets) * 4 > pixel_width
+        assert sum(bucket.count for bucket in buckets) >= span
+        if span >= 997:
+            # Downsampled levels keep the hitch peaks a mean-only series would flatten.
+            assert max(bucket.max_value for bucket in buckets) == 80.0
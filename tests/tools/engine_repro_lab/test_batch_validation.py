@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 from engine.api.debug import ReplayValidationView
-from tools.engine_repro_lab.batch import run_batch_validation, summarize_batch_runs
+from tools.engine_repro_lab.batch import (
+    ParallelBatchConfig,
+    run_batch_validation,
+    run_parallel_batch_validation,
+    summarize_batch_runs,
+)
+from tools.engine_repro_lab.diff import compare_batch_runs
+from tools.engine_repro_lab.main import _default_simulator
 from tools.engine_repro_lab.runner import ValidationConfig, ValidationRun
 
 
@@ -95,3 +103,67 @@ def test_summarize_batch_runs() -> None:
     assert summary.total_mismatches == 2
     assert str(summary.worst_replay).endswith("b.json")
     assert summary.worst_mismatch_count == 2
+    assert summary.errored_count == 0
+
+
+def _write_replay(path: Path, *, last_tick: int) -> Path:
+    path.write_text(
+        json.dumps(
+            {
+                "schema_version": "diag.replay_session.v1",
+                "manifest": {"first_tick": 0, "last_tick": last_tick},
+                "commands": [{"tick": 1, "type": "input.action", "payload": {}}],
+                "state_hashes": [],
+            }
+        ),
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_parallel_batch_validation_orders_results_and_streams_report(tmp_path: Path) -> None:
+    replay_paths = [_write_replay(tmp_path / f"{name}.json", last_tick=20) for name in "cab"]
+    report_path = tmp_path / "report.jsonl"
+
+    result = run_parallel_batch_validation(
+        replay_paths,
+        config=ValidationConfig(),
+        simulator_factory=_default_simulator,
+        parallel=ParallelBatchConfig(workers=2, job_timeout_s=30.0, report_path=report_path),
+    )
+
+    assert [run.replay_path.name for run in result.runs] == ["a.json", "b.json", "c.json"]
+    assert all(job.status == "ok" for job in result.jobs)
+    assert all(run.result.passed for run in result.runs)
+    lines = [json.loads(line) for line in report_path.read_text(encoding="utf-8").splitlines()]
+    assert sorted(Path(line["replay_path"]).name for line in lines) == [
+        "a.json",
+        "b.json",
+        "c.json",
+    ]
+    serial = run_batch_validation(
+        replay_paths, config=ValidationConfig(), simulator_factory=_default_simulator
+    )
+    _diffs, summary = compare_batch_runs(serial, result.runs)
+    assert summary.total_compared == 3
+    assert summary.regressions == 0
+
+
+def test_parallel_batch_validation_times_out_slow_jobs(tmp_path: Path) -> None:
+    fast = _write_replay(tmp_path / "fast.json", last_tick=10)
+    slow = _write_replay(tmp_path / "slow.json", last_tick=50_000_000)
+
+    result = run_parallel_batch_validation(
+        [slow, fast],
+        config=ValidationConfig(),
+        simulator_factory=_default_simulator,
+        parallel=ParallelBatchConfig(workers=1, job_timeout_s=0.5),
+    )
+
+    statuses = {job.replay_path.name: job.status for job in result.jobs}
+    assert statuses == {"fast.json": "ok", "slow.json": "timeout"}
+    summary = summarize_batch_runs(result.runs)
+    assert summary.failed_count == 1
+    assert summary.errored_count == 1
+    assert summary.errored_replays == (str(slow),)
+    assert summary.worst_replay is None
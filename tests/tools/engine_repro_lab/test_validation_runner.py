@@ -4,9 +4,12 @@ import json
 from pathlib import Path
 
 from engine.api.debug import ReplayValidationView
+from engine.diagnostics import compute_state_hash
+from tools.engine_repro_lab.main import _default_restorable_simulator
 from tools.engine_repro_lab.runner import (
     ValidationConfig,
     load_replay_snapshot,
+    run_bisect_from_file,
     run_validation_from_file,
 )
 
@@ -85,3 +88,38 @@ def test_run_validation_from_file_uses_engine_api(tmp_path: Path, monkeypatch) -
     assert run.result.passed is True
     assert calls["snapshot"] == _sample_replay_payload()
     assert float(calls["fixed_step_seconds"]) == 1.0 / 120.0
+
+
+def test_run_bisect_from_file_reports_first_divergent_tick(tmp_path: Path) -> None:
+    hashes = []
+    for tick in range(0, 100, 10):
+        # Recorded build counted one extra command from tick 50 onwards.
+        command_count = 1 if tick >= 50 else 0
+        hashes.append(
+            {"tick": tick, "hash": compute_state_hash({"tick": tick, "command_count": command_count})}
+        )
+    payload = {
+        "schema_version": "diag.replay_session.v1",
+        "manifest": {"first_tick": 0, "last_tick": 99},
+        "commands": [],
+        "state_hashes": hashes,
+        "state_checkpoints": [
+            {"tick": tick, "state": {"tick": tick, "command_count": 0}} for tick in (24, 49, 74)
+        ],
+    }
+    replay_path = tmp_path / "replay.json"
+    replay_path.write_text(json.dumps(payload), encoding="utf-8")
+    apply_command, step, restore = _default_restorable_simulator()
+
+    run = run_bisect_from_file(
+        replay_path,
+        config=ValidationConfig(),
+        apply_command=apply_command,
+        step=step,
+        restore=restore,
+    )
+
+    assert run.result.diverged is True
+    assert run.result.first_divergent_tick == 50
+    assert run.result.last_good_tick == 49
+    assert run.result.segments_replayed == 4
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from tools.engine_session_inspector.main import build_parser
+
+
+def test_event_index_is_opt_in() -> None:
+    parser = build_parser()
+
+    assert parser.parse_args([]).index is False
+    args = parser.parse_args(["--index", "--index-dir", "idx"])
+    assert args.index is True
+    assert args.index_dir == Path("idx")
@@ -1,7 +1,16 @@
 from __future__ import annotations
 
+import numpy as np
+
 from tools.engine_obs_core.contracts import FramePoint, SpanRecord
-from tools.engine_session_inspector.views.profiling import build_profiling_view_model
+from tools.engine_obs_core.timeline import TimelinePyramid
+from tools.engine_session_inspector.views.profiling import (
+    ProfilingViewModel,
+    build_profiling_timeline_layout,
+    build_profiling_view_model,
+    profiling_tick_range,
+    zoom_tick_range,
+)
 
 
 def _span(tick: int, category: str, name: str, duration_ms: float) -> SpanRecord:
@@ -46,3 +55,49 @@ def test_build_profiling_view_model_handles_empty_inputs() -> None:
     assert model.top_p95_rows == []
     assert model.timeline_points == []
     assert model.hitch_correlations == []
+
+
+def test_profiling_timeline_redraw_per_zoom_level_is_bounded_for_million_frames() -> None:
+    ticks = np.arange(1_000_000, dtype=np.int64)
+    model = ProfilingViewModel(
+        total_spans=0,
+        timeline_points=[],
+        frame_timeline_points=[],
+        render_timeline_points=[],
+        top_total_rows=[],
+        top_p95_rows=[],
+        hitch_correlations=[],
+        frame_pyramid=TimelinePyramid(ticks, 16.0 + (ticks % 7)),
+        render_pyramid=TimelinePyramid(ticks, 4.0 + (ticks % 3)),
+    )
+    full = profiling_tick_range(model)
+    assert full == (0, 999_999)
+
+    view = full
+    plot_w = 700
+    assert model.frame_pyramid is not None
+    while True:
+        layout = build_profiling_timeline_layout(
+            model, left=24, top=18, width=plot_w, height=140, view_range=view
+        )
+
+        assert layout is not None
+        assert [layer.bucket_count <= plot_w for layer in layout.layers] == [True, True]
+        # Each layer is drawn from a pyramid level, never from the raw million points.
+        frame_buckets = model.frame_pyramid.buckets(
+            pixel_width=plot_w, start_tick=view[0], end_tick=view[1]
+        )
+        assert layout.layers[0].bucket_count == len(frame_buckets)
+        assert len(layout.layers[0].mean_line) == 2 * len(frame_buckets)
+        if view[1] - view[0] <= 8:
+            break
+        view = zoom_tick_range(view, full, anchor_tick=250_000, factor=0.25)
+
+
+def test_zoom_tick_range_keeps_anchor_and_clamps_to_session() -> None:
+    full = (0, 1000)
+    assert zoom_tick_range(full, full, anchor_tick=500, factor=0.5) == (250, 750)
+    assert zoom_tick_range((0, 100), full, anchor_tick=0, factor=0.5) == (0, 50)
+    assert zoom_tick_range((900, 1000), full, anchor_tick=950, factor=4.0) == (600, 1000)
+    assert zoom_tick_range((0, 1000), full, anchor_tick=10, factor=2.0) == full
+    assert zoom_tick_range((0, 10), full, anchor_tick=5, factor=0.1) == (1, 9)
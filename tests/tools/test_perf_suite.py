@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+import scripts.perf_suite as perf_suite
+
+
+def _baseline(cases: dict[str, list[float]]) -> dict[str, object]:
+    return {
+        "schema_version": perf_suite.PERF_BASELINE_SCHEMA_VERSION,
+        "machine": {},
+        "cases": {name: {"samples_ns": samples} for name, samples in cases.items()},
+    }
+
+
+@pytest.fixture(autouse=True)
+def _no_git(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(perf_suite, "_git_revision", lambda: None)
+
+
+def test_bootstrap_ci_brackets_the_median_and_is_seeded() -> None:
+    samples = [100.0, 101.0, 99.0, 102.0, 98.0, 100.5, 99.5, 250.0]
+
+    low, high = perf_suite._bootstrap_ci(samples, None)  # noqa: SLF001
+
+    assert low <= 100.25 <= high
+    assert high < 250.0
+    assert perf_suite._bootstrap_ci(samples, None) == (low, high)  # noqa: SLF001
+    assert perf_suite._bootstrap_ci([7.0] * 5, None) == (7.0, 7.0)  # noqa: SLF001
+
+
+def test_bootstrap_ci_of_ratio_excludes_one_for_a_clear_slowdown() -> None:
+    baseline = [100.0 + index % 3 for index in range(15)]
+    current = [value * 1.5 for value in baseline]
+
+    low, high = perf_suite._bootstrap_ci(current, baseline)  # noqa: SLF001
+
+    assert 1.4 < low <= 1.5 <= high < 1.6
+
+
+def test_compare_flags_only_confident_regressions(capsys: pytest.CaptureFixture[str]) -> None:
+    steady = [100.0 + index % 5 for index in range(15)]
+    results = {
+        "slower": {"samples_ns": [value * 1.5 for value in steady]},
+        "noisy": {"samples_ns": [value * 1.05 for value in steady]},
+        "faster": {"samples_ns": [value * 0.5 for value in steady]},
+        "added": {"samples_ns": steady},
+    }
+    baseline = _baseline({"slower": steady, "noisy": steady, "faster": steady})
+
+    code = perf_suite._compare(results, baseline, threshold_pct=10.0)  # noqa: SLF001
+
+    lines = capsys.readouterr().out.splitlines()
+    assert code == 1
+    assert "slower.verdict=regressed" in lines
+    assert "noisy.verdict=unchanged" in lines
+    assert "faster.verdict=improved" in lines
+    assert "added.verdict=new" in lines
+    assert "regressions=1" in lines
+
+
+def test_compare_passes_when_nothing_regressed(capsys: pytest.CaptureFixture[str]) -> None:
+    steady = [100.0 + index % 5 for index in range(15)]
+
+    code = perf_suite._compare(  # noqa: SLF001
+        {"case": {"samples_ns": steady}}, _baseline({"case": steady}), threshold_pct=10.0
+    )
+
+    assert code == 0
+    assert "regressions=0" in capsys.readouterr().out.splitlines()
+
+
+def test_compare_without_a_recorded_baseline_explains_how_to_record_one(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    missing = tmp_path / "perf_baseline.json"
+    monkeypatch.setenv("PYTHONHASHSEED", "0")
+    monkeypatch.setattr(sys, "argv", ["perf_suite.py", "--compare", str(missing)])
+
+    assert perf_suite.main() == 2
+    assert "--save-baseline" in capsys.readouterr().err
@@ -35,6 +35,18 @@ class _Controller:
     def ui_state(self):
         return self._ui
 
+    ai_turn_pending = False
+
+    def poll_ai_turn(self, *, tick: int = 0) -> bool:
+        _ = tick
+        return False
+
+    def bind_ai_diagnostics(self, hub) -> None:
+        _ = hub
+
+    def shutdown_ai(self) -> None:
+        return
+
 
 class _Host:
     def __init__(self) -> None:
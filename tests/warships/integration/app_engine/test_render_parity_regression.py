@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from dataclasses import replace
 
+import pytest
+
+from engine.api.render_snapshot import render_pass_commands
 from engine.ui_runtime.grid_layout import GridLayout
 from tests.warships.unit.ui.helpers import FakeRenderer, make_ui_state
 from warships.game.app.state_machine import AppState
@@ -95,3 +98,40 @@ def test_battle_snapshot_contains_hit_miss_and_enemy_overlay(valid_fleet) -> Non
     assert any(key.startswith("shot:player:") for key in keys)
     assert any(key.startswith("shot:ai:") for key in keys)
     assert "title:enemy" in keys
+
+
+@pytest.mark.parametrize(
+    "state",
+    [AppState.MAIN_MENU, AppState.PLACEMENT_EDIT, AppState.BATTLE],
+)
+def test_columnar_rect_snapshot_matches_command_snapshot(state, valid_fleet) -> None:
+    ui = make_ui_state(state=state)
+    if state is AppState.BATTLE:
+        session = create_session(valid_fleet, valid_fleet)
+        session.player_board.apply_shot(Coord(0, 0))
+        session.ai_board.apply_shot(Coord(9, 9))
+        ui = replace(ui, status="Battle mode", session=session)
+
+    def _build(columnar: bool):
+        view = GameView(FakeRenderer(), GridLayout(), columnar_rects=columnar)
+        snapshot, _labels = view.build_snapshot(
+            frame_index=4,
+            ui=ui,
+            debug_ui=False,
+            debug_labels_state=[],
+        )
+        return snapshot
+
+    command_snapshot = _build(False)
+    columnar_snapshot = _build(True)
+
+    columnar_pass = columnar_snapshot.passes[0]
+    if state is AppState.BATTLE:
+        assert columnar_pass.rect_batches
+    assert all(command.kind != "rect" for command in columnar_pass.commands)
+    expected = render_pass_commands(command_snapshot.passes[0])
+    actual = render_pass_commands(columnar_pass)
+    assert actual == expected
+    assert [command.order_key for command in actual] == [
+        command.order_key for command in expected
+    ]
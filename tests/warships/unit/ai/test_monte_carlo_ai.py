@@ -0,0 +1,58 @@
+import random
+
+from warships.game.ai.monte_carlo import MonteCarloAI, _sample_fleets
+from warships.game.core.fleet import build_board_from_fleet, random_fleet
+from warships.game.core.models import Coord, ShotResult
+
+
+def _play(ai: MonteCarloAI, seed: int) -> list[Coord]:
+    board = build_board_from_fleet(random_fleet(random.Random(seed)))
+    shots: list[Coord] = []
+    while not board.all_ships_sunk():
+        shot = ai.choose_shot()
+        result, _sunk = board.apply_shot(shot)
+        assert result not in {ShotResult.INVALID, ShotResult.REPEAT}
+        ai.notify_result(shot, result)
+        shots.append(shot)
+    return shots
+
+
+def test_monte_carlo_ai_finishes_games_and_is_reproducible_without_budget() -> None:
+    first = _play(MonteCarloAI(random.Random(5), budget_s=None, max_samples=60), seed=21)
+    second = _play(MonteCarloAI(random.Random(5), budget_s=None, max_samples=60), seed=21)
+    assert first == second
+    assert len(first) < 100
+
+
+def test_monte_carlo_ai_targets_remaining_neighbour_of_isolated_hit() -> None:
+    ai = MonteCarloAI(random.Random(1), budget_s=None, max_samples=200)
+    ai.notify_result(Coord(4, 4), ShotResult.HIT)
+    for coord in (Coord(3, 4), Coord(5, 4), Coord(4, 5)):
+        ai.notify_result(coord, ShotResult.MISS)
+    assert ai.choose_shot() == Coord(4, 3)
+    assert ai.stats.moves == 1
+    assert ai.stats.samples == 200
+
+
+def test_sampled_fleets_keep_clear_of_sunk_ship_halo() -> None:
+    ai = MonteCarloAI(random.Random(2), budget_s=None)
+    ai.notify_result(Coord(0, 0), ShotResult.HIT)
+    ai.notify_result(Coord(0, 1), ShotResult.SUNK)
+    assert ai._remaining_ship_lengths == [5, 4, 3, 3]
+    counts, samples, _attempts = _sample_fleets(
+        10, (5, 4, 3, 3), ai._misses | ai._sunk_halo, ai._hits, ai._full & ~ai._shot, 3, None, 300
+    )
+    assert samples == 300
+    for row, col in ((0, 2), (1, 0), (1, 1), (1, 2)):
+        assert counts[row * 10 + col] == 0
+    assert sum(counts) == 300 * (5 + 4 + 3 + 3)
+
+
+def test_monte_carlo_ai_samples_in_worker_pool() -> None:
+    ai = MonteCarloAI(random.Random(3), budget_s=None, max_samples=40, workers=2)
+    try:
+        shot = ai.choose_shot()
+    finally:
+        ai.close()
+    assert 0 <= shot.row < 10 and 0 <= shot.col < 10
+    assert ai.stats.samples == 40
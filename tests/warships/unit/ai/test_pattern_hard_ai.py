@@ -1,7 +1,21 @@
+import hashlib
 import random
 
 from warships.game.ai.pattern_hard import PatternHardAI
-from warships.game.core.models import Coord, ShotResult
+from warships.game.core.fleet import build_board_from_fleet, random_fleet
+from warships.game.core.models import LARGE_RULES, Coord, ShotResult
+
+
+def _play(seed: int) -> str:
+    board = build_board_from_fleet(random_fleet(random.Random(seed)))
+    ai = PatternHardAI(random.Random(seed))
+    shots: list[str] = []
+    while not board.all_ships_sunk():
+        shot = ai.choose_shot()
+        result, _sunk = board.apply_shot(shot)
+        ai.notify_result(shot, result)
+        shots.append(f"{shot.row}{shot.col}")
+    return " ".join(shots)
 
 
 def test_pattern_hard_ai_choose_hunt_then_target() -> None:
@@ -20,3 +34,31 @@ def test_pattern_hard_ai_sunk_removes_cluster() -> None:
     # should recover to hunt mode without crashing
     shot = ai.choose_shot()
     assert isinstance(shot, Coord)
+
+
+def test_pattern_hard_ai_shot_sequence_matches_full_rescan_scoring() -> None:
+    # Recorded with the per-shot full placement rescan the incremental cache replaced.
+    assert _play(3) == (
+        "44 55 66 33 26 16 27 25 24 62 73 83 93 63 51 48 77 59 58 49 39 69 79 04 40 41 "
+        "50 30 60 70 20 75 88 46 86 13 22 11 81 18 02 01"
+    )
+    games = "\n".join(_play(seed) for seed in range(12))
+    assert hashlib.sha256(games.encode()).hexdigest() == (
+        "8fb22be222decc0bba98a96c48180b3a77182d8f84c10464fe117fbe1aa34fba"
+    )
+
+
+def test_pattern_hard_ai_clears_large_board() -> None:
+    board = build_board_from_fleet(
+        random_fleet(random.Random(3), rules=LARGE_RULES), rules=LARGE_RULES
+    )
+    ai = PatternHardAI(random.Random(3), rules=LARGE_RULES)
+    shots: set[Coord] = set()
+    while not board.all_ships_sunk():
+        shot = ai.choose_shot()
+        assert shot not in shots
+        assert 0 <= shot.row < 30 and 0 <= shot.col < 30
+        shots.add(shot)
+        result, _sunk = board.apply_shot(shot)
+        ai.notify_result(shot, result)
+    assert len(shots) < 30 * 30
@@ -1,8 +1,19 @@
 import random
+import threading
+import time
 
+import warships.game.ai.monte_carlo as monte_carlo
 import warships.game.app.services.battle as battle_service
-from warships.game.app.services.battle import build_ai_strategy, resolve_player_turn, start_game
-from warships.game.core.models import Coord, ShotResult, Turn
+from engine.api.ai import create_async_agent_runner
+from warships.game.ai.strategy import AIStrategy
+from warships.game.app.services.battle import (
+    AsyncAITurns,
+    build_ai_strategy,
+    resolve_player_turn,
+    start_game,
+)
+from warships.game.core.fleet import build_board_from_fleet, random_fleet
+from warships.game.core.models import LARGE_RULES, Coord, ShotResult, Turn
 from warships.game.core.rules import create_session
 from warships.game.presets.repository import PresetRepository
 from warships.game.presets.service import PresetService
@@ -62,6 +73,51 @@ def test_build_ai_strategy_defaults_unknown_difficulty_to_normal() -> None:
     assert ai.__class__.__name__ == "HuntTargetAI"
 
 
+def test_build_ai_strategy_expert_uses_monte_carlo_sampler() -> None:
+    ai = build_ai_strategy("Expert", random.Random(4))
+    assert ai.__class__.__name__ == "MonteCarloAI"
+
+
+def test_build_ai_strategy_expert_replays_from_seed(monkeypatch) -> None:
+    # Fewer samples keep the test fast; reproducibility does not depend on the count.
+    monkeypatch.setattr(battle_service, "EXPERT_SAMPLES_PER_MOVE", 100)
+
+    def shots(seed: int) -> list[Coord]:
+        ai = build_ai_strategy("Expert", random.Random(seed))
+        board = build_board_from_fleet(random_fleet(random.Random(seed)))
+        fired: list[Coord] = []
+        for _ in range(12):
+            shot = ai.choose_shot()
+            result, _sunk = board.apply_shot(shot)
+            ai.notify_result(shot, result)
+            fired.append(shot)
+        return fired
+
+    first = shots(9)
+    # A clock that jumps a second per read would end any time-budgeted search early.
+    ticks = iter(range(10_000_000))
+    monkeypatch.setattr(monte_carlo, "perf_counter", lambda: float(next(ticks)))
+    assert shots(9) == first
+
+
+def test_build_ai_strategy_expert_moves_stay_within_frame_budget_on_large_board() -> None:
+    ai = build_ai_strategy("Expert", random.Random(6), rules=LARGE_RULES)
+    fleet = random_fleet(random.Random(6), rules=LARGE_RULES)
+    board = build_board_from_fleet(fleet, rules=LARGE_RULES)
+    moves = 5
+    started = time.perf_counter()
+    for _ in range(moves):
+        shot = ai.choose_shot()
+        result, _sunk = board.apply_shot(shot)
+        ai.notify_result(shot, result)
+    per_move_s = (time.perf_counter() - started) / moves
+
+    assert isinstance(ai, monte_carlo.MonteCarloAI)
+    assert ai.stats.samples == moves * battle_service.EXPERT_SAMPLES_PER_MOVE
+    # Well inside the 500 ms async AI deadline; full scans took ~5 s per move.
+    assert per_move_s < 0.5
+
+
 def test_resolve_player_turn_keeps_player_sink_feedback_when_ai_responds(monkeypatch) -> None:
     session = create_session(_fleet_for_test(), _fleet_for_test())
 
@@ -98,3 +154,69 @@ def _fleet_for_test():
             ShipPlacement(ShipType.DESTROYER, _Coord(8, 0), Orientation.HORIZONTAL),
         ]
     )
+
+
+class _ScriptedAI(AIStrategy):
+    def __init__(self, shot: Coord, release: threading.Event | None = None) -> None:
+        super().__init__()
+        self._shot = shot
+        self._release = release
+        self.results: list[tuple[Coord, ShotResult]] = []
+
+    def choose_shot(self) -> Coord:
+        if self._release is not None:
+            self._release.wait(2.0)
+        return self._shot
+
+    def notify_result(self, coord: Coord, result: ShotResult) -> None:
+        self.results.append((coord, result))
+
+
+def _poll_until_resolved(ai_turns, session, ai) -> ShotResult:
+    end = time.monotonic() + 2.0
+    while time.monotonic() < end:
+        result = ai_turns.poll(session, ai, tick=1)
+        if result is not None:
+            return result
+        time.sleep(0.001)
+    raise AssertionError("AI turn did not resolve")
+
+
+def test_async_ai_turn_resolves_on_later_poll(valid_fleet) -> None:
+    session = create_session(valid_fleet, valid_fleet)
+    ai = _ScriptedAI(Coord(9, 9))
+    runner = create_async_agent_runner()
+    ai_turns = AsyncAITurns(runner, deadline_s=1.0)
+    try:
+        turn = resolve_player_turn(session, ai, Coord(9, 9), ai_turns=ai_turns)
+        assert turn.shot_result is ShotResult.MISS
+        assert session.turn is Turn.AI
+        assert ai_turns.pending
+        assert _poll_until_resolved(ai_turns, session, ai) is ShotResult.MISS
+    finally:
+        runner.close()
+    assert session.turn is Turn.PLAYER
+    assert ai.results == [(Coord(9, 9), ShotResult.MISS)]
+
+
+def test_async_ai_turn_falls_back_and_defers_results_until_worker_finishes(valid_fleet) -> None:
+    session = create_session(valid_fleet, valid_fleet)
+    release = threading.Event()
+    ai = _ScriptedAI(Coord(9, 9), release)
+    runner = create_async_agent_runner()
+    ai_turns = AsyncAITurns(runner, deadline_s=0.01)
+    try:
+        resolve_player_turn(session, ai, Coord(9, 9), ai_turns=ai_turns)
+        # Fallback hunts the first checkerboard cell.
+        assert _poll_until_resolved(ai_turns, session, ai) is ShotResult.HIT
+        assert session.player_board.was_shot(Coord(0, 0))
+        assert ai.results == []
+        release.set()
+        end = time.monotonic() + 2.0
+        while not ai.results and time.monotonic() < end:
+            ai_turns.poll(session, ai)
+            time.sleep(0.001)
+    finally:
+        release.set()
+        runner.close()
+    assert ai.results == [(Coord(0, 0), ShotResult.HIT)]
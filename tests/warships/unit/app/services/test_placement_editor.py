@@ -1,6 +1,9 @@
+import random
+
 from engine.ui_runtime.grid_layout import GridLayout
 from warships.game.app.services.placement_editor import PlacementEditorService
-from warships.game.core.models import Coord, Orientation, ShipPlacement, ShipType
+from warships.game.core.board import BoardState
+from warships.game.core.models import DEFAULT_FLEET, Coord, Orientation, ShipPlacement, ShipType
 from warships.game.ui.layout_metrics import PLACEMENT_PANEL
 
 
@@ -29,6 +32,44 @@ def test_can_place_and_reject_duplicate_or_overlap() -> None:
     assert not PlacementEditorService.can_place(placements, candidate_overlap)
 
 
+def _replay_reason(
+    placements: dict[ShipType, ShipPlacement | None], candidate: ShipPlacement
+) -> tuple[bool, str]:
+    board = BoardState()
+    seen: set[ShipType] = set()
+    placed = [p for p in placements.values() if p is not None] + [candidate]
+    for idx, placement in enumerate(placed, start=1):
+        if placement.ship_type in seen:
+            return False, "duplicate_ship_type"
+        seen.add(placement.ship_type)
+        if not board.can_place(placement):
+            return False, board.placement_error_code(placement)
+        board.place_ship(idx, placement)
+    return True, ""
+
+
+def test_can_place_with_reason_matches_full_board_replay() -> None:
+    rng = random.Random(31)
+
+    def placement(ship_type: ShipType) -> ShipPlacement:
+        return ShipPlacement(
+            ship_type,
+            Coord(rng.randrange(-1, 11), rng.randrange(-1, 11)),
+            rng.choice((Orientation.HORIZONTAL, Orientation.VERTICAL)),
+        )
+
+    for _ in range(400):
+        # Placed ships may themselves be invalid, as after a preset with stale data.
+        placements: dict[ShipType, ShipPlacement | None] = {
+            ship_type: placement(ship_type) if rng.random() < 0.6 else None
+            for ship_type in DEFAULT_FLEET
+        }
+        for _ in range(10):
+            candidate = placement(rng.choice(DEFAULT_FLEET))
+            expected = _replay_reason(placements, candidate)
+            assert PlacementEditorService.can_place_with_reason(placements, candidate) == expected
+
+
 def test_to_primary_grid_cell_and_palette_lookup() -> None:
     layout = GridLayout()
     coord = PlacementEditorService.to_primary_grid_cell(layout, 81.0, 151.0)
@@ -1,6 +1,13 @@
 from __future__ import annotations
 
+import random
+
+from engine.api.debug import create_state_hasher
+from warships.game.app.controller import GameController
 from warships.game.app.events import ButtonPressed
+from warships.game.core.models import LARGE_RULES, Coord
+from warships.game.presets.repository import PresetRepository
+from warships.game.presets.service import PresetService
 from warships.game.app.state_machine import AppState
 from warships.game.ui.layout_metrics import PRESET_PANEL
 
@@ -72,3 +79,50 @@ def test_controller_modal_mode_blocks_wheel_and_sets_prompt_overlay(
     assert top.screen_id == "prompt"
     panel = PRESET_PANEL.panel_rect()
     assert not controller.handle_wheel(panel.x + 5.0, panel.y + 5.0, 1.0)
+
+
+def test_controller_debug_state_digest_tracks_board_changes(
+    controller_factory, preset_service, valid_fleet
+) -> None:
+    preset_service.save_preset("alpha", valid_fleet)
+    controller = controller_factory()
+    assert controller.handle_button(ButtonPressed("new_game"))
+    assert controller.handle_button(ButtonPressed("start_game"))
+    hasher = create_state_hasher()
+
+    first = controller.debug_state_digest(hasher)
+    assert controller.debug_state_digest(hasher) == first
+    assert first == controller.debug_state_digest(create_state_hasher())
+
+    session = controller.ui_state().session
+    assert session is not None
+    session.ai_board.apply_shot(Coord(row=0, col=0))
+    assert controller.debug_state_digest(hasher) != first
+
+
+def test_controller_plays_large_rules_profile_with_random_fleet(tmp_path) -> None:
+    service = PresetService(PresetRepository(tmp_path), rules=LARGE_RULES)
+    controller = GameController(preset_service=service, rng=random.Random(4))
+    assert controller.rules is LARGE_RULES
+    assert controller.handle_button(ButtonPressed("new_game"))
+    assert controller.handle_button(ButtonPressed("new_game_randomize"))
+    assert controller.handle_button(ButtonPressed("start_game"))
+    ui = controller.ui_state()
+    assert ui.state is AppState.BATTLE
+    assert ui.session is not None
+    assert ui.session.ai_board.size == 30
+
+
+def test_controller_disables_preset_editing_when_fleet_repeats_ship_types(tmp_path) -> None:
+    service = PresetService(PresetRepository(tmp_path), rules=LARGE_RULES)
+    controller = GameController(preset_service=service, rng=random.Random(4))
+    assert controller.handle_button(ButtonPressed("manage_presets"))
+    buttons = {button.id: button for button in controller.ui_state().buttons}
+    assert not buttons["create_preset"].enabled
+
+    assert controller.handle_button(ButtonPressed("create_preset"))
+    ui = controller.ui_state()
+    assert ui.state is AppState.PRESET_MANAGE
+    assert "large" in ui.status
+    assert controller.handle_button(ButtonPressed("preset_edit:any"))
+    assert controller.ui_state().state is AppState.PRESET_MANAGE
@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+import random
+import time
 from types import SimpleNamespace
 
+from engine.api.ai import create_async_agent_runner
+from engine.api.debug import validate_replay_snapshot
 from engine.api.game_module import HostFrameContext
 from engine.api.input_snapshot import InputSnapshot
 from engine.api.render_snapshot import RenderSnapshot
+from engine.runtime.host import EngineHost
+from warships.game.app import engine_hosted_runtime
+from warships.game.app.controller import GameController
 from warships.game.app.engine_game_module import WarshipsGameModule
+from warships.game.app.events import BoardCellPressed, ButtonPressed
+from warships.game.core.models import Coord
+from warships.game.presets.repository import PresetRepository
+from warships.game.presets.service import PresetService
 
 
 class _Framework:
@@ -44,6 +55,18 @@ class _Controller:
     def ui_state(self):
         return self._ui
 
+    ai_turn_pending = False
+
+    def poll_ai_turn(self, *, tick: int = 0) -> bool:
+        _ = tick
+        return False
+
+    def bind_ai_diagnostics(self, hub) -> None:
+        _ = hub
+
+    def shutdown_ai(self) -> None:
+        return
+
 
 class _Host:
     def __init__(self) -> None:
@@ -93,3 +116,167 @@ def test_game_module_frame_and_close_lifecycle() -> None:
     assert snapshot is not None
     assert host.closed == 1
     assert not module.should_close()
+
+
+class _OnDemandRenderer:
+    """Render API stub that, like an on-demand loop, only draws after ``invalidate``."""
+
+    def __init__(self) -> None:
+        self.redraw_requested = False
+
+    def invalidate(self) -> None:
+        self.redraw_requested = True
+
+    def render_snapshot(self, snapshot: RenderSnapshot) -> None:
+        _ = snapshot
+
+
+class _SlowRunner:
+    """Runner wrapper whose decisions only show up after a few polls."""
+
+    def __init__(self, held_polls: int) -> None:
+        self._inner = create_async_agent_runner(max_workers=1)
+        self._held_polls = held_polls
+        self.polls = 0
+
+    def __getattr__(self, name: str):
+        return getattr(self._inner, name)
+
+    def poll(self, *, tick: int = 0):
+        self.polls += 1
+        if self.polls <= self._held_polls:
+            return ()
+        return self._inner.poll(tick=tick)
+
+
+def test_async_ai_turn_resolves_on_demand_host_without_input(tmp_path) -> None:
+    runner = _SlowRunner(held_polls=5)
+    controller = GameController(
+        PresetService(PresetRepository(tmp_path)),
+        random.Random(3),
+        ai_runner=runner,  # type: ignore[arg-type]
+        ai_deadline_s=5.0,
+    )
+    for button in ("new_game", "new_game_randomize", "start_game"):
+        controller.handle_button(ButtonPressed(button))
+    module = WarshipsGameModule(
+        controller=controller, framework=_Framework(), view=_View(), debug_ui=False
+    )
+    renderer = _OnDemandRenderer()
+    host = EngineHost(module=module, render_api=renderer)
+    host.frame()
+    session = controller.ui_state().session
+    assert session is not None
+    assert controller.handle_board_click(BoardCellPressed(is_ai_board=True, coord=Coord(0, 0)))
+    assert controller.ai_turn_pending
+
+    # The click's own redraw; after that only frames the game asks for are drawn.
+    renderer.redraw_requested = True
+    deadline = time.monotonic() + 5.0
+    while renderer.redraw_requested and time.monotonic() < deadline:
+        renderer.redraw_requested = False
+        host.frame()
+        time.sleep(0.001)
+
+    assert not controller.ai_turn_pending
+    assert runner.polls > 5
+    assert int((session.player_board.shots != 0).sum()) == 1
+    host.close()
+
+
+def test_recorded_session_contains_state_checkpoints(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("ENGINE_DIAGNOSTICS_REPLAY_ENABLED", "1")
+    monkeypatch.setenv("ENGINE_DIAGNOSTICS_REPLAY_CHECKPOINT_INTERVAL", "2")
+    controller = GameController(PresetService(PresetRepository(tmp_path)), random.Random(3))
+    for button in ("new_game", "new_game_randomize", "start_game"):
+        controller.handle_button(ButtonPressed(button))
+    module = WarshipsGameModule(
+        controller=controller, framework=_Framework(), view=_View(), debug_ui=False
+    )
+    host = EngineHost(module=module)
+    host.frame()
+    controller.handle_board_click(BoardCellPressed(is_ai_board=True, coord=Coord(0, 0)))
+    host.frame()
+    host.frame()
+
+    replay = host.diagnostics_replay_snapshot
+    checkpoints = replay["state_checkpoints"]
+    assert [item["tick"] for item in checkpoints] == [0, 2]
+    first, last = (item["state"] for item in checkpoints)
+    assert first["app_state"] == last["app_state"] == "BATTLE"
+    assert first["state_hash"] != last["state_hash"]
+    assert last["session"]["ai_shots"] == "1"
+    host.close()
+
+
+def test_state_checkpoint_restores_session_ai_and_rng(tmp_path) -> None:
+    controller = GameController(PresetService(PresetRepository(tmp_path)), random.Random(3))
+    for button in ("new_game", "new_game_randomize", "start_game"):
+        controller.handle_button(ButtonPressed(button))
+    module = WarshipsGameModule(
+        controller=controller, framework=_Framework(), view=_View(), debug_ui=False
+    )
+    controller.handle_board_click(BoardCellPressed(is_ai_board=True, coord=Coord(0, 0)))
+    checkpoint = module.debug_state_checkpoint()
+
+    def play() -> tuple[str, list[str]]:
+        for col in range(1, 4):
+            controller.handle_board_click(BoardCellPressed(is_ai_board=True, coord=Coord(1, col)))
+        session = controller.ui_state().session
+        assert session is not None
+        return module.debug_state_hash(), list(session.history)
+
+    expected = play()
+    module.debug_state_restore(checkpoint)
+    assert module.debug_state_hash() == checkpoint["state_hash"]
+    assert play() == expected
+
+
+def test_recorded_session_with_async_ai_configured_replays(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("ENGINE_DIAGNOSTICS_REPLAY_ENABLED", "1")
+    monkeypatch.setenv("WARSHIPS_AI_ASYNC", "1")
+    clicks = {2: Coord(0, 0), 5: Coord(4, 4), 6: Coord(9, 9)}
+
+    def start() -> tuple[GameController, WarshipsGameModule, EngineHost]:
+        controller = GameController(
+            PresetService(PresetRepository(tmp_path)),
+            random.Random(11),
+            ai_runner=engine_hosted_runtime._build_ai_runner(),
+            ai_deadline_s=0.001,
+        )
+        for button in ("new_game", "new_game_randomize", "start_game"):
+            controller.handle_button(ButtonPressed(button))
+        module = WarshipsGameModule(
+            controller=controller, framework=_Framework(), view=_View(), debug_ui=False
+        )
+        return controller, module, EngineHost(module=module)
+
+    def click(controller: GameController, tick: int) -> None:
+        if tick in clicks:
+            event = BoardCellPressed(is_ai_board=True, coord=clicks[tick])
+            assert controller.handle_board_click(event)
+
+    controller, _, host = start()
+    for tick in range(10):
+        click(controller, tick)
+        host.frame()
+    recorded = host.diagnostics_replay_snapshot
+    session = controller.ui_state().session
+    assert session is not None
+    assert int((session.player_board.shots != 0).sum()) == len(clicks)
+    host.close()
+
+    controller, module, host = start()
+    ticks = iter(range(10))
+
+    def step(_dt: float) -> str:
+        click(controller, next(ticks))
+        host.frame()
+        return module.debug_state_hash()
+
+    result = validate_replay_snapshot(
+        recorded, fixed_step_seconds=1.0 / 60.0, apply_command=lambda _command: None, step=step
+    )
+    host.close()
+    assert result.passed
+    assert result.total_ticks == 10
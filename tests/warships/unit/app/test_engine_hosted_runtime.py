@@ -19,3 +19,18 @@ def test_run_engine_hosted_app_builds_controller_and_invokes_runtime(monkeypatch
     monkeypatch.setattr(runtime_mod, "run_hosted_runtime", _fake_run)
     runtime_mod.run_engine_hosted_app()
     assert called["run"] == 1
+
+
+def test_ai_runner_is_synchronous_for_replay_capture_and_fast_forward(monkeypatch) -> None:
+    monkeypatch.delenv("WARSHIPS_AI_ASYNC", raising=False)
+    monkeypatch.delenv("ENGINE_DIAGNOSTICS_REPLAY_ENABLED", raising=False)
+    monkeypatch.delenv("ENGINE_HEADLESS_FAST_FORWARD", raising=False)
+    runner = runtime_mod._build_ai_runner()
+    assert runner is not None
+    runner.close()
+
+    monkeypatch.setenv("ENGINE_DIAGNOSTICS_REPLAY_ENABLED", "1")
+    assert runtime_mod._build_ai_runner() is None
+    monkeypatch.delenv("ENGINE_DIAGNOSTICS_REPLAY_ENABLED")
+    monkeypatch.setenv("ENGINE_HEADLESS_FAST_FORWARD", "true")
+    assert runtime_mod._build_ai_runner() is None
@@ -0,0 +1,122 @@
+"""Randomised equivalence checks: bitboard BoardState versus the cell-loop rules."""
+
+import random
+
+import numpy as np
+
+from warships.game.core.board import BoardState
+from warships.game.core.models import (
+    DEFAULT_FLEET,
+    Coord,
+    Orientation,
+    ShipPlacement,
+    ShipType,
+    ShotResult,
+    cells_for_placement,
+)
+
+
+class _LoopBoard:
+    """Reference rules as written before bitboards: per-cell loops over the grid."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.ships = np.zeros((size, size), dtype=np.int16)
+        self.shots = np.zeros((size, size), dtype=np.int8)
+        self.ship_types: dict[int, ShipType] = {}
+        self.ship_remaining: dict[int, int] = {}
+
+    def _in_bounds(self, coord: Coord) -> bool:
+        return 0 <= coord.row < self.size and 0 <= coord.col < self.size
+
+    def reason(self, placement: ShipPlacement) -> str:
+        cells = cells_for_placement(placement)
+        candidate = {(cell.row, cell.col) for cell in cells}
+        for cell in cells:
+            if not self._in_bounds(cell):
+                return "out_of_bounds"
+            if self.ships[cell.row, cell.col] != 0:
+                return "overlap"
+        for row, col in candidate:
+            for dr in (-1, 0, 1):
+                for dc in (-1, 0, 1):
+                    rr = row + dr
+                    cc = col + dc
+                    if not (0 <= rr < self.size and 0 <= cc < self.size):
+                        continue
+                    if (rr, cc) not in candidate and int(self.ships[rr, cc]) != 0:
+                        return "touching"
+        return ""
+
+    def place(self, ship_id: int, placement: ShipPlacement) -> None:
+        cells = cells_for_placement(placement)
+        for cell in cells:
+            self.ships[cell.row, cell.col] = ship_id
+        self.ship_types[ship_id] = placement.ship_type
+        self.ship_remaining[ship_id] = len(cells)
+
+    def shoot(self, coord: Coord) -> tuple[ShotResult, ShipType | None]:
+        if not self._in_bounds(coord):
+            return ShotResult.INVALID, None
+        if self.shots[coord.row, coord.col] != 0:
+            return ShotResult.REPEAT, None
+        ship_id = int(self.ships[coord.row, coord.col])
+        if ship_id == 0:
+            self.shots[coord.row, coord.col] = 1
+            return ShotResult.MISS, None
+        self.shots[coord.row, coord.col] = 2
+        self.ship_remaining[ship_id] -= 1
+        if self.ship_remaining[ship_id] == 0:
+            return ShotResult.SUNK, self.ship_types[ship_id]
+        return ShotResult.HIT, None
+
+    def all_sunk(self) -> bool:
+        return all(remaining == 0 for remaining in self.ship_remaining.values())
+
+
+def _random_placement(rng: random.Random, size: int) -> ShipPlacement:
+    # Bows range past every edge so out-of-bounds and partial overlaps are common.
+    return ShipPlacement(
+        ship_type=rng.choice(DEFAULT_FLEET),
+        bow=Coord(rng.randrange(-2, size + 1), rng.randrange(-2, size + 1)),
+        orientation=rng.choice((Orientation.HORIZONTAL, Orientation.VERTICAL)),
+    )
+
+
+def test_bitboard_placement_rules_match_cell_loops() -> None:
+    rng = random.Random(2024)
+    for _trial in range(300):
+        size = rng.choice((6, 8, 10, 12))
+        board = BoardState(size=size)
+        reference = _LoopBoard(size)
+        ship_id = 0
+        for _ in range(40):
+            placement = _random_placement(rng, size)
+            expected = reference.reason(placement)
+            assert board.can_place_with_reason(placement) == (not expected, expected)
+            if not expected:
+                ship_id += 1
+                board.place_ship(ship_id, placement)
+                reference.place(ship_id, placement)
+        assert (board.ships == reference.ships).all()
+
+
+def test_bitboard_shots_and_sunk_state_match_cell_loops() -> None:
+    rng = random.Random(7)
+    for _trial in range(200):
+        size = rng.choice((7, 10))
+        board = BoardState(size=size)
+        reference = _LoopBoard(size)
+        ship_id = 0
+        for _ in range(30):
+            placement = _random_placement(rng, size)
+            if not reference.reason(placement):
+                ship_id += 1
+                board.place_ship(ship_id, placement)
+                reference.place(ship_id, placement)
+        assert board.all_ships_sunk() == reference.all_sunk()
+        for _ in range(size * size + 20):
+            coord = Coord(rng.randrange(-1, size + 1), rng.randrange(-1, size + 1))
+            assert board.apply_shot(coord) == reference.shoot(coord)
+            assert board.all_ships_sunk() == reference.all_sunk()
+        assert (board.shots == reference.shots).all()
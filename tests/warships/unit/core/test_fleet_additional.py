@@ -1,12 +1,23 @@
 import random
 
+import pytest
+
 from warships.game.core.fleet import (
+    FleetPool,
     _generate_relaxed_fleet,
     build_board_from_fleet,
     random_fleet,
+    random_fleets,
     validate_fleet,
 )
-from warships.game.core.models import Coord, FleetPlacement, Orientation, ShipPlacement, ShipType
+from warships.game.core.models import (
+    LARGE_RULES,
+    Coord,
+    FleetPlacement,
+    Orientation,
+    ShipPlacement,
+    ShipType,
+)
 
 
 def test_validate_fleet_rejects_missing_ship() -> None:
@@ -34,3 +45,43 @@ def test_random_fleet_and_relaxed_fleet_paths() -> None:
     assert validate_fleet(fleet)[0]
     relaxed = _generate_relaxed_fleet(random.Random(10), 10)
     assert validate_fleet(relaxed)[0]
+
+
+def test_random_fleets_are_valid_and_reproducible() -> None:
+    fleets = random_fleets(random.Random(4), 500)
+    assert len(fleets) == 500
+    assert all(validate_fleet(fleet)[0] for fleet in fleets)
+    assert fleets == random_fleets(random.Random(4), 500)
+    assert random_fleets(random.Random(4), 0) == []
+    small = random_fleets(random.Random(5), 10, size=7)
+    assert all(validate_fleet(fleet, size=7)[0] for fleet in small)
+
+
+def test_fleet_pool_round_trips_and_samples_valid_fleets(tmp_path) -> None:
+    pool = FleetPool.generate(random.Random(6), 64)
+    path = tmp_path / "pools" / "fleets.npz"
+    pool.save(path)
+    loaded = FleetPool.load(path)
+    assert len(loaded) == 64
+    assert (loaded.ids == pool.ids).all()
+    sampled = loaded.sample(random.Random(7), 200)
+    assert len(sampled) == 200
+    assert all(validate_fleet(fleet)[0] for fleet in sampled)
+
+
+def test_fleet_pool_load_rejects_ids_for_another_board_size(tmp_path) -> None:
+    path = tmp_path / "fleets.npz"
+    ids = FleetPool.generate(random.Random(8), 16, size=12).ids
+    FleetPool(size=7, ids=ids).save(path)
+    with pytest.raises(ValueError):
+        FleetPool.load(path)
+
+
+def test_random_fleet_fills_large_rules_profile() -> None:
+    fleet = random_fleet(random.Random(5), rules=LARGE_RULES)
+    assert len(fleet.ships) == len(LARGE_RULES.fleet)
+    assert validate_fleet(fleet, rules=LARGE_RULES) == (True, "")
+    assert not validate_fleet(fleet)[0]
+    board = build_board_from_fleet(fleet, rules=LARGE_RULES)
+    assert board.size == 30
+    assert int((board.ships > 0).sum()) == sum(LARGE_RULES.ship_lengths)
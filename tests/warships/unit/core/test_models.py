@@ -1,5 +1,10 @@
+import pytest
+
 from warships.game.core.models import (
+    CLASSIC_RULES,
+    LARGE_RULES,
     Coord,
+    RulesProfile,
     Orientation,
     ShipPlacement,
     ShipType,
@@ -17,3 +22,19 @@ def test_cells_for_placement_horizontal_and_vertical() -> None:
     vertical = ShipPlacement(ShipType.CRUISER, Coord(1, 2), Orientation.VERTICAL)
     assert cells_for_placement(horizontal) == [Coord(1, 2), Coord(1, 3), Coord(1, 4)]
     assert cells_for_placement(vertical) == [Coord(1, 2), Coord(2, 2), Coord(3, 2)]
+
+
+def test_rules_profiles_scale_fleet_with_board() -> None:
+    assert CLASSIC_RULES.board_size == 10
+    assert len(CLASSIC_RULES.fleet) == 5
+    assert LARGE_RULES.board_size == 30
+    assert len(LARGE_RULES.fleet) == 15
+    assert sorted(LARGE_RULES.ship_lengths) == sorted(CLASSIC_RULES.ship_lengths * 3)
+    assert RulesProfile.scaled(20).name == "scaled_20"
+
+
+def test_rules_profile_rejects_ships_longer_than_board() -> None:
+    with pytest.raises(ValueError):
+        RulesProfile(name="tiny", board_size=4, fleet=(ShipType.CARRIER,))
+    with pytest.raises(ValueError):
+        RulesProfile(name="empty", board_size=10, fleet=())
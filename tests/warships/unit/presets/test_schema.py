@@ -9,6 +9,16 @@ def test_schema_roundtrip(valid_fleet: FleetPlacement) -> None:
     name, fleet = payload_to_fleet(payload)
     assert name == "alpha"
     assert len(fleet.ships) == len(valid_fleet.ships)
+    assert payload["version"] == 2
+    assert payload["rules_profile"] == "classic"
+
+
+def test_schema_loads_version_1_payload(valid_fleet: FleetPlacement) -> None:
+    payload = {**fleet_to_payload("legacy", valid_fleet), "version": 1}
+    del payload["rules_profile"]
+    name, fleet = payload_to_fleet(payload)
+    assert name == "legacy"
+    assert fleet.ships == valid_fleet.ships
 
 
 def test_schema_rejects_invalid_payload() -> None:
@@ -1,11 +1,12 @@
 import pytest
 
+from warships.game.core.models import LARGE_RULES
 from warships.game.presets.schema import payload_to_fleet
 
 
 def test_schema_rejects_wrong_version_and_grid_size() -> None:
     with pytest.raises(ValueError):
-        payload_to_fleet({"version": 2, "name": "x", "grid_size": 10, "ships": []})
+        payload_to_fleet({"version": 3, "name": "x", "grid_size": 10, "ships": []})
     with pytest.raises(ValueError):
         payload_to_fleet({"version": 1, "name": "x", "grid_size": 9, "ships": []})
 
@@ -18,3 +19,23 @@ def test_schema_rejects_malformed_ship_entries() -> None:
         payload_to_fleet(
             {**base, "ships": [{"type": "DESTROYER", "bow": [0], "orientation": "HORIZONTAL"}]}
         )
+
+
+def test_schema_checks_grid_size_against_rules_profile() -> None:
+    payload = {"version": 2, "name": "x", "rules_profile": "large", "grid_size": 30, "ships": []}
+    with pytest.raises(ValueError):
+        payload_to_fleet(payload)
+    with pytest.raises(ValueError):
+        payload_to_fleet({**payload, "rules_profile": "classic"}, rules=LARGE_RULES)
+    name, fleet = payload_to_fleet(payload, rules=LARGE_RULES)
+    assert name == "x"
+    assert fleet.ships == []
+
+
+def test_schema_loads_version_1_payload_as_classic_only() -> None:
+    payload = {"version": 1, "name": "x", "ships": []}
+    assert payload_to_fleet(payload)[0] == "x"
+    with pytest.raises(ValueError):
+        payload_to_fleet(payload, rules=LARGE_RULES)
+    with pytest.raises(ValueError):
+        payload_to_fleet({**payload, "grid_size": 30}, rules=LARGE_RULES)
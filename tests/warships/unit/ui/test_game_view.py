@@ -64,6 +64,7 @@ def test_game_view_build_snapshot_contains_scalar_render_payloads() -> None:
 
     assert snapshot.frame_index == 7
     assert snapshot.passes
+    assert snapshot.trusted
     for render_pass in snapshot.passes:
         for command in render_pass.commands:
             assert len(command.transform.values) == 16
@@ -1,9 +1,11 @@
+from engine.api.ui_primitives import GridLayout
 from warships.game.ui.layout_metrics import (
     NEW_GAME_SETUP,
     PLACEMENT_PANEL,
     PRESET_PANEL,
     PROMPT,
     content_rect,
+    grid_layout_for_board,
     root_rect,
     status_rect,
     top_bar_rect,
@@ -32,3 +34,11 @@ def test_new_game_and_prompt_layout_helpers() -> None:
     assert NEW_GAME_SETUP.visible_row_capacity() >= 1
     assert PRESET_PANEL.visible_row_capacity() >= 1
     assert PROMPT.overlay_rect().contains(PROMPT.panel_rect().x, PROMPT.panel_rect().y)
+
+
+def test_grid_layout_for_board_keeps_pixel_footprint() -> None:
+    base = GridLayout()
+    large = grid_layout_for_board(base, 30)
+    assert large.grid_size == 30
+    assert large.rect_for_target("primary") == base.rect_for_target("primary")
+    assert grid_layout_for_board(base, base.grid_size) is base
@@ -0,0 +1,45 @@
+"""Decode fast-mode binary logs (``*.englog``) to JSON lines."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections import deque
+from collections.abc import Sequence
+from pathlib import Path
+
+from engine.api.debug import iter_binary_log_records
+from engine.diagnostics.json_codec import dumps_text
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", type=Path, help="Binary log file to decode.")
+    parser.add_argument("--out", type=Path, default=None, help="Write JSONL here, not stdout.")
+    parser.add_argument(
+        "--logger-prefix", default="", help="Keep rows whose logger has this prefix."
+    )
+    parser.add_argument("--tail", type=int, default=0, help="Only the last N matching rows.")
+    args = parser.parse_args(argv)
+
+    try:
+        rows = iter_binary_log_records(args.path)
+        if args.logger_prefix:
+            rows = (row for row in rows if str(row["logger"]).startswith(args.logger_prefix))
+        if args.tail > 0:
+            rows = iter(deque(rows, maxlen=args.tail))
+        lines = [dumps_text(row) for row in rows]
+    except (OSError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+    text = "\n".join(lines) + ("\n" if lines else "")
+    if args.out is None:
+        sys.stdout.write(text)
+    else:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(text, encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
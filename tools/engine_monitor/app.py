@@ -8,7 +8,11 @@ from tools.engine_monitor.views.health import build_health_view_model
 from tools.engine_monitor.views.hitches import build_hitch_rows
 from tools.engine_monitor.views.performance import build_performance_breakdown_model
 from tools.engine_monitor.views.render_resize import build_render_resize_model
-from tools.engine_monitor.views.timeline import build_timeline_points
+from tools.engine_monitor.views.timeline import (
+    build_lane_polylines,
+    build_timeline_lanes,
+    build_timeline_points,
+)
 from tools.engine_obs_core.datasource.live_source import LiveObsSource
 
 
@@ -141,7 +145,7 @@ class MonitorApp:
     def _update_timeline(self, snapshot) -> None:
         if self.timeline_canvas is None:
             return
-        points = build_timeline_points(snapshot.events)[-120:]
+        points = build_timeline_points(snapshot.events)
         canvas = self.timeline_canvas
         canvas.delete("all")
         width = max(1, int(canvas.winfo_width() or 1200))
@@ -151,23 +155,15 @@ class MonitorApp:
                 width // 2, height // 2, text="No live timeline points.", fill="#9aa3af"
             )
             return
-        max_value = max(
-            1.0,
-            max(max(p.frame_ms, p.render_ms, p.queue_depth, p.publish_count) for p in points),
+        frame_coords, render_coords = build_lane_polylines(
+            build_timeline_lanes(points),
+            width=width,
+            height=height,
+            start_tick=points[-min(120, len(points))].tick,
         )
-
-        def y(value: float) -> float:
-            return height - (value / max_value) * (height - 20.0) - 10.0
-
-        step = width / max(1, len(points) - 1)
-        frame_coords = []
-        render_coords = []
-        for idx, point in enumerate(points):
-            x = idx * step
-            frame_coords.extend((x, y(point.frame_ms)))
-            render_coords.extend((x, y(point.render_ms)))
-        canvas.create_line(*frame_coords, fill="#55d8ff", width=2)
-        canvas.create_line(*render_coords, fill="#ffa657", width=2)
+        if len(frame_coords) >= 4:
+            canvas.create_line(*frame_coords, fill="#55d8ff", width=2)
+            canvas.create_line(*render_coords, fill="#ffa657", width=2)
         canvas.create_text(80, 16, text="frame.time_ms", fill="#55d8ff")
         canvas.create_text(220, 16, text="render.frame_ms", fill="#ffa657")
 
@@ -3,6 +3,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from tools.engine_obs_core.contracts import EventRecord
+from tools.engine_obs_core.timeline import (
+    TimelinePlotArea,
+    TimelinePyramid,
+    bucket_series_coords,
+    bucket_value_range,
+)
 
 
 @dataclass(frozen=True)
@@ -46,3 +52,48 @@ def build_timeline_points(events: list[EventRecord]) -> list[TimelinePoint]:
         )
         for tick, values in sorted(lanes.items())
     ]
+
+
+@dataclass(frozen=True)
+class TimelineLanes:
+    frame: TimelinePyramid
+    render: TimelinePyramid
+
+
+def build_timeline_lanes(points: list[TimelinePoint]) -> TimelineLanes:
+    ticks = [point.tick for point in points]
+    return TimelineLanes(
+        frame=TimelinePyramid(ticks, [point.frame_ms for point in points]),
+        render=TimelinePyramid(ticks, [point.render_ms for point in points]),
+    )
+
+
+def build_lane_polylines(
+    lanes: TimelineLanes,
+    *,
+    width: int,
+    height: int,
+    start_tick: int | None = None,
+    end_tick: int | None = None,
+) -> tuple[list[float], list[float]]:
+    """Return frame and render mean polylines with at most one bucket per pixel."""
+    tick_range = lanes.frame.tick_range
+    if tick_range is None:
+        return [], []
+    start = tick_range[0] if start_tick is None else int(start_tick)
+    end = tick_range[1] if end_tick is None else int(end_tick)
+    frame = lanes.frame.buckets(pixel_width=width, start_tick=start, end_tick=end)
+    render = lanes.render.buckets(pixel_width=width, start_tick=start, end_tick=end)
+    value_range = bucket_value_range(frame, render)
+    max_value = max(1.0, value_range[1] if value_range is not None else 0.0)
+    area = TimelinePlotArea(
+        left=0.0,
+        top=10.0,
+        width=float(width),
+        height=float(height) - 20.0,
+        min_tick=start,
+        max_tick=end,
+        min_value=0.0,
+        max_value=max_value,
+    )
+    return bucket_series_coords(frame, area)[0], bucket_series_coords(render, area)[0]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol
@@ -20,6 +22,7 @@ class SessionRef:
     root: Path
     run_log: Path | None
     ui_log: Path | None
+    replay_stream: Path | None = None
 
 
 @dataclass(frozen=True)
@@ -35,8 +38,30 @@ class MetricsSnapshot:
 
 @dataclass(frozen=True)
 class ReplaySession:
-    commands: list[ReplayCommandRecord]
-    checkpoints: list[ReplayCheckpointRecord]
+    """Tick-ordered replay records; sequences may be lazily backed by a stream."""
+
+    commands: Sequence[ReplayCommandRecord]
+    checkpoints: Sequence[ReplayCheckpointRecord]
+
+    def commands_at(self, tick: int) -> list[ReplayCommandRecord]:
+        commands = self.commands
+        index = bisect_left(commands, int(tick), key=_record_tick)
+        out: list[ReplayCommandRecord] = []
+        while index < len(commands) and commands[index].tick == tick:
+            out.append(commands[index])
+            index += 1
+        return out
+
+    def checkpoint_at(self, tick: int) -> ReplayCheckpointRecord | None:
+        checkpoints = self.checkpoints
+        index = bisect_left(checkpoints, int(tick), key=_record_tick)
+        if index < len(checkpoints) and checkpoints[index].tick == tick:
+            return checkpoints[index]
+        return None
+
+
+def _record_tick(record: ReplayCommandRecord | ReplayCheckpointRecord) -> int:
+    return record.tick
 
 
 class ObsSource(Protocol):
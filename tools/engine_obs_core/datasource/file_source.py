@@ -1,11 +1,22 @@
 from __future__ import annotations
 
-import json
+import hashlib
+from bisect import bisect_right
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, overload
 
-from engine.api.debug import DebugSessionBundle, discover_debug_sessions, load_debug_session
+from engine.api.debug import (
+    DebugLoadedSession,
+    DebugSessionBundle,
+    ReplayStream,
+    discover_debug_sessions,
+    find_latest_debug_payload,
+    load_debug_session,
+    open_replay_stream,
+    tail_log_records,
+)
 from engine.diagnostics.schema import (
     DIAG_PROFILING_SCHEMA_VERSION,
     DIAG_REPLAY_SESSION_SCHEMA_VERSION,
@@ -28,7 +39,9 @@ from tools.engine_obs_core.datasource.base import (
     SessionRef,
     TimeWindow,
 )
+from tools.engine_obs_core.event_store import EventStore
 from tools.engine_obs_core.export import export_json_report
+from tools.engine_obs_core.query import filter_events
 
 
 def _parse_ts(value: object) -> datetime | None:
@@ -43,9 +56,26 @@ def _parse_ts(value: object) -> datetime | None:
 class FileObsSource(ObsSource):
     """File-backed diagnostics source using existing engine debug loaders."""
 
-    def __init__(self, root: Path, *, recursive: bool = True) -> None:
+    def __init__(
+        self, root: Path, *, recursive: bool = True, index_dir: Path | None = None
+    ) -> None:
         self._root = root
         self._recursive = recursive
+        self._index_dir = index_dir
+        self._stores: dict[str, EventStore] = {}
+
+    def __enter__(self) -> FileObsSource:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the SQLite connections of every cached event index."""
+        stores = list(self._stores.values())
+        self._stores.clear()
+        for store in stores:
+            store.close()
 
     def list_sessions(self) -> list[SessionRef]:
         bundles = discover_debug_sessions(self._root, recursive=self._recursive)
@@ -57,6 +87,7 @@ class FileObsSource(ObsSource):
                     root=self._root,
                     run_log=bundle.run_log,
                     ui_log=bundle.ui_log,
+                    replay_stream=bundle.replay_stream,
                 )
             )
         return out
@@ -64,10 +95,95 @@ class FileObsSource(ObsSource):
     def load_events(
         self, session: SessionRef, window: TimeWindow | None = None
     ) -> list[EventRecord]:
-        loaded = self._load_session(session)
-        events: list[EventRecord] = []
+        with self._load_session(session) as loaded:
+            events = list(self._iter_events(loaded))
+        events.sort(key=lambda item: (_parse_ts(item.ts_utc) or datetime.min, item.tick))
+        return self._apply_window(events, window)
 
-        for record in loaded.run_records:
+    def tail_events(
+        self, session: SessionRef, count: int, *, name_prefix: str | None = None
+    ) -> list[EventRecord]:
+        """Last ``count`` run-log events without loading the whole session.
+
+        ``name_prefix`` matches the event name (the logger), and non-matching
+        lines are skipped before they are parsed.
+        """
+        if session.run_log is None:
+            return []
+        records = tail_log_records(
+            session.run_log,
+            count,
+            field_prefixes={"logger": name_prefix} if name_prefix else None,
+        )
+        return list(self._iter_run_events(records))
+
+    def event_store(self, session: SessionRef) -> EventStore | None:
+        """Return the session's SQLite event index, (re)building it when logs changed.
+
+        Returns ``None`` when the source was created without ``index_dir``.
+        """
+        if self._index_dir is None:
+            return None
+        fingerprint = self._session_fingerprint(session)
+        digest = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:16]
+        store = self._stores.get(digest)
+        if store is not None:
+            return store
+        path = self._index_dir / f"events_{digest}.sqlite"
+        if path.exists():
+            store = EventStore.open(path)
+            if store.fingerprint != fingerprint:
+                store.close()
+                store = None
+        if store is None:
+            with self._load_session(session) as loaded:
+                store = EventStore.build(
+                    path,
+                    events=self._iter_events(loaded),
+                    spans=self.load_spans(session, limit=1_000_000),
+                    fingerprint=fingerprint,
+                )
+        self._stores[digest] = store
+        return store
+
+    def query_events(
+        self,
+        session: SessionRef,
+        *,
+        window: TimeWindow | None = None,
+        category: str | None = None,
+        name: str | None = None,
+        level: str | None = None,
+        text: str | None = None,
+        limit: int | None = None,
+    ) -> list[EventRecord]:
+        """Filtered events; runs in SQL when an ``index_dir`` is configured."""
+        store = self.event_store(session)
+        if store is None:
+            events = filter_events(
+                self.load_events(session, window),
+                category=category,
+                name=name,
+                level=level,
+                text=text,
+            )
+            return events if limit is None else events[: max(0, int(limit))]
+        return store.query_events(
+            category=category,
+            name=name,
+            level=level,
+            text=text,
+            start_ts_utc=window.start_ts_utc if window is not None else None,
+            end_ts_utc=window.end_ts_utc if window is not None else None,
+            limit=limit,
+        )
+
+    def _iter_events(self, loaded: Any) -> Iterator[EventRecord]:
+        yield from self._iter_run_events(loaded.run_records)
+        yield from self._iter_ui_events(loaded.ui_frames)
+
+    def _iter_run_events(self, records: Iterable[dict[str, Any]]) -> Iterator[EventRecord]:
+        for record in records:
             ts_utc = str(record.get("ts", ""))
             logger = str(record.get("logger", "runlog"))
             level = str(record.get("level", "INFO")).lower()
@@ -78,44 +194,51 @@ class FileObsSource(ObsSource):
             metadata = dict(record)
             for key in ("ts", "logger", "level", "msg"):
                 metadata.pop(key, None)
-            events.append(
-                EventRecord(
-                    ts_utc=ts_utc,
-                    tick=tick,
-                    category=category,
-                    name=name,
-                    level=level,
-                    value=msg,
-                    metadata=metadata,
-                )
+            yield EventRecord(
+                ts_utc=ts_utc,
+                tick=tick,
+                category=category,
+                name=name,
+                level=level,
+                value=msg,
+                metadata=metadata,
             )
 
-        for frame in loaded.ui_frames:
+    @staticmethod
+    def _iter_ui_events(frames: Iterable[dict[str, Any]]) -> Iterator[EventRecord]:
+        for frame in frames:
             ts_utc = str(frame.get("ts_utc", ""))
             frame_seq = int(frame.get("frame_seq", 0))
-            events.append(
-                EventRecord(
-                    ts_utc=ts_utc,
-                    tick=frame_seq,
-                    category="ui_diag",
-                    name="ui.frame",
-                    level="info" if not frame.get("anomalies") else "warning",
-                    value={
-                        "reasons": list(frame.get("reasons", [])),
-                        "anomalies": list(frame.get("anomalies", [])),
-                    },
-                    metadata=dict(frame),
-                )
+            yield EventRecord(
+                ts_utc=ts_utc,
+                tick=frame_seq,
+                category="ui_diag",
+                name="ui.frame",
+                level="info" if not frame.get("anomalies") else "warning",
+                value={
+                    "reasons": list(frame.get("reasons", [])),
+                    "anomalies": list(frame.get("anomalies", [])),
+                },
+                metadata=dict(frame),
             )
 
-        events.sort(key=lambda item: (_parse_ts(item.ts_utc) or datetime.min, item.tick))
-        return self._apply_window(events, window)
+    @staticmethod
+    def _session_fingerprint(session: SessionRef) -> str:
+        parts: list[str] = []
+        for path in (session.run_log, session.ui_log):
+            if path is None or not path.exists():
+                parts.append("-")
+                continue
+            stat = path.stat()
+            parts.append(f"{path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}")
+        return "\n".join(parts)
 
     def load_metrics(self, session: SessionRef) -> MetricsSnapshot:
-        loaded = self._load_session(session)
+        with self._load_session(session) as loaded:
+            ui_frames = loaded.ui_frames
         points = []
         previous_ts: datetime | None = None
-        for frame in loaded.ui_frames:
+        for frame in ui_frames:
             ts = _parse_ts(frame.get("ts_utc"))
             if ts is None:
                 continue
@@ -170,6 +293,8 @@ class FileObsSource(ObsSource):
         return spans
 
     def load_replay(self, session: SessionRef) -> ReplaySession:
+        if session.replay_stream is not None and session.replay_stream.exists():
+            return self._load_replay_stream(session.replay_stream)
         payload = self._find_latest_payload(
             session,
             schema=DIAG_REPLAY_SESSION_SCHEMA_VERSION,
@@ -206,6 +331,27 @@ class FileObsSource(ObsSource):
                 )
         return ReplaySession(commands=commands, checkpoints=checkpoints)
 
+    def _load_replay_stream(self, path: Path) -> ReplaySession:
+        try:
+            stream = open_replay_stream(path)
+        except (OSError, ValueError):
+            return ReplaySession(commands=[], checkpoints=[])
+        counts = [(chunk.command_count, chunk.state_hash_count) for chunk in stream.chunks]
+        return ReplaySession(
+            commands=_LazyReplayRecords(
+                stream,
+                key="commands",
+                counts=[commands for commands, _ in counts],
+                convert=_command_record,
+            ),
+            checkpoints=_LazyReplayRecords(
+                stream,
+                key="state_hashes",
+                counts=[hashes for _, hashes in counts],
+                convert=_checkpoint_record,
+            ),
+        )
+
     def load_crash(self, session: SessionRef) -> CrashBundleRecord | None:
         payload = self._find_latest_payload(
             session,
@@ -233,12 +379,13 @@ class FileObsSource(ObsSource):
     def export_report(self, report: dict, path: Path) -> Path:
         return export_json_report(report, path)
 
-    def _load_session(self, session: SessionRef):
+    def _load_session(self, session: SessionRef) -> DebugLoadedSession:
         bundle = DebugSessionBundle(
             run_log=session.run_log,
             ui_log=session.ui_log,
             run_stamp=None,
             ui_stamp=None,
+            replay_stream=session.replay_stream,
         )
         return load_debug_session(bundle)
 
@@ -313,25 +460,63 @@ class FileObsSource(ObsSource):
             candidates.append(self._root.parent / "profiles")
             candidates.append(self._root / "tools" / "data" / "profiles")
 
-        json_paths: list[Path] = []
-        for base in candidates:
-            if not base.exists() or not base.is_dir():
-                continue
-            json_paths.extend(base.glob("*.json"))
-        json_paths.sort(key=lambda path: path.stat().st_mtime, reverse=True)
+        return find_latest_debug_payload(self._root, candidates, schema=schema)
 
-        for path in json_paths:
-            payload = self._safe_load_json(path)
-            if payload is None:
-                continue
-            if str(payload.get("schema_version", "")) == schema:
-                return payload
-        return None
 
-    @staticmethod
-    def _safe_load_json(path: Path) -> dict[str, Any] | None:
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except Exception:
-            return None
-        return payload if isinstance(payload, dict) else None
+def _command_record(item: dict[str, Any]) -> ReplayCommandRecord:
+    return ReplayCommandRecord(
+        tick=int(item.get("tick", 0)),
+        type=str(item.get("type", "")),
+        payload=dict(item.get("payload", {}) or {}),
+    )
+
+
+def _checkpoint_record(item: dict[str, Any]) -> ReplayCheckpointRecord:
+    return ReplayCheckpointRecord(tick=int(item.get("tick", 0)), hash=str(item.get("hash", "")))
+
+
+class _LazyReplayRecords[T](Sequence[T]):
+    """Index into a replay stream's chunks without materializing the whole capture."""
+
+    def __init__(
+        self,
+        stream: ReplayStream,
+        *,
+        key: str,
+        counts: list[int],
+        convert: Callable[[dict[str, Any]], T],
+    ) -> None:
+        self._stream = stream
+        self._key = key
+        self._convert = convert
+        self._offsets: list[int] = []
+        total = 0
+        for count in counts:
+            self._offsets.append(total)
+            total += int(count)
+        self._len = total
+
+    def __len__(self) -> int:
+        return self._len
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError(index)
+        chunk_index = bisect_right(self._offsets, index) - 1
+        rows = self._stream.read_chunk(chunk_index).get(self._key, [])
+        return self._convert(rows[index - self._offsets[chunk_index]])
+
+    def __iter__(self) -> Iterator[T]:
+        for chunk_index in range(len(self._offsets)):
+            for item in self._stream.read_chunk(chunk_index).get(self._key, []):
+                yield self._convert(item)
@@ -0,0 +1,386 @@
+"""SQLite-backed event index for one diagnostics session.
+
+Events are ingested once into a per-session database with indexed tick,
+category, name, level and timestamp columns plus an FTS5 trigram table over
+the same text ``filter_events`` searches, so filters, time windows and span
+aggregations run in SQL instead of over in-memory lists.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from tools.engine_obs_core.aggregations import SpanAggregate
+from tools.engine_obs_core.contracts import EventRecord, SpanRecord
+
+EVENT_STORE_SCHEMA_VERSION = "obs.event_store.v1"
+_INGEST_BATCH = 20_000
+
+
+class EventStore:
+    """Indexed, queryable copy of a session's events and spans."""
+
+    def __init__(self, connection: sqlite3.Connection, *, path: Path, fts: bool) -> None:
+        self._conn = connection
+        self._path = path
+        self._fts = fts
+
+    @classmethod
+    def open(cls, path: Path) -> EventStore:
+        """Open an existing store (or create an empty one) at ``path``."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path)
+        _create_schema(conn)
+        fts = _table_exists(conn, "events_fts")
+        return cls(conn, path=path, fts=fts)
+
+    @classmethod
+    def build(
+        cls,
+        path: Path,
+        *,
+        events: Iterable[EventRecord],
+        spans: Iterable[SpanRecord] = (),
+        fingerprint: str = "",
+    ) -> EventStore:
+        """Ingest ``events``/``spans`` into a fresh store that replaces ``path`` atomically."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.unlink(missing_ok=True)
+        conn = sqlite3.connect(tmp_path)
+        try:
+            conn.execute("PRAGMA journal_mode=OFF")
+            conn.execute("PRAGMA synchronous=OFF")
+            _create_schema(conn, indexes=False)
+            fts = _table_exists(conn, "events_fts")
+            _ingest_events(conn, events, fts=fts)
+            _ingest_spans(conn, spans)
+            _create_indexes(conn)
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)",
+                [("schema_version", EVENT_STORE_SCHEMA_VERSION), ("fingerprint", fingerprint)],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(tmp_path, path)
+        return cls.open(path)
+
+    def __enter__(self) -> EventStore:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def fingerprint(self) -> str | None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+        version = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'schema_version'"
+        ).fetchone()
+        if row is None or version is None or version[0] != EVENT_STORE_SCHEMA_VERSION:
+            return None
+        return str(row[0])
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def count_events(self, **filters: Any) -> int:
+        where, params = self._where(**filters)
+        row = self._conn.execute(f"SELECT COUNT(*) FROM events e {where}", params).fetchone()
+        return int(row[0])
+
+    def query_events(
+        self,
+        *,
+        category: str | None = None,
+        name: str | None = None,
+        level: str | None = None,
+        text: str | None = None,
+        start_ts_utc: str | None = None,
+        end_ts_utc: str | None = None,
+        tick_min: int | None = None,
+        tick_max: int | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[EventRecord]:
+        """Return events matching every given predicate, ordered like ``load_events``.
+
+        Predicates mirror ``filter_events``; ``start_ts_utc``/``end_ts_utc`` mirror
+        ``TimeWindow`` (events without a parseable timestamp are excluded once a
+        window is given).
+        """
+        where, params = self._where(
+            category=category,
+            name=name,
+            level=level,
+            text=text,
+            start_ts_utc=start_ts_utc,
+            end_ts_utc=end_ts_utc,
+            tick_min=tick_min,
+            tick_max=tick_max,
+        )
+        sql = (
+            "SELECT ts_utc, tick, category, name, level, value_json, metadata_json "
+            f"FROM events e {where} ORDER BY ts_key, tick, id"
+        )
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params = [*params, max(0, int(limit)), max(0, int(offset))]
+        loads = orjson.loads
+        return [
+            EventRecord(
+                ts_utc=ts_utc,
+                tick=tick,
+                category=category,
+                name=name,
+                level=level,
+                value=loads(value_json),
+                metadata=loads(metadata_json),
+            )
+            for ts_utc, tick, category, name, level, value_json, metadata_json in (
+                self._conn.execute(sql, params)
+            )
+        ]
+
+    def categories(self) -> list[str]:
+        rows = self._conn.execute("SELECT DISTINCT category FROM events ORDER BY category")
+        return [str(row[0]) for row in rows]
+
+    def aggregate_spans(self) -> list[SpanAggregate]:
+        """SQL equivalent of ``aggregations.aggregate_spans``."""
+        totals = {
+            str(row[0]): row
+            for row in self._conn.execute(
+                "SELECT category || ':' || name AS key, COUNT(*) AS n, "
+                "SUM(duration_ms) AS total, MAX(duration_ms) AS peak "
+                "FROM spans GROUP BY category, name"
+            )
+        }
+        # Only fetch the two ranks ``percentile`` interpolates between.
+        ranked: dict[str, dict[int, float]] = {}
+        for row in self._conn.execute(
+            "SELECT key, rn, duration_ms FROM ("
+            " SELECT category || ':' || name AS key, duration_ms,"
+            " ROW_NUMBER() OVER (PARTITION BY category, name ORDER BY duration_ms) - 1 AS rn,"
+            " CAST(0.95 * (COUNT(*) OVER (PARTITION BY category, name) - 1) AS INTEGER) AS lo"
+            " FROM spans"
+            ") WHERE rn IN (lo, lo + 1)"
+        ):
+            ranked.setdefault(str(row[0]), {})[int(row[1])] = float(row[2])
+        out: list[SpanAggregate] = []
+        for key, (_key, count, total, peak) in totals.items():
+            count = int(count)
+            total = float(total)
+            index = 0.95 * (count - 1)
+            lo = int(index)
+            values = ranked.get(key, {})
+            lo_value = values.get(lo, 0.0)
+            hi_value = values.get(min(lo + 1, count - 1), lo_value)
+            out.append(
+                SpanAggregate(
+                    key=key,
+                    count=count,
+                    total_ms=total,
+                    mean_ms=total / count if count > 0 else 0.0,
+                    p95_ms=lo_value + (hi_value - lo_value) * (index - lo),
+                    max_ms=float(peak),
+                )
+            )
+        return out
+
+    def _where(
+        self,
+        *,
+        category: str | None = None,
+        name: str | None = None,
+        level: str | None = None,
+        text: str | None = None,
+        start_ts_utc: str | None = None,
+        end_ts_utc: str | None = None,
+        tick_min: int | None = None,
+        tick_max: int | None = None,
+    ) -> tuple[str, list[Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if category is not None:
+            clauses.append("e.category = ?")
+            params.append(category)
+        if name is not None:
+            clauses.append("e.name = ?")
+            params.append(name)
+        if level is not None:
+            clauses.append("e.level = ? COLLATE NOCASE")
+            params.append(level)
+        if start_ts_utc is not None or end_ts_utc is not None:
+            clauses.append("e.ts_key IS NOT NULL")
+            start_key = _ts_key(start_ts_utc)
+            end_key = _ts_key(end_ts_utc)
+            if start_key is not None:
+                clauses.append("e.ts_key >= ?")
+                params.append(start_key)
+            if end_key is not None:
+                clauses.append("e.ts_key <= ?")
+                params.append(end_key)
+        if tick_min is not None:
+            clauses.append("e.tick >= ?")
+            params.append(int(tick_min))
+        if tick_max is not None:
+            clauses.append("e.tick <= ?")
+            params.append(int(tick_max))
+        if text is not None and text.strip():
+            # ``body`` is lowercased at ingest, so a case-sensitive GLOB gives the
+            # same substring match as ``filter_events``; the trigram index serves it
+            # for needles of 3+ characters.
+            table = "events_fts" if self._fts else "events_text"
+            needle = "".join(f"[{ch}]" if ch in "*?[" else ch for ch in text.lower().strip())
+            clauses.append(f"e.id IN (SELECT rowid FROM {table} WHERE body GLOB ?)")
+            params.append(f"*{needle}*")
+        if not clauses:
+            return "", params
+        return "WHERE " + " AND ".join(clauses), params
+
+
+def _create_schema(conn: sqlite3.Connection, *, indexes: bool = True) -> None:
+    conn.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+        CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY,
+            ts_utc TEXT NOT NULL,
+            ts_key REAL,
+            tick INTEGER NOT NULL,
+            category TEXT NOT NULL,
+            name TEXT NOT NULL,
+            level TEXT NOT NULL,
+            value TEXT,
+            value_json BLOB NOT NULL,
+            metadata_json BLOB NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS spans (
+            id INTEGER PRIMARY KEY,
+            tick INTEGER NOT NULL,
+            category TEXT NOT NULL,
+            name TEXT NOT NULL,
+            start_s REAL NOT NULL,
+            end_s REAL NOT NULL,
+            duration_ms REAL NOT NULL
+        );
+        """
+    )
+    if not _table_exists(conn, "events_fts") and not _table_exists(conn, "events_text"):
+        try:
+            conn.execute(
+                "CREATE VIRTUAL TABLE events_fts USING fts5(body, tokenize='trigram', detail=none)"
+            )
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5 (or < 3.34): plain table scanned with GLOB.
+            conn.execute("CREATE TABLE events_text (rowid INTEGER PRIMARY KEY, body TEXT)")
+    if indexes:
+        _create_indexes(conn)
+
+
+def _create_indexes(conn: sqlite3.Connection) -> None:
+    conn.executescript(
+        """
+        CREATE INDEX IF NOT EXISTS ix_events_order ON events(ts_key, tick, id);
+        CREATE INDEX IF NOT EXISTS ix_events_tick ON events(tick);
+        CREATE INDEX IF NOT EXISTS ix_events_category ON events(category, ts_key);
+        CREATE INDEX IF NOT EXISTS ix_events_name ON events(name);
+        CREATE INDEX IF NOT EXISTS ix_events_level ON events(level COLLATE NOCASE);
+        CREATE INDEX IF NOT EXISTS ix_events_value ON events(value);
+        CREATE INDEX IF NOT EXISTS ix_spans_key ON spans(category, name, duration_ms);
+        """
+    )
+
+
+def _table_exists(conn: sqlite3.Connection, name: str) -> bool:
+    row = conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (name,)).fetchone()
+    return row is not None
+
+
+def _ingest_events(conn: sqlite3.Connection, events: Iterable[EventRecord], *, fts: bool) -> None:
+    text_table = "events_fts" if fts else "events_text"
+    next_id = 1
+    for batch in _batched(events, _INGEST_BATCH):
+        event_rows: list[tuple[Any, ...]] = []
+        text_rows: list[tuple[int, str]] = []
+        for event in batch:
+            value = event.value
+            scalar = None if isinstance(value, dict) or value is None else str(value)
+            event_rows.append(
+                (
+                    next_id,
+                    event.ts_utc,
+                    _ts_key(event.ts_utc),
+                    int(event.tick),
+                    event.category,
+                    event.name,
+                    event.level,
+                    scalar,
+                    orjson.dumps(value, default=str),
+                    orjson.dumps(event.metadata, default=str),
+                )
+            )
+            # Same haystack as query.filter_events.
+            text_rows.append(
+                (
+                    next_id,
+                    f"{event.name}\n{event.category}\n{value}\n{event.metadata}".lower(),
+                )
+            )
+            next_id += 1
+        conn.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", event_rows)
+        conn.executemany(f"INSERT INTO {text_table}(rowid, body) VALUES (?, ?)", text_rows)
+
+
+def _ingest_spans(conn: sqlite3.Connection, spans: Iterable[SpanRecord]) -> None:
+    for batch in _batched(spans, _INGEST_BATCH):
+        conn.executemany(
+            "INSERT INTO spans(tick, category, name, start_s, end_s, duration_ms) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    int(span.tick),
+                    span.category,
+                    span.name,
+                    float(span.start_s),
+                    float(span.end_s),
+                    float(span.duration_ms),
+                )
+                for span in batch
+            ],
+        )
+
+
+def _batched[T](items: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _ts_key(value: str | None) -> float | None:
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed.timestamp()
+
+
+__all__ = ["EVENT_STORE_SCHEMA_VERSION", "EventStore"]
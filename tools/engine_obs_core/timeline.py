@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
 from datetime import datetime
 
+import numpy as np
+
 from tools.engine_obs_core.contracts import EventRecord, SpanRecord
 
 
@@ -51,3 +55,199 @@ def build_span_bucket_series(
         mean = (sum(values) / len(values)) if values else 0.0
         points.append((bucket_tick, mean))
     return points
+
+
+@dataclass(frozen=True, slots=True)
+class TimelineBucket:
+    start_tick: int
+    end_tick: int
+    count: int
+    min_value: float
+    max_value: float
+    mean_value: float
+
+
+@dataclass(frozen=True, slots=True)
+class _PyramidLevel:
+    start_ticks: np.ndarray
+    end_ticks: np.ndarray
+    counts: np.ndarray
+    mins: np.ndarray
+    maxs: np.ndarray
+    sums: np.ndarray
+
+    def window(self, start_tick: int, end_tick: int) -> tuple[int, int]:
+        lo = int(np.searchsorted(self.end_ticks, start_tick, side="left"))
+        hi = int(np.searchsorted(self.start_ticks, end_tick, side="right"))
+        return lo, max(lo, hi)
+
+
+class TimelinePyramid:
+    """Min/max/mean/count buckets of a tick series at several resolutions.
+
+    Level 0 holds one bucket per distinct tick; each higher level merges
+    ``fanout`` consecutive buckets of the level below. The pyramid is built once
+    per series; ``buckets`` then serves any visible window from the finest level
+    that fits in ``pixel_width`` buckets, so redraw cost does not grow with the
+    session length.
+    """
+
+    def __init__(self, ticks: Sequence[int], values: Sequence[float], *, fanout: int = 4) -> None:
+        tick_array = np.asarray(ticks, dtype=np.int64)
+        value_array = np.asarray(values, dtype=np.float64)
+        if tick_array.shape != value_array.shape or tick_array.ndim != 1:
+            raise ValueError("ticks and values must be 1-D sequences of equal length")
+        self._fanout = max(2, int(fanout))
+        self._levels: list[_PyramidLevel] = []
+        if tick_array.size == 0:
+            return
+        order = np.argsort(tick_array, kind="stable")
+        tick_array = tick_array[order]
+        value_array = value_array[order]
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(tick_array)) + 1))
+        level = _PyramidLevel(
+            start_ticks=tick_array[starts],
+            end_ticks=tick_array[starts],
+            counts=np.diff(np.append(starts, tick_array.size)),
+            mins=np.minimum.reduceat(value_array, starts),
+            maxs=np.maximum.reduceat(value_array, starts),
+            sums=np.add.reduceat(value_array, starts),
+        )
+        self._levels.append(level)
+        while level.start_ticks.size > 1:
+            size = level.start_ticks.size
+            starts = np.arange(0, size, self._fanout)
+            ends = np.minimum(starts + self._fanout, size) - 1
+            level = _PyramidLevel(
+                start_ticks=level.start_ticks[starts],
+                end_ticks=level.end_ticks[ends],
+                counts=np.add.reduceat(level.counts, starts),
+                mins=np.minimum.reduceat(level.mins, starts),
+                maxs=np.maximum.reduceat(level.maxs, starts),
+                sums=np.add.reduceat(level.sums, starts),
+            )
+            self._levels.append(level)
+
+    @classmethod
+    def from_points(
+        cls, points: Iterable[tuple[int, float]], *, fanout: int = 4
+    ) -> TimelinePyramid:
+        ticks: list[int] = []
+        values: list[float] = []
+        for tick, value in points:
+            ticks.append(int(tick))
+            values.append(float(value))
+        return cls(ticks, values, fanout=fanout)
+
+    @property
+    def level_count(self) -> int:
+        return len(self._levels)
+
+    @property
+    def sample_count(self) -> int:
+        return int(self._levels[0].counts.sum()) if self._levels else 0
+
+    @property
+    def tick_range(self) -> tuple[int, int] | None:
+        if not self._levels:
+            return None
+        base = self._levels[0]
+        return int(base.start_ticks[0]), int(base.end_ticks[-1])
+
+    def level_for(self, *, pixel_width: int, start_tick: int, end_tick: int) -> int:
+        """Return the finest level with at most ``pixel_width`` buckets in the window."""
+        limit = max(1, int(pixel_width))
+        for index, level in enumerate(self._levels):
+            lo, hi = level.window(start_tick, end_tick)
+            if hi - lo <= limit:
+                return index
+        return len(self._levels) - 1
+
+    def buckets(
+        self,
+        *,
+        pixel_width: int,
+        start_tick: int | None = None,
+        end_tick: int | None = None,
+    ) -> list[TimelineBucket]:
+        tick_range = self.tick_range
+        if tick_range is None:
+            return []
+        start = tick_range[0] if start_tick is None else int(start_tick)
+        end = tick_range[1] if end_tick is None else int(end_tick)
+        level = self._levels[
+            self.level_for(pixel_width=pixel_width, start_tick=start, end_tick=end)
+        ]
+        lo, hi = level.window(start, end)
+        counts = level.counts[lo:hi]
+        means = level.sums[lo:hi] / counts
+        return [
+            TimelineBucket(
+                start_tick=first,
+                end_tick=last,
+                count=count,
+                min_value=low,
+                max_value=high,
+                mean_value=mean,
+            )
+            for first, last, count, low, high, mean in zip(
+                level.start_ticks[lo:hi].tolist(),
+                level.end_ticks[lo:hi].tolist(),
+                counts.tolist(),
+                level.mins[lo:hi].tolist(),
+                level.maxs[lo:hi].tolist(),
+                means.tolist(),
+                strict=True,
+            )
+        ]
+
+
+@dataclass(frozen=True, slots=True)
+class TimelinePlotArea:
+    left: float
+    top: float
+    width: float
+    height: float
+    min_tick: int
+    max_tick: int
+    min_value: float
+    max_value: float
+
+
+def bucket_value_range(*series: list[TimelineBucket]) -> tuple[float, float] | None:
+    lows = [bucket.min_value for buckets in series for bucket in buckets]
+    if not lows:
+        return None
+    highs = [bucket.max_value for buckets in series for bucket in buckets]
+    return min(lows), max(highs)
+
+
+def bucket_series_coords(
+    buckets: list[TimelineBucket], area: TimelinePlotArea
+) -> tuple[list[float], list[float]]:
+    """Return canvas coords for the mean polyline and the min/max envelope polygon.
+
+    The envelope is empty when every bucket holds a single value.
+    """
+    tick_span = max(1, area.max_tick - area.min_tick)
+    value_span = max(1e-6, area.max_value - area.min_value)
+    x_scale = area.width / tick_span
+    y_scale = area.height / value_span
+    bottom = area.top + area.height
+    mean_line: list[float] = []
+    upper: list[float] = []
+    lower: list[float] = []
+    banded = False
+    for bucket in buckets:
+        x = area.left + ((bucket.start_tick + bucket.end_tick) * 0.5 - area.min_tick) * x_scale
+        mean_line.extend((x, bottom - (bucket.mean_value - area.min_value) * y_scale))
+        upper.extend((x, bottom - (bucket.max_value - area.min_value) * y_scale))
+        lower.extend((x, bottom - (bucket.min_value - area.min_value) * y_scale))
+        banded = banded or bucket.max_value > bucket.min_value
+    if not banded:
+        return mean_line, []
+    # Walk the max edge forwards and the min edge backwards to close the polygon.
+    envelope = list(upper)
+    for index in range(len(lower) - 2, -1, -2):
+        envelope.extend((lower[index], lower[index + 1]))
+    return mean_line, envelope
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from tools.engine_repro_lab.runner import ValidationRun
+from tools.engine_repro_lab.runner import BisectRun, ValidationRun
 
 
 def render_result_table(run: ValidationRun) -> str:
@@ -26,3 +26,26 @@ def render_result_table(run: ValidationRun) -> str:
                 f"actual={mismatch['actual_hash']}"
             )
     return "\n".join(lines)
+
+
+def render_bisect_table(run: BisectRun) -> str:
+    result = run.result
+    lines = [
+        f"replay={run.replay_path}",
+        f"fixed_step_seconds={run.config.fixed_step_seconds:.8f}",
+        f"diverged={result.diverged}",
+        f"state_checkpoints={result.state_checkpoint_count}",
+        f"segments_replayed={result.segments_replayed}",
+        f"ticks_replayed={result.ticks_replayed}",
+    ]
+    if result.diverged:
+        lines.extend(
+            [
+                f"first_divergent_tick={result.first_divergent_tick}",
+                f"last_good_tick={result.last_good_tick}",
+                f"resumed_from_tick={result.resumed_from_tick}",
+                f"expected={result.expected_hash}",
+                f"actual={result.actual_hash}",
+            ]
+        )
+    return "\n".join(lines)
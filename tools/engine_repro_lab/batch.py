@@ -2,24 +2,52 @@
 
 from __future__ import annotations
 
+import json
+import multiprocessing
+import os
+from collections import deque
 from collections.abc import Callable, Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection, wait
 from pathlib import Path
+from time import perf_counter
 from typing import Any
 
+from engine.api.debug import ReplayValidationView
+from engine.diagnostics.schema import DIAG_REPLAY_VALIDATION_SCHEMA_VERSION
 from tools.engine_repro_lab.runner import ValidationConfig, ValidationRun, run_validation_from_file
 
+try:
+    import resource
+except ImportError:  # pragma: no cover - non-POSIX
+    resource = None  # type: ignore[assignment]
+
 SimulatorFactory = Callable[[], tuple[Any, Any]]
 
+JOB_OK = "ok"
+JOB_ERROR = "error"
+JOB_MEMORY = "memory"
+JOB_TIMEOUT = "timeout"
+JOB_CRASHED = "crashed"
+
 
 @dataclass(frozen=True)
 class BatchValidationSummary:
+    """Batch totals; ``errored_*`` are replays that failed without any mismatch.
+
+    Those jobs never produced a comparison (error, timeout, crash or memory
+    limit), so they are counted apart from ``total_mismatches`` and never
+    reported as ``worst_replay``.
+    """
+
     total_replays: int
     passed_count: int
     failed_count: int
     total_mismatches: int
     worst_replay: str | None
     worst_mismatch_count: int
+    errored_count: int = 0
+    errored_replays: tuple[str, ...] = ()
 
 
 def run_batch_validation(
@@ -53,8 +81,13 @@ def summarize_batch_runs(runs: Iterable[ValidationRun]) -> BatchValidationSummar
     total_mismatches = sum(count for _, count in mismatch_counts)
     worst_replay: str | None = None
     worst_count = 0
-    if mismatch_counts:
+    if total_mismatches > 0:
         worst_replay, worst_count = max(mismatch_counts, key=lambda item: item[1])
+    errored = tuple(
+        str(run.replay_path)
+        for run in run_list
+        if not run.result.passed and not run.result.mismatches
+    )
     return BatchValidationSummary(
         total_replays=total,
         passed_count=passed,
@@ -62,4 +95,273 @@ def summarize_batch_runs(runs: Iterable[ValidationRun]) -> BatchValidationSummar
         total_mismatches=total_mismatches,
         worst_replay=worst_replay,
         worst_mismatch_count=worst_count,
+        errored_count=len(errored),
+        errored_replays=errored,
     )
+
+
+@dataclass(frozen=True)
+class ParallelBatchConfig:
+    """Process-pool settings for ``run_parallel_batch_validation``.
+
+    ``simulator_factory`` must be importable from worker processes (a module-level
+    function). ``memory_limit_mb`` caps each worker's address space via
+    ``resource.RLIMIT_AS`` where available.
+    """
+
+    workers: int = field(default_factory=lambda: os.cpu_count() or 1)
+    job_timeout_s: float | None = None
+    memory_limit_mb: int | None = None
+    report_path: Path | None = None
+    start_method: str | None = None
+
+
+@dataclass(frozen=True)
+class BatchJobResult:
+    replay_path: Path
+    status: str
+    elapsed_s: float
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class ParallelBatchResult:
+    """Runs and job records ordered by replay path regardless of completion order."""
+
+    runs: list[ValidationRun]
+    jobs: list[BatchJobResult]
+    wall_seconds: float
+
+    @property
+    def replays_per_minute(self) -> float:
+        if self.wall_seconds <= 0.0:
+            return 0.0
+        return len(self.jobs) * 60.0 / self.wall_seconds
+
+    def job_seconds_percentile(self, q: float) -> float | None:
+        values = sorted(job.elapsed_s for job in self.jobs)
+        if not values:
+            return None
+        index = q * (len(values) - 1)
+        lo = int(index)
+        hi = min(lo + 1, len(values) - 1)
+        return values[lo] + (values[hi] - values[lo]) * (index - lo)
+
+
+def run_parallel_batch_validation(
+    replay_paths: Iterable[Path],
+    *,
+    config: ValidationConfig,
+    simulator_factory: SimulatorFactory,
+    parallel: ParallelBatchConfig,
+) -> ParallelBatchResult:
+    """Validate replays on a pool of worker processes.
+
+    Workers are long-lived and pull one replay at a time. A job over its timeout
+    or a worker that dies is recorded as a failed run and the worker is replaced.
+    Each finished job is appended to ``parallel.report_path`` (JSONL) as soon as
+    it completes; the returned runs stay compatible with ``compare_batch_runs``.
+    """
+    paths = sorted(replay_paths, key=str)
+    started = perf_counter()
+    context = multiprocessing.get_context(parallel.start_method)
+    pending: deque[Path] = deque(paths)
+    runs: dict[Path, ValidationRun] = {}
+    jobs: dict[Path, BatchJobResult] = {}
+    report = _open_job_report(parallel.report_path)
+    workers: list[_PoolWorker] = []
+
+    def record(
+        path: Path,
+        status: str,
+        elapsed_s: float,
+        run: ValidationRun | None,
+        error: str | None,
+    ) -> None:
+        job = BatchJobResult(replay_path=path, status=status, elapsed_s=elapsed_s, error=error)
+        jobs[path] = job
+        runs[path] = run if run is not None else _failed_run(path, config)
+        if report is not None:
+            report.write(json.dumps(_job_payload(job, runs[path]), ensure_ascii=True) + "\n")
+            report.flush()
+
+    def dispatch(worker: _PoolWorker) -> None:
+        if pending:
+            worker.start_job(pending.popleft())
+
+    try:
+        for _ in range(max(1, min(int(parallel.workers), len(paths)))):
+            worker = _PoolWorker.spawn(context, config, simulator_factory, parallel.memory_limit_mb)
+            workers.append(worker)
+            dispatch(worker)
+        while any(worker.job is not None for worker in workers):
+            busy = [worker for worker in workers if worker.job is not None]
+            ready = set(wait(_wait_handles(busy), timeout=_next_deadline(busy, parallel)))
+            now = perf_counter()
+            for index, worker in enumerate(workers):
+                job = worker.job
+                if job is None:
+                    continue
+                path, job_started = job
+                if worker.conn in ready:
+                    try:
+                        status, run, error = worker.conn.recv()
+                    except (EOFError, OSError):
+                        status, run, error = JOB_CRASHED, None, "worker connection closed"
+                    record(path, status, now - job_started, run, error)
+                    worker.job = None
+                    if status == JOB_CRASHED:
+                        worker.stop()
+                        worker = workers[index] = _PoolWorker.spawn(
+                            context, config, simulator_factory, parallel.memory_limit_mb
+                        )
+                    dispatch(worker)
+                elif worker.process.sentinel in ready or (
+                    parallel.job_timeout_s is not None
+                    and now - job_started >= parallel.job_timeout_s
+                ):
+                    if worker.process.is_alive():
+                        status, error = JOB_TIMEOUT, f"exceeded {parallel.job_timeout_s}s"
+                    else:
+                        status, error = JOB_CRASHED, f"exit code {worker.process.exitcode}"
+                    record(path, status, now - job_started, None, error)
+                    worker.stop()
+                    worker = workers[index] = _PoolWorker.spawn(
+                        context, config, simulator_factory, parallel.memory_limit_mb
+                    )
+                    dispatch(worker)
+    finally:
+        for worker in workers:
+            worker.stop()
+        if report is not None:
+            report.close()
+    return ParallelBatchResult(
+        runs=[runs[path] for path in paths],
+        jobs=[jobs[path] for path in paths],
+        wall_seconds=perf_counter() - started,
+    )
+
+
+class _PoolWorker:
+    def __init__(self, process: Any, conn: Connection) -> None:
+        self.process = process
+        self.conn = conn
+        self.job: tuple[Path, float] | None = None
+
+    @classmethod
+    def spawn(
+        cls,
+        context: Any,
+        config: ValidationConfig,
+        simulator_factory: SimulatorFactory,
+        memory_limit_mb: int | None,
+    ) -> _PoolWorker:
+        parent_conn, child_conn = context.Pipe()
+        process = context.Process(
+            target=_worker_main,
+            args=(child_conn, config, simulator_factory, memory_limit_mb),
+            name="repro-lab-worker",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        return cls(process, parent_conn)
+
+    def start_job(self, path: Path) -> None:
+        self.conn.send(path)
+        self.job = (path, perf_counter())
+
+    def stop(self) -> None:
+        if self.process.is_alive():
+            if self.job is None:
+                try:
+                    self.conn.send(None)
+                except OSError:
+                    pass
+                self.process.join(timeout=1.0)
+            if self.process.is_alive():
+                self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+def _worker_main(
+    conn: Connection,
+    config: ValidationConfig,
+    simulator_factory: SimulatorFactory,
+    memory_limit_mb: int | None,
+) -> None:
+    if memory_limit_mb is not None and resource is not None:
+        limit = int(memory_limit_mb) * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    while True:
+        try:
+            path = conn.recv()
+        except EOFError:
+            return
+        if path is None:
+            return
+        try:
+            apply_command, step = simulator_factory()
+            run = run_validation_from_file(
+                path, config=config, apply_command=apply_command, step=step
+            )
+            conn.send((JOB_OK, run, None))
+        except MemoryError:
+            conn.send((JOB_MEMORY, None, "memory limit exceeded"))
+        except Exception as exc:
+            conn.send((JOB_ERROR, None, f"{type(exc).__name__}: {exc}"))
+
+
+def _wait_handles(busy: list[_PoolWorker]) -> list[Any]:
+    handles: list[Any] = []
+    for worker in busy:
+        handles.append(worker.conn)
+        handles.append(worker.process.sentinel)
+    return handles
+
+
+def _next_deadline(busy: list[_PoolWorker], parallel: ParallelBatchConfig) -> float | None:
+    if parallel.job_timeout_s is None:
+        return None
+    now = perf_counter()
+    remaining = [
+        parallel.job_timeout_s - (now - worker.job[1]) for worker in busy if worker.job is not None
+    ]
+    return max(0.0, min(remaining)) if remaining else None
+
+
+def _failed_run(path: Path, config: ValidationConfig) -> ValidationRun:
+    return ValidationRun(
+        replay_path=path,
+        config=config,
+        result=ReplayValidationView(
+            schema_version=DIAG_REPLAY_VALIDATION_SCHEMA_VERSION,
+            passed=False,
+            total_ticks=0,
+            commands_applied=0,
+            checkpoint_count=0,
+            mismatches=[],
+        ),
+    )
+
+
+def _open_job_report(path: Path | None) -> Any:
+    if path is None:
+        return None
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path.open("w", encoding="utf-8")
+
+
+def _job_payload(job: BatchJobResult, run: ValidationRun) -> dict[str, Any]:
+    return {
+        "replay_path": str(job.replay_path),
+        "status": job.status,
+        "elapsed_s": round(job.elapsed_s, 6),
+        "error": job.error,
+        "passed": bool(run.result.passed),
+        "total_ticks": int(run.result.total_ticks),
+        "commands_applied": int(run.result.commands_applied),
+        "checkpoint_count": int(run.result.checkpoint_count),
+        "mismatches": list(run.result.mismatches),
+    }
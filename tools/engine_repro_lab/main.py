@@ -4,11 +4,23 @@ import argparse
 from pathlib import Path
 from typing import Any
 
-from tools.engine_repro_lab.app import render_result_table
-from tools.engine_repro_lab.batch import run_batch_validation, summarize_batch_runs
+from engine.diagnostics.replay_stream import REPLAY_STREAM_SUFFIX
+from tools.engine_repro_lab.app import render_bisect_table, render_result_table
+from tools.engine_repro_lab.batch import (
+    BatchValidationSummary,
+    ParallelBatchConfig,
+    run_batch_validation,
+    run_parallel_batch_validation,
+    summarize_batch_runs,
+)
 from tools.engine_repro_lab.diff import compare_batch_runs
 from tools.engine_repro_lab.reporting import build_report, export_report
-from tools.engine_repro_lab.runner import ValidationConfig, run_validation_from_file
+from tools.engine_repro_lab.runner import (
+    ValidationConfig,
+    ValidationRun,
+    run_bisect_from_file,
+    run_validation_from_file,
+)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -39,6 +51,35 @@ def build_parser() -> argparse.ArgumentParser:
         default=1.0 / 60.0,
         help="Fixed simulation step seconds.",
     )
+    parser.add_argument(
+        "--bisect",
+        action="store_true",
+        help="Find the first diverging tick and the checkpoint that reproduces it (--replay-json).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for batch/differential validation (1 = in-process).",
+    )
+    parser.add_argument(
+        "--job-timeout",
+        type=float,
+        default=None,
+        help="Per-replay timeout in seconds for pooled validation.",
+    )
+    parser.add_argument(
+        "--memory-limit-mb",
+        type=int,
+        default=None,
+        help="Per-worker address space cap in MiB for pooled validation (POSIX only).",
+    )
+    parser.add_argument(
+        "--jsonl-out",
+        type=Path,
+        default=None,
+        help="Stream pooled per-replay results to this JSONL file as jobs finish.",
+    )
     parser.add_argument(
         "--report-out",
         type=Path,
@@ -49,6 +90,11 @@ def build_parser() -> argparse.ArgumentParser:
 
 
 def _default_simulator() -> tuple[Any, Any]:
+    apply_command, step, _restore = _default_restorable_simulator()
+    return apply_command, step
+
+
+def _default_restorable_simulator() -> tuple[Any, Any, Any]:
     state = {"tick": -1, "command_count": 0}
 
     def apply_command(_command: Any) -> None:
@@ -59,7 +105,57 @@ def _default_simulator() -> tuple[Any, Any]:
         # Deterministic shape for MVP runner.
         return {"tick": state["tick"], "command_count": state["command_count"]}
 
-    return apply_command, step
+    def restore(checkpoint: Any) -> None:
+        state["tick"] = int(checkpoint.get("tick", -1))
+        state["command_count"] = int(checkpoint.get("command_count", 0))
+
+    return apply_command, step, restore
+
+
+def _replay_files(directory: Path) -> list[Path]:
+    """Replay JSON exports and chunked replay streams in ``directory``."""
+    return sorted([*directory.glob("*.json"), *directory.glob(f"*{REPLAY_STREAM_SUFFIX}")])
+
+
+def _validate_batch(
+    replay_paths: list[Path], *, config: ValidationConfig, args: argparse.Namespace
+) -> list[ValidationRun]:
+    if int(args.workers) <= 1 and args.job_timeout is None and args.memory_limit_mb is None:
+        return run_batch_validation(
+            replay_paths,
+            config=config,
+            simulator_factory=_default_simulator,
+        )
+    result = run_parallel_batch_validation(
+        replay_paths,
+        config=config,
+        simulator_factory=_default_simulator,
+        parallel=ParallelBatchConfig(
+            workers=max(1, int(args.workers)),
+            job_timeout_s=args.job_timeout,
+            memory_limit_mb=args.memory_limit_mb,
+            report_path=args.jsonl_out,
+        ),
+    )
+    print(f"replays_per_min={result.replays_per_minute:.1f}")
+    print(
+        "job_seconds "
+        f"p50={result.job_seconds_percentile(0.5) or 0.0:.3f} "
+        f"p90={result.job_seconds_percentile(0.9) or 0.0:.3f} "
+        f"p99={result.job_seconds_percentile(0.99) or 0.0:.3f}"
+    )
+    failed_jobs = [job for job in result.jobs if job.status != "ok"]
+    if failed_jobs:
+        print(f"failed_jobs={len(failed_jobs)}")
+    return result.runs
+
+
+def _print_batch_summary(summary: BatchValidationSummary) -> None:
+    print(f"total_replays={summary.total_replays}")
+    print(f"passed={summary.passed_count} failed={summary.failed_count}")
+    print(f"total_mismatches={summary.total_mismatches} errored={summary.errored_count}")
+    if summary.errored_replays:
+        print(f"errored_replays={','.join(summary.errored_replays)}")
 
 
 def main() -> int:
@@ -71,14 +167,14 @@ def main() -> int:
     config = ValidationConfig(fixed_step_seconds=float(args.fixed_step_seconds))
 
     if args.batch_dir is not None:
-        replay_paths = sorted(args.batch_dir.glob("*.json"))
+        replay_paths = _replay_files(args.batch_dir)
         if not replay_paths:
             fallback_dirs = [
                 Path("warships/appdata/replay"),
                 Path("warships/appdata/logs/replay"),
             ]
             for directory in fallback_dirs:
-                candidate_paths = sorted(directory.glob("*.json"))
+                candidate_paths = _replay_files(directory)
                 if candidate_paths:
                     replay_paths = candidate_paths
                     print(
@@ -93,15 +189,9 @@ def main() -> int:
                 "(common dirs: tools/data/replay, warships/appdata/replay)."
             )
             return 0
-        runs = run_batch_validation(
-            replay_paths,
-            config=config,
-            simulator_factory=_default_simulator,
-        )
+        runs = _validate_batch(replay_paths, config=config, args=args)
         summary = summarize_batch_runs(runs)
-        print(f"total_replays={summary.total_replays}")
-        print(f"passed={summary.passed_count} failed={summary.failed_count}")
-        print(f"total_mismatches={summary.total_mismatches}")
+        _print_batch_summary(summary)
         worst_line = (
             f"worst_replay={summary.worst_replay} "
             f"worst_mismatch_count={summary.worst_mismatch_count}"
@@ -113,18 +203,10 @@ def main() -> int:
         if args.baseline_dir is None or args.candidate_dir is None:
             print("Both --baseline-dir and --candidate-dir are required for differential mode.")
             return 2
-        baseline_paths = sorted(args.baseline_dir.glob("*.json"))
-        candidate_paths = sorted(args.candidate_dir.glob("*.json"))
-        baseline_runs = run_batch_validation(
-            baseline_paths,
-            config=config,
-            simulator_factory=_default_simulator,
-        )
-        candidate_runs = run_batch_validation(
-            candidate_paths,
-            config=config,
-            simulator_factory=_default_simulator,
-        )
+        baseline_paths = _replay_files(args.baseline_dir)
+        candidate_paths = _replay_files(args.candidate_dir)
+        baseline_runs = _validate_batch(baseline_paths, config=config, args=args)
+        candidate_runs = _validate_batch(candidate_paths, config=config, args=args)
         diffs, summary = compare_batch_runs(baseline_runs, candidate_runs)
         print(f"total_compared={summary.total_compared}")
         summary_line = (
@@ -150,17 +232,11 @@ def main() -> int:
     replay_path = args.replay_json
     if replay_path is None:
         default_batch_dir = Path("tools/data/replay")
-        replay_paths = sorted(default_batch_dir.glob("*.json"))
+        replay_paths = _replay_files(default_batch_dir)
         if replay_paths:
-            runs = run_batch_validation(
-                replay_paths,
-                config=config,
-                simulator_factory=_default_simulator,
-            )
+            runs = _validate_batch(replay_paths, config=config, args=args)
             summary = summarize_batch_runs(runs)
-            print(f"total_replays={summary.total_replays}")
-            print(f"passed={summary.passed_count} failed={summary.failed_count}")
-            print(f"total_mismatches={summary.total_mismatches}")
+            _print_batch_summary(summary)
             return 0 if summary.failed_count == 0 else 1
         print("Missing --replay-json and no default replay batch found.")
         print(
@@ -171,6 +247,18 @@ def main() -> int:
         print(f"Replay file not found: {replay_path}")
         return 2
 
+    if args.bisect:
+        apply_command, step, restore = _default_restorable_simulator()
+        bisect_run = run_bisect_from_file(
+            replay_path,
+            config=config,
+            apply_command=apply_command,
+            step=step,
+            restore=restore,
+        )
+        print(render_bisect_table(bisect_run))
+        return 1 if bisect_run.result.diverged else 0
+
     apply_command, step = _default_simulator()
     run = run_validation_from_file(
         replay_path,
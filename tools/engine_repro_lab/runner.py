@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from engine.api.debug import ReplayValidationView, validate_replay_snapshot
+from engine.api.debug import (
+    ReplayBisectView,
+    ReplayValidationView,
+    bisect_replay_snapshot,
+    load_replay_file,
+    validate_replay_snapshot,
+)
 
 
 @dataclass(frozen=True)
@@ -22,11 +27,15 @@ class ValidationRun:
     result: ReplayValidationView
 
 
+@dataclass(frozen=True)
+class BisectRun:
+    replay_path: Path
+    config: ValidationConfig
+    result: ReplayBisectView
+
+
 def load_replay_snapshot(path: Path) -> dict[str, Any]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    if not isinstance(payload, dict):
-        raise ValueError("Replay payload must be a JSON object.")
-    return payload
+    return load_replay_file(path)
 
 
 def run_validation(
@@ -59,3 +68,22 @@ def run_validation_from_file(
         step=step,
     )
     return ValidationRun(replay_path=replay_path, config=config, result=result)
+
+
+def run_bisect_from_file(
+    replay_path: Path,
+    *,
+    config: ValidationConfig,
+    apply_command: Any,
+    step: Any,
+    restore: Any,
+) -> BisectRun:
+    snapshot = load_replay_snapshot(replay_path)
+    result = bisect_replay_snapshot(
+        snapshot,
+        fixed_step_seconds=config.fixed_step_seconds,
+        apply_command=apply_command,
+        step=step,
+        restore=restore,
+    )
+    return BisectRun(replay_path=replay_path, config=config, result=result)
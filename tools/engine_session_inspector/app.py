@@ -25,10 +25,17 @@ from tools.engine_session_inspector.views.crash import build_crash_focus_text
 from tools.engine_session_inspector.views.events import (
     EventFilter,
     apply_event_filter,
+    event_filter_kwargs,
     event_to_row,
     format_event_payload,
 )
-from tools.engine_session_inspector.views.profiling import build_profiling_view_model
+from tools.engine_session_inspector.views.profiling import (
+    ProfilingViewModel,
+    build_profiling_timeline_layout,
+    build_profiling_view_model,
+    profiling_tick_range,
+    zoom_tick_range,
+)
 from tools.engine_session_inspector.views.replay import (
     build_replay_timeline_model,
     clamp_index,
@@ -40,12 +47,12 @@ from tools.engine_session_inspector.views.summary import build_summary_lines
 
 
 class SessionInspectorApp:
-    def __init__(self, root: Tk, *, logs_root: Path) -> None:
+    def __init__(self, root: Tk, *, logs_root: Path, index_dir: Path | None = None) -> None:
         self.root = root
         self.root.title("Engine Session Inspector")
         self.root.geometry("1500x980")
 
-        self.source = FileObsSource(logs_root, recursive=True)
+        self.source = FileObsSource(logs_root, recursive=True, index_dir=index_dir)
         self.state = InspectorState()
 
         self.status_var = StringVar(value="No session loaded.")
@@ -80,6 +87,8 @@ class SessionInspectorApp:
         self._filtered_events = []
         self._profiling_total_iid_by_key: dict[str, str] = {}
         self._profiling_selected_hitch_tick: int | None = None
+        self._profiling_model: ProfilingViewModel | None = None
+        self._profiling_view_range: tuple[int, int] | None = None
         self._replay_checkpoint_mismatch_ticks: set[int] = set()
         self._replay_render_packets: dict[int, dict[str, object]] = {}
         self._replay_index = 0
@@ -390,6 +399,10 @@ class SessionInspectorApp:
 
         self.profiling_canvas = Canvas(timeline_frame, bg="#10141a", height=180)
         self.profiling_canvas.pack(fill=BOTH, expand=True)
+        self.profiling_canvas.bind("<MouseWheel>", self._on_profiling_zoom)
+        self.profiling_canvas.bind("<Button-4>", self._on_profiling_zoom)
+        self.profiling_canvas.bind("<Button-5>", self._on_profiling_zoom)
+        self.profiling_canvas.bind("<Double-Button-1>", self._on_profiling_zoom_reset)
 
         table_split = ttk.Panedwindow(tables_frame, orient="horizontal")
         table_split.pack(fill=BOTH, expand=True)
@@ -508,8 +521,14 @@ class SessionInspectorApp:
             level=self.level_var.get() or "all",
             query=self.query_var.get(),
         )
-        categories = sorted({event.category for event in self.state.events})
-        filtered = apply_event_filter(self.state.events, filt)
+        session = self.state.selected_session
+        store = self.source.event_store(session) if session is not None else None
+        if store is not None and session is not None:
+            categories = store.categories()
+            filtered = self.source.query_events(session, **event_filter_kwargs(filt))
+        else:
+            categories = sorted({event.category for event in self.state.events})
+            filtered = apply_event_filter(self.state.events, filt)
         self._filtered_events = filtered
 
         category_values = ["all", *categories]
@@ -619,10 +638,8 @@ class SessionInspectorApp:
         tick = int(point.tick)
         self.replay_pos_var.set(f"tick={tick} index={idx + 1}/{len(points)}")
 
-        commands = [cmd for cmd in self.state.replay.commands if int(cmd.tick) == tick]
-        checkpoint = next(
-            (cp for cp in self.state.replay.checkpoints if int(cp.tick) == tick), None
-        )
+        commands = self.state.replay.commands_at(tick)
+        checkpoint = self.state.replay.checkpoint_at(tick)
 
         if self.replay_text is not None:
             mismatch = tick in self._replay_checkpoint_mismatch_ticks
@@ -695,6 +712,8 @@ class SessionInspectorApp:
 
     def _refresh_profiling_view(self) -> None:
         model = build_profiling_view_model(self.state.spans, self.state.metrics.frame_points)
+        self._profiling_model = model
+        self._profiling_view_range = None
 
         if self.profiling_text is not None:
             self.profiling_text.delete("1.0", END)
@@ -753,7 +772,7 @@ class SessionInspectorApp:
 
         self._draw_profiling_timeline(model)
 
-    def _draw_profiling_timeline(self, model: object) -> None:
+    def _draw_profiling_timeline(self, model: ProfilingViewModel) -> None:
         canvas = self.profiling_canvas
         if canvas is None:
             return
@@ -761,10 +780,19 @@ class SessionInspectorApp:
         width = max(200, int(canvas.winfo_width() or 900))
         height = max(120, int(canvas.winfo_height() or 180))
         canvas.create_rectangle(0, 0, width, height, fill="#10141a", outline="")
-        span_points = list(getattr(model, "timeline_points", []) or [])
-        frame_points = list(getattr(model, "frame_timeline_points", []) or [])
-        render_points = list(getattr(model, "render_timeline_points", []) or [])
-        if len(span_points) < 2 and len(frame_points) < 2 and len(render_points) < 2:
+        pad_x = 24
+        pad_y = 18
+        plot_w = max(1, int(width * 0.62) - 2 * pad_x)
+        plot_h = max(1, height - 2 * pad_y)
+        layout = build_profiling_timeline_layout(
+            model,
+            left=pad_x,
+            top=pad_y,
+            width=plot_w,
+            height=plot_h,
+            view_range=self._profiling_view_range,
+        )
+        if layout is None:
             canvas.create_text(
                 10,
                 10,
@@ -773,31 +801,18 @@ class SessionInspectorApp:
                 fill="#95a0ac",
             )
             return
-        all_values = [point[1] for point in span_points + frame_points + render_points]
-        min_v = min(all_values)
-        max_v = max(all_values)
-        span = max(1e-6, max_v - min_v)
-        pad_x = 24
-        pad_y = 18
-        plot_w = max(1, int(width * 0.62) - 2 * pad_x)
-        plot_h = max(1, height - 2 * pad_y)
-        min_tick = min(point[0] for point in span_points + frame_points + render_points)
-        max_tick = max(point[0] for point in span_points + frame_points + render_points)
-        tick_span = max(1, max_tick - min_tick)
-
-        def _draw_series(points: list[tuple[int, float]], color: str) -> None:
-            if len(points) < 2:
-                return
-            poly: list[float] = []
-            for tick, value in points:
-                x = pad_x + ((tick - min_tick) / tick_span) * plot_w
-                y = pad_y + (1.0 - ((value - min_v) / span)) * plot_h
-                poly.extend((x, y))
-            canvas.create_line(*poly, fill=color, width=2, smooth=True)
-
-        _draw_series(frame_points, "#4dd2ff")
-        _draw_series(render_points, "#7bf1a8")
-        _draw_series(span_points, "#ffa657")
+        area = layout.area
+        min_v = area.min_value
+        max_v = area.max_value
+        min_tick = area.min_tick
+        max_tick = area.max_tick
+        for layer in layout.layers:
+            if layer.envelope:
+                canvas.create_polygon(
+                    *layer.envelope, fill=layer.color, outline="", stipple="gray25"
+                )
+        for layer in layout.layers:
+            canvas.create_line(*layer.mean_line, fill=layer.color, width=2)
 
         # Visual summary of top offenders as an inline bar chart.
         bars = list(getattr(model, "top_total_rows", []) or [])[:8]
@@ -823,7 +838,8 @@ class SessionInspectorApp:
                 canvas.create_text(
                     bar_right, (y0 + y1) / 2, anchor="e", text=f"{total_ms:.1f}ms", fill="#d8dee9"
                 )
-        if self._profiling_selected_hitch_tick is not None:
+        hitch_tick = self._profiling_selected_hitch_tick
+        if hitch_tick is not None and min_tick <= hitch_tick <= max_tick:
             if max_tick > min_tick:
                 marker_x = (
                     pad_x
@@ -865,9 +881,34 @@ class SessionInspectorApp:
                 self.profiling_total_tree.focus(iid)
                 self.profiling_total_tree.see(iid)
         self._profiling_selected_hitch_tick = hitch_tick
-        model = build_profiling_view_model(self.state.spans, self.state.metrics.frame_points)
+        if self._profiling_model is not None:
+            self._draw_profiling_timeline(self._profiling_model)
+
+    def _on_profiling_zoom(self, event: object) -> None:
+        canvas = self.profiling_canvas
+        model = self._profiling_model
+        if canvas is None or model is None:
+            return
+        full = profiling_tick_range(model)
+        if full is None:
+            return
+        view = self._profiling_view_range or full
+        delta = int(getattr(event, "delta", 0) or 0)
+        zoom_in = delta > 0 or int(getattr(event, "num", 0) or 0) == 4
+        pad_x = 24
+        plot_w = max(1, int(max(200, int(canvas.winfo_width() or 900)) * 0.62) - 2 * pad_x)
+        fraction = (float(getattr(event, "x", pad_x)) - pad_x) / plot_w
+        anchor = view[0] + min(1.0, max(0.0, fraction)) * (view[1] - view[0])
+        self._profiling_view_range = zoom_tick_range(
+            view, full, anchor_tick=anchor, factor=0.8 if zoom_in else 1.25
+        )
         self._draw_profiling_timeline(model)
 
+    def _on_profiling_zoom_reset(self, _event: object) -> None:
+        self._profiling_view_range = None
+        if self._profiling_model is not None:
+            self._draw_profiling_timeline(self._profiling_model)
+
     def _on_event_select(self, _event: object) -> None:
         if self.events_tree is None or self.payload_text is None:
             return
@@ -988,8 +1029,11 @@ class SessionInspectorApp:
         return f"{session_id} | run={run_name} | ui={ui_name}"
 
 
-def run_app(*, logs_root: Path) -> int:
+def run_app(*, logs_root: Path, index_dir: Path | None = None) -> int:
     root = Tk()
-    SessionInspectorApp(root, logs_root=logs_root)
-    root.mainloop()
+    app = SessionInspectorApp(root, logs_root=logs_root, index_dir=index_dir)
+    try:
+        root.mainloop()
+    finally:
+        app.source.close()
     return 0
@@ -15,6 +15,20 @@ def build_parser() -> argparse.ArgumentParser:
         default=Path("warships/appdata"),
         help="Root directory where run/ui logs are discovered.",
     )
+    parser.add_argument(
+        "--index",
+        action="store_true",
+        help=(
+            "Filter events through a per-session SQLite index. The first open of a session "
+            "ingests it into the index, which is slower than loading it in memory."
+        ),
+    )
+    parser.add_argument(
+        "--index-dir",
+        type=Path,
+        default=Path("tools/data/obs_index"),
+        help="Directory for per-session SQLite event indexes (with --index).",
+    )
     return parser
 
 
@@ -23,7 +37,7 @@ def main() -> int:
     if args.version:
         print("engine_session_inspector v0.2")
         return 0
-    return run_app(logs_root=args.logs_root)
+    return run_app(logs_root=args.logs_root, index_dir=args.index_dir if args.index else None)
 
 
 if __name__ == "__main__":
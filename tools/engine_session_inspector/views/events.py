@@ -16,10 +16,16 @@ class EventFilter:
     query: str = ""
 
 
+def event_filter_kwargs(filt: EventFilter) -> dict[str, str | None]:
+    return {
+        "category": None if filt.category == "all" else filt.category,
+        "level": None if filt.level == "all" else filt.level,
+        "text": filt.query,
+    }
+
+
 def apply_event_filter(events: list[EventRecord], filt: EventFilter) -> list[EventRecord]:
-    category = None if filt.category == "all" else filt.category
-    level = None if filt.level == "all" else filt.level
-    return filter_events(events, category=category, level=level, text=filt.query)
+    return filter_events(events, **event_filter_kwargs(filt))
 
 
 def event_to_row(event: EventRecord) -> tuple[str, str, str, str, str]:
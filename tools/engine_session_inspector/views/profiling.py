@@ -6,7 +6,18 @@ from dataclasses import dataclass
 
 from tools.engine_obs_core.aggregations import detect_hitches, top_span_aggregates
 from tools.engine_obs_core.contracts import FramePoint, SpanRecord
-from tools.engine_obs_core.timeline import build_span_bucket_series
+from tools.engine_obs_core.timeline import (
+    TimelinePlotArea,
+    TimelinePyramid,
+    bucket_series_coords,
+    bucket_value_range,
+    build_span_bucket_series,
+)
+
+FRAME_SERIES_COLOR = "#4dd2ff"
+RENDER_SERIES_COLOR = "#7bf1a8"
+SPAN_SERIES_COLOR = "#ffa657"
+_MIN_VIEW_TICKS = 8
 
 
 @dataclass(frozen=True)
@@ -26,6 +37,27 @@ class ProfilingViewModel:
     top_total_rows: list[tuple[str, int, float, float]]
     top_p95_rows: list[tuple[str, int, float, float]]
     hitch_correlations: list[HitchCorrelation]
+    frame_pyramid: TimelinePyramid | None = None
+    render_pyramid: TimelinePyramid | None = None
+    span_pyramid: TimelinePyramid | None = None
+
+
+@dataclass(frozen=True)
+class TimelineSeriesLayer:
+    color: str
+    mean_line: list[float]
+    envelope: list[float]
+    bucket_count: int
+
+
+@dataclass(frozen=True)
+class ProfilingTimelineLayout:
+    area: TimelinePlotArea
+    layers: list[TimelineSeriesLayer]
+
+
+def _pyramid_or_none(points: list[tuple[int, float]]) -> TimelinePyramid | None:
+    return TimelinePyramid.from_points(points) if points else None
 
 
 def build_profiling_view_model(
@@ -90,4 +122,90 @@ def build_profiling_view_model(
         top_total_rows=top_total_rows,
         top_p95_rows=top_p95_rows,
         hitch_correlations=correlations,
+        frame_pyramid=_pyramid_or_none(frame_timeline_points),
+        render_pyramid=_pyramid_or_none(render_timeline_points),
+        span_pyramid=_pyramid_or_none(
+            [(int(span.tick), float(span.duration_ms)) for span in spans]
+        ),
     )
+
+
+def profiling_tick_range(model: ProfilingViewModel) -> tuple[int, int] | None:
+    ranges = [
+        pyramid.tick_range
+        for pyramid in (model.frame_pyramid, model.render_pyramid, model.span_pyramid)
+        if pyramid is not None and pyramid.tick_range is not None
+    ]
+    if not ranges:
+        return None
+    return min(item[0] for item in ranges), max(item[1] for item in ranges)
+
+
+def zoom_tick_range(
+    view: tuple[int, int],
+    full: tuple[int, int],
+    *,
+    anchor_tick: float,
+    factor: float,
+) -> tuple[int, int]:
+    """Scale ``view`` by ``factor`` around ``anchor_tick``, clamped to ``full``."""
+    full_span = max(1, full[1] - full[0])
+    span = min(full_span, max(_MIN_VIEW_TICKS, round((view[1] - view[0]) * factor)))
+    anchor = min(max(float(anchor_tick), float(view[0])), float(view[1]))
+    ratio = (anchor - view[0]) / max(1, view[1] - view[0])
+    start = round(anchor - ratio * span)
+    start = min(max(start, full[0]), full[1] - span)
+    return start, start + span
+
+
+def build_profiling_timeline_layout(
+    model: ProfilingViewModel,
+    *,
+    left: float,
+    top: float,
+    width: int,
+    height: int,
+    view_range: tuple[int, int] | None = None,
+) -> ProfilingTimelineLayout | None:
+    """Return canvas coords for the visible window at the plot's pixel width.
+
+    Each series is drawn from the pyramid level with at most one bucket per
+    pixel, so the cost depends on ``width`` rather than the session length.
+    """
+    full = profiling_tick_range(model)
+    if full is None:
+        return None
+    start, end = view_range if view_range is not None else full
+    series = [
+        (color, pyramid.buckets(pixel_width=width, start_tick=start, end_tick=end))
+        for color, pyramid in (
+            (FRAME_SERIES_COLOR, model.frame_pyramid),
+            (RENDER_SERIES_COLOR, model.render_pyramid),
+            (SPAN_SERIES_COLOR, model.span_pyramid),
+        )
+        if pyramid is not None
+    ]
+    value_range = bucket_value_range(*(buckets for _color, buckets in series))
+    if value_range is None or not any(len(buckets) >= 2 for _color, buckets in series):
+        return None
+    area = TimelinePlotArea(
+        left=left,
+        top=top,
+        width=float(width),
+        height=float(height),
+        min_tick=start,
+        max_tick=end,
+        min_value=value_range[0],
+        max_value=value_range[1],
+    )
+    layers: list[TimelineSeriesLayer] = []
+    for color, buckets in series:
+        if len(buckets) < 2:
+            continue
+        mean_line, envelope = bucket_series_coords(buckets, area)
+        layers.append(
+            TimelineSeriesLayer(
+                color=color, mean_line=mean_line, envelope=envelope, bucket_count=len(buckets)
+            )
+        )
+    return ProfilingTimelineLayout(area=area, layers=layers)
@@ -6,14 +6,17 @@ import random
 from collections import deque
 
 from warships.game.ai.strategy import AIStrategy
-from warships.game.core.models import BOARD_SIZE, Coord, ShotResult
+from warships.game.core.models import CLASSIC_RULES, Coord, RulesProfile, ShotResult
 
 
 class HuntTargetAI(AIStrategy):
     """Deterministic hunt/target AI with parity optimization."""
 
-    def __init__(self, rng: random.Random, size: int = BOARD_SIZE) -> None:
+    def __init__(
+        self, rng: random.Random, size: int | None = None, *, rules: RulesProfile = CLASSIC_RULES
+    ) -> None:
         super().__init__()
+        size = rules.board_size if size is None else size
         self._rng = rng
         self._size = size
         self._remaining: set[tuple[int, int]] = {(r, c) for r in range(size) for c in range(size)}
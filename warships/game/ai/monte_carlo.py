@@ -0,0 +1,325 @@
+"""Expert AI: Monte Carlo sampling of fleets consistent with the shots so far.
+
+Each move draws full-fleet configurations that respect the known misses, the
+unsunk hits, the sunk ships and the one-cell gap rule of ``random_fleet``, and
+fires at the unshot cell occupied in the most samples. Sampling stops at the
+per-move wall-clock budget or the sample cap, whichever comes first, and can be
+spread over a process pool. With ``budget_s=None`` the move depends only on the
+RNG and the sample cap, so play stays reproducible for replays.
+"""
+
+from __future__ import annotations
+
+import random
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from time import perf_counter
+
+from warships.game.ai.pattern_hard import PatternHardAI
+from warships.game.ai.strategy import AIStrategy
+from warships.game.core.models import CLASSIC_RULES, Coord, RulesProfile, ShotResult
+
+# (mask, halo mask, cell indices) for one ship placement; cells are row * size + col.
+type _Placement = tuple[int, int, tuple[int, ...]]
+
+# Rejection draws per free ship before falling back to scanning every placement.
+_FREE_PLACEMENT_DRAWS = 16
+
+
+@dataclass(frozen=True, slots=True)
+class _PlacementTable:
+    by_length: dict[int, tuple[_Placement, ...]]
+    by_length_cell: dict[int, tuple[tuple[_Placement, ...], ...]]
+
+
+@dataclass(frozen=True, slots=True)
+class MonteCarloSearchStats:
+    """Cumulative sampling totals across moves."""
+
+    moves: int = 0
+    samples: int = 0
+    attempts: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def samples_per_second(self) -> float:
+        return self.samples / self.elapsed_s if self.elapsed_s > 0.0 else 0.0
+
+
+class MonteCarloAI(AIStrategy):
+    """Fleet-sampling AI that trades CPU time per move for strength."""
+
+    def __init__(
+        self,
+        rng: random.Random,
+        size: int | None = None,
+        *,
+        rules: RulesProfile = CLASSIC_RULES,
+        budget_s: float | None = 0.05,
+        max_samples: int = 4000,
+        workers: int = 0,
+    ) -> None:
+        super().__init__()
+        size = rules.board_size if size is None else size
+        self._rng = rng
+        self._size = size
+        self._budget_s = budget_s
+        self._max_samples = max(1, int(max_samples))
+        self._workers = max(0, int(workers))
+        self._executor: Executor | None = None
+        self._full = (1 << (size * size)) - 1
+        self._shot = 0
+        self._misses = 0
+        self._hits = 0
+        self._sunk_halo = 0
+        self._remaining_ship_lengths: list[int] = sorted(rules.ship_lengths, reverse=True)
+        self._stats = MonteCarloSearchStats()
+        # Used when no consistent fleet can be drawn (e.g. inconsistent results).
+        self._fallback = PatternHardAI(rng, size, rules=rules)
+
+    @property
+    def stats(self) -> MonteCarloSearchStats:
+        return self._stats
+
+    def choose_shot(self) -> Coord:
+        unknown = self._full & ~self._shot
+        seed = self._rng.getrandbits(64)
+        started = perf_counter()
+        counts, samples, attempts = self._sample(unknown, seed)
+        self._stats = MonteCarloSearchStats(
+            moves=self._stats.moves + 1,
+            samples=self._stats.samples + samples,
+            attempts=self._stats.attempts + attempts,
+            elapsed_s=self._stats.elapsed_s + (perf_counter() - started),
+        )
+        if not samples:
+            return self._fallback.choose_shot()
+        best_count = -1
+        best: list[int] = []
+        for index, count in enumerate(counts):
+            if not (unknown >> index) & 1:
+                continue
+            if count > best_count:
+                best_count = count
+                best = [index]
+            elif count == best_count:
+                best.append(index)
+        row, col = divmod(self._rng.choice(best), self._size)
+        return Coord(row=row, col=col)
+
+    def notify_result(self, coord: Coord, result: ShotResult) -> None:
+        self._fallback.notify_result(coord, result)
+        if not (0 <= coord.row < self._size and 0 <= coord.col < self._size):
+            return
+        bit = 1 << (coord.row * self._size + coord.col)
+        self._shot |= bit
+        if result is ShotResult.MISS:
+            self._misses |= bit
+        elif result is ShotResult.HIT:
+            self._hits |= bit
+        elif result is ShotResult.SUNK:
+            ship = self._connected_hits(self._hits | bit, bit)
+            self._hits &= ~ship
+            self._sunk_halo |= _halo(ship, self._size)
+            self._consume_ship_length(ship.bit_count())
+
+    def __getstate__(self) -> dict[str, object]:
+        # The worker pool cannot be pickled; a restored copy starts its own on demand.
+        state = dict(self.__dict__)
+        state["_executor"] = None
+        return state
+
+    def close(self) -> None:
+        """Shut down the sampling worker pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _sample(self, unknown: int, seed: int) -> tuple[list[int], int, int]:
+        args = (
+            self._size,
+            tuple(self._remaining_ship_lengths),
+            self._misses | self._sunk_halo,
+            self._hits,
+            unknown,
+        )
+        if self._workers <= 1:
+            return _sample_fleets(*args, seed, self._budget_s, self._max_samples)
+        executor = self._executor
+        if executor is None:
+            executor = ProcessPoolExecutor(max_workers=self._workers)
+            self._executor = executor
+            weakref.finalize(self, executor.shutdown, wait=False, cancel_futures=True)
+        share = -(-self._max_samples // self._workers)
+        futures = [
+            executor.submit(_sample_fleets, *args, seed + worker, self._budget_s, share)
+            for worker in range(self._workers)
+        ]
+        counts = [0] * (self._size * self._size)
+        samples = 0
+        attempts = 0
+        for future in futures:
+            part_counts, part_samples, part_attempts = future.result()
+            for index, count in enumerate(part_counts):
+                counts[index] += count
+            samples += part_samples
+            attempts += part_attempts
+        return counts, samples, attempts
+
+    def _connected_hits(self, hits: int, start: int) -> int:
+        size = self._size
+        component = start
+        frontier = start
+        while frontier:
+            bit = frontier & -frontier
+            frontier ^= bit
+            row, col = divmod(bit.bit_length() - 1, size)
+            for rr, cc in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+                if 0 <= rr < size and 0 <= cc < size:
+                    neighbor = 1 << (rr * size + cc)
+                    if hits & neighbor and not component & neighbor:
+                        component |= neighbor
+                        frontier |= neighbor
+        return component
+
+    def _consume_ship_length(self, length: int) -> None:
+        if length in self._remaining_ship_lengths:
+            self._remaining_ship_lengths.remove(length)
+            return
+        if not self._remaining_ship_lengths:
+            return
+        # Defensive fallback if hit tracking drifted: remove closest size.
+        closest = min(self._remaining_ship_lengths, key=lambda s: abs(s - length))
+        self._remaining_ship_lengths.remove(closest)
+
+
+def _sample_fleets(
+    size: int,
+    lengths: tuple[int, ...],
+    blocked: int,
+    hits: int,
+    unknown: int,
+    seed: int,
+    budget_s: float | None,
+    max_samples: int,
+) -> tuple[list[int], int, int]:
+    """Draw consistent fleets; return per-cell occupancy counts, accepted and attempted."""
+    rng = random.Random(seed)
+    table = _placement_table(size, frozenset(lengths))
+    counts = [0] * (size * size)
+    deadline = None if budget_s is None else perf_counter() + budget_s
+    samples = 0
+    attempts = 0
+    # Bound rejection work when the constraints admit (almost) no fleet.
+    max_attempts = max_samples * 50
+    while samples < max_samples and attempts < max_attempts:
+        # Checking the clock every few draws keeps its cost out of the loop.
+        if deadline is not None and attempts & 15 == 0 and perf_counter() >= deadline:
+            break
+        attempts += 1
+        fleet = _draw_fleet(rng, table, lengths, blocked, hits, unknown, size)
+        if fleet is None:
+            continue
+        samples += 1
+        for _mask, _halo_mask, cells in fleet:
+            for index in cells:
+                counts[index] += 1
+    return counts, samples, attempts
+
+
+def _draw_fleet(
+    rng: random.Random,
+    table: _PlacementTable,
+    lengths: tuple[int, ...],
+    blocked: int,
+    hits: int,
+    unknown: int,
+    size: int,
+) -> list[_Placement] | None:
+    pending = list(lengths)
+    taken = blocked
+    uncovered = hits
+    fleet: list[_Placement] = []
+    # Cover every unsunk hit first so rejection only happens on real conflicts.
+    while uncovered:
+        target = (uncovered & -uncovered).bit_length() - 1
+        options: list[tuple[int, _Placement]] = []
+        for length in set(pending):
+            for placement in table.by_length_cell[length][target]:
+                # A ship still afloat has at least one unshot cell.
+                if not placement[0] & taken and placement[0] & unknown:
+                    options.append((length, placement))
+        if not options:
+            return None
+        length, placement = rng.choice(options)
+        pending.remove(length)
+        taken |= placement[1]
+        uncovered &= ~placement[0]
+        if uncovered & placement[1]:
+            # A remaining hit touches this ship but is not part of it.
+            return None
+        fleet.append(placement)
+    taken |= hits
+    for length in pending:
+        candidates = table.by_length[length]
+        # Uniform draws that skip taken placements are uniform over the free ones, and
+        # on open boards one of the first few draws fits; scan only when they all miss.
+        for _ in range(_FREE_PLACEMENT_DRAWS):
+            placement = rng.choice(candidates)
+            if not placement[0] & taken:
+                break
+        else:
+            options_free = [p for p in candidates if not p[0] & taken]
+            if not options_free:
+                return None
+            placement = rng.choice(options_free)
+        taken |= placement[1]
+        fleet.append(placement)
+    return fleet
+
+
+@lru_cache(maxsize=8)
+def _placement_table(size: int, lengths: frozenset[int]) -> _PlacementTable:
+    by_length: dict[int, tuple[_Placement, ...]] = {}
+    by_length_cell: dict[int, tuple[tuple[_Placement, ...], ...]] = {}
+    for length in lengths:
+        placements: list[_Placement] = []
+        for row in range(size):
+            for col in range(size - length + 1):
+                placements.append(_placement([row * size + col + i for i in range(length)], size))
+        if length > 1:
+            for row in range(size - length + 1):
+                for col in range(size):
+                    placements.append(
+                        _placement([(row + i) * size + col for i in range(length)], size)
+                    )
+        per_cell: list[list[_Placement]] = [[] for _ in range(size * size)]
+        for placement in placements:
+            for index in placement[2]:
+                per_cell[index].append(placement)
+        by_length[length] = tuple(placements)
+        by_length_cell[length] = tuple(tuple(cell) for cell in per_cell)
+    return _PlacementTable(by_length=by_length, by_length_cell=by_length_cell)
+
+
+def _placement(cells: list[int], size: int) -> _Placement:
+    mask = 0
+    for index in cells:
+        mask |= 1 << index
+    return (mask, _halo(mask, size), tuple(cells))
+
+
+def _halo(mask: int, size: int) -> int:
+    """Return ``mask`` plus its 8-neighbourhood, clipped to the board."""
+    halo = 0
+    remaining = mask
+    while remaining:
+        bit = remaining & -remaining
+        remaining ^= bit
+        row, col = divmod(bit.bit_length() - 1, size)
+        for rr in range(max(0, row - 1), min(size, row + 2)):
+            for cc in range(max(0, col - 1), min(size, col + 2)):
+                halo |= 1 << (rr * size + cc)
+    return halo
@@ -1,12 +1,20 @@
-"""Hard AI: hunt by ship-pattern probabilities, then finish ships deterministically."""
+"""Hard AI: hunt by ship-pattern probabilities, then finish ships deterministically.
+
+A placement stays legal until one of its cells is shot, so the per-length
+placement counts are cached and only the placements covering the shot cell are
+retired in ``notify_result``; scoring then reduces to a few vector adds.
+"""
 
 from __future__ import annotations
 
 import random
 from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
 
 from warships.game.ai.strategy import AIStrategy
-from warships.game.core.models import BOARD_SIZE, Coord, ShotResult
+from warships.game.core.models import CLASSIC_RULES, Coord, RulesProfile, ShotResult
 
 
 @dataclass(slots=True)
@@ -15,18 +23,50 @@ class _HitCluster:
     last_updated: int
 
 
+@dataclass(frozen=True, slots=True)
+class _PlacementTable:
+    # Cell indices (row * size + col) per placement, in hunt enumeration order.
+    placements: tuple[tuple[int, ...], ...]
+    # Per cell: (placement id, offset of the cell in that placement), ascending ids.
+    cover: tuple[tuple[tuple[int, int], ...], ...]
+    cover_ids: tuple[np.ndarray, ...]
+    # One row per placement, one column per cell; column sums are the initial counts.
+    occupancy: np.ndarray
+
+
+@dataclass(slots=True)
+class _PlacementCounts:
+    table: _PlacementTable
+    alive: np.ndarray
+    counts: np.ndarray
+    total: int = 0
+
+
 class PatternHardAI(AIStrategy):
     """Strong AI that aggressively converts hits into sinks."""
 
-    def __init__(self, rng: random.Random, size: int = BOARD_SIZE) -> None:
+    def __init__(
+        self, rng: random.Random, size: int | None = None, *, rules: RulesProfile = CLASSIC_RULES
+    ) -> None:
         super().__init__()
+        size = rules.board_size if size is None else size
         self._rng = rng
         self._size = size
         self._remaining: set[tuple[int, int]] = {(r, c) for r in range(size) for c in range(size)}
         self._misses: set[tuple[int, int]] = set()
-        self._remaining_ship_lengths: list[int] = [5, 4, 3, 3, 2]
+        self._remaining_ship_lengths: list[int] = sorted(rules.ship_lengths, reverse=True)
         self._active_clusters: list[_HitCluster] = []
         self._shot_index = 0
+        self._placement_counts: dict[int, _PlacementCounts] = {}
+        self._scores: np.ndarray | None = None
+        for ship_len in set(self._remaining_ship_lengths):
+            table = _placement_table(size, ship_len)
+            self._placement_counts[ship_len] = _PlacementCounts(
+                table=table,
+                alive=np.ones(len(table.placements), dtype=np.bool_),
+                counts=table.occupancy.sum(axis=0),
+                total=len(table.placements),
+            )
 
     def choose_shot(self) -> Coord:
         if self._active_clusters:
@@ -41,8 +81,11 @@ class PatternHardAI(AIStrategy):
 
     def notify_result(self, coord: Coord, result: ShotResult) -> None:
         self._shot_index += 1
+        self._scores = None
         key = (coord.row, coord.col)
-        self._remaining.discard(key)
+        if key in self._remaining:
+            self._remaining.remove(key)
+            self._retire_placements(coord.row * self._size + coord.col)
 
         if result is ShotResult.MISS:
             self._misses.add(key)
@@ -106,12 +149,13 @@ class PatternHardAI(AIStrategy):
 
     def _choose_hunt_shot(self) -> Coord:
         scores = self._hunt_scores()
-        if not scores:
+        best_score = float(scores.max())
+        if best_score <= 0.0:
             row, col = self._rng.choice(list(self._remaining))
             return Coord(row=row, col=col)
 
-        best_score = max(scores.values())
-        best = [Coord(r, c) for (r, c), score in scores.items() if score == best_score]
+        indices = sorted(np.flatnonzero(scores == best_score).tolist(), key=self._hunt_rank)
+        best = [Coord(*divmod(index, self._size)) for index in indices]
         # Prefer parity while no ship of size 1 exists.
         if self._remaining_ship_lengths and min(self._remaining_ship_lengths) > 1:
             parity = [coord for coord in best if (coord.row + coord.col) % 2 == 0]
@@ -119,44 +163,50 @@ class PatternHardAI(AIStrategy):
                 best = parity
         return self._rng.choice(best)
 
-    def _hunt_scores(self) -> dict[tuple[int, int], float]:
-        scores: dict[tuple[int, int], float] = {}
+    def _hunt_scores(self) -> np.ndarray:
+        """Weighted placement density per cell index.
+
+        Each legal placement adds ``ship_len * scarcity`` to its cells. The
+        weight is added once per covering placement, not multiplied by the
+        count, so scores round exactly like the per-placement sum and ties
+        resolve the same way.
+        """
+        if self._scores is not None:
+            return self._scores
+        scores = np.zeros(self._size * self._size, dtype=np.float64)
         for ship_len in self._remaining_ship_lengths:
-            self._accumulate_scores_for_length(ship_len, scores)
+            cache = self._placement_counts.get(ship_len)
+            if cache is None or not cache.total:
+                continue
+            # Scarce placements get amplified so late-game search locks onto legal gaps.
+            scarcity_weight = (self._size * self._size) / cache.total
+            placement_weight = ship_len * scarcity_weight
+            counts = cache.counts
+            for depth in range(1, int(counts.max()) + 1):
+                np.add(scores, placement_weight, out=scores, where=counts >= depth)
+        self._scores = scores
         return scores
 
-    def _accumulate_scores_for_length(
-        self, ship_len: int, scores: dict[tuple[int, int], float]
-    ) -> None:
-        placements: list[list[tuple[int, int]]] = []
-        for row in range(self._size):
-            for col in range(self._size - ship_len + 1):
-                cells = [(row, col + i) for i in range(ship_len)]
-                if self._is_valid_placement(cells):
-                    placements.append(cells)
-
-        for row in range(self._size - ship_len + 1):
-            for col in range(self._size):
-                cells = [(row + i, col) for i in range(ship_len)]
-                if self._is_valid_placement(cells):
-                    placements.append(cells)
-
-        if not placements:
-            return
-        # Scarce placements get amplified so late-game search locks onto legal gaps.
-        scarcity_weight = (self._size * self._size) / len(placements)
-        placement_weight = ship_len * scarcity_weight
-        for cells in placements:
-            for cell in cells:
-                scores[cell] = scores.get(cell, 0.0) + placement_weight
-
-    def _is_valid_placement(self, cells: list[tuple[int, int]]) -> bool:
-        for cell in cells:
-            if cell in self._misses:
-                return False
-            if cell not in self._remaining:
-                return False
-        return True
+    def _hunt_rank(self, index: int) -> tuple[int, int, int]:
+        """Order tied cells by first legal placement, matching the enumeration order."""
+        for position, ship_len in enumerate(self._remaining_ship_lengths):
+            cache = self._placement_counts.get(ship_len)
+            if cache is None or not cache.counts[index]:
+                continue
+            for placement_id, offset in cache.table.cover[index]:
+                if cache.alive[placement_id]:
+                    return (position, placement_id, offset)
+        return (len(self._remaining_ship_lengths), 0, 0)
+
+    def _retire_placements(self, index: int) -> None:
+        for cache in self._placement_counts.values():
+            ids = cache.table.cover_ids[index]
+            ids = ids[cache.alive[ids]]
+            if not ids.size:
+                continue
+            cache.alive[ids] = False
+            cache.counts -= cache.table.occupancy[ids].sum(axis=0)
+            cache.total -= int(ids.size)
 
     def _record_hit(self, hit: tuple[int, int]) -> _HitCluster:
         touching = [
@@ -216,7 +266,34 @@ class PatternHardAI(AIStrategy):
     def _pick_best(self, coords: list[Coord]) -> Coord:
         if len(coords) == 1:
             return coords[0]
-        score_map = self._hunt_scores()
-        best_score = max(score_map.get((c.row, c.col), 0) for c in coords)
-        best = [c for c in coords if score_map.get((c.row, c.col), 0) == best_score]
+        scores = self._hunt_scores()
+        values = [scores[c.row * self._size + c.col] for c in coords]
+        best_score = max(values)
+        best = [c for c, value in zip(coords, values, strict=True) if value == best_score]
         return self._rng.choice(best)
+
+
+@lru_cache(maxsize=16)
+def _placement_table(size: int, ship_len: int) -> _PlacementTable:
+    placements: list[tuple[int, ...]] = []
+    for row in range(size):
+        for col in range(size - ship_len + 1):
+            placements.append(tuple(row * size + col + i for i in range(ship_len)))
+    for row in range(size - ship_len + 1):
+        for col in range(size):
+            placements.append(tuple((row + i) * size + col for i in range(ship_len)))
+    cover: list[list[tuple[int, int]]] = [[] for _ in range(size * size)]
+    occupancy = np.zeros((len(placements), size * size), dtype=np.int32)
+    for placement_id, cells in enumerate(placements):
+        occupancy[placement_id, list(cells)] = 1
+        for offset, index in enumerate(cells):
+            cover[index].append((placement_id, offset))
+    return _PlacementTable(
+        placements=tuple(placements),
+        cover=tuple(tuple(cells) for cells in cover),
+        cover_ids=tuple(
+            np.array([placement_id for placement_id, _ in cells], dtype=np.intp)
+            for cells in cover
+        ),
+        occupancy=occupancy,
+    )
@@ -5,20 +5,23 @@ from __future__ import annotations
 import random
 
 from warships.game.ai.strategy import AIStrategy
-from warships.game.core.models import BOARD_SIZE, Coord, ShotResult
+from warships.game.core.models import CLASSIC_RULES, Coord, RulesProfile, ShotResult
 
 
 class ProbabilityTargetAI(AIStrategy):
     """Hard AI that scores cells from all valid ship placements."""
 
-    def __init__(self, rng: random.Random, size: int = BOARD_SIZE) -> None:
+    def __init__(
+        self, rng: random.Random, size: int | None = None, *, rules: RulesProfile = CLASSIC_RULES
+    ) -> None:
         super().__init__()
+        size = rules.board_size if size is None else size
         self._rng = rng
         self._size = size
         self._remaining: set[tuple[int, int]] = {(r, c) for r in range(size) for c in range(size)}
         self._misses: set[tuple[int, int]] = set()
         self._active_hits: list[Coord] = []
-        self._remaining_ship_lengths: list[int] = [5, 4, 3, 3, 2]
+        self._remaining_ship_lengths: list[int] = sorted(rules.ship_lengths, reverse=True)
 
     def choose_shot(self) -> Coord:
         required_hits = set((c.row, c.col) for c in self._active_hits)
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 from engine.api.ai import Agent, Blackboard, DecisionContext, create_blackboard
+from warships.game.core.board import BoardState
 from warships.game.core.models import Coord, ShotResult
 
 
@@ -23,9 +26,14 @@ class AIStrategy(Agent, ABC):
 
     def decide(self, context: DecisionContext) -> str:
         """Expose strategy through the generic engine Agent contract."""
-        context.blackboard.set(self._NEXT_SHOT_KEY, self.choose_shot())
+        self.put_decided_shot(context.blackboard, self.choose_shot())
         return self.ACTION_FIRE
 
+    @classmethod
+    def put_decided_shot(cls, blackboard: Blackboard, shot: Coord) -> None:
+        """Publish the pending shot for ``take_decided_shot``."""
+        blackboard.set(cls._NEXT_SHOT_KEY, shot)
+
     @classmethod
     def take_decided_shot(cls, blackboard: Blackboard) -> Coord:
         """Read and clear the pending shot from blackboard."""
@@ -41,3 +49,30 @@ class AIStrategy(Agent, ABC):
     @abstractmethod
     def notify_result(self, coord: Coord, result: ShotResult) -> None:
         """Update strategy state with shot result."""
+
+
+def fallback_shot(board: BoardState) -> Coord:
+    """Cheap deterministic shot: extend an unsunk hit, else hunt on a checkerboard."""
+    shots = board.shots
+    size = board.size
+    # Sinks are announced, so hits on sunk ships are not worth extending.
+    sunk = {
+        (cell.row, cell.col)
+        for ship_id, remaining in board.ship_remaining.items()
+        if remaining == 0
+        for cell in board.ship_cells[ship_id]
+    }
+    for row, col in np.argwhere(shots == 2).tolist():
+        if (row, col) in sunk:
+            continue
+        for rr, cc in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if 0 <= rr < size and 0 <= cc < size and shots[rr, cc] == 0:
+                return Coord(row=rr, col=cc)
+    unshot = np.argwhere(shots == 0).tolist()
+    if not unshot:
+        raise ValueError("no unshot cells left")
+    for row, col in unshot:
+        if (row + col) % 2 == 0:
+            return Coord(row=row, col=col)
+    row, col = unshot[0]
+    return Coord(row=row, col=col)
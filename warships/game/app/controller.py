@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import base64
 import logging
+import pickle
 import random
+from dataclasses import fields
 
+from engine.api.ai import AsyncAgentRunner
+from engine.api.debug import StateHasher
 from engine.api.interaction_modes import create_interaction_mode_machine
 from warships.game.app.controller_state import ControllerState
 from warships.game.app.events import (
@@ -17,7 +22,12 @@ from warships.game.app.events import (
 )
 from warships.game.app.ports.runtime_primitives import GridLayout
 from warships.game.app.ports.runtime_services import apply_wheel_scroll, create_action_dispatcher
-from warships.game.app.services.battle import resolve_player_turn, start_game
+from warships.game.app.services.battle import (
+    AsyncAITurns,
+    PlayerTurnResult,
+    resolve_player_turn,
+    start_game,
+)
 from warships.game.app.services.controller_support import ControllerSupport
 from warships.game.app.services.input_policy import (
     can_handle_key_for_placement,
@@ -51,9 +61,9 @@ from warships.game.app.services.transition_orchestration import apply_transition
 from warships.game.app.state_machine import AppState
 from warships.game.app.ui_state import AppUIState
 from warships.game.core.fleet import random_fleet
-from warships.game.core.models import FleetPlacement, ShipPlacement, ShipType
+from warships.game.core.models import FleetPlacement, RulesProfile, ShipPlacement, ShipType
 from warships.game.presets.service import PresetService
-from warships.game.ui.layout_metrics import NEW_GAME_SETUP, PRESET_PANEL
+from warships.game.ui.layout_metrics import NEW_GAME_SETUP, PRESET_PANEL, grid_layout_for_board
 
 _SHIP_ORDER = [
     ShipType.CARRIER,
@@ -64,7 +74,6 @@ _SHIP_ORDER = [
 ]
 
 logger = logging.getLogger(__name__)
-_GRID_LAYOUT = GridLayout()
 _NEW_GAME_VISIBLE_PRESET_ROWS = NEW_GAME_SETUP.visible_row_capacity()
 _PRESET_MANAGE_VISIBLE_ROWS = PRESET_PANEL.visible_row_capacity()
 
@@ -73,10 +82,26 @@ class GameController:
     """Handles app events and owns editor state."""
 
     def __init__(
-        self, preset_service: PresetService, rng: random.Random, debug_ui: bool = False
+        self,
+        preset_service: PresetService,
+        rng: random.Random,
+        debug_ui: bool = False,
+        *,
+        ai_runner: AsyncAgentRunner | None = None,
+        ai_deadline_s: float = 0.5,
     ) -> None:
         self._preset_service = preset_service
         self._rng = rng
+        # Board size and fleet follow the preset service so saved presets always match.
+        self._rules = preset_service.rules
+        self._layout = grid_layout_for_board(GridLayout(), self._rules.board_size)
+        # The editor has one slot per ShipType, so fleets that repeat a type cannot be edited.
+        self._presets_editable = len(set(self._rules.fleet)) == len(self._rules.fleet)
+        # Without a runner AI turns resolve synchronously inside the click.
+        self._ai_runner = ai_runner
+        self._ai_turns = (
+            None if ai_runner is None else AsyncAITurns(ai_runner, deadline_s=ai_deadline_s)
+        )
 
         self._state_data = ControllerState(
             placements_by_type={ship_type: None for ship_type in _SHIP_ORDER},
@@ -88,6 +113,7 @@ class GameController:
             preset_manage_visible_rows=_PRESET_MANAGE_VISIBLE_ROWS,
             logger=logger,
             debug_ui=debug_ui,
+            presets_editable=self._presets_editable,
         )
         self._button_dispatcher = create_action_dispatcher(
             direct_handlers={
@@ -122,6 +148,11 @@ class GameController:
         self._refresh_buttons()
         self._announce_state()
 
+    @property
+    def rules(self) -> RulesProfile:
+        """Board size and fleet this controller plays with."""
+        return self._rules
+
     def ui_state(self) -> AppUIState:
         """Return current view-ready state."""
         return build_ui_state(
@@ -170,6 +201,8 @@ class GameController:
         return self._apply_session_transition("to_new_game_setup")
 
     def _on_create_preset(self) -> bool:
+        if not self._presets_editable:
+            return self._reject_preset_editing()
         return self._apply_session_transition("to_create_preset")
 
     def _on_back_main(self) -> bool:
@@ -193,7 +226,7 @@ class GameController:
         return True
 
     def _on_new_game_randomize(self) -> bool:
-        selection = NewGameFlowService.randomize_selection(self._rng)
+        selection = NewGameFlowService.randomize_selection(self._rng, rules=self._rules)
         self._apply_new_game_selection_state(
             selected_preset=selection.selected_preset,
             random_fleet=selection.random_fleet,
@@ -252,8 +285,13 @@ class GameController:
             return False
         if not event.is_ai_board:
             return False
+        if self._ai_turns is not None and self._ai_turns.pending:
+            return False
         turn = resolve_player_turn(
-            self._state_data.session, self._state_data.ai_strategy, event.coord
+            self._state_data.session,
+            self._state_data.ai_strategy,
+            event.coord,
+            ai_turns=self._ai_turns,
         )
         apply_battle_turn_outcome(
             turn,
@@ -262,6 +300,48 @@ class GameController:
         )
         return True
 
+    @property
+    def ai_turn_pending(self) -> bool:
+        """Whether an off-thread AI turn is still waiting to be applied."""
+        return self._ai_turns is not None and self._ai_turns.pending
+
+    def poll_ai_turn(self, *, tick: int = 0) -> bool:
+        """Apply a finished off-thread AI turn; return whether state changed."""
+        ai_turns = self._ai_turns
+        if ai_turns is None:
+            return False
+        state = self._state_data
+        if state.app_state is not AppState.BATTLE or state.session is None:
+            ai_turns.cancel()
+            return False
+        if state.ai_strategy is None:
+            return False
+        result = ai_turns.poll(state.session, state.ai_strategy, tick=tick)
+        if result is None:
+            return False
+        apply_battle_turn_outcome(
+            PlayerTurnResult(
+                shot_result=result,
+                status=str(state.session.last_message),
+                winner=state.session.winner,
+            ),
+            state=state,
+            refresh_buttons=self._refresh_buttons,
+        )
+        return True
+
+    def bind_ai_diagnostics(self, hub: object | None) -> None:
+        """Route off-thread AI decision overruns to the host diagnostics hub."""
+        if self._ai_turns is not None:
+            self._ai_turns.bind_diagnostics(hub)
+
+    def shutdown_ai(self) -> None:
+        """Stop the off-thread AI runner, dropping any in-flight decision."""
+        if self._ai_turns is not None:
+            self._ai_turns.cancel()
+        if self._ai_runner is not None:
+            self._ai_runner.close()
+
     def handle_pointer_move(self, event: PointerMoved) -> bool:
         """Update hover cell while dragging in editor."""
         self._sync_interaction_mode()
@@ -272,7 +352,7 @@ class GameController:
         self._state_data.hover_x = event.x
         self._state_data.hover_y = event.y
         self._state_data.hover_cell = PlacementEditorService.to_primary_grid_cell(
-            _GRID_LAYOUT, event.x, event.y
+            self._layout, event.x, event.y
         )
         self._state_data.placement_popup_message = None
         self._state_data.held_preview_valid = True
@@ -295,7 +375,7 @@ class GameController:
                 self._state_data.held_orientation,
             )
             is_valid, reason = PlacementEditorService.can_place_with_reason(
-                self._state_data.placements_by_type, candidate
+                self._state_data.placements_by_type, candidate, self._rules.board_size
             )
             self._state_data.held_preview_valid = is_valid
             self._state_data.held_preview_reason = reason or None
@@ -311,7 +391,7 @@ class GameController:
         outcome = PlacementFlowService.on_pointer_release(
             placements_by_type=self._state_data.placements_by_type,
             held_state=self._held_state(),
-            layout=_GRID_LAYOUT,
+            layout=self._layout,
             x=event.x,
             y=event.y,
         )
@@ -446,7 +526,7 @@ class GameController:
             outcome = PlacementFlowService.on_right_pointer_down(
                 placements_by_type=self._state_data.placements_by_type,
                 held_state=self._held_state(),
-                layout=_GRID_LAYOUT,
+                layout=self._layout,
                 x=x,
                 y=y,
             )
@@ -464,7 +544,7 @@ class GameController:
             ship_order=_SHIP_ORDER,
             placements_by_type=self._state_data.placements_by_type,
             held_state=self._held_state(),
-            layout=_GRID_LAYOUT,
+            layout=self._layout,
             x=x,
             y=y,
         )
@@ -513,7 +593,13 @@ class GameController:
             self._sync_interaction_mode()
         return handled
 
+    def _reject_preset_editing(self) -> bool:
+        self._set_status(f"Presets cannot be edited under the {self._rules.name} rules profile.")
+        return True
+
     def _edit_preset(self, name: str) -> bool:
+        if not self._presets_editable:
+            return self._reject_preset_editing()
         result = PresetFlowService.load_preset_for_edit(self._preset_service, name)
         return apply_edit_preset_result(
             result,
@@ -554,12 +640,103 @@ class GameController:
 
     def _randomize_editor(self) -> bool:
         self._reset_editor()
-        for placement in random_fleet(self._rng).ships:
+        # The editor holds one ship per type, so it lays out the classic fleet.
+        for placement in random_fleet(self._rng, self._rules.board_size).ships:
             self._state_data.placements_by_type[placement.ship_type] = placement
         self._state_data.status = "Placement randomized."
         self._refresh_buttons()
         return True
 
+    def debug_state_digest(self, hasher: StateHasher) -> str:
+        """Fold controller, board and RNG sections into ``hasher`` for replay marks."""
+        state = self._state_data
+        controller_digest = hasher.update(
+            "controller", version=None, build=self._debug_controller_section
+        )
+        activity: tuple[object, ...] = (controller_digest,)
+        session = state.session
+        if session is None:
+            for name in ("session", "board.player", "board.ai"):
+                hasher.discard(name)
+        else:
+            hasher.update(
+                "session",
+                version=None,
+                build=lambda: {
+                    "turn": session.turn.value,
+                    "winner": session.winner.value if session.winner is not None else None,
+                    "history": len(session.history),
+                },
+            )
+            boards = (("board.player", session.player_board), ("board.ai", session.ai_board))
+            for name, board in boards:
+                hasher.update(name, version=board.version, build=lambda b=board: (b.ships, b.shots))
+            activity += (session.player_board.version, session.ai_board.version)
+        # RNG draws only happen inside actions that also change the controller or a
+        # board, so those sections key the (comparatively expensive) RNG snapshot.
+        hasher.update("rng", version=activity, build=self._rng.getstate)
+        return hasher.digest()
+
+    def debug_state_checkpoint(self, hasher: StateHasher) -> dict[str, object]:
+        """JSON-ready replay checkpoint: digest, readable summary and a restorable snapshot."""
+        state = self._state_data
+        session = state.session
+        # The controller state and its RNG are pickled together so the AI strategy
+        # keeps sharing the restored RNG. Only restore checkpoints you recorded.
+        snapshot = pickle.dumps((state, self._rng), protocol=pickle.HIGHEST_PROTOCOL)
+        checkpoint: dict[str, object] = {
+            "state_hash": self.debug_state_digest(hasher),
+            "app_state": state.app_state.name,
+            "status": state.status,
+            "session": None,
+            "snapshot": base64.b64encode(snapshot).decode("ascii"),
+        }
+        if session is not None:
+            checkpoint["session"] = {
+                "turn": session.turn.value,
+                "winner": session.winner.value if session.winner is not None else None,
+                "history": len(session.history),
+                # Shot bitsets (bit = row * size + col) locate where boards diverge.
+                "player_shots": f"{session.player_board.shot_bits:x}",
+                "ai_shots": f"{session.ai_board.shot_bits:x}",
+            }
+        return checkpoint
+
+    def debug_state_restore(self, checkpoint: dict[str, object]) -> None:
+        """Restore controller, session, AI and RNG state from ``debug_state_checkpoint``."""
+        snapshot = checkpoint.get("snapshot")
+        if not isinstance(snapshot, str):
+            raise ValueError("checkpoint has no state snapshot")
+        restored, rng = pickle.loads(base64.b64decode(snapshot))
+        if self._ai_turns is not None:
+            self._ai_turns.cancel()
+        close_strategy = getattr(self._state_data.ai_strategy, "close", None)
+        if callable(close_strategy):
+            close_strategy()
+        # Helper services hold this state object, so copy fields into it in place.
+        for item in fields(ControllerState):
+            setattr(self._state_data, item.name, getattr(restored, item.name))
+        self._rng = rng
+
+    def _debug_controller_section(self) -> dict[str, object]:
+        state = self._state_data
+        return {
+            "app_state": state.app_state.name,
+            "status": state.status,
+            "is_closing": state.is_closing,
+            "placements": {
+                ship_type.value: placement
+                for ship_type, placement in state.placements_by_type.items()
+            },
+            "held_ship_type": state.held_ship_type,
+            "held_orientation": state.held_orientation,
+            "held_grab_index": state.held_grab_index,
+            "hover_cell": state.hover_cell,
+            "difficulty_index": state.new_game_difficulty_index,
+            "selected_preset": state.new_game_selected_preset,
+            "pending_save_name": state.pending_save_name,
+        }
+
     def _current_difficulty(self) -> str:
         return NewGameFlowService.current_difficulty(self._state_data.new_game_difficulty_index)
 
@@ -598,10 +775,13 @@ class GameController:
             difficulty=self._current_difficulty(),
             selected_preset=self._state_data.new_game_selected_preset,
             random_fleet_choice=self._state_data.new_game_random_fleet,
+            rules=self._rules,
         )
         if not result.success or result.session is None or result.ai_strategy is None:
             self._set_status(result.status)
             return True
+        if self._ai_turns is not None:
+            self._ai_turns.cancel()
         self._state_data.session = result.session
         self._state_data.ai_strategy = result.ai_strategy
         self._apply_transition(
@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from typing import cast
 
 from engine.api.context import RuntimeContext, create_runtime_context
+from engine.api.debug import create_state_hasher
 from engine.api.events import Subscription, create_event_bus
 from engine.api.game_module import GameModule, HostControl, HostFrameContext
 from engine.api.gameplay import (
@@ -45,6 +46,29 @@ class _FrameworkSyncSystem(GameplaySystem):
         _ = context
 
 
+class _AITurnSystem(GameplaySystem):
+    """Apply off-thread AI turns that finished since the last frame."""
+
+    def start(self, context: RuntimeContext) -> None:
+        _ = context
+
+    def update(self, context: RuntimeContext, delta_seconds: float) -> None:
+        _ = delta_seconds
+        controller = cast(GameController, context.require("controller"))
+        frame_context = cast(HostFrameContext | None, context.get("frame_context"))
+        tick = frame_context.frame_index if frame_context is not None else 0
+        module = cast(WarshipsGameModule, context.require("engine_game_module"))
+        if controller.poll_ai_turn(tick=tick):
+            module.mark_render_dirty()
+        if controller.ai_turn_pending:
+            # On-demand render loops only draw on input; keep frames coming until the
+            # reply or its deadline fallback lands.
+            module.request_frame()
+
+    def shutdown(self, context: RuntimeContext) -> None:
+        _ = context
+
+
 class _ViewProjectionSystem(GameplaySystem):
     """Capture current UI state for frame snapshot build."""
 
@@ -127,6 +151,7 @@ class WarshipsGameModule(GameModule):
         self._frame_ui_state: object | None = None
         self._update_loop = create_update_loop()
         self._update_loop.add_system(SystemSpec("framework_sync", _FrameworkSyncSystem(), order=0))
+        self._update_loop.add_system(SystemSpec("ai_turns", _AITurnSystem(), order=5))
         self._update_loop.add_system(SystemSpec("view_projection", _ViewProjectionSystem(), order=10))
         self._update_loop.add_system(
             SystemSpec("close_lifecycle", _CloseLifecycleSystem(), order=20)
@@ -136,6 +161,7 @@ class WarshipsGameModule(GameModule):
         self._last_debug_ui: bool = bool(debug_ui)
         self._cached_render_snapshot: RenderSnapshot | None = None
         self._render_dirty: bool = True
+        self._state_hasher = create_state_hasher()
 
     def on_start(self, host: HostControl) -> None:
         self._host = host
@@ -145,6 +171,10 @@ class WarshipsGameModule(GameModule):
             self._context.provide("metrics_collector", metrics_collector)
             if hasattr(self._events, "set_metrics_collector"):
                 self._events.set_metrics_collector(metrics_collector)
+        # The update loop only reports per-system spans while a trace export is running.
+        if getattr(host, "diagnostics_trace_active", False):
+            self._context.provide("diagnostics_hub", getattr(host, "diagnostics_hub", None))
+        self._controller.bind_ai_diagnostics(getattr(host, "diagnostics_hub", None))
         self._close_subscription = self._events.subscribe(_CloseRequested, self._on_close_requested)
         self._graph.start_all(self._context)
 
@@ -190,12 +220,38 @@ class WarshipsGameModule(GameModule):
     def should_close(self) -> bool:
         return False
 
+    def mark_render_dirty(self) -> None:
+        """Rebuild the render snapshot next frame instead of reusing the cached one."""
+        self._render_dirty = True
+
+    def request_frame(self) -> None:
+        """Ask the host for another frame when it supports redraw requests."""
+        request_redraw = getattr(self._host, "request_redraw", None)
+        if callable(request_redraw):
+            request_redraw()
+
+    def debug_state_hash(self) -> str:
+        """Replay state mark; unchanged sections reuse their cached digests."""
+        return self._controller.debug_state_digest(self._state_hasher)
+
+    def debug_state_checkpoint(self) -> dict[str, object]:
+        """Replay checkpoint; the host asks for one every checkpoint-interval ticks."""
+        return self._controller.debug_state_checkpoint(self._state_hasher)
+
+    def debug_state_restore(self, checkpoint: dict[str, object]) -> None:
+        """Resume from a checkpoint recorded by ``debug_state_checkpoint``."""
+        self._controller.debug_state_restore(checkpoint)
+        # Restored boards reuse older version counters, so cached sections are stale.
+        self._state_hasher = create_state_hasher()
+        self._render_dirty = True
+
     def ui_design_resolution(self) -> tuple[float, float]:
         """Authored Warships UI design-space exposed for engine snapshot scaling."""
         return (float(DESIGN_WIDTH), float(DESIGN_HEIGHT))
 
     def on_shutdown(self) -> None:
         self._graph.shutdown_all(self._context)
+        self._controller.shutdown_ai()
         if self._host is not None and self._close_task_id is not None:
             self._host.cancel_task(self._close_task_id)
             self._close_task_id = None
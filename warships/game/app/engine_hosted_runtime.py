@@ -6,6 +6,7 @@ import os
 import random
 from pathlib import Path
 
+from engine.api.ai import AsyncAgentRunner, create_async_agent_runner
 from engine.api.hosted_runtime import HostedRuntimeConfig, run_hosted_runtime
 from engine.api.render import RenderAPI
 from engine.api.ui_framework import create_app_render_api, create_ui_framework
@@ -14,10 +15,12 @@ from warships.game.app.controller import GameController
 from warships.game.app.engine_adapter import WarshipsAppAdapter
 from warships.game.app.engine_game_module import WarshipsGameModule
 from warships.game.app.events import ButtonPressed
+from warships.game.core.models import CLASSIC_RULES, RulesProfile, rules_profile
 from warships.game.infra.app_data import resolve_presets_dir
 from warships.game.presets.repository import PresetRepository
 from warships.game.presets.service import PresetService
 from warships.game.ui.game_view import GameView
+from warships.game.ui.layout_metrics import grid_layout_for_board
 
 
 def run_engine_hosted_app() -> None:
@@ -37,12 +40,56 @@ def run_engine_hosted_app() -> None:
     )
 
 
+def _build_ai_runner() -> AsyncAgentRunner | None:
+    """AI turns run on a worker thread unless WARSHIPS_AI_ASYNC=0 or the run is replayable.
+
+    Async turns trade determinism for a responsive frame: the wall-clock deadline
+    picks between the strategy's shot and the fallback, and thread timing picks the
+    frame the shot lands on. Replay capture and headless fast-forward need every
+    run of the same input to match, so they decide synchronously instead.
+    """
+    if os.getenv("WARSHIPS_AI_ASYNC", "1").strip() == "0" or _replayable_run():
+        return None
+    return create_async_agent_runner(max_workers=1)
+
+
+def _replayable_run() -> bool:
+    return any(
+        os.getenv(name, "0").strip().lower() in {"1", "true", "yes", "on"}
+        for name in ("ENGINE_DIAGNOSTICS_REPLAY_ENABLED", "ENGINE_HEADLESS_FAST_FORWARD")
+    )
+
+
+def _ai_deadline_seconds() -> float:
+    raw = os.getenv("WARSHIPS_AI_DEADLINE_MS", "").strip()
+    try:
+        value = float(raw) if raw else 500.0
+    except ValueError:
+        value = 500.0
+    return max(1.0, value) / 1000.0
+
+
+def _rules_profile() -> RulesProfile:
+    """Board size and fleet from WARSHIPS_RULES_PROFILE; unknown names play classic."""
+    name = os.getenv("WARSHIPS_RULES_PROFILE", "").strip().lower()
+    try:
+        return rules_profile(name) if name else CLASSIC_RULES
+    except ValueError:
+        return CLASSIC_RULES
+
+
 def _build_controller() -> GameController:
     configured_presets = os.getenv("WARSHIPS_PRESETS_DIR", "").strip()
     preset_root = Path(configured_presets) if configured_presets else resolve_presets_dir()
-    preset_service = PresetService(PresetRepository(preset_root))
+    preset_service = PresetService(PresetRepository(preset_root), rules=_rules_profile())
     debug_ui = os.getenv("WARSHIPS_DEBUG_UI", "0") == "1"
-    controller = GameController(preset_service=preset_service, rng=random.Random(), debug_ui=debug_ui)
+    controller = GameController(
+        preset_service=preset_service,
+        rng=random.Random(),
+        debug_ui=debug_ui,
+        ai_runner=_build_ai_runner(),
+        ai_deadline_s=_ai_deadline_seconds(),
+    )
     _apply_startup_screen_override(controller)
     return controller
 
@@ -53,9 +100,14 @@ def _build_module(
     layout: GridLayout,
     debug_ui: bool,
 ) -> WarshipsGameModule:
+    layout = grid_layout_for_board(layout, controller.rules.board_size)
     app = WarshipsAppAdapter(controller)
     app_renderer = create_app_render_api(app=app, renderer=renderer)
-    view = GameView(app_renderer, layout)
+    view = GameView(
+        app_renderer,
+        layout,
+        columnar_rects=os.getenv("WARSHIPS_COLUMNAR_RECTS", "0") == "1",
+    )
     framework = create_ui_framework(app=app, renderer=renderer, layout=layout)
     return WarshipsGameModule(
         controller=controller,
@@ -5,15 +5,34 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass
 
-from engine.api.ai import DecisionContext, best_action
+from engine.api.ai import (
+    AsyncAgentRunner,
+    AsyncDecision,
+    DecisionContext,
+    best_action,
+    create_functional_agent,
+)
 from warships.game.ai.hunt_target import HuntTargetAI
+from warships.game.ai.monte_carlo import MonteCarloAI
 from warships.game.ai.pattern_hard import PatternHardAI
-from warships.game.ai.strategy import AIStrategy
+from warships.game.ai.strategy import AIStrategy, fallback_shot
 from warships.game.core.fleet import random_fleet
-from warships.game.core.models import Coord, FleetPlacement, ShotResult, Turn
+from warships.game.core.models import (
+    CLASSIC_RULES,
+    Coord,
+    FleetPlacement,
+    RulesProfile,
+    ShotResult,
+    Turn,
+)
 from warships.game.core.rules import GameSession, ai_fire, create_session, player_fire
 from warships.game.presets.service import PresetService
 
+# In-game Expert draws a fixed sample count rather than a wall-clock budget, so a
+# seed replays the same moves on any machine; ~15 ms per move on a classic board
+# and ~50 ms on the 30x30 large board.
+EXPERT_SAMPLES_PER_MOVE = 1000
+
 
 @dataclass(frozen=True, slots=True)
 class StartGameResult:
@@ -41,6 +60,7 @@ def start_game(
     difficulty: str,
     selected_preset: str | None,
     random_fleet_choice: FleetPlacement | None,
+    rules: RulesProfile = CLASSIC_RULES,
 ) -> StartGameResult:
     """Create a new session and AI strategy from setup choices."""
     if random_fleet_choice is not None:
@@ -65,8 +85,8 @@ def start_game(
             success=False,
         )
 
-    session = create_session(player_fleet, random_fleet(rng))
-    strategy = build_ai_strategy(difficulty, rng)
+    session = create_session(player_fleet, random_fleet(rng, rules=rules), rules=rules)
+    strategy = build_ai_strategy(difficulty, rng, rules=rules)
     return StartGameResult(
         session=session,
         ai_strategy=strategy,
@@ -76,9 +96,17 @@ def start_game(
 
 
 def resolve_player_turn(
-    session: GameSession, ai_strategy: AIStrategy, coord: Coord
+    session: GameSession,
+    ai_strategy: AIStrategy,
+    coord: Coord,
+    *,
+    ai_turns: AsyncAITurns | None = None,
 ) -> PlayerTurnResult:
-    """Apply player shot and resolve AI response when needed."""
+    """Apply player shot and resolve AI response when needed.
+
+    With ``ai_turns`` the AI response is only started; ``AsyncAITurns.poll``
+    resolves it on a later frame.
+    """
     result = player_fire(session, coord)
     if result in {ShotResult.INVALID, ShotResult.REPEAT}:
         return PlayerTurnResult(
@@ -93,6 +121,9 @@ def resolve_player_turn(
         )
 
     player_feedback = str(session.last_message)
+    if ai_turns is not None:
+        ai_turns.begin(session, ai_strategy)
+        return PlayerTurnResult(shot_result=result, status=player_feedback, winner=session.winner)
     _run_ai_turn(session, ai_strategy)
     combined_status = str(session.last_message)
     if result is ShotResult.SUNK and player_feedback and player_feedback != combined_status:
@@ -122,18 +153,116 @@ def _run_ai_turn(session: GameSession, ai_strategy: AIStrategy) -> None:
         break
 
 
-def build_ai_strategy(difficulty: str, rng: random.Random) -> AIStrategy:
+class AsyncAITurns:
+    """Runs AI turn decisions off the frame thread via an engine agent runner.
+
+    A decision past ``deadline_s`` is replaced by ``fallback_shot``. Results for
+    the strategy are held back while an abandoned decision still runs on the
+    worker, then replayed in order once the runner is idle. Outcomes depend on
+    thread timing, so replayable runs resolve AI turns synchronously instead.
+    """
+
+    def __init__(self, runner: AsyncAgentRunner, *, deadline_s: float = 0.5) -> None:
+        self._runner = runner
+        self._deadline_s = deadline_s
+        self._ticket: int | None = None
+        self._session: GameSession | None = None
+        self._deferred: list[tuple[AIStrategy, Coord, ShotResult]] = []
+
+    @property
+    def pending(self) -> bool:
+        return self._ticket is not None
+
+    def bind_diagnostics(self, hub: object | None) -> None:
+        self._runner.bind_diagnostics(hub)
+
+    def begin(self, session: GameSession, ai_strategy: AIStrategy) -> None:
+        if session.turn is not Turn.AI or session.winner is not None:
+            return
+        self.cancel()
+        self._flush_deferred()
+        board = session.player_board
+
+        def cheap(context: DecisionContext) -> str:
+            AIStrategy.put_decided_shot(context.blackboard, fallback_shot(board))
+            return AIStrategy.ACTION_FIRE
+
+        self._session = session
+        self._ticket = self._runner.submit(
+            ai_strategy,
+            DecisionContext(
+                now_seconds=0.0,
+                delta_seconds=0.0,
+                blackboard=ai_strategy.blackboard,
+                observations={"turn": session.turn.name},
+            ),
+            deadline_s=self._deadline_s,
+            fallback=create_functional_agent(cheap),
+        )
+
+    def poll(
+        self, session: GameSession, ai_strategy: AIStrategy, *, tick: int = 0
+    ) -> ShotResult | None:
+        """Apply a finished AI decision; return its shot result, or None if still thinking."""
+        decisions = self._runner.poll(tick=tick)
+        decision = next((item for item in decisions if item.ticket == self._ticket), None)
+        if decision is None:
+            self._flush_deferred()
+            return None
+        self._ticket = None
+        if self._session is not session:
+            return None
+        return self._apply(session, ai_strategy, decision)
+
+    def cancel(self) -> None:
+        """Drop the in-flight decision, e.g. when the battle is left."""
+        if self._ticket is not None:
+            self._runner.cancel(self._ticket)
+            self._ticket = None
+        self._session = None
+
+    def _apply(
+        self, session: GameSession, ai_strategy: AIStrategy, decision: AsyncDecision
+    ) -> ShotResult:
+        result = ShotResult.INVALID
+        if decision.action == AIStrategy.ACTION_FIRE:
+            shot = AIStrategy.take_decided_shot(ai_strategy.blackboard)
+            result = ai_fire(session, shot)
+        if result in {ShotResult.INVALID, ShotResult.REPEAT}:
+            # The strategy may not have seen a deferred fallback shot yet.
+            shot = fallback_shot(session.player_board)
+            result = ai_fire(session, shot)
+        self._deferred.append((ai_strategy, shot, result))
+        self._flush_deferred()
+        return result
+
+    def _flush_deferred(self) -> None:
+        # Never mutate a strategy while an abandoned decision may still read it.
+        if not self._deferred or not self._runner.idle:
+            return
+        deferred, self._deferred = self._deferred, []
+        for ai_strategy, shot, result in deferred:
+            ai_strategy.notify_result(shot, result)
+
+
+def build_ai_strategy(
+    difficulty: str, rng: random.Random, *, rules: RulesProfile = CLASSIC_RULES
+) -> AIStrategy:
     """Construct AI strategy from selected difficulty."""
     selected = _resolve_difficulty(difficulty)
     if selected == "Easy":
-        return _RandomShotAI(rng)
+        return _RandomShotAI(rng, rules.board_size)
     if selected == "Hard":
-        return PatternHardAI(rng)
-    return HuntTargetAI(rng)
+        return PatternHardAI(rng, rules=rules)
+    if selected == "Expert":
+        return MonteCarloAI(
+            rng, rules=rules, budget_s=None, max_samples=EXPERT_SAMPLES_PER_MOVE
+        )
+    return HuntTargetAI(rng, rules=rules)
 
 
 def _resolve_difficulty(difficulty: str) -> str:
-    scores = {"Easy": 0.0, "Normal": 1.0, "Hard": 0.0}
+    scores = {"Easy": 0.0, "Normal": 1.0, "Hard": 0.0, "Expert": 0.0}
     if difficulty in scores:
         for key in scores:
             scores[key] = 1.0 if key == difficulty else 0.0
@@ -141,10 +270,12 @@ def _resolve_difficulty(difficulty: str) -> str:
 
 
 class _RandomShotAI(AIStrategy):
-    def __init__(self, rng: random.Random) -> None:
+    def __init__(self, rng: random.Random, size: int) -> None:
         super().__init__()
         self._rng = rng
-        self._remaining: set[tuple[int, int]] = {(r, c) for r in range(10) for c in range(10)}
+        self._remaining: set[tuple[int, int]] = {
+            (r, c) for r in range(size) for c in range(size)
+        }
 
     def choose_shot(self) -> Coord:
         row, col = self._rng.choice(list(self._remaining))
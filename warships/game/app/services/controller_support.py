@@ -23,6 +23,7 @@ class ControllerSupport:
         preset_manage_visible_rows: int,
         logger: logging.Logger,
         debug_ui: bool,
+        presets_editable: bool = True,
     ) -> None:
         self._state = state
         self._ship_order = ship_order
@@ -30,6 +31,7 @@ class ControllerSupport:
         self._preset_manage_visible_rows = preset_manage_visible_rows
         self._logger = logger
         self._debug_ui = debug_ui
+        self._presets_editable = presets_editable
 
     def reset_editor(self) -> None:
         self._state.placements_by_type = PlacementEditorService.reset(self._ship_order)
@@ -81,6 +83,7 @@ class ControllerSupport:
             new_game_visible_rows=self._new_game_visible_rows,
             new_game_difficulty_open=self._state.new_game_difficulty_open,
             prompt=self._state.prompt_state.prompt,
+            presets_editable=self._presets_editable,
         )
 
     def preset_manage_can_scroll_down(self) -> bool:
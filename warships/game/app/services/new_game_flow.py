@@ -8,10 +8,10 @@ from dataclasses import dataclass
 from warships.game.app.services.preset_flow import PresetFlowService
 from warships.game.app.ui_state import PresetRowView
 from warships.game.core.fleet import random_fleet
-from warships.game.core.models import FleetPlacement, ShipPlacement
+from warships.game.core.models import CLASSIC_RULES, FleetPlacement, RulesProfile, ShipPlacement
 from warships.game.presets.service import PresetService
 
-DIFFICULTIES: tuple[str, ...] = ("Easy", "Normal", "Hard")
+DIFFICULTIES: tuple[str, ...] = ("Easy", "Normal", "Hard", "Expert")
 
 
 @dataclass(frozen=True, slots=True)
@@ -57,8 +57,10 @@ class NewGameFlowService:
         )
 
     @staticmethod
-    def randomize_selection(rng: random.Random) -> NewGameSelection:
-        fleet = random_fleet(rng)
+    def randomize_selection(
+        rng: random.Random, *, rules: RulesProfile = CLASSIC_RULES
+    ) -> NewGameSelection:
+        fleet = random_fleet(rng, rules=rules)
         return NewGameSelection(
             selected_preset=None,
             random_fleet=fleet,
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from functools import lru_cache
 
 from warships.game.app.ports.runtime_primitives import GridLayout
-from warships.game.core.board import BoardState
-from warships.game.core.models import Coord, ShipPlacement, ShipType
+from warships.game.core.board import placement_error_code_for_masks, placement_masks
+from warships.game.core.models import BOARD_SIZE, Coord, ShipPlacement, ShipType
 from warships.game.ui.layout_metrics import PLACEMENT_PANEL
 
 
@@ -42,19 +43,17 @@ class PlacementEditorService:
     def can_place_with_reason(
         placements_by_type: dict[ShipType, ShipPlacement | None],
         candidate: ShipPlacement,
+        size: int = BOARD_SIZE,
     ) -> tuple[bool, str]:
-        board = BoardState()
-        temp: list[ShipPlacement] = [p for p in placements_by_type.values() if p is not None]
-        temp.append(candidate)
-        seen: set[ShipType] = set()
-        for idx, placement in enumerate(temp, start=1):
-            if placement.ship_type in seen:
-                return False, "duplicate_ship_type"
-            seen.add(placement.ship_type)
-            if not board.can_place(placement):
-                return False, board.placement_error_code(placement)
-            board.place_ship(idx, placement)
-        return True, ""
+        placed = tuple(p for p in placements_by_type.values() if p is not None)
+        # Hover checks repeat for one set of placed ships; only the candidate changes.
+        occupied, halo, seen, reason = _placed_fleet_masks(placed, size)
+        if reason:
+            return False, reason
+        if candidate.ship_type in seen:
+            return False, "duplicate_ship_type"
+        reason = placement_error_code_for_masks(candidate, occupied, halo, size)
+        return not reason, reason
 
     @staticmethod
     def to_primary_grid_cell(layout: GridLayout, x: float, y: float) -> Coord | None:
@@ -75,3 +74,25 @@ class PlacementEditorService:
             if row.contains(x, y):
                 return ship_type
         return None
+
+
+@lru_cache(maxsize=32)
+def _placed_fleet_masks(
+    placed: tuple[ShipPlacement, ...],
+    size: int,
+) -> tuple[int, int, frozenset[ShipType], str]:
+    """Fold placed ships into (occupied, halo, ship types, first error code)."""
+    occupied = 0
+    halo = 0
+    seen: set[ShipType] = set()
+    for placement in placed:
+        if placement.ship_type in seen:
+            return occupied, halo, frozenset(seen), "duplicate_ship_type"
+        seen.add(placement.ship_type)
+        reason = placement_error_code_for_masks(placement, occupied, halo, size)
+        if reason:
+            return occupied, halo, frozenset(seen), reason
+        mask, ship_halo, _inside = placement_masks(placement, size)
+        occupied |= mask
+        halo |= ship_halo
+    return occupied, halo, frozenset(seen), ""
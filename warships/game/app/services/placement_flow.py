@@ -64,7 +64,9 @@ class PlacementFlowService:
             )
         bow = bow_from_grab_index(target, held_state.orientation, held_state.grab_index)
         candidate = ShipPlacement(held_state.ship_type, bow, held_state.orientation)
-        can_place, reason = PlacementEditorService.can_place_with_reason(placements_by_type, candidate)
+        can_place, reason = PlacementEditorService.can_place_with_reason(
+            placements_by_type, candidate, layout.grid_size
+        )
         if can_place:
             placements_by_type[held_state.ship_type] = candidate
             return PlacementActionResult(
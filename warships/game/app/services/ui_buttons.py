@@ -27,13 +27,18 @@ def prompt_buttons(prompt: PromptView) -> list[Button]:
     )
 
 
-def preset_row_buttons(rows: list[PresetRowView]) -> list[Button]:
+def preset_row_buttons(rows: list[PresetRowView], *, editable: bool = True) -> list[Button]:
     specs: list[ButtonSpec] = []
     for idx, row in enumerate(rows):
         edit_rect, rename_rect, delete_rect = PRESET_PANEL.action_button_rects(idx)
         specs.append(
             ButtonSpec(
-                f"preset_edit:{row.name}", edit_rect.x, edit_rect.y, edit_rect.w, edit_rect.h
+                f"preset_edit:{row.name}",
+                edit_rect.x,
+                edit_rect.y,
+                edit_rect.w,
+                edit_rect.h,
+                enabled=editable,
             )
         )
         specs.append(
@@ -112,15 +117,17 @@ def compose_buttons(
     new_game_visible_rows: int,
     new_game_difficulty_open: bool,
     prompt: PromptView | None,
+    presets_editable: bool = True,
 ) -> list[Button]:
     """Compose state, row, and modal buttons for current controller snapshot."""
     buttons = buttons_for_state(
         state=state,
         placement_ready=placement_ready,
         has_presets=has_presets,
+        presets_editable=presets_editable,
     )
     if state is AppState.PRESET_MANAGE:
-        buttons.extend(preset_row_buttons(visible_preset_manage_rows))
+        buttons.extend(preset_row_buttons(visible_preset_manage_rows, editable=presets_editable))
     if state is AppState.NEW_GAME_SETUP:
         buttons.extend(
             new_game_setup_buttons(
@@ -1,8 +1,16 @@
-"""Board state representation and mutation helpers."""
+"""Board state representation and mutation helpers.
+
+Besides the numpy ``ships``/``shots`` grids, a board keeps int bitboards (bit
+``row * size + col``) for occupied cells, their one-cell halo and shot cells, so
+placement checks, shots and the sunk test are a few mask operations. The grids
+stay in sync for views and AI code that read them.
+"""
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import count
 
 import numpy as np
 
@@ -15,6 +23,12 @@ from warships.game.core.models import (
     cells_for_placement,
 )
 
+_BOARD_VERSIONS = count(1)
+
+
+def _next_board_version() -> int:
+    return next(_BOARD_VERSIONS)
+
 
 @dataclass(slots=True)
 class BoardState:
@@ -30,12 +44,20 @@ class BoardState:
     ship_cells: dict[int, list[Coord]] = field(default_factory=dict)
     ship_types: dict[int, ShipType] = field(default_factory=dict)
     ship_remaining: dict[int, int] = field(default_factory=dict)
+    # Process-unique token bumped on every mutation; keys replay state-hash caches.
+    version: int = field(default_factory=_next_board_version, compare=False, repr=False)
+    occupied_bits: int = field(default=0, compare=False, repr=False)
+    halo_bits: int = field(default=0, compare=False, repr=False)
+    shot_bits: int = field(default=0, compare=False, repr=False)
 
     def __post_init__(self) -> None:
         if self.ships.shape != (self.size, self.size):
             self.ships = np.zeros((self.size, self.size), dtype=np.int16)
         if self.shots.shape != (self.size, self.size):
             self.shots = np.zeros((self.size, self.size), dtype=np.int8)
+        self.occupied_bits = _bits_from_cells(np.flatnonzero(self.ships))
+        self.halo_bits = _halo_bits(self.occupied_bits, self.size)
+        self.shot_bits = _bits_from_cells(np.flatnonzero(self.shots))
 
     def in_bounds(self, coord: Coord) -> bool:
         """Return whether the coordinate is in board bounds."""
@@ -48,25 +70,10 @@ class BoardState:
 
     def can_place_with_reason(self, placement: ShipPlacement) -> tuple[bool, str]:
         """Return whether placement is legal with a human-readable failure reason."""
-        cells = cells_for_placement(placement)
-        candidate = {(cell.row, cell.col) for cell in cells}
-        for cell in cells:
-            if not self.in_bounds(cell):
-                return False, "out_of_bounds"
-            if self.ships[cell.row, cell.col] != 0:
-                return False, "overlap"
-        for row, col in candidate:
-            for dr in (-1, 0, 1):
-                for dc in (-1, 0, 1):
-                    rr = row + dr
-                    cc = col + dc
-                    if not (0 <= rr < self.size and 0 <= cc < self.size):
-                        continue
-                    if (rr, cc) in candidate:
-                        continue
-                    if int(self.ships[rr, cc]) != 0:
-                        return False, "touching"
-        return True, ""
+        reason = placement_error_code_for_masks(
+            placement, self.occupied_bits, self.halo_bits, self.size
+        )
+        return not reason, reason
 
     def placement_error_message(self, placement: ShipPlacement) -> str:
         """Return stable placement-validation error text."""
@@ -105,9 +112,13 @@ class BoardState:
         cells = cells_for_placement(placement)
         for cell in cells:
             self.ships[cell.row, cell.col] = ship_id
+        mask, halo, _inside = placement_masks(placement, self.size)
+        self.occupied_bits |= mask
+        self.halo_bits |= halo
         self.ship_cells[ship_id] = cells
         self.ship_types[ship_id] = placement.ship_type
         self.ship_remaining[ship_id] = len(cells)
+        self.version = _next_board_version()
 
     def was_shot(self, coord: Coord) -> bool:
         """Return whether this cell was previously targeted."""
@@ -117,15 +128,18 @@ class BoardState:
         """Apply a shot and return result + sunk ship type if any."""
         if not self.in_bounds(coord):
             return ShotResult.INVALID, None
-        if self.was_shot(coord):
+        bit = 1 << (coord.row * self.size + coord.col)
+        if self.shot_bits & bit:
             return ShotResult.REPEAT, None
 
-        ship_id = int(self.ships[coord.row, coord.col])
-        if ship_id == 0:
+        self.version = _next_board_version()
+        self.shot_bits |= bit
+        if not self.occupied_bits & bit:
             self.shots[coord.row, coord.col] = 1
             return ShotResult.MISS, None
 
         self.shots[coord.row, coord.col] = 2
+        ship_id = int(self.ships[coord.row, coord.col])
         self.ship_remaining[ship_id] -= 1
         if self.ship_remaining[ship_id] == 0:
             return ShotResult.SUNK, self.ship_types[ship_id]
@@ -133,4 +147,65 @@ class BoardState:
 
     def all_ships_sunk(self) -> bool:
         """Return whether every ship has been sunk."""
-        return all(remaining == 0 for remaining in self.ship_remaining.values())
+        return not self.occupied_bits & ~self.shot_bits
+
+
+def placement_masks(placement: ShipPlacement, size: int = BOARD_SIZE) -> tuple[int, int, int]:
+    """Return (cell mask, halo mask, in-bounds cell count) for a placement.
+
+    Cells are counted from the bow up to the first one outside the board; the
+    mask covers only those cells and the halo is their 8-neighbourhood.
+    """
+    return _placement_masks(placement, size)
+
+
+def placement_error_code_for_masks(
+    placement: ShipPlacement, occupied: int, halo: int, size: int = BOARD_SIZE
+) -> str:
+    """Return the placement error code against occupancy/halo bitboards ("" if legal).
+
+    Codes follow a per-cell walk from the bow: an occupied cell before the first
+    out-of-bounds cell reports ``overlap``, then ``out_of_bounds``, then ``touching``.
+    """
+    mask, _halo, inside = _placement_masks(placement, size)
+    if mask & occupied:
+        return "overlap"
+    if inside < placement.ship_type.size:
+        return "out_of_bounds"
+    if mask & halo:
+        return "touching"
+    return ""
+
+
+@lru_cache(maxsize=4096)
+def _placement_masks(placement: ShipPlacement, size: int) -> tuple[int, int, int]:
+    mask = 0
+    inside = 0
+    for cell in cells_for_placement(placement):
+        if not (0 <= cell.row < size and 0 <= cell.col < size):
+            break
+        mask |= 1 << (cell.row * size + cell.col)
+        inside += 1
+    return mask, _halo_bits(mask, size), inside
+
+
+@lru_cache(maxsize=16)
+def _edge_masks(size: int) -> tuple[int, int, int]:
+    first_col = 0
+    for row in range(size):
+        first_col |= 1 << (row * size)
+    return first_col, first_col << (size - 1), (1 << (size * size)) - 1
+
+
+def _halo_bits(mask: int, size: int) -> int:
+    """Return ``mask`` plus its 8-neighbourhood, clipped to the board."""
+    first_col, last_col, full = _edge_masks(size)
+    row_band = mask | ((mask & ~last_col) << 1) | ((mask & ~first_col) >> 1)
+    return (row_band | (row_band << size) | (row_band >> size)) & full
+
+
+def _bits_from_cells(indices: np.ndarray) -> int:
+    bits = 0
+    for index in indices.tolist():
+        bits |= 1 << index
+    return bits
@@ -3,45 +3,68 @@
 from __future__ import annotations
 
 import random
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 
-from warships.game.core.board import BoardState
+import numpy as np
+
+from warships.game.core.board import BoardState, placement_masks
 from warships.game.core.models import (
-    BOARD_SIZE,
+    CLASSIC_RULES,
     DEFAULT_FLEET,
     Coord,
     FleetPlacement,
     Orientation,
+    RulesProfile,
     ShipPlacement,
     ShipType,
     cells_for_placement,
 )
 
+_COUNT_WORDS = (
+    "zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten",
+)  # fmt: skip
+
+
+def validate_fleet(
+    fleet: FleetPlacement, size: int | None = None, *, rules: RulesProfile = CLASSIC_RULES
+) -> tuple[bool, str]:
+    """Validate whether a fleet exactly matches the rules profile (classic by default).
 
-def validate_fleet(fleet: FleetPlacement, size: int = BOARD_SIZE) -> tuple[bool, str]:
-    """Validate whether a fleet exactly matches classic rules."""
-    seen: set[ShipType] = set()
+    ``size`` overrides the profile's board size.
+    """
+    size = rules.board_size if size is None else size
+    required = Counter(rules.fleet)
+    seen: Counter[ShipType] = Counter()
     board = BoardState(size=size)
 
-    if len(fleet.ships) != len(DEFAULT_FLEET):
-        return False, "Fleet must contain exactly five ships."
+    if len(fleet.ships) != len(rules.fleet):
+        count = len(rules.fleet)
+        label = _COUNT_WORDS[count] if count < len(_COUNT_WORDS) else str(count)
+        return False, f"Fleet must contain exactly {label} ships."
 
     for placement in fleet.ships:
-        if placement.ship_type in seen:
+        seen[placement.ship_type] += 1
+        if seen[placement.ship_type] > required[placement.ship_type]:
             return False, f"Duplicate ship type: {placement.ship_type.value}."
-        seen.add(placement.ship_type)
         if not board.can_place(placement):
             return False, board.placement_error_message(placement)
-        board.place_ship(len(seen), placement)
+        board.place_ship(seen.total(), placement)
 
-    missing = [ship for ship in DEFAULT_FLEET if ship not in seen]
+    missing = [ship for ship in required if seen[ship] < required[ship]]
     if missing:
         return False, f"Missing ships: {', '.join(ship.value for ship in missing)}."
     return True, ""
 
 
-def build_board_from_fleet(fleet: FleetPlacement, size: int = BOARD_SIZE) -> BoardState:
+def build_board_from_fleet(
+    fleet: FleetPlacement, size: int | None = None, *, rules: RulesProfile = CLASSIC_RULES
+) -> BoardState:
     """Create a board state from a validated fleet placement."""
-    valid, reason = validate_fleet(fleet, size=size)
+    size = rules.board_size if size is None else size
+    valid, reason = validate_fleet(fleet, size=size, rules=rules)
     if not valid:
         raise ValueError(reason)
     board = BoardState(size=size)
@@ -50,42 +73,136 @@ def build_board_from_fleet(fleet: FleetPlacement, size: int = BOARD_SIZE) -> Boa
     return board
 
 
-def random_fleet(rng: random.Random, size: int = BOARD_SIZE) -> FleetPlacement:
+def random_fleet(
+    rng: random.Random, size: int | None = None, *, rules: RulesProfile = CLASSIC_RULES
+) -> FleetPlacement:
     """Generate a random valid fleet placement with non-touching ships."""
+    return _random_fleet(rng, rules.board_size if size is None else size, rules.fleet)
+
+
+def random_fleets(
+    rng: random.Random,
+    n: int,
+    size: int | None = None,
+    *,
+    rules: RulesProfile = CLASSIC_RULES,
+) -> list[FleetPlacement]:
+    """Generate ``n`` fleets drawn from the same distribution as ``random_fleet``.
+
+    The sequential placement process runs over whole batches as array operations,
+    and fleets that run out of room are redrawn instead of retried one by one.
+    """
+    size = rules.board_size if size is None else size
+    return _fleets_from_ids(_random_fleet_ids(rng, n, size, rules.fleet), size, rules.fleet)
+
+
+_FLEET_POOL_SCHEMA = "fleet_pool.v1"
+# Rejected batches in a row before giving the rest of the request to random_fleet.
+_MAX_EMPTY_BATCHES = 16
+_MAX_BATCH = 1 << 15
+
+
+@dataclass(frozen=True, slots=True)
+class FleetPool:
+    """Pre-generated fleets stored as placement ids, sampled uniformly with replacement."""
+
+    size: int
+    # One row per fleet, one column per ship in ``fleet`` order.
+    ids: np.ndarray
+    fleet: tuple[ShipType, ...] = DEFAULT_FLEET
+
+    @classmethod
+    def generate(
+        cls,
+        rng: random.Random,
+        count: int,
+        size: int | None = None,
+        *,
+        rules: RulesProfile = CLASSIC_RULES,
+    ) -> FleetPool:
+        size = rules.board_size if size is None else size
+        ids = _random_fleet_ids(rng, count, size, rules.fleet)
+        return cls(size=size, ids=ids, fleet=rules.fleet)
+
+    @classmethod
+    def load(cls, path: Path) -> FleetPool:
+        with np.load(path, allow_pickle=False) as data:
+            if str(data["schema"]) != _FLEET_POOL_SCHEMA:
+                raise ValueError(f"Unsupported fleet pool schema: {data['schema']}.")
+            size = int(data["size"])
+            ids = np.array(data["ids"], dtype=np.int16)
+            # Pools written before rules profiles hold the classic fleet.
+            fleet = (
+                tuple(ShipType(str(name)) for name in data["fleet"].tolist())
+                if "fleet" in data
+                else DEFAULT_FLEET
+            )
+        tables = _fleet_tables(size, fleet)
+        limits = np.array([len(table.placements) for table in tables])
+        if ids.ndim != 2 or ids.shape[1] != len(tables) or (ids < 0).any():
+            raise ValueError("Fleet pool ids have the wrong shape.")
+        if len(ids) and (ids.max(axis=0) >= limits).any():
+            raise ValueError("Fleet pool ids do not match the board size.")
+        return cls(size=size, ids=ids, fleet=fleet)
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as handle:
+            np.savez_compressed(
+                handle,
+                schema=np.array(_FLEET_POOL_SCHEMA),
+                size=np.array(self.size),
+                fleet=np.array([ship.value for ship in self.fleet]),
+                ids=self.ids,
+            )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def sample(self, rng: random.Random, n: int) -> list[FleetPlacement]:
+        if not len(self.ids):
+            raise ValueError("Fleet pool is empty.")
+        picks = np.random.default_rng(rng.getrandbits(64)).integers(0, len(self.ids), size=n)
+        return _fleets_from_ids(self.ids[picks], self.size, self.fleet)
+
+
+def _random_fleet(rng: random.Random, size: int, fleet: tuple[ShipType, ...]) -> FleetPlacement:
     for _ in range(400):
-        generated = _generate_non_touching_fleet(rng, size)
+        generated = _generate_non_touching_fleet(rng, size, fleet)
         if generated is not None:
             return generated
     # Fallback preserves playability for atypical board sizes/configs.
-    return _generate_relaxed_fleet(rng, size)
+    return _generate_relaxed_fleet(rng, size, fleet)
 
 
-def _generate_non_touching_fleet(rng: random.Random, size: int) -> FleetPlacement | None:
-    occupied: set[tuple[int, int]] = set()
-    placements_by_type: dict[ShipType, ShipPlacement] = {}
-    ship_order = list(DEFAULT_FLEET)
-    rng.shuffle(ship_order)
+def _generate_non_touching_fleet(
+    rng: random.Random, size: int, fleet: tuple[ShipType, ...] = DEFAULT_FLEET
+) -> FleetPlacement | None:
+    blocked = 0
+    placements_by_slot: dict[int, ShipPlacement] = {}
+    # Shuffling slots consumes the RNG exactly like shuffling the ship types did.
+    slot_order = list(range(len(fleet)))
+    rng.shuffle(slot_order)
 
-    for ship_type in ship_order:
-        candidates = _candidate_placements(ship_type, size, occupied)
+    for slot in slot_order:
+        options = _placement_options(fleet[slot], size)
+        candidates = [index for index, (_p, mask, _h) in enumerate(options) if not mask & blocked]
         if not candidates:
             return None
-        placement = rng.choice(candidates)
-        placements_by_type[ship_type] = placement
-        for cell in cells_for_placement(placement):
-            occupied.add((cell.row, cell.col))
+        placement, _mask, halo = options[rng.choice(candidates)]
+        placements_by_slot[slot] = placement
+        blocked |= halo
 
-    ordered = [placements_by_type[ship_type] for ship_type in DEFAULT_FLEET]
+    ordered = [placements_by_slot[slot] for slot in range(len(fleet))]
     return FleetPlacement(ships=ordered)
 
 
-def _candidate_placements(
-    ship_type: ShipType,
-    size: int,
-    occupied: set[tuple[int, int]],
-) -> list[ShipPlacement]:
-    forbidden = _build_forbidden_zone(occupied, size)
-    candidates: list[ShipPlacement] = []
+@lru_cache(maxsize=32)
+def _placement_options(
+    ship_type: ShipType, size: int
+) -> tuple[tuple[ShipPlacement, int, int], ...]:
+    """Every in-bounds placement with its cell and halo bitboards, in scan order."""
+    options: list[tuple[ShipPlacement, int, int]] = []
     for orientation in (Orientation.HORIZONTAL, Orientation.VERTICAL):
         max_row = size if orientation is Orientation.HORIZONTAL else size - ship_type.size + 1
         max_col = size - ship_type.size + 1 if orientation is Orientation.HORIZONTAL else size
@@ -94,31 +211,19 @@ def _candidate_placements(
                 placement = ShipPlacement(
                     ship_type=ship_type, bow=Coord(row=row, col=col), orientation=orientation
                 )
-                cells = cells_for_placement(placement)
-                if any((c.row, c.col) in forbidden for c in cells):
-                    continue
-                candidates.append(placement)
-    return candidates
-
-
-def _build_forbidden_zone(occupied: set[tuple[int, int]], size: int) -> set[tuple[int, int]]:
-    forbidden: set[tuple[int, int]] = set()
-    for row, col in occupied:
-        for dr in (-1, 0, 1):
-            for dc in (-1, 0, 1):
-                rr = row + dr
-                cc = col + dc
-                if 0 <= rr < size and 0 <= cc < size:
-                    forbidden.add((rr, cc))
-    return forbidden
-
-
-def _generate_relaxed_fleet(rng: random.Random, size: int) -> FleetPlacement:
+                mask, halo, _inside = placement_masks(placement, size)
+                options.append((placement, mask, halo))
+    return tuple(options)
+
+
+def _generate_relaxed_fleet(
+    rng: random.Random, size: int, fleet: tuple[ShipType, ...] = DEFAULT_FLEET
+) -> FleetPlacement:
     """Legacy fallback generator used as a last resort."""
     board = BoardState(size=size)
     placements: list[ShipPlacement] = []
 
-    for ship_type in DEFAULT_FLEET:
+    for ship_type in fleet:
         placed = False
         for _ in range(10_000):
             orientation = rng.choice([Orientation.HORIZONTAL, Orientation.VERTICAL])
@@ -136,3 +241,119 @@ def _generate_relaxed_fleet(rng: random.Random, size: int) -> FleetPlacement:
             raise RuntimeError("Failed to generate random fleet placement.")
 
     return FleetPlacement(ships=placements)
+
+
+@dataclass(frozen=True, slots=True)
+class _FleetTable:
+    placements: tuple[ShipPlacement, ...]
+    # Transposed occupancy, one column per placement, for batched overlap tests.
+    cells_t: np.ndarray
+    # Occupied cells plus their 8-neighbourhood, one row per placement.
+    halo: np.ndarray
+
+
+@lru_cache(maxsize=8)
+def _fleet_tables(size: int, fleet: tuple[ShipType, ...]) -> tuple[_FleetTable, ...]:
+    by_type = {ship_type: _ship_table(size, ship_type) for ship_type in set(fleet)}
+    return tuple(by_type[ship_type] for ship_type in fleet)
+
+
+@lru_cache(maxsize=32)
+def _ship_table(size: int, ship_type: ShipType) -> _FleetTable:
+    placements = [placement for placement, _mask, _halo in _placement_options(ship_type, size)]
+    cells = np.zeros((len(placements), size * size), dtype=np.float32)
+    halo = np.zeros((len(placements), size, size), dtype=np.float32)
+    for index, placement in enumerate(placements):
+        for cell in cells_for_placement(placement):
+            cells[index, cell.row * size + cell.col] = 1.0
+            halo[
+                index,
+                max(0, cell.row - 1) : cell.row + 2,
+                max(0, cell.col - 1) : cell.col + 2,
+            ] = 1.0
+    return _FleetTable(
+        placements=tuple(placements),
+        cells_t=np.ascontiguousarray(cells.T),
+        halo=halo.reshape(len(placements), size * size),
+    )
+
+
+def _random_fleet_ids(
+    rng: random.Random, n: int, size: int, fleet: tuple[ShipType, ...]
+) -> np.ndarray:
+    tables = _fleet_tables(size, fleet)
+    generator = np.random.default_rng(rng.getrandbits(64))
+    chunks: list[np.ndarray] = []
+    needed = max(0, int(n))
+    accept_rate = 1.0
+    empty_batches = 0
+    while needed and empty_batches < _MAX_EMPTY_BATCHES:
+        batch = min(_MAX_BATCH, max(64, int(needed * 1.1 / accept_rate) + 1))
+        ids = _draw_fleet_batch(generator, tables, batch, size)
+        accept_rate = max(0.01, len(ids) / batch)
+        empty_batches = 0 if len(ids) else empty_batches + 1
+        chunks.append(ids[:needed])
+        needed -= len(chunks[-1])
+    if needed:
+        # Boards too small for the non-touching rule end up in the relaxed path.
+        lookup = [
+            {placement: index for index, placement in enumerate(table.placements)}
+            for table in tables
+        ]
+        fallback = [_random_fleet(rng, size, fleet) for _ in range(needed)]
+        chunks.append(
+            np.array(
+                [
+                    [lookup[slot][placed.ships[slot]] for slot in range(len(tables))]
+                    for placed in fallback
+                ],
+                dtype=np.int16,
+            ).reshape(needed, len(tables))
+        )
+    if not chunks:
+        return np.zeros((0, len(tables)), dtype=np.int16)
+    return np.concatenate(chunks)
+
+
+def _draw_fleet_batch(
+    generator: np.random.Generator,
+    tables: tuple[_FleetTable, ...],
+    batch: int,
+    size: int,
+) -> np.ndarray:
+    """Place every fleet of the batch ship by ship; return the rows that fit."""
+    slots = len(tables)
+    # Per-fleet random ship order, as ``_generate_non_touching_fleet`` shuffles it.
+    order = np.argsort(generator.random((batch, slots)), axis=1)
+    forbidden = np.zeros((batch, size * size), dtype=np.float32)
+    ids = np.zeros((batch, slots), dtype=np.int16)
+    alive = np.ones(batch, dtype=np.bool_)
+    for step in range(slots):
+        for slot, table in enumerate(tables):
+            rows = np.flatnonzero((order[:, step] == slot) & alive)
+            if not rows.size:
+                continue
+            if not table.placements:
+                alive[rows] = False
+                continue
+            # Uniform choice among free placements: the largest random key wins.
+            keys = generator.random((rows.size, len(table.placements)))
+            keys[(forbidden[rows] @ table.cells_t) > 0.0] = -1.0
+            choice = keys.argmax(axis=1)
+            fits = keys[np.arange(rows.size), choice] >= 0.0
+            alive[rows[~fits]] = False
+            rows = rows[fits]
+            choice = choice[fits]
+            ids[rows, slot] = choice
+            forbidden[rows] = np.maximum(forbidden[rows], table.halo[choice])
+    return ids[alive]
+
+
+def _fleets_from_ids(
+    ids: np.ndarray, size: int, fleet: tuple[ShipType, ...]
+) -> list[FleetPlacement]:
+    placements = [table.placements for table in _fleet_tables(size, fleet)]
+    return [
+        FleetPlacement(ships=[placements[slot][index] for slot, index in enumerate(row)])
+        for row in ids.tolist()
+    ]
@@ -46,6 +46,57 @@ DEFAULT_FLEET: tuple[ShipType, ...] = (
 )
 
 
+@dataclass(frozen=True, slots=True)
+class RulesProfile:
+    """Board size and fleet composition for one rules variant.
+
+    A ship type may appear several times in ``fleet``; fleets list their ships in
+    the same order.
+    """
+
+    name: str = "classic"
+    board_size: int = BOARD_SIZE
+    fleet: tuple[ShipType, ...] = DEFAULT_FLEET
+
+    def __post_init__(self) -> None:
+        if self.board_size < 1:
+            raise ValueError("Board size must be positive.")
+        if not self.fleet:
+            raise ValueError("Fleet must contain at least one ship.")
+        if max(ship.size for ship in self.fleet) > self.board_size:
+            raise ValueError("Longest ship does not fit on the board.")
+
+    @classmethod
+    def scaled(cls, board_size: int, *, name: str | None = None) -> RulesProfile:
+        """Classic fleet repeated once per ten rows, e.g. 15 ships on a 30x30 board."""
+        copies = max(1, board_size // BOARD_SIZE)
+        return cls(
+            name=name or f"scaled_{board_size}",
+            board_size=board_size,
+            fleet=DEFAULT_FLEET * copies,
+        )
+
+    @property
+    def ship_lengths(self) -> tuple[int, ...]:
+        return tuple(ship.size for ship in self.fleet)
+
+
+CLASSIC_RULES = RulesProfile()
+LARGE_RULES = RulesProfile.scaled(30, name="large")
+RULES_PROFILES: dict[str, RulesProfile] = {
+    profile.name: profile for profile in (CLASSIC_RULES, LARGE_RULES)
+}
+
+
+def rules_profile(name: str) -> RulesProfile:
+    """Return a registered rules profile by name."""
+    try:
+        return RULES_PROFILES[name.strip().lower()]
+    except KeyError:
+        known = ", ".join(sorted(RULES_PROFILES))
+        raise ValueError(f"Unknown rules profile {name!r}; expected one of: {known}.") from None
+
+
 class ShotResult(StrEnum):
     """Result of a single shot."""
 
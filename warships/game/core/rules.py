@@ -6,7 +6,14 @@ from dataclasses import dataclass, field
 
 from warships.game.core.board import BoardState
 from warships.game.core.fleet import build_board_from_fleet
-from warships.game.core.models import Coord, FleetPlacement, ShotResult, Turn
+from warships.game.core.models import (
+    CLASSIC_RULES,
+    Coord,
+    FleetPlacement,
+    RulesProfile,
+    ShotResult,
+    Turn,
+)
 
 
 @dataclass(slots=True)
@@ -21,10 +28,15 @@ class GameSession:
     history: list[str] = field(default_factory=list)
 
 
-def create_session(player_fleet: FleetPlacement, ai_fleet: FleetPlacement) -> GameSession:
+def create_session(
+    player_fleet: FleetPlacement,
+    ai_fleet: FleetPlacement,
+    *,
+    rules: RulesProfile = CLASSIC_RULES,
+) -> GameSession:
     """Create a game session from fleet placements."""
-    player_board = build_board_from_fleet(player_fleet)
-    ai_board = build_board_from_fleet(ai_fleet)
+    player_board = build_board_from_fleet(player_fleet, rules=rules)
+    ai_board = build_board_from_fleet(ai_fleet, rules=rules)
     return GameSession(
         player_board=player_board,
         ai_board=ai_board,
@@ -17,22 +17,37 @@ def setup_logging() -> None:
     """Configure application logging via engine logging API."""
     level_name = os.getenv("WARSHIPS_LOG_LEVEL", os.getenv("LOG_LEVEL", "INFO")).upper()
     console_format = os.getenv("LOG_FORMAT", "json").lower()
-    file_path = _resolve_run_log_file_path()
+    file_format = os.getenv("WARSHIPS_LOG_FILE_FORMAT", "json").strip().lower() or "json"
+    file_path = _resolve_run_log_file_path(binary=file_format == "binary")
     configure_logging(
         EngineLoggingConfig(
             level_name=level_name,
             console_format=console_format,
             file_path=file_path,
-            file_format="json",
+            file_format=file_format,
+            fast_mode=_env_flag("WARSHIPS_LOG_FAST_MODE"),
+            rate_limit_per_site=_env_int("WARSHIPS_LOG_RATE_LIMIT", 0),
         )
     )
     logging.getLogger(__name__).info("logging_file=%s", file_path)
 
 
-def _resolve_run_log_file_path() -> str:
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "0").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _resolve_run_log_file_path(*, binary: bool = False) -> str:
     configured = os.getenv("WARSHIPS_LOG_DIR", "").strip()
     base_dir = Path(configured) if configured else resolve_logs_dir()
     base_dir.mkdir(parents=True, exist_ok=True)
     stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
     game_name = os.getenv("WARSHIPS_GAME_NAME", "warships").strip() or "warships"
-    return str(base_dir / f"{game_name}_run_{stamp}.jsonl")
+    suffix = ".englog" if binary else ".jsonl"
+    return str(base_dir / f"{game_name}_run_{stamp}{suffix}")
@@ -6,13 +6,19 @@ from dataclasses import dataclass
 
 from warships.game.core.models import (
     BOARD_SIZE,
+    CLASSIC_RULES,
     Coord,
     FleetPlacement,
     Orientation,
+    RulesProfile,
     ShipPlacement,
     ShipType,
 )
 
+# v2 records the rules profile; v1 presets are classic 10x10 fleets.
+PRESET_SCHEMA_VERSION = 2
+_SUPPORTED_VERSIONS = (1, PRESET_SCHEMA_VERSION)
+
 
 @dataclass(slots=True)
 class PresetModel:
@@ -22,14 +28,18 @@ class PresetModel:
     name: str
     grid_size: int
     ships: list[dict[str, object]]
+    rules_profile: str = CLASSIC_RULES.name
 
 
-def fleet_to_payload(name: str, fleet: FleetPlacement) -> dict[str, object]:
+def fleet_to_payload(
+    name: str, fleet: FleetPlacement, *, rules: RulesProfile = CLASSIC_RULES
+) -> dict[str, object]:
     """Convert fleet placement to JSON-serializable payload."""
     return {
-        "version": 1,
+        "version": PRESET_SCHEMA_VERSION,
         "name": name,
-        "grid_size": BOARD_SIZE,
+        "rules_profile": rules.name,
+        "grid_size": rules.board_size,
         "ships": [
             {
                 "type": placement.ship_type.value,
@@ -41,22 +51,31 @@ def fleet_to_payload(name: str, fleet: FleetPlacement) -> dict[str, object]:
     }
 
 
-def payload_to_fleet(payload: dict[str, object]) -> tuple[str, FleetPlacement]:
-    """Convert loaded payload into fleet placement."""
+def payload_to_fleet(
+    payload: dict[str, object], *, rules: RulesProfile = CLASSIC_RULES
+) -> tuple[str, FleetPlacement]:
+    """Convert loaded payload into fleet placement for a board of ``rules.board_size``."""
     raw_version = payload.get("version", -1)
     if not isinstance(raw_version, (int, str)):
         raise ValueError("Preset version must be int-compatible.")
     version = int(raw_version)
-    if version != 1:
+    if version not in _SUPPORTED_VERSIONS:
         raise ValueError("Unsupported preset version.")
     name = str(payload.get("name", "")).strip()
     if not name:
         raise ValueError("Preset name is required.")
-    raw_grid_size = payload.get("grid_size", BOARD_SIZE)
+    if version == 1:
+        # v1 predates rules profiles: every v1 preset is a classic 10x10 fleet.
+        expected_grid_size = BOARD_SIZE
+    elif payload.get("rules_profile") != rules.name:
+        raise ValueError("Preset rules profile mismatch.")
+    else:
+        expected_grid_size = rules.board_size
+    raw_grid_size = payload.get("grid_size", expected_grid_size)
     if not isinstance(raw_grid_size, (int, str)):
         raise ValueError("Preset grid_size must be int-compatible.")
     grid_size = int(raw_grid_size)
-    if grid_size != BOARD_SIZE:
+    if grid_size != expected_grid_size or grid_size != rules.board_size:
         raise ValueError("Preset grid size mismatch.")
 
     raw_ships = payload.get("ships")
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from warships.game.core.fleet import validate_fleet
-from warships.game.core.models import FleetPlacement
+from warships.game.core.models import CLASSIC_RULES, FleetPlacement, RulesProfile
 from warships.game.presets.repository import PresetRepository
 from warships.game.presets.schema import fleet_to_payload, payload_to_fleet
 
@@ -11,8 +11,16 @@ from warships.game.presets.schema import fleet_to_payload, payload_to_fleet
 class PresetService:
     """High-level preset operations with schema and rules validation."""
 
-    def __init__(self, repository: PresetRepository) -> None:
+    def __init__(
+        self, repository: PresetRepository, *, rules: RulesProfile = CLASSIC_RULES
+    ) -> None:
         self._repository = repository
+        self._rules = rules
+
+    @property
+    def rules(self) -> RulesProfile:
+        """Rules profile presets are validated against."""
+        return self._rules
 
     def list_presets(self) -> list[str]:
         """List available preset names."""
@@ -20,15 +28,15 @@ class PresetService:
 
     def save_preset(self, name: str, fleet: FleetPlacement) -> None:
         """Validate fleet and persist preset."""
-        valid, reason = validate_fleet(fleet)
+        valid, reason = validate_fleet(fleet, rules=self._rules)
         if not valid:
             raise ValueError(reason)
-        self._repository.save_payload(name, fleet_to_payload(name, fleet))
+        self._repository.save_payload(name, fleet_to_payload(name, fleet, rules=self._rules))
 
     def load_preset(self, name: str) -> FleetPlacement:
         """Load and validate preset into a fleet placement."""
-        _, fleet = payload_to_fleet(self._repository.load_payload(name))
-        valid, reason = validate_fleet(fleet)
+        _, fleet = payload_to_fleet(self._repository.load_payload(name), rules=self._rules)
+        valid, reason = validate_fleet(fleet, rules=self._rules)
         if not valid:
             raise ValueError(f"Preset '{name}' is invalid: {reason}")
         return fleet
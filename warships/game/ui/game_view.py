@@ -10,8 +10,11 @@ from typing import cast
 from engine.api.render_snapshot import (
     RenderCommand,
     RenderPassSnapshot,
+    RenderRectBatchBuilder,
     RenderSnapshot,
     Vec3,
+    create_render_command,
+    render_command_order_key,
     mat4_translation,
 )
 from engine.api.render import RenderAPI as Render2D
@@ -65,9 +68,12 @@ class _ResolvedButtonStyle:
 class GameView:
     """Draws game state using retained keyed scene nodes."""
 
-    def __init__(self, renderer: Render2D, layout: GridLayout) -> None:
+    def __init__(
+        self, renderer: Render2D, layout: GridLayout, *, columnar_rects: bool = False
+    ) -> None:
         self._renderer = renderer
         self._layout = layout
+        self._columnar_rects = columnar_rects
         self._theme: SceneTheme = theme_for_state(AppState.MAIN_MENU)
 
     def render(
@@ -109,9 +115,13 @@ class GameView:
             if ui.placement_popup_message:
                 draw_placement_rule_popup(self._renderer, ui.placement_popup_message)
         if ui.state is AppState.PRESET_MANAGE:
-            draw_preset_manage(self._renderer, ui, theme=self._theme)
+            draw_preset_manage(
+                self._renderer, ui, theme=self._theme, grid_size=self._layout.grid_size
+            )
         if ui.state is AppState.NEW_GAME_SETUP:
-            draw_new_game_setup(self._renderer, ui, theme=self._theme)
+            draw_new_game_setup(
+                self._renderer, ui, theme=self._theme, grid_size=self._layout.grid_size
+            )
 
         prompt_widget = build_modal_text_input_widget(ui)
         if prompt_widget is not None:
@@ -353,7 +363,7 @@ class GameView:
         debug_labels_state: list[str],
     ) -> tuple[RenderSnapshot, list[str]]:
         """Build immutable render snapshot for current UI state."""
-        recorder = _SnapshotRecorder()
+        recorder = _SnapshotRecorder(columnar_rects=self._columnar_rects)
         snapshot_view = GameView(recorder, self._layout)
         labels = snapshot_view.render(
             ui=ui,
@@ -366,8 +376,14 @@ class GameView:
 class _SnapshotRecorder:
     """RenderAPI-compatible recorder that captures immutable snapshot commands."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, columnar_rects: bool = False) -> None:
         self._commands: list[RenderCommand] = []
+        self._rect_batch = RenderRectBatchBuilder() if columnar_rects else None
+
+    def _next_sequence(self) -> int:
+        if self._rect_batch is None:
+            return len(self._commands)
+        return len(self._commands) + len(self._rect_batch)
 
     def begin_frame(self) -> None:
         return
@@ -386,8 +402,22 @@ class _SnapshotRecorder:
         z: float = 0.0,
         static: bool = False,
     ) -> None:
+        if self._rect_batch is not None:
+            self._rect_batch.append(
+                key=key,
+                x=float(x),
+                y=float(y),
+                w=float(w),
+                h=float(h),
+                color=str(color),
+                z=float(z),
+                static=bool(static),
+                sequence=self._next_sequence(),
+            )
+            return
         self._commands.append(
-            RenderCommand(
+            create_render_command(
+                sequence=self._next_sequence(),
                 kind="rect",
                 layer=int(round(z * 100.0)),
                 transform=mat4_translation(Vec3(x=float(x), y=float(y), z=float(z))),
@@ -430,7 +460,8 @@ class _SnapshotRecorder:
             if isinstance(value, (str, int, float, bool))
         )
         self._commands.append(
-            RenderCommand(
+            create_render_command(
+                sequence=self._next_sequence(),
                 kind=str(style_kind),
                 layer=int(round(float(z) * 100.0)),
                 transform=mat4_translation(Vec3(x=float(x), y=float(y), z=float(z))),
@@ -465,7 +496,8 @@ class _SnapshotRecorder:
         static: bool = False,
     ) -> None:
         self._commands.append(
-            RenderCommand(
+            create_render_command(
+                sequence=self._next_sequence(),
                 kind="grid",
                 layer=int(round(z * 100.0)),
                 transform=mat4_translation(Vec3(x=float(x), y=float(y), z=float(z))),
@@ -496,7 +528,8 @@ class _SnapshotRecorder:
         static: bool = False,
     ) -> None:
         self._commands.append(
-            RenderCommand(
+            create_render_command(
+                sequence=self._next_sequence(),
                 kind="text",
                 layer=int(round(z * 100.0)),
                 transform=mat4_translation(Vec3(x=float(x), y=float(y), z=float(z))),
@@ -516,7 +549,8 @@ class _SnapshotRecorder:
 
     def set_title(self, title: str) -> None:
         self._commands.append(
-            RenderCommand(
+            create_render_command(
+                sequence=self._next_sequence(),
                 kind="title",
                 layer=0,
                 transform=mat4_translation(Vec3(0.0, 0.0, 0.0)),
@@ -526,7 +560,8 @@ class _SnapshotRecorder:
 
     def fill_window(self, key: str, color: str, z: float = -100.0) -> None:
         self._commands.append(
-            RenderCommand(
+            create_render_command(
+                sequence=self._next_sequence(),
                 kind="fill_window",
                 layer=int(round(z * 100.0)),
                 transform=mat4_translation(Vec3(0.0, 0.0, float(z))),
@@ -556,17 +591,20 @@ class _SnapshotRecorder:
         return
 
     def finish(self, *, frame_index: int) -> RenderSnapshot:
-        commands = tuple(
-            sorted(
-                self._commands,
-                key=lambda command: (
-                    int(getattr(command, "layer", 0)),
-                    str(getattr(command, "kind", "")),
-                    str(getattr(command, "sort_key", "")),
-                ),
-            )
+        commands = tuple(sorted(self._commands, key=render_command_order_key))
+        rect_batches = (
+            (self._rect_batch.build(),)
+            if self._rect_batch is not None and len(self._rect_batch) > 0
+            else ()
         )
+        # Every recorder entry point coerces payload values to primitives,
+        # so the pass is pre-frozen and the host can skip deep sanitize.
         return RenderSnapshot(
             frame_index=int(frame_index),
-            passes=(RenderPassSnapshot(name="ui", commands=commands),),
+            passes=(
+                RenderPassSnapshot(
+                    name="ui", commands=commands, trusted=True, rect_batches=rect_batches
+                ),
+            ),
+            trusted=True,
         )
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
-from engine.api.ui_primitives import Rect
+from engine.api.ui_primitives import GridLayout, Rect
 
 DESIGN_WIDTH = 1200.0
 DESIGN_HEIGHT = 720.0
@@ -30,6 +30,14 @@ def status_rect() -> Rect:
     return Rect(60.0, DESIGN_HEIGHT - 70.0, DESIGN_WIDTH - 120.0, 44.0)
 
 
+def grid_layout_for_board(layout: GridLayout, board_size: int) -> GridLayout:
+    """Fit ``board_size`` cells into the pixel footprint of ``layout``'s grid."""
+    if board_size == layout.grid_size:
+        return layout
+    cell_size = layout.cell_size * layout.grid_size / board_size
+    return replace(layout, grid_size=board_size, cell_size=cell_size)
+
+
 def _inset(rect: Rect, dx: float, dy: float) -> Rect:
     return Rect(rect.x + dx, rect.y + dy, max(0.0, rect.w - 2.0 * dx), max(0.0, rect.h - 2.0 * dy))
 
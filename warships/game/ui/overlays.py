@@ -11,6 +11,8 @@ def buttons_for_state(
     state: AppState,
     placement_ready: bool,
     has_presets: bool,
+    *,
+    presets_editable: bool = True,
 ) -> list[Button]:
     """Build buttons for the current app state."""
     top_bar = top_bar_rect()
@@ -33,7 +35,7 @@ def buttons_for_state(
         ]
     if state is AppState.PRESET_MANAGE:
         return [
-            Button("create_preset", left_x, base_y, bw, bh),
+            Button("create_preset", left_x, base_y, bw, bh, enabled=presets_editable),
             Button("back_main", left_x + bw + gap, base_y, bw, bh),
         ]
     if state is AppState.PLACEMENT_EDIT:
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from engine.api.render import RenderAPI as Render2D
 from engine.api.ui_style import DEFAULT_UI_STYLE_TOKENS, draw_rounded_rect
-from warships.game.core.models import ShipPlacement, cells_for_placement
+from warships.game.core.models import BOARD_SIZE, ShipPlacement, cells_for_placement
 
 TOKENS = DEFAULT_UI_STYLE_TOKENS
 
@@ -17,15 +17,18 @@ def draw_preset_preview(
     x: float,
     y: float,
     cell: float,
+    grid_size: int = BOARD_SIZE,
 ) -> None:
-    """Render a compact 10x10 fleet preview."""
+    """Render a compact fleet preview; ``cell`` is sized for a 10x10 board."""
+    # Larger boards shrink their cells to keep the preview footprint.
+    cell = cell * BOARD_SIZE / grid_size
     draw_rounded_rect(
         renderer,
         key=f"preset:preview:bg:{key_prefix}",
         x=x,
         y=y,
-        w=cell * 10,
-        h=cell * 10,
+        w=cell * grid_size,
+        h=cell * grid_size,
         radius=max(2.0, cell),
         color=TOKENS.board_bg,
         z=1.0,
@@ -14,6 +14,7 @@ from engine.api.ui_style import (
 )
 from warships.game.app.state_machine import AppState
 from warships.game.app.ui_state import AppUIState
+from warships.game.core.models import BOARD_SIZE
 from warships.game.ui.layout_metrics import NEW_GAME_SETUP
 from warships.game.ui.scene_theme import SceneTheme, theme_for_state
 from warships.game.ui.views.common import draw_preset_preview
@@ -22,7 +23,11 @@ TOKENS = DEFAULT_UI_STYLE_TOKENS
 
 
 def draw_new_game_setup(
-    renderer: Render2D, ui: AppUIState, theme: SceneTheme | None = None
+    renderer: Render2D,
+    ui: AppUIState,
+    theme: SceneTheme | None = None,
+    *,
+    grid_size: int = BOARD_SIZE,
 ) -> None:
     active_theme = theme or theme_for_state(AppState.NEW_GAME_SETUP)
     panel = NEW_GAME_SETUP.panel_rect()
@@ -372,4 +377,5 @@ def draw_new_game_setup(
         x=preview_x,
         y=preview_y,
         cell=NEW_GAME_SETUP.preview_cell,
+        grid_size=grid_size,
     )
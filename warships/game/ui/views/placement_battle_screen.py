@@ -200,7 +200,7 @@ def draw_board_frame(
         y=rect.y,
         width=rect.w,
         height=rect.h,
-        lines=11,
+        lines=layout.grid_size + 1,
         color=active_theme.board_grid,
         z=0.2,
     )
@@ -276,6 +276,7 @@ def draw_shots(renderer: Render2D, layout: GridLayout, board: BoardState, is_ai:
 def draw_forbidden_neighbor_cells(
     renderer: Render2D, layout: GridLayout, placements: list[ShipPlacement]
 ) -> None:
+    size = layout.grid_size
     occupied = {(cell.row, cell.col) for p in placements for cell in cells_for_placement(p)}
     forbidden: set[tuple[int, int]] = set()
     for row, col in occupied:
@@ -283,7 +284,7 @@ def draw_forbidden_neighbor_cells(
             for dc in (-1, 0, 1):
                 rr = row + dr
                 cc = col + dc
-                if rr < 0 or rr >= 10 or cc < 0 or cc >= 10:
+                if rr < 0 or rr >= size or cc < 0 or cc >= size:
                     continue
                 if (rr, cc) in occupied:
                     continue
@@ -460,7 +461,7 @@ def draw_held_ship_preview(
         for i in range(ship_type.size):
             row = bow_row + (i if orientation is Orientation.VERTICAL else 0)
             col = bow_col + (i if orientation is Orientation.HORIZONTAL else 0)
-            if row < 0 or row >= 10 or col < 0 or col >= 10:
+            if row < 0 or row >= layout.grid_size or col < 0 or col >= layout.grid_size:
                 continue
             cell_rect = layout.cell_rect_for_target("primary", row=row, col=col)
             renderer.add_rect(
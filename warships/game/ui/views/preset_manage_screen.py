@@ -14,6 +14,7 @@ from engine.api.ui_style import (
 )
 from warships.game.app.state_machine import AppState
 from warships.game.app.ui_state import AppUIState
+from warships.game.core.models import BOARD_SIZE
 from warships.game.ui.layout_metrics import PRESET_PANEL
 from warships.game.ui.scene_theme import SceneTheme, theme_for_state
 from warships.game.ui.views.common import draw_preset_preview
@@ -91,7 +92,11 @@ def _draw_action_button(
 
 
 def draw_preset_manage(
-    renderer: Render2D, ui: AppUIState, theme: SceneTheme | None = None
+    renderer: Render2D,
+    ui: AppUIState,
+    theme: SceneTheme | None = None,
+    *,
+    grid_size: int = BOARD_SIZE,
 ) -> None:
     active_theme = theme or theme_for_state(AppState.PRESET_MANAGE)
     panel = PRESET_PANEL.panel_rect()
@@ -228,6 +233,7 @@ def draw_preset_manage(
             x=preview.x,
             y=preview.y,
             cell=PRESET_PANEL.preview_cell,
+            grid_size=grid_size,
         )
         edit_rect, rename_rect, delete_rect = PRESET_PANEL.action_button_rects(idx)
         _draw_action_button(